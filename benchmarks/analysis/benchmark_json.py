@@ -0,0 +1,124 @@
+"""
+Helpers for reading Google Benchmark JSON output.
+
+Google Benchmark writes NaN/nan for undefined statistics (e.g. the cv row of
+a single-repetition run). The json module accepts some of these spellings but
+strict parsers such as ijson and simdjson do not, so the helpers here rewrite
+them to null first.
+
+Scripts outside benchmarks/analysis import this module with that directory
+on PYTHONPATH, e.g. from benchmarks/:
+
+    PYTHONPATH=analysis python3 results/figures/regenerate_all_plots.py
+
+load_or_parse caches each script's parsed statistics under .stats_cache/
+next to the JSON file.
+"""
+
+import hashlib
+import json
+import pickle
+from pathlib import Path
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None
+
+NAN_TOKENS = (b': -nan', b': -NaN', b': nan', b': NaN')
+
+
+def nan_to_null(data):
+    """Rewrite bare NaN values in raw JSON bytes to null."""
+    for token in NAN_TOKENS:
+        data = data.replace(token, b': null')
+    return data
+
+
+class NanToNullReader:
+    """Binary file wrapper that rewrites bare NaN values to null while streaming."""
+
+    def __init__(self, f):
+        self._f = f
+        self._pending = b''
+
+    def read(self, size=-1):
+        if size == 0:
+            return b''
+        while True:
+            chunk = self._f.read(size)
+            data = self._pending + chunk
+            # Emit only up to the last comma so no token is split across reads
+            cut = data.rfind(b',') + 1 if chunk else len(data)
+            if cut:
+                break
+            self._pending = data
+            if not chunk:
+                return b''
+        self._pending = data[cut:]
+        return nan_to_null(data[:cut])
+
+
+def load_benchmark_data(filepath):
+    """
+    Load Google Benchmark JSON data.
+
+    With ijson installed the entries are streamed one at a time instead of
+    decoding the whole document, so the result can only be iterated once.
+    """
+    if IJSON_AVAILABLE:
+        return stream_benchmarks(filepath)
+    with open(filepath, 'r') as f:
+        data = json.load(f)
+    return data['benchmarks']
+
+
+# Bump when a parser's output layout changes so stale cache entries are ignored
+STATS_CACHE_VERSION = 2
+
+
+def load_or_parse(json_path, parser, cache_dir=None, loader=None):
+    """
+    Return parser(loader(json_path)), pickled to cache_dir.
+
+    loader defaults to load_benchmark_data; scripts that need more of the
+    document than the 'benchmarks' array pass their own.
+
+    Cache entries are keyed on the file's path, size and mtime and on the
+    parser and STATS_CACHE_VERSION, so regenerating the JSON invalidates
+    them. With cache_dir=None the file is always parsed.
+    """
+    json_path = Path(json_path)
+    if loader is None:
+        loader = load_benchmark_data
+    if cache_dir is None:
+        return parser(loader(json_path))
+
+    st = json_path.stat()
+    # Parsers of different scripts share names, so identify them by source file
+    parser_id = f"{parser.__code__.co_filename}:{parser.__qualname__}"
+    key = hashlib.blake2b(
+        f"{json_path.resolve()}|{parser_id}|{STATS_CACHE_VERSION}|{st.st_mtime_ns}|{st.st_size}".encode()
+    ).hexdigest()[:16]
+    cache_path = Path(cache_dir) / f"{key}.pkl"
+    if cache_path.exists():
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+
+    stats = parser(loader(json_path))
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(stats, f, protocol=5)
+    except OSError as e:
+        # A read-only results directory should not stop plotting
+        print(f"Warning: could not write cache {cache_path}: {e}")
+    return stats
+
+
+def stream_benchmarks(filepath):
+    """Yield the entries of the 'benchmarks' array without building the full document."""
+    with open(filepath, 'rb') as f:
+        yield from ijson.items(NanToNullReader(f), 'benchmarks.item', use_float=True)
@@ -16,8 +16,6 @@ Following scientific plotting guide standards:
 
 import json
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib as mpl
 from pathlib import Path
 from collections import defaultdict
 
@@ -67,6 +65,8 @@ SHELL_PAIR_L = {
 
 def configure_publication_style(font_scale=1.2):
     """Configure matplotlib for publication-quality figures."""
+    import matplotlib.pyplot as plt
+
     base_sizes = {
         'axes.labelsize': 10,
         'axes.titlesize': 11,
@@ -120,8 +120,6 @@ def configure_publication_style(font_scale=1.2):
         # Figure configuration
         'figure.dpi': 150,
         'savefig.dpi': 300,
-        'savefig.bbox': 'tight',
-        'savefig.pad_inches': 0.02,
     })
 
 
@@ -176,12 +174,15 @@ def plot_shell_pair_comparison(results, output_path):
     """
     Plot 1: Bar chart comparison of implementations by shell pair.
     """
+    import matplotlib.pyplot as plt
+
     configure_publication_style(font_scale=1.2)
 
-    fig, ax = plt.subplots(figsize=(COLUMN_WIDTHS['double'], 4.0))
+    fig, ax = plt.subplots(figsize=(COLUMN_WIDTHS['double'], 4.0), layout='tight')
 
     # Filter to shell pairs that have all implementations
     shell_pairs = [sp for sp in SHELL_PAIR_ORDER if sp in results]
+    shell_L = np.array([SHELL_PAIR_L[sp] for sp in shell_pairs])
     n_pairs = len(shell_pairs)
     n_impls = 3
 
@@ -215,17 +216,16 @@ def plot_shell_pair_comparison(results, output_path):
     ax2 = ax.twiny()
     ax2.set_xlim(ax.get_xlim())
     ax2.set_xticks(x)
-    L_labels = [str(SHELL_PAIR_L.get(sp, '')) for sp in shell_pairs]
+    L_labels = [str(L) for L in shell_L]
     ax2.set_xticklabels(L_labels, fontsize=7)
     ax2.set_xlabel('Total Angular Momentum L', fontsize=9)
     ax2.spines['top'].set_visible(False)
     ax2.tick_params(length=0)
 
-    plt.tight_layout()
-    fig.savefig(output_path, dpi=300, bbox_inches='tight')
+    fig.savefig(output_path, dpi=300)
     # Also save PNG for preview
     png_path = str(output_path).replace('.pdf', '.png')
-    fig.savefig(png_path, dpi=300, bbox_inches='tight')
+    fig.savefig(png_path, dpi=300)
     plt.close(fig)
     print(f"Saved: {output_path}")
     print(f"Saved: {png_path}")
@@ -235,22 +235,24 @@ def plot_speedup_vs_L(results, output_path):
     """
     Plot 2: Speedup analysis showing CSE speedup vs Original and Symbolic.
     """
+    import matplotlib.pyplot as plt
+
     configure_publication_style(font_scale=1.3)
 
-    fig, ax = plt.subplots(figsize=(COLUMN_WIDTHS['single'], 3.0))
+    fig, ax = plt.subplots(figsize=(COLUMN_WIDTHS['single'], 3.0), layout='tight')
 
     # Calculate speedups
     shell_pairs = [sp for sp in SHELL_PAIR_ORDER if sp in results]
+    shell_L = np.array([SHELL_PAIR_L[sp] for sp in shell_pairs])
 
     L_values = []
     speedup_vs_orig = []
     speedup_vs_symb = []
     shell_labels = []
 
-    for sp in shell_pairs:
+    for sp, L in zip(shell_pairs, shell_L):
         if 0 in results[sp] and 2 in results[sp]:
-            L = SHELL_PAIR_L.get(sp, 0)
-            L_values.append(L)
+            L_values.append(int(L))
             shell_labels.append(sp)
 
             orig_time = results[sp][0].get('mean', 1)
@@ -281,11 +283,10 @@ def plot_speedup_vs_L(results, output_path):
     # Shade region where CSE wins
     ax.fill_between(ax.get_xlim(), 1, ax.get_ylim()[1], alpha=0.1, color=OKABE_ITO['green'])
 
-    plt.tight_layout()
-    fig.savefig(output_path, dpi=300, bbox_inches='tight')
+    fig.savefig(output_path, dpi=300)
     # Also save PNG for preview
     png_path = str(output_path).replace('.pdf', '.png')
-    fig.savefig(png_path, dpi=300, bbox_inches='tight')
+    fig.savefig(png_path, dpi=300)
     plt.close(fig)
     print(f"Saved: {output_path}")
     print(f"Saved: {png_path}")
@@ -295,19 +296,22 @@ def plot_timing_vs_L(results, output_path):
     """
     Plot 3: Scaling with L showing timing for all implementations on log scale.
     """
+    import matplotlib.pyplot as plt
+
     configure_publication_style(font_scale=1.3)
 
-    fig, ax = plt.subplots(figsize=(COLUMN_WIDTHS['single'], 3.5))
+    fig, ax = plt.subplots(figsize=(COLUMN_WIDTHS['single'], 3.5), layout='tight')
 
     shell_pairs = [sp for sp in SHELL_PAIR_ORDER if sp in results]
+    shell_L = np.array([SHELL_PAIR_L[sp] for sp in shell_pairs])
 
     # Collect data for each implementation
     impl_data = {0: {'L': [], 'time': [], 'sp': []},
                  1: {'L': [], 'time': [], 'sp': []},
                  2: {'L': [], 'time': [], 'sp': []}}
 
-    for sp in shell_pairs:
-        L = SHELL_PAIR_L.get(sp, 0)
+    for sp, L in zip(shell_pairs, shell_L):
+        L = int(L)
         for impl in [0, 1, 2]:
             if impl in results[sp] and 'mean' in results[sp][impl]:
                 impl_data[impl]['L'].append(L)
@@ -341,11 +345,10 @@ def plot_timing_vs_L(results, output_path):
     ax.set_xlim(-0.3, 8.3)
     ax.set_xticks(range(9))
 
-    plt.tight_layout()
-    fig.savefig(output_path, dpi=300, bbox_inches='tight')
+    fig.savefig(output_path, dpi=300)
     # Also save PNG for preview
     png_path = str(output_path).replace('.pdf', '.png')
-    fig.savefig(png_path, dpi=300, bbox_inches='tight')
+    fig.savefig(png_path, dpi=300)
     plt.close(fig)
     print(f"Saved: {output_path}")
     print(f"Saved: {png_path}")
@@ -356,6 +359,7 @@ def generate_summary_table(results, output_path):
     Generate summary table showing winner for each shell pair.
     """
     shell_pairs = [sp for sp in SHELL_PAIR_ORDER if sp in results]
+    shell_L = np.array([SHELL_PAIR_L[sp] for sp in shell_pairs])
 
     lines = []
     lines.append("=" * 90)
@@ -367,8 +371,8 @@ def generate_summary_table(results, output_path):
 
     total_wins = {0: 0, 1: 0, 2: 0}
 
-    for sp in shell_pairs:
-        L = SHELL_PAIR_L.get(sp, 0)
+    for sp, L in zip(shell_pairs, shell_L):
+        L = int(L)
 
         times = {}
         for impl in [0, 1, 2]:
@@ -407,9 +411,8 @@ def generate_summary_table(results, output_path):
 
     print(f"Saved: {output_path}")
 
-    # Also print to console
-    for line in lines:
-        print(line)
+    # Also print to console (single write instead of one per line)
+    print('\n'.join(lines))
 
 
 def main():
@@ -17,13 +17,8 @@ from pathlib import Path
 from collections import defaultdict
 import numpy as np
 
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-
-# Publication style
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams.update({
+# Publication style, applied by configure_publication_style
+PUBLICATION_RC = {
     'font.size': 12,
     'axes.labelsize': 14,
     'axes.titlesize': 15,
@@ -32,9 +27,18 @@ plt.rcParams.update({
     'legend.fontsize': 11,
     'figure.dpi': 150,
     'savefig.dpi': 300,
-    'savefig.bbox': 'tight',
     'font.family': 'serif',
-})
+}
+
+
+def configure_publication_style():
+    """Configure matplotlib for publication-quality figures."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    plt.style.use('seaborn-v0_8-whitegrid')
+    plt.rcParams.update(PUBLICATION_RC)
 
 
 def load_benchmark_data(filepath):
@@ -85,6 +89,10 @@ def parse_benchmarks(data):
 
 def plot_shell_pair_comparison(stats, output_dir):
     """Generate bar chart comparing all shell pairs."""
+    import matplotlib.pyplot as plt
+
+    configure_publication_style()
+
     # Shell pairs in order of angular momentum
     shell_order = ['ss', 'sp', 'pp', 'sd', 'pd', 'sf', 'pf', 'dd', 'df', 'sg', 'pg', 'ff', 'dg', 'fg', 'gg']
 
@@ -105,7 +113,7 @@ def plot_shell_pair_comparison(stats, output_dir):
     x = np.arange(len(shells))
     width = 0.25
 
-    fig, ax = plt.subplots(figsize=(14, 6))
+    fig, ax = plt.subplots(figsize=(14, 6), layout='tight')
 
     bars1 = ax.bar(x - width, orig_times, width, label='Original TMP', color='#3498db',
                    yerr=orig_errs, capsize=3, alpha=0.8)
@@ -123,8 +131,6 @@ def plot_shell_pair_comparison(stats, output_dir):
     ax.legend(fontsize=12, loc='upper left')
     ax.grid(True, alpha=0.3, axis='y')
 
-    plt.tight_layout()
-
     for fmt in ['png', 'pdf']:
         fig.savefig(output_dir / f'fig1_shell_pair_comparison.{fmt}')
     plt.close(fig)
@@ -133,6 +139,10 @@ def plot_shell_pair_comparison(stats, output_dir):
 
 def plot_speedup_analysis(stats, output_dir):
     """Generate speedup analysis plot."""
+    import matplotlib.pyplot as plt
+
+    configure_publication_style()
+
     shell_order = ['ss', 'sp', 'pp', 'sd', 'pd', 'sf', 'pf', 'dd', 'df', 'sg', 'pg', 'ff', 'dg', 'fg', 'gg']
 
     shells = []
@@ -151,7 +161,7 @@ def plot_speedup_analysis(stats, output_dir):
             cse_vs_sym.append(sym / cse)    # >1 means CSE faster
             L_values.append(stats[(shell, 'CSE')]['L'])
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5), layout='tight')
 
     # Speedup vs Original TMP
     colors1 = ['#2ecc71' if s > 1 else '#e74c3c' for s in cse_vs_orig]
@@ -183,8 +193,7 @@ def plot_speedup_analysis(stats, output_dir):
                 f'{val:.2f}x', ha='center', va='bottom', fontsize=9)
 
     plt.suptitle('Speedup Analysis: Layered TMP with CSE\n(Green: CSE faster, Red: CSE slower)',
-                fontsize=14, y=1.02)
-    plt.tight_layout()
+                fontsize=14)
 
     for fmt in ['png', 'pdf']:
         fig.savefig(output_dir / f'fig2_speedup_analysis.{fmt}')
@@ -194,6 +203,10 @@ def plot_speedup_analysis(stats, output_dir):
 
 def plot_scaling_with_L(stats, output_dir):
     """Plot execution time vs angular momentum L."""
+    import matplotlib.pyplot as plt
+
+    configure_publication_style()
+
     shell_order = ['ss', 'sp', 'pp', 'sd', 'pd', 'sf', 'pf', 'dd', 'df', 'sg', 'pg', 'ff', 'dg', 'fg', 'gg']
 
     L_vals = []
@@ -207,7 +220,7 @@ def plot_scaling_with_L(stats, output_dir):
             cse_data.append((L, stats[(shell, 'CSE')]['mean'], stats[(shell, 'CSE')]['std']))
             sym_data.append((L, stats[(shell, 'Sym')]['mean'], stats[(shell, 'Sym')]['std']))
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = plt.subplots(figsize=(10, 6), layout='tight')
 
     # Plot with error bars
     L_unique = sorted(set(L_vals))
@@ -238,8 +251,6 @@ def plot_scaling_with_L(stats, output_dir):
     ax.grid(True, alpha=0.3)
     ax.set_xticks(range(9))
 
-    plt.tight_layout()
-
     for fmt in ['png', 'pdf']:
         fig.savefig(output_dir / f'fig3_scaling_with_L.{fmt}')
     plt.close(fig)
@@ -248,6 +259,10 @@ def plot_scaling_with_L(stats, output_dir):
 
 def plot_winner_analysis(stats, output_dir):
     """Show which implementation wins for each shell pair."""
+    import matplotlib.pyplot as plt
+
+    configure_publication_style()
+
     shell_order = ['ss', 'sp', 'pp', 'sd', 'pd', 'sf', 'pf', 'dd', 'df', 'sg', 'pg', 'ff', 'dg', 'fg', 'gg']
 
     data = []
@@ -270,7 +285,7 @@ def plot_winner_analysis(stats, output_dir):
                 'cse_improvement_vs_sym': (sym - cse) / sym * 100 if sym > 0 else 0
             })
 
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = plt.subplots(figsize=(12, 6), layout='tight')
 
     x = range(len(data))
     colors = ['#2ecc71' if d['winner'] == 'CSE' else '#e74c3c' if d['winner'] == 'Symbolic' else '#3498db'
@@ -291,8 +306,6 @@ def plot_winner_analysis(stats, output_dir):
     ax.legend(fontsize=11)
     ax.grid(True, alpha=0.3, axis='y')
 
-    plt.tight_layout()
-
     for fmt in ['png', 'pdf']:
         fig.savefig(output_dir / f'fig4_stacked_comparison.{fmt}')
     plt.close(fig)
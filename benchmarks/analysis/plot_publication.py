@@ -7,23 +7,42 @@ No theoretical values or estimates are used.
 """
 
 import json
+import multiprocessing
 import os
 import sys
+import warnings
 from pathlib import Path
 from collections import defaultdict
-import statistics
+
+from benchmark_json import NanToNullReader, load_or_parse, nan_to_null
 
 # Check for matplotlib
 try:
-    import matplotlib.pyplot as plt
+    import matplotlib
     import matplotlib.ticker as ticker
+    from matplotlib.figure import Figure
+    from matplotlib.colors import to_rgba
     import numpy as np
 except ImportError:
     print("Error: matplotlib and numpy required. Install with: pip install matplotlib numpy")
     sys.exit(1)
 
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+    simdjson = None
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None
+
 # Publication-quality settings
-plt.rcParams.update({
+matplotlib.rcParams.update({
     'font.family': 'serif',
     'font.serif': ['Times New Roman', 'DejaVu Serif', 'serif'],
     'font.size': 10,
@@ -32,10 +51,8 @@ plt.rcParams.update({
     'xtick.labelsize': 9,
     'ytick.labelsize': 9,
     'legend.fontsize': 9,
-    'figure.dpi': 150,
+    'figure.dpi': 72,
     'savefig.dpi': 300,
-    'savefig.bbox': 'tight',
-    'savefig.pad_inches': 0.1,
     'axes.grid': True,
     'grid.alpha': 0.3,
     'axes.axisbelow': True,
@@ -50,22 +67,72 @@ COLORS = {
 }
 
 
-def load_benchmark_data(json_path):
-    """Load and parse benchmark JSON data."""
-    import re
-    with open(json_path, 'r') as f:
-        content = f.read()
+def iter_benchmark_json(json_path):
+    """
+    Return (context, benchmarks) using the fastest available parser.
+
+    simdjson parses the whole file at once but only materializes the fields
+    that are accessed; ijson streams entries one at a time.
+    """
+    if SIMDJSON_AVAILABLE:
+        doc = simdjson.Parser().parse(nan_to_null(Path(json_path).read_bytes()))
+        context = doc.get('context')
+        return context.as_dict() if context is not None else {}, doc.get('benchmarks', [])
+
+    if IJSON_AVAILABLE:
+        with open(json_path, 'rb') as f:
+            context = next(ijson.items(NanToNullReader(f), 'context'), {})
+
+        def stream():
+            with open(json_path, 'rb') as f:
+                yield from ijson.items(NanToNullReader(f), 'benchmarks.item', use_float=True)
+
+        return context, stream()
+
     # Fix invalid JSON: replace -nan and nan with null
-    content = re.sub(r':\s*-?nan\b', ': null', content)
-    data = json.loads(content)
+    data = json.loads(nan_to_null(Path(json_path).read_bytes()))
+    return data.get('context', {}), data.get('benchmarks', [])
+
+
+def group_mean_std(groups):
+    """
+    Return (mean, sample std) arrays for a non-empty list of timing lists.
+
+    The groups are packed into one NaN-padded 2-D array so both statistics are
+    single vectorized reductions; single-sample groups get a std of 0.0.
+    """
+    lengths = np.fromiter(map(len, groups), dtype=np.intp, count=len(groups))
+    padded = np.full((len(groups), lengths.max()), np.nan)
+    padded[np.arange(padded.shape[1]) < lengths[:, None]] = np.concatenate(groups)
+    with warnings.catch_warnings():
+        # nanstd warns about rows with fewer than two samples; those become 0.0
+        warnings.simplefilter('ignore', RuntimeWarning)
+        stds = np.nanstd(padded, axis=1, ddof=1)
+    return np.nanmean(padded, axis=1), np.nan_to_num(stds)
+
+
+def load_benchmark_data(json_path, cache_dir=None):
+    """
+    Load and parse benchmark JSON data.
+
+    With a cache_dir the aggregated results are reused while the JSON file is
+    unchanged (see benchmark_json.load_or_parse).
+    """
+    return load_or_parse(json_path, aggregate_benchmarks, cache_dir,
+                         loader=iter_benchmark_json)
+
+
+def aggregate_benchmarks(parsed):
+    """Group the (context, benchmarks) from iter_benchmark_json into (mean, std) per key."""
+    context, benchmarks = parsed
 
     results = {
-        'context': data.get('context', {}),
+        'context': context,
         'scaling': {'TMP': {}, 'Symbolic': {}},
         'compare': {'TMP': {}, 'Symbolic': {}},
     }
 
-    for bench in data.get('benchmarks', []):
+    for bench in benchmarks:
         # Skip aggregate results (we'll compute our own)
         if bench.get('aggregate_name'):
             continue
@@ -96,26 +163,59 @@ def load_benchmark_data(json_path):
                 results['compare'][impl_name][key] = []
             results['compare'][impl_name][key].append(real_time)
 
+    # Reduce each group's samples to (mean, std) once so the plots and the
+    # summary table share the statistics instead of recomputing them
+    for section in ('scaling', 'compare'):
+        for impl_data in results[section].values():
+            if impl_data:
+                means, stds = group_mean_std(list(impl_data.values()))
+                impl_data.update(zip(impl_data, zip(means.tolist(), stds.tolist())))
+
     return results
 
 
-def plot_scaling_comparison(results, output_dir):
+def sorted_common_keys(tmp_data, sym_data):
+    """Return the (nA, nB, t) keys present in both dicts, ordered by (nA+nB, nA, nB, t)."""
+    keys = np.array(list(tmp_data.keys() & sym_data.keys()), dtype=np.int64).reshape(-1, 3)
+    nA, nB, t = keys.T
+    order = np.lexsort((t, nB, nA, nA + nB))
+    return list(map(tuple, keys[order].tolist()))
+
+
+def new_figure(figsize):
+    """
+    Create a figure with a single axes without going through pyplot.
+
+    The figure is never registered with a pyplot figure manager, so it needs
+    no explicit close and is freed as soon as the plot function returns.
+    """
+    fig = Figure(figsize=figsize, layout='tight')
+    return fig, fig.add_subplot()
+
+
+def save_figure(fig, output_dir, name, formats):
+    """Save figure once per requested format."""
+    for fmt in formats:
+        output_path = os.path.join(output_dir, f'{name}.{fmt}')
+        fig.savefig(output_path)
+        print(f"Generated: {output_path}")
+
+
+def plot_scaling_comparison(results, output_dir, formats=('png',)):
     """Plot 1: Performance scaling with angular momentum."""
-    fig, ax = plt.subplots(figsize=(6, 4.5))
+    fig, ax = new_figure((6, 4.5))
 
     for impl_name in ['TMP', 'Symbolic']:
         L_values = sorted(results['scaling'][impl_name].keys())
-        means = []
-        stds = []
-
-        for L in L_values:
-            times = results['scaling'][impl_name][L]
-            means.append(statistics.mean(times))
-            stds.append(statistics.stdev(times) if len(times) > 1 else 0)
+        # reshape keeps an implementation without scaling entries as two empty columns
+        means, stds = np.array([results['scaling'][impl_name][L] for L in L_values]).reshape(-1, 2).T
 
-        ax.errorbar(L_values, means, yerr=stds,
-                   marker='o', markersize=8, capsize=5, linewidth=2,
-                   color=COLORS[impl_name], label=impl_name)
+        # One line plus one shaded band per implementation instead of
+        # per-point error bar and cap artists
+        ax.plot(L_values, means, marker='o', markersize=8, linewidth=2,
+                color=COLORS[impl_name], label=impl_name)
+        ax.fill_between(L_values, means - stds, means + stds,
+                        color=COLORS[impl_name], alpha=0.2, linewidth=0)
 
     ax.set_xlabel('Total Angular Momentum ($L_A + L_B$)')
     ax.set_ylabel('Execution Time (ns)')
@@ -123,45 +223,30 @@ def plot_scaling_comparison(results, output_dir):
     ax.legend(frameon=True, fancybox=False, edgecolor='black')
     ax.set_xticks([0, 2, 4, 6])
 
-    plt.tight_layout()
-    output_path = os.path.join(output_dir, 'fig1_scaling_comparison.png')
-    plt.savefig(output_path)
-    plt.savefig(output_path.replace('.png', '.pdf'))
-    plt.close()
-    print(f"Generated: {output_path}")
+    save_figure(fig, output_dir, 'fig1_scaling_comparison', formats)
 
 
-def plot_speedup_analysis(results, output_dir):
+def plot_speedup_analysis(results, output_dir, formats=('png',)):
     """Plot 2: Speedup analysis with crossover point."""
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = new_figure((8, 5))
 
-    # Calculate speedups for E^{3,3}_t coefficients
-    speedups = {}
     tmp_data = results['compare']['TMP']
     sym_data = results['compare']['Symbolic']
 
-    # Focus on (3,3,t) coefficients for clear crossover visualization
-    for key in tmp_data:
-        if key in sym_data:
-            tmp_mean = statistics.mean(tmp_data[key])
-            sym_mean = statistics.mean(sym_data[key])
-            speedup = sym_mean / tmp_mean  # >1 means TMP faster
-            speedups[key] = {
-                'speedup': speedup,
-                'tmp_time': tmp_mean,
-                'sym_time': sym_mean
-            }
-
     # Sort by (nA+nB, t) for grouping
-    sorted_keys = sorted(speedups.keys(), key=lambda x: (x[0] + x[1], x[0], x[1], x[2]))
+    sorted_keys = sorted_common_keys(tmp_data, sym_data)
+
+    # Speedups for all coefficients in one vectorized division (>1 means TMP faster)
+    tmp_means = np.array([tmp_data[k][0] for k in sorted_keys])
+    sym_means = np.array([sym_data[k][0] for k in sorted_keys])
+    values = sym_means / tmp_means
 
     labels = [f"E({k[0]},{k[1]},{k[2]})" for k in sorted_keys]
-    values = [speedups[k]['speedup'] for k in sorted_keys]
 
     x = np.arange(len(labels))
 
     # Color bars based on which implementation is faster
-    colors = [COLORS['TMP'] if v > 1 else COLORS['Symbolic'] for v in values]
+    colors = np.where((values > 1)[:, None], to_rgba(COLORS['TMP']), to_rgba(COLORS['Symbolic']))
 
     bars = ax.bar(x, values, color=colors, edgecolor='black', linewidth=0.5, alpha=0.8)
 
@@ -190,17 +275,12 @@ def plot_speedup_analysis(results, output_dir):
     ]
     ax.legend(handles=legend_elements, loc='upper right', frameon=True)
 
-    plt.tight_layout()
-    output_path = os.path.join(output_dir, 'fig2_speedup_analysis.png')
-    plt.savefig(output_path)
-    plt.savefig(output_path.replace('.png', '.pdf'))
-    plt.close()
-    print(f"Generated: {output_path}")
+    save_figure(fig, output_dir, 'fig2_speedup_analysis', formats)
 
 
-def plot_ff_crossover(results, output_dir):
+def plot_ff_crossover(results, output_dir, formats=('png',)):
     """Plot 3: Focus on (ff) shell pair crossover point."""
-    fig, ax = plt.subplots(figsize=(7, 5))
+    fig, ax = new_figure((7, 5))
 
     tmp_data = results['compare']['TMP']
     sym_data = results['compare']['Symbolic']
@@ -216,10 +296,8 @@ def plot_ff_crossover(results, output_dir):
         return
 
     t_values = [c[0][2] for c in ff_coeffs]
-    tmp_means = [statistics.mean(c[1]) for c in ff_coeffs]
-    tmp_stds = [statistics.stdev(c[1]) if len(c[1]) > 1 else 0 for c in ff_coeffs]
-    sym_means = [statistics.mean(c[2]) for c in ff_coeffs]
-    sym_stds = [statistics.stdev(c[2]) if len(c[2]) > 1 else 0 for c in ff_coeffs]
+    tmp_means, tmp_stds = zip(*(c[1] for c in ff_coeffs))
+    sym_means, sym_stds = zip(*(c[2] for c in ff_coeffs))
 
     x = np.array(t_values)
 
@@ -252,17 +330,12 @@ def plot_ff_crossover(results, output_dir):
                fontsize=9, ha='center',
                arrowprops=dict(arrowstyle='->', color='gray'))
 
-    plt.tight_layout()
-    output_path = os.path.join(output_dir, 'fig3_ff_crossover.png')
-    plt.savefig(output_path)
-    plt.savefig(output_path.replace('.png', '.pdf'))
-    plt.close()
-    print(f"Generated: {output_path}")
+    save_figure(fig, output_dir, 'fig3_ff_crossover', formats)
 
 
-def plot_comparison_bars(results, output_dir):
+def plot_comparison_bars(results, output_dir, formats=('png',)):
     """Plot 4: Side-by-side bar comparison for selected coefficients."""
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig, ax = new_figure((10, 5))
 
     tmp_data = results['compare']['TMP']
     sym_data = results['compare']['Symbolic']
@@ -274,10 +347,10 @@ def plot_comparison_bars(results, output_dir):
 
     labels = [f"$E^{{{k[0]},{k[1]}}}_{k[2]}$" for k in selected]
 
-    tmp_means = [statistics.mean(tmp_data[k]) for k in selected]
-    tmp_stds = [statistics.stdev(tmp_data[k]) if len(tmp_data[k]) > 1 else 0 for k in selected]
-    sym_means = [statistics.mean(sym_data[k]) for k in selected]
-    sym_stds = [statistics.stdev(sym_data[k]) if len(sym_data[k]) > 1 else 0 for k in selected]
+    tmp_means = [tmp_data[k][0] for k in selected]
+    tmp_stds = [tmp_data[k][1] for k in selected]
+    sym_means = [sym_data[k][0] for k in selected]
+    sym_stds = [sym_data[k][1] for k in selected]
 
     x = np.arange(len(selected))
     width = 0.35
@@ -289,15 +362,16 @@ def plot_comparison_bars(results, output_dir):
            label='Symbolic', color=COLORS['Symbolic'], edgecolor='black',
            linewidth=0.5, capsize=3)
 
-    # Add speedup annotations
-    for i, (tmp, sym) in enumerate(zip(tmp_means, sym_means)):
-        if tmp > 0 and sym > 0:
-            speedup = sym / tmp
-            color = 'green' if speedup > 1 else 'red'
-            marker = '+' if speedup > 1 else ''
-            ax.annotate(f'{marker}{(speedup-1)*100:.0f}%',
-                       xy=(i, max(tmp, sym) * 1.05),
-                       ha='center', fontsize=7, color=color, fontweight='bold')
+    # Add speedup annotations (arithmetic for all bars in one pass)
+    tmp_arr = np.asarray(tmp_means)
+    sym_arr = np.asarray(sym_means)
+    valid = (tmp_arr > 0) & (sym_arr > 0)
+    speedups = sym_arr[valid] / tmp_arr[valid]
+    heights = np.maximum(tmp_arr[valid], sym_arr[valid]) * 1.05
+    colors = np.where(speedups > 1, 'green', 'red')
+    texts = [f"{'+' if s > 1 else ''}{(s - 1) * 100:.0f}%" for s in speedups]
+    for xi, h, text, color in zip(x[valid], heights, texts, colors):
+        ax.text(xi, h, text, ha='center', fontsize=7, color=color, fontweight='bold')
 
     ax.set_xlabel('Hermite E Coefficient')
     ax.set_ylabel('Execution Time (ns)')
@@ -307,12 +381,7 @@ def plot_comparison_bars(results, output_dir):
     ax.legend(frameon=True, fancybox=False, edgecolor='black')
     ax.set_yscale('log')
 
-    plt.tight_layout()
-    output_path = os.path.join(output_dir, 'fig4_comparison_bars.png')
-    plt.savefig(output_path)
-    plt.savefig(output_path.replace('.png', '.pdf'))
-    plt.close()
-    print(f"Generated: {output_path}")
+    save_figure(fig, output_dir, 'fig4_comparison_bars', formats)
 
 
 def generate_summary_table(results, output_dir):
@@ -328,12 +397,11 @@ def generate_summary_table(results, output_dir):
         "|-------------|----------|---------------|---------|--------|",
     ]
 
-    sorted_keys = sorted(set(tmp_data.keys()) & set(sym_data.keys()),
-                        key=lambda x: (x[0] + x[1], x[0], x[1], x[2]))
+    sorted_keys = sorted_common_keys(tmp_data, sym_data)
 
     for key in sorted_keys:
-        tmp_mean = statistics.mean(tmp_data[key])
-        sym_mean = statistics.mean(sym_data[key])
+        tmp_mean = tmp_data[key][0]
+        sym_mean = sym_data[key][0]
         speedup = sym_mean / tmp_mean
         faster = "TMP" if speedup > 1 else "Symbolic"
         lines.append(f"| E^{{{key[0]},{key[1]}}}_{key[2]} | {tmp_mean:.2f} | {sym_mean:.2f} | {speedup:.2f}x | {faster} |")
@@ -356,6 +424,11 @@ def generate_summary_table(results, output_dir):
     print(f"Generated: {output_path}")
 
 
+def run_task(func, args):
+    """Call func(*args); module-level so it can be sent to worker processes."""
+    return func(*args)
+
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description='Generate publication plots from benchmark data')
@@ -364,7 +437,14 @@ def main():
                        help='Input JSON benchmark file')
     parser.add_argument('--output-dir', default='../results/figures',
                        help='Output directory for figures')
+    parser.add_argument('--formats', default='png',
+                       help='Comma-separated figure formats, e.g. png,pdf (default: png)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always re-parse the benchmark JSON instead of using cached statistics')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Worker processes for figure generation (default: 1, render in this process)')
     args = parser.parse_args()
+    formats = args.formats.split(',')
 
     # Resolve paths relative to script location
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -378,16 +458,28 @@ def main():
     os.makedirs(output_dir, exist_ok=True)
 
     print(f"Loading benchmark data from: {json_path}")
-    results = load_benchmark_data(json_path)
+    cache_dir = None if args.no_cache else Path(json_path).parent / '.stats_cache'
+    results = load_benchmark_data(json_path, cache_dir)
 
     print(f"\nGenerating publication-quality figures...")
     print(f"Output directory: {output_dir}\n")
 
-    plot_scaling_comparison(results, output_dir)
-    plot_speedup_analysis(results, output_dir)
-    plot_ff_crossover(results, output_dir)
-    plot_comparison_bars(results, output_dir)
-    generate_summary_table(results, output_dir)
+    # The figures are independent, so render them in parallel
+    tasks = [
+        (plot_scaling_comparison, (results, output_dir, formats)),
+        (plot_speedup_analysis, (results, output_dir, formats)),
+        (plot_ff_crossover, (results, output_dir, formats)),
+        (plot_comparison_bars, (results, output_dir, formats)),
+        (generate_summary_table, (results, output_dir)),
+    ]
+    jobs = min(args.jobs, len(tasks))
+    if jobs > 1:
+        # spawn avoids forking a process that has already initialized matplotlib
+        with multiprocessing.get_context('spawn').Pool(jobs) as pool:
+            pool.starmap(run_task, tasks)
+    else:
+        for func, func_args in tasks:
+            run_task(func, func_args)
 
     print(f"\nAll figures generated successfully!")
     print("Note: All plots are based exclusively on actual benchmark measurements.")
@@ -5,12 +5,19 @@
  * AUTO-GENERATED - DO NOT EDIT MANUALLY
  *
  * Coverage: E^{0,0}_0 to E^{4,4}_{8} (125 coefficients)
- * Also includes gradient dispatchers for dE/dPA, dE/dPB
+ * Also includes gradient dispatchers for dE/dPA, dE/dPB, and a layer
+ * dispatcher that fills every t of one (nA, nB) with a single fused call
+ *
+ * Each dispatcher is a flat constexpr table of plain function pointers indexed
+ * by nA * STRIDE_NA + nB * STRIDE_NB + t, so a call is one unsigned compare
+ * and a single indirect call. computeSymbolic and computeSymbolicGradPA
+ * instead go through nested switches of direct calls, which fold away for
+ * compile-time indices; define RECURSUM_USE_TABLE_DISPATCH to route them
+ * through the tables.
  */
 
 #pragma once
 
-#include <functional>
 #include <array>
 #include <stdexcept>
 
@@ -20,7 +27,31 @@
 
 #include <recursum/mcmd/hermite_e.hpp>
 #include <recursum/mcmd/hermite_grad.hpp>
-#include "hermite_e_symbolic.hpp"
+#include "hermite_e_symbolic_0_0.hpp"
+#include "hermite_e_symbolic_0_1.hpp"
+#include "hermite_e_symbolic_0_2.hpp"
+#include "hermite_e_symbolic_0_3.hpp"
+#include "hermite_e_symbolic_0_4.hpp"
+#include "hermite_e_symbolic_1_0.hpp"
+#include "hermite_e_symbolic_1_1.hpp"
+#include "hermite_e_symbolic_1_2.hpp"
+#include "hermite_e_symbolic_1_3.hpp"
+#include "hermite_e_symbolic_1_4.hpp"
+#include "hermite_e_symbolic_2_0.hpp"
+#include "hermite_e_symbolic_2_1.hpp"
+#include "hermite_e_symbolic_2_2.hpp"
+#include "hermite_e_symbolic_2_3.hpp"
+#include "hermite_e_symbolic_2_4.hpp"
+#include "hermite_e_symbolic_3_0.hpp"
+#include "hermite_e_symbolic_3_1.hpp"
+#include "hermite_e_symbolic_3_2.hpp"
+#include "hermite_e_symbolic_3_3.hpp"
+#include "hermite_e_symbolic_3_4.hpp"
+#include "hermite_e_symbolic_4_0.hpp"
+#include "hermite_e_symbolic_4_1.hpp"
+#include "hermite_e_symbolic_4_2.hpp"
+#include "hermite_e_symbolic_4_3.hpp"
+#include "hermite_e_symbolic_4_4.hpp"
 #include "hermite_grad_symbolic.hpp"
 
 namespace recursum {
@@ -33,12 +64,40 @@ constexpr int BENCH_MAX_N = 2 * BENCH_MAX_L;  // Max t index = 8
 /**
  * @brief Function signature for coefficient evaluation
  */
-using CoeffFunction = std::function<Vec8d(const Vec8d&, const Vec8d&, const Vec8d&)>;
+using CoeffFunction = Vec8d (*)(const Vec8d&, const Vec8d&, const Vec8d&);
 
 /**
  * @brief Function signature for gradient evaluation (5 params)
  */
-using GradFunction = std::function<Vec8d(const Vec8d&, const Vec8d&, const Vec8d&, const Vec8d&, const Vec8d&)>;
+using GradFunction = Vec8d (*)(const Vec8d&, const Vec8d&, const Vec8d&, const Vec8d&, const Vec8d&);
+
+/**
+ * @brief Function signature for a fused layer writing E^{nA,nB}_t for every t
+ */
+using LayerFunction = void (*)(Vec8d, Vec8d, Vec8d, Vec8d*);
+
+namespace detail {
+
+// Free-function adapters with the CoeffFunction signature, one instantiation
+// per table slot
+
+template<int NA, int NB, int T>
+inline Vec8d tmp_hermite_e(const Vec8d& pa, const Vec8d& pb, const Vec8d& p) {
+    return mcmd::HermiteE<NA, NB, T>::compute(pa, pb, p);
+}
+
+template<int NA, int NB, int T>
+inline Vec8d tmp_hermite_dE_dPA(const Vec8d& pa, const Vec8d& pb, const Vec8d& p) {
+    return mcmd::HermiteDerivPA<NA, NB, T>::compute(pa, pb, p);
+}
+
+// The symbolic kernels take their arguments by value
+template<Vec8d (*F)(Vec8d, Vec8d, Vec8d)>
+inline Vec8d by_ref(const Vec8d& pa, const Vec8d& pb, const Vec8d& p) {
+    return F(pa, pb, p);
+}
+
+} // namespace detail
 
 // =============================================================================
 // TMP DISPATCHER
@@ -54,85 +113,90 @@ public:
     static constexpr int MAX_NB = BENCH_MAX_L;
     static constexpr int MAX_N = BENCH_MAX_N;
 
-    using NTable = std::array<CoeffFunction, MAX_N + 1>;
-    using NBTable = std::array<NTable, MAX_NB + 1>;
-    using DispatchTable = std::array<NBTable, MAX_NA + 1>;
+    static constexpr unsigned STRIDE_NB = MAX_N + 1;
+    static constexpr unsigned STRIDE_NA = (MAX_NB + 1) * STRIDE_NB;
+    static constexpr unsigned TABLE_SIZE = (MAX_NA + 1) * STRIDE_NA;
 
     static const TMPDispatcher& instance() {
         static TMPDispatcher dispatcher;
         return dispatcher;
     }
 
+    /**
+     * Indices outside 0 <= nA <= MAX_NA, 0 <= nB <= MAX_NB, 0 <= t <= MAX_N
+     * (negative ones wrap to large unsigned values) and t > nA + nB yield zero.
+     */
     Vec8d compute(int nA, int nB, int t,
                   const Vec8d& PA, const Vec8d& PB, const Vec8d& p) const {
-        if (nA < 0 || nA > MAX_NA || nB < 0 || nB > MAX_NB ||
-            t < 0 || t > MAX_N || t > nA + nB) {
-            return Vec8d(0.0);
-        }
-        const auto& func = table_[nA][nB][t];
-        if (!func) return Vec8d(0.0);
-        return func(PA, PB, p);
+        // Each index is bounded on its own: a packed-index check alone would
+        // let an out-of-range nB or t alias into a neighbouring row
+        if (static_cast<unsigned>(nA) > static_cast<unsigned>(MAX_NA) ||
+            static_cast<unsigned>(nB) > static_cast<unsigned>(MAX_NB) ||
+            static_cast<unsigned>(t) > static_cast<unsigned>(MAX_N)) return Vec8d(0.0);
+        const unsigned idx = nA * STRIDE_NA + nB * STRIDE_NB + t;
+        if (!table_[idx]) return Vec8d(0.0);
+        return table_[idx](PA, PB, p);
     }
 
     TMPDispatcher(const TMPDispatcher&) = delete;
     TMPDispatcher& operator=(const TMPDispatcher&) = delete;
 
 private:
-    TMPDispatcher() {
-        for (auto& na_slice : table_) {
-            for (auto& nb_slice : na_slice) {
-                for (auto& func : nb_slice) {
-                    func = nullptr;
-                }
-            }
-        }
-        registerAll();
-    }
-
-    template<int NA, int NB, int T>
-    void registerCoeff() {
-        table_[NA][NB][T] = [](const Vec8d& pa, const Vec8d& pb, const Vec8d& p) -> Vec8d {
-            return mcmd::HermiteE<NA, NB, T>::compute(pa, pb, p);
-        };
-    }
+    TMPDispatcher() = default;
 
-    template<int NA, int NB, int T>
-    struct RegisterT {
-        static void apply(TMPDispatcher* d) {
-            if constexpr (T <= NA + NB && T <= MAX_N) {
-                d->registerCoeff<NA, NB, T>();
-                if constexpr (T + 1 <= NA + NB && T + 1 <= MAX_N) {
-                    RegisterT<NA, NB, T + 1>::apply(d);
-                }
-            }
-        }
+    // Filled at compile time; slots with t > nA + nB are nullptr
+    static constexpr CoeffFunction table_[TABLE_SIZE] = {
+        // nA = 0, nB = 0
+        &detail::tmp_hermite_e<0, 0, 0>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 1
+        &detail::tmp_hermite_e<0, 1, 0>, &detail::tmp_hermite_e<0, 1, 1>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 2
+        &detail::tmp_hermite_e<0, 2, 0>, &detail::tmp_hermite_e<0, 2, 1>, &detail::tmp_hermite_e<0, 2, 2>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 3
+        &detail::tmp_hermite_e<0, 3, 0>, &detail::tmp_hermite_e<0, 3, 1>, &detail::tmp_hermite_e<0, 3, 2>, &detail::tmp_hermite_e<0, 3, 3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 4
+        &detail::tmp_hermite_e<0, 4, 0>, &detail::tmp_hermite_e<0, 4, 1>, &detail::tmp_hermite_e<0, 4, 2>, &detail::tmp_hermite_e<0, 4, 3>, &detail::tmp_hermite_e<0, 4, 4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 0
+        &detail::tmp_hermite_e<1, 0, 0>, &detail::tmp_hermite_e<1, 0, 1>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 1
+        &detail::tmp_hermite_e<1, 1, 0>, &detail::tmp_hermite_e<1, 1, 1>, &detail::tmp_hermite_e<1, 1, 2>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 2
+        &detail::tmp_hermite_e<1, 2, 0>, &detail::tmp_hermite_e<1, 2, 1>, &detail::tmp_hermite_e<1, 2, 2>, &detail::tmp_hermite_e<1, 2, 3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 3
+        &detail::tmp_hermite_e<1, 3, 0>, &detail::tmp_hermite_e<1, 3, 1>, &detail::tmp_hermite_e<1, 3, 2>, &detail::tmp_hermite_e<1, 3, 3>, &detail::tmp_hermite_e<1, 3, 4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 4
+        &detail::tmp_hermite_e<1, 4, 0>, &detail::tmp_hermite_e<1, 4, 1>, &detail::tmp_hermite_e<1, 4, 2>, &detail::tmp_hermite_e<1, 4, 3>, &detail::tmp_hermite_e<1, 4, 4>, &detail::tmp_hermite_e<1, 4, 5>, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 0
+        &detail::tmp_hermite_e<2, 0, 0>, &detail::tmp_hermite_e<2, 0, 1>, &detail::tmp_hermite_e<2, 0, 2>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 1
+        &detail::tmp_hermite_e<2, 1, 0>, &detail::tmp_hermite_e<2, 1, 1>, &detail::tmp_hermite_e<2, 1, 2>, &detail::tmp_hermite_e<2, 1, 3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 2
+        &detail::tmp_hermite_e<2, 2, 0>, &detail::tmp_hermite_e<2, 2, 1>, &detail::tmp_hermite_e<2, 2, 2>, &detail::tmp_hermite_e<2, 2, 3>, &detail::tmp_hermite_e<2, 2, 4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 3
+        &detail::tmp_hermite_e<2, 3, 0>, &detail::tmp_hermite_e<2, 3, 1>, &detail::tmp_hermite_e<2, 3, 2>, &detail::tmp_hermite_e<2, 3, 3>, &detail::tmp_hermite_e<2, 3, 4>, &detail::tmp_hermite_e<2, 3, 5>, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 4
+        &detail::tmp_hermite_e<2, 4, 0>, &detail::tmp_hermite_e<2, 4, 1>, &detail::tmp_hermite_e<2, 4, 2>, &detail::tmp_hermite_e<2, 4, 3>, &detail::tmp_hermite_e<2, 4, 4>, &detail::tmp_hermite_e<2, 4, 5>, &detail::tmp_hermite_e<2, 4, 6>, nullptr, nullptr,
+        // nA = 3, nB = 0
+        &detail::tmp_hermite_e<3, 0, 0>, &detail::tmp_hermite_e<3, 0, 1>, &detail::tmp_hermite_e<3, 0, 2>, &detail::tmp_hermite_e<3, 0, 3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 3, nB = 1
+        &detail::tmp_hermite_e<3, 1, 0>, &detail::tmp_hermite_e<3, 1, 1>, &detail::tmp_hermite_e<3, 1, 2>, &detail::tmp_hermite_e<3, 1, 3>, &detail::tmp_hermite_e<3, 1, 4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 3, nB = 2
+        &detail::tmp_hermite_e<3, 2, 0>, &detail::tmp_hermite_e<3, 2, 1>, &detail::tmp_hermite_e<3, 2, 2>, &detail::tmp_hermite_e<3, 2, 3>, &detail::tmp_hermite_e<3, 2, 4>, &detail::tmp_hermite_e<3, 2, 5>, nullptr, nullptr, nullptr,
+        // nA = 3, nB = 3
+        &detail::tmp_hermite_e<3, 3, 0>, &detail::tmp_hermite_e<3, 3, 1>, &detail::tmp_hermite_e<3, 3, 2>, &detail::tmp_hermite_e<3, 3, 3>, &detail::tmp_hermite_e<3, 3, 4>, &detail::tmp_hermite_e<3, 3, 5>, &detail::tmp_hermite_e<3, 3, 6>, nullptr, nullptr,
+        // nA = 3, nB = 4
+        &detail::tmp_hermite_e<3, 4, 0>, &detail::tmp_hermite_e<3, 4, 1>, &detail::tmp_hermite_e<3, 4, 2>, &detail::tmp_hermite_e<3, 4, 3>, &detail::tmp_hermite_e<3, 4, 4>, &detail::tmp_hermite_e<3, 4, 5>, &detail::tmp_hermite_e<3, 4, 6>, &detail::tmp_hermite_e<3, 4, 7>, nullptr,
+        // nA = 4, nB = 0
+        &detail::tmp_hermite_e<4, 0, 0>, &detail::tmp_hermite_e<4, 0, 1>, &detail::tmp_hermite_e<4, 0, 2>, &detail::tmp_hermite_e<4, 0, 3>, &detail::tmp_hermite_e<4, 0, 4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 4, nB = 1
+        &detail::tmp_hermite_e<4, 1, 0>, &detail::tmp_hermite_e<4, 1, 1>, &detail::tmp_hermite_e<4, 1, 2>, &detail::tmp_hermite_e<4, 1, 3>, &detail::tmp_hermite_e<4, 1, 4>, &detail::tmp_hermite_e<4, 1, 5>, nullptr, nullptr, nullptr,
+        // nA = 4, nB = 2
+        &detail::tmp_hermite_e<4, 2, 0>, &detail::tmp_hermite_e<4, 2, 1>, &detail::tmp_hermite_e<4, 2, 2>, &detail::tmp_hermite_e<4, 2, 3>, &detail::tmp_hermite_e<4, 2, 4>, &detail::tmp_hermite_e<4, 2, 5>, &detail::tmp_hermite_e<4, 2, 6>, nullptr, nullptr,
+        // nA = 4, nB = 3
+        &detail::tmp_hermite_e<4, 3, 0>, &detail::tmp_hermite_e<4, 3, 1>, &detail::tmp_hermite_e<4, 3, 2>, &detail::tmp_hermite_e<4, 3, 3>, &detail::tmp_hermite_e<4, 3, 4>, &detail::tmp_hermite_e<4, 3, 5>, &detail::tmp_hermite_e<4, 3, 6>, &detail::tmp_hermite_e<4, 3, 7>, nullptr,
+        // nA = 4, nB = 4
+        &detail::tmp_hermite_e<4, 4, 0>, &detail::tmp_hermite_e<4, 4, 1>, &detail::tmp_hermite_e<4, 4, 2>, &detail::tmp_hermite_e<4, 4, 3>, &detail::tmp_hermite_e<4, 4, 4>, &detail::tmp_hermite_e<4, 4, 5>, &detail::tmp_hermite_e<4, 4, 6>, &detail::tmp_hermite_e<4, 4, 7>, &detail::tmp_hermite_e<4, 4, 8>,
     };
-
-    template<int NA, int NB>
-    struct RegisterNB {
-        static void apply(TMPDispatcher* d) {
-            RegisterT<NA, NB, 0>::apply(d);
-            if constexpr (NB + 1 <= MAX_NB) {
-                RegisterNB<NA, NB + 1>::apply(d);
-            }
-        }
-    };
-
-    template<int NA>
-    struct RegisterNA {
-        static void apply(TMPDispatcher* d) {
-            RegisterNB<NA, 0>::apply(d);
-            if constexpr (NA + 1 <= MAX_NA) {
-                RegisterNA<NA + 1>::apply(d);
-            }
-        }
-    };
-
-    void registerAll() {
-        RegisterNA<0>::apply(this);
-    }
-
-    DispatchTable table_;
 };
 
 // =============================================================================
@@ -149,420 +213,153 @@ public:
     static constexpr int MAX_NB = BENCH_MAX_L;
     static constexpr int MAX_N = BENCH_MAX_N;
 
-    using NTable = std::array<CoeffFunction, MAX_N + 1>;
-    using NBTable = std::array<NTable, MAX_NB + 1>;
-    using DispatchTable = std::array<NBTable, MAX_NA + 1>;
+    static constexpr unsigned STRIDE_NB = MAX_N + 1;
+    static constexpr unsigned STRIDE_NA = (MAX_NB + 1) * STRIDE_NB;
+    static constexpr unsigned TABLE_SIZE = (MAX_NA + 1) * STRIDE_NA;
 
     static const SymbolicDispatcher& instance() {
         static SymbolicDispatcher dispatcher;
         return dispatcher;
     }
 
+    /**
+     * Indices outside 0 <= nA <= MAX_NA, 0 <= nB <= MAX_NB, 0 <= t <= MAX_N
+     * (negative ones wrap to large unsigned values) and t > nA + nB yield zero.
+     */
     Vec8d compute(int nA, int nB, int t,
                   const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p) const {
-        if (nA < 0 || nA > MAX_NA || nB < 0 || nB > MAX_NB ||
-            t < 0 || t > MAX_N || t > nA + nB) {
-            return Vec8d(0.0);
-        }
-        const auto& func = table_[nA][nB][t];
-        if (!func) return Vec8d(0.0);
-        return func(PA, PB, one_over_2p);
+        // Each index is bounded on its own: a packed-index check alone would
+        // let an out-of-range nB or t alias into a neighbouring row
+        if (static_cast<unsigned>(nA) > static_cast<unsigned>(MAX_NA) ||
+            static_cast<unsigned>(nB) > static_cast<unsigned>(MAX_NB) ||
+            static_cast<unsigned>(t) > static_cast<unsigned>(MAX_N)) return Vec8d(0.0);
+        const unsigned idx = nA * STRIDE_NA + nB * STRIDE_NB + t;
+        if (!table_[idx]) return Vec8d(0.0);
+        return table_[idx](PA, PB, one_over_2p);
     }
 
     SymbolicDispatcher(const SymbolicDispatcher&) = delete;
     SymbolicDispatcher& operator=(const SymbolicDispatcher&) = delete;
 
 private:
-    SymbolicDispatcher() {
-        for (auto& na_slice : table_) {
-            for (auto& nb_slice : na_slice) {
-                for (auto& func : nb_slice) {
-                    func = nullptr;
-                }
-            }
-        }
-        registerAll();
+    SymbolicDispatcher() = default;
+
+    // Filled at compile time; slots with t > nA + nB are nullptr
+    static constexpr CoeffFunction table_[TABLE_SIZE] = {
+        // nA = 0, nB = 0
+        &detail::by_ref<&symbolic::hermite_e_symbolic_0_0_0>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 1
+        &detail::by_ref<&symbolic::hermite_e_symbolic_0_1_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_0_1_1>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 2
+        &detail::by_ref<&symbolic::hermite_e_symbolic_0_2_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_0_2_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_0_2_2>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 3
+        &detail::by_ref<&symbolic::hermite_e_symbolic_0_3_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_0_3_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_0_3_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_0_3_3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 4
+        &detail::by_ref<&symbolic::hermite_e_symbolic_0_4_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_0_4_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_0_4_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_0_4_3>, &detail::by_ref<&symbolic::hermite_e_symbolic_0_4_4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 0
+        &detail::by_ref<&symbolic::hermite_e_symbolic_1_0_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_1_0_1>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 1
+        &detail::by_ref<&symbolic::hermite_e_symbolic_1_1_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_1_1_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_1_1_2>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 2
+        &detail::by_ref<&symbolic::hermite_e_symbolic_1_2_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_1_2_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_1_2_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_1_2_3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 3
+        &detail::by_ref<&symbolic::hermite_e_symbolic_1_3_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_1_3_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_1_3_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_1_3_3>, &detail::by_ref<&symbolic::hermite_e_symbolic_1_3_4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 4
+        &detail::by_ref<&symbolic::hermite_e_symbolic_1_4_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_1_4_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_1_4_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_1_4_3>, &detail::by_ref<&symbolic::hermite_e_symbolic_1_4_4>, &detail::by_ref<&symbolic::hermite_e_symbolic_1_4_5>, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 0
+        &detail::by_ref<&symbolic::hermite_e_symbolic_2_0_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_0_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_0_2>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 1
+        &detail::by_ref<&symbolic::hermite_e_symbolic_2_1_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_1_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_1_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_1_3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 2
+        &detail::by_ref<&symbolic::hermite_e_symbolic_2_2_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_2_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_2_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_2_3>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_2_4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 3
+        &detail::by_ref<&symbolic::hermite_e_symbolic_2_3_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_3_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_3_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_3_3>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_3_4>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_3_5>, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 4
+        &detail::by_ref<&symbolic::hermite_e_symbolic_2_4_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_4_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_4_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_4_3>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_4_4>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_4_5>, &detail::by_ref<&symbolic::hermite_e_symbolic_2_4_6>, nullptr, nullptr,
+        // nA = 3, nB = 0
+        &detail::by_ref<&symbolic::hermite_e_symbolic_3_0_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_0_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_0_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_0_3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 3, nB = 1
+        &detail::by_ref<&symbolic::hermite_e_symbolic_3_1_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_1_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_1_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_1_3>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_1_4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 3, nB = 2
+        &detail::by_ref<&symbolic::hermite_e_symbolic_3_2_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_2_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_2_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_2_3>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_2_4>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_2_5>, nullptr, nullptr, nullptr,
+        // nA = 3, nB = 3
+        &detail::by_ref<&symbolic::hermite_e_symbolic_3_3_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_3_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_3_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_3_3>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_3_4>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_3_5>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_3_6>, nullptr, nullptr,
+        // nA = 3, nB = 4
+        &detail::by_ref<&symbolic::hermite_e_symbolic_3_4_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_4_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_4_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_4_3>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_4_4>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_4_5>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_4_6>, &detail::by_ref<&symbolic::hermite_e_symbolic_3_4_7>, nullptr,
+        // nA = 4, nB = 0
+        &detail::by_ref<&symbolic::hermite_e_symbolic_4_0_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_0_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_0_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_0_3>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_0_4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 4, nB = 1
+        &detail::by_ref<&symbolic::hermite_e_symbolic_4_1_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_1_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_1_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_1_3>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_1_4>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_1_5>, nullptr, nullptr, nullptr,
+        // nA = 4, nB = 2
+        &detail::by_ref<&symbolic::hermite_e_symbolic_4_2_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_2_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_2_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_2_3>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_2_4>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_2_5>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_2_6>, nullptr, nullptr,
+        // nA = 4, nB = 3
+        &detail::by_ref<&symbolic::hermite_e_symbolic_4_3_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_3_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_3_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_3_3>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_3_4>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_3_5>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_3_6>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_3_7>, nullptr,
+        // nA = 4, nB = 4
+        &detail::by_ref<&symbolic::hermite_e_symbolic_4_4_0>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_4_1>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_4_2>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_4_3>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_4_4>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_4_5>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_4_6>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_4_7>, &detail::by_ref<&symbolic::hermite_e_symbolic_4_4_8>,
+    };
+};
+
+/**
+ * @class SymbolicLayerDispatcher
+ * @brief Dispatcher for fused Symbolic E layers (all t of one shell pair per call)
+ */
+class SymbolicLayerDispatcher {
+public:
+    static constexpr int MAX_NA = BENCH_MAX_L;
+    static constexpr int MAX_NB = BENCH_MAX_L;
+
+    static constexpr unsigned TABLE_SIZE = (MAX_NA + 1) * (MAX_NB + 1);
+
+    static const SymbolicLayerDispatcher& instance() {
+        static SymbolicLayerDispatcher dispatcher;
+        return dispatcher;
     }
 
-    void registerAll() {
-        table_[0][0][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_0_0_0(PA, PB, p);
-        };
-        table_[0][1][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_0_1_0(PA, PB, p);
-        };
-        table_[0][1][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_0_1_1(PA, PB, p);
-        };
-        table_[0][2][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_0_2_0(PA, PB, p);
-        };
-        table_[0][2][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_0_2_1(PA, PB, p);
-        };
-        table_[0][2][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_0_2_2(PA, PB, p);
-        };
-        table_[0][3][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_0_3_0(PA, PB, p);
-        };
-        table_[0][3][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_0_3_1(PA, PB, p);
-        };
-        table_[0][3][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_0_3_2(PA, PB, p);
-        };
-        table_[0][3][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_0_3_3(PA, PB, p);
-        };
-        table_[0][4][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_0_4_0(PA, PB, p);
-        };
-        table_[0][4][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_0_4_1(PA, PB, p);
-        };
-        table_[0][4][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_0_4_2(PA, PB, p);
-        };
-        table_[0][4][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_0_4_3(PA, PB, p);
-        };
-        table_[0][4][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_0_4_4(PA, PB, p);
-        };
-        table_[1][0][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_0_0(PA, PB, p);
-        };
-        table_[1][0][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_0_1(PA, PB, p);
-        };
-        table_[1][1][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_1_0(PA, PB, p);
-        };
-        table_[1][1][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_1_1(PA, PB, p);
-        };
-        table_[1][1][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_1_2(PA, PB, p);
-        };
-        table_[1][2][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_2_0(PA, PB, p);
-        };
-        table_[1][2][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_2_1(PA, PB, p);
-        };
-        table_[1][2][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_2_2(PA, PB, p);
-        };
-        table_[1][2][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_2_3(PA, PB, p);
-        };
-        table_[1][3][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_3_0(PA, PB, p);
-        };
-        table_[1][3][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_3_1(PA, PB, p);
-        };
-        table_[1][3][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_3_2(PA, PB, p);
-        };
-        table_[1][3][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_3_3(PA, PB, p);
-        };
-        table_[1][3][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_3_4(PA, PB, p);
-        };
-        table_[1][4][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_4_0(PA, PB, p);
-        };
-        table_[1][4][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_4_1(PA, PB, p);
-        };
-        table_[1][4][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_4_2(PA, PB, p);
-        };
-        table_[1][4][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_4_3(PA, PB, p);
-        };
-        table_[1][4][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_4_4(PA, PB, p);
-        };
-        table_[1][4][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_1_4_5(PA, PB, p);
-        };
-        table_[2][0][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_0_0(PA, PB, p);
-        };
-        table_[2][0][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_0_1(PA, PB, p);
-        };
-        table_[2][0][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_0_2(PA, PB, p);
-        };
-        table_[2][1][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_1_0(PA, PB, p);
-        };
-        table_[2][1][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_1_1(PA, PB, p);
-        };
-        table_[2][1][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_1_2(PA, PB, p);
-        };
-        table_[2][1][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_1_3(PA, PB, p);
-        };
-        table_[2][2][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_2_0(PA, PB, p);
-        };
-        table_[2][2][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_2_1(PA, PB, p);
-        };
-        table_[2][2][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_2_2(PA, PB, p);
-        };
-        table_[2][2][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_2_3(PA, PB, p);
-        };
-        table_[2][2][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_2_4(PA, PB, p);
-        };
-        table_[2][3][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_3_0(PA, PB, p);
-        };
-        table_[2][3][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_3_1(PA, PB, p);
-        };
-        table_[2][3][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_3_2(PA, PB, p);
-        };
-        table_[2][3][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_3_3(PA, PB, p);
-        };
-        table_[2][3][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_3_4(PA, PB, p);
-        };
-        table_[2][3][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_3_5(PA, PB, p);
-        };
-        table_[2][4][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_4_0(PA, PB, p);
-        };
-        table_[2][4][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_4_1(PA, PB, p);
-        };
-        table_[2][4][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_4_2(PA, PB, p);
-        };
-        table_[2][4][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_4_3(PA, PB, p);
-        };
-        table_[2][4][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_4_4(PA, PB, p);
-        };
-        table_[2][4][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_4_5(PA, PB, p);
-        };
-        table_[2][4][6] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_2_4_6(PA, PB, p);
-        };
-        table_[3][0][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_0_0(PA, PB, p);
-        };
-        table_[3][0][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_0_1(PA, PB, p);
-        };
-        table_[3][0][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_0_2(PA, PB, p);
-        };
-        table_[3][0][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_0_3(PA, PB, p);
-        };
-        table_[3][1][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_1_0(PA, PB, p);
-        };
-        table_[3][1][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_1_1(PA, PB, p);
-        };
-        table_[3][1][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_1_2(PA, PB, p);
-        };
-        table_[3][1][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_1_3(PA, PB, p);
-        };
-        table_[3][1][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_1_4(PA, PB, p);
-        };
-        table_[3][2][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_2_0(PA, PB, p);
-        };
-        table_[3][2][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_2_1(PA, PB, p);
-        };
-        table_[3][2][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_2_2(PA, PB, p);
-        };
-        table_[3][2][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_2_3(PA, PB, p);
-        };
-        table_[3][2][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_2_4(PA, PB, p);
-        };
-        table_[3][2][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_2_5(PA, PB, p);
-        };
-        table_[3][3][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_3_0(PA, PB, p);
-        };
-        table_[3][3][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_3_1(PA, PB, p);
-        };
-        table_[3][3][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_3_2(PA, PB, p);
-        };
-        table_[3][3][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_3_3(PA, PB, p);
-        };
-        table_[3][3][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_3_4(PA, PB, p);
-        };
-        table_[3][3][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_3_5(PA, PB, p);
-        };
-        table_[3][3][6] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_3_6(PA, PB, p);
-        };
-        table_[3][4][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_4_0(PA, PB, p);
-        };
-        table_[3][4][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_4_1(PA, PB, p);
-        };
-        table_[3][4][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_4_2(PA, PB, p);
-        };
-        table_[3][4][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_4_3(PA, PB, p);
-        };
-        table_[3][4][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_4_4(PA, PB, p);
-        };
-        table_[3][4][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_4_5(PA, PB, p);
-        };
-        table_[3][4][6] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_4_6(PA, PB, p);
-        };
-        table_[3][4][7] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_3_4_7(PA, PB, p);
-        };
-        table_[4][0][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_0_0(PA, PB, p);
-        };
-        table_[4][0][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_0_1(PA, PB, p);
-        };
-        table_[4][0][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_0_2(PA, PB, p);
-        };
-        table_[4][0][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_0_3(PA, PB, p);
-        };
-        table_[4][0][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_0_4(PA, PB, p);
-        };
-        table_[4][1][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_1_0(PA, PB, p);
-        };
-        table_[4][1][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_1_1(PA, PB, p);
-        };
-        table_[4][1][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_1_2(PA, PB, p);
-        };
-        table_[4][1][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_1_3(PA, PB, p);
-        };
-        table_[4][1][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_1_4(PA, PB, p);
-        };
-        table_[4][1][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_1_5(PA, PB, p);
-        };
-        table_[4][2][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_2_0(PA, PB, p);
-        };
-        table_[4][2][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_2_1(PA, PB, p);
-        };
-        table_[4][2][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_2_2(PA, PB, p);
-        };
-        table_[4][2][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_2_3(PA, PB, p);
-        };
-        table_[4][2][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_2_4(PA, PB, p);
-        };
-        table_[4][2][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_2_5(PA, PB, p);
-        };
-        table_[4][2][6] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_2_6(PA, PB, p);
-        };
-        table_[4][3][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_3_0(PA, PB, p);
-        };
-        table_[4][3][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_3_1(PA, PB, p);
-        };
-        table_[4][3][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_3_2(PA, PB, p);
-        };
-        table_[4][3][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_3_3(PA, PB, p);
-        };
-        table_[4][3][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_3_4(PA, PB, p);
-        };
-        table_[4][3][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_3_5(PA, PB, p);
-        };
-        table_[4][3][6] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_3_6(PA, PB, p);
-        };
-        table_[4][3][7] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_3_7(PA, PB, p);
-        };
-        table_[4][4][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_4_0(PA, PB, p);
-        };
-        table_[4][4][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_4_1(PA, PB, p);
-        };
-        table_[4][4][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_4_2(PA, PB, p);
-        };
-        table_[4][4][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_4_3(PA, PB, p);
-        };
-        table_[4][4][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_4_4(PA, PB, p);
-        };
-        table_[4][4][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_4_5(PA, PB, p);
-        };
-        table_[4][4][6] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_4_6(PA, PB, p);
-        };
-        table_[4][4][7] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_4_7(PA, PB, p);
-        };
-        table_[4][4][8] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_e_symbolic_4_4_8(PA, PB, p);
-        };
+    /**
+     * Writes E^{nA,nB}_t for t = 0..nA+nB into E and returns the number of
+     * values written (0 for an out-of-range or negative shell pair).
+     */
+    int compute(int nA, int nB,
+                const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p, Vec8d* E) const {
+        if (static_cast<unsigned>(nA) > static_cast<unsigned>(MAX_NA) ||
+            static_cast<unsigned>(nB) > static_cast<unsigned>(MAX_NB)) return 0;
+        table_[nA * (MAX_NB + 1) + nB](PA, PB, one_over_2p, E);
+        return nA + nB + 1;
     }
 
-    DispatchTable table_;
+    SymbolicLayerDispatcher(const SymbolicLayerDispatcher&) = delete;
+    SymbolicLayerDispatcher& operator=(const SymbolicLayerDispatcher&) = delete;
+
+private:
+    SymbolicLayerDispatcher() = default;
+
+    static constexpr LayerFunction table_[TABLE_SIZE] = {
+        &symbolic::hermite_e_symbolic_layer_0_0,
+        &symbolic::hermite_e_symbolic_layer_0_1,
+        &symbolic::hermite_e_symbolic_layer_0_2,
+        &symbolic::hermite_e_symbolic_layer_0_3,
+        &symbolic::hermite_e_symbolic_layer_0_4,
+        &symbolic::hermite_e_symbolic_layer_1_0,
+        &symbolic::hermite_e_symbolic_layer_1_1,
+        &symbolic::hermite_e_symbolic_layer_1_2,
+        &symbolic::hermite_e_symbolic_layer_1_3,
+        &symbolic::hermite_e_symbolic_layer_1_4,
+        &symbolic::hermite_e_symbolic_layer_2_0,
+        &symbolic::hermite_e_symbolic_layer_2_1,
+        &symbolic::hermite_e_symbolic_layer_2_2,
+        &symbolic::hermite_e_symbolic_layer_2_3,
+        &symbolic::hermite_e_symbolic_layer_2_4,
+        &symbolic::hermite_e_symbolic_layer_3_0,
+        &symbolic::hermite_e_symbolic_layer_3_1,
+        &symbolic::hermite_e_symbolic_layer_3_2,
+        &symbolic::hermite_e_symbolic_layer_3_3,
+        &symbolic::hermite_e_symbolic_layer_3_4,
+        &symbolic::hermite_e_symbolic_layer_4_0,
+        &symbolic::hermite_e_symbolic_layer_4_1,
+        &symbolic::hermite_e_symbolic_layer_4_2,
+        &symbolic::hermite_e_symbolic_layer_4_3,
+        &symbolic::hermite_e_symbolic_layer_4_4,
+    };
 };
 
 // =============================================================================
@@ -579,82 +376,90 @@ public:
     static constexpr int MAX_NB = BENCH_MAX_L;
     static constexpr int MAX_N = BENCH_MAX_N;
 
-    using NTable = std::array<CoeffFunction, MAX_N + 1>;
-    using NBTable = std::array<NTable, MAX_NB + 1>;
-    using DispatchTable = std::array<NBTable, MAX_NA + 1>;
+    static constexpr unsigned STRIDE_NB = MAX_N + 1;
+    static constexpr unsigned STRIDE_NA = (MAX_NB + 1) * STRIDE_NB;
+    static constexpr unsigned TABLE_SIZE = (MAX_NA + 1) * STRIDE_NA;
 
     static const TMPGradPADispatcher& instance() {
         static TMPGradPADispatcher dispatcher;
         return dispatcher;
     }
 
+    /**
+     * Indices outside 0 <= nA <= MAX_NA, 0 <= nB <= MAX_NB, 0 <= t <= MAX_N
+     * (negative ones wrap to large unsigned values) and t > nA + nB yield zero.
+     */
     Vec8d compute(int nA, int nB, int t,
                   const Vec8d& PA, const Vec8d& PB, const Vec8d& p) const {
-        if (nA < 0 || nA > MAX_NA || nB < 0 || nB > MAX_NB ||
-            t < 0 || t > MAX_N || t > nA + nB) {
-            return Vec8d(0.0);
-        }
-        const auto& func = table_[nA][nB][t];
-        if (!func) return Vec8d(0.0);
-        return func(PA, PB, p);
-    }
-
-private:
-    TMPGradPADispatcher() {
-        for (auto& na_slice : table_) {
-            for (auto& nb_slice : na_slice) {
-                for (auto& func : nb_slice) {
-                    func = nullptr;
-                }
-            }
-        }
-        registerAll();
+        // Each index is bounded on its own: a packed-index check alone would
+        // let an out-of-range nB or t alias into a neighbouring row
+        if (static_cast<unsigned>(nA) > static_cast<unsigned>(MAX_NA) ||
+            static_cast<unsigned>(nB) > static_cast<unsigned>(MAX_NB) ||
+            static_cast<unsigned>(t) > static_cast<unsigned>(MAX_N)) return Vec8d(0.0);
+        const unsigned idx = nA * STRIDE_NA + nB * STRIDE_NB + t;
+        if (!table_[idx]) return Vec8d(0.0);
+        return table_[idx](PA, PB, p);
     }
 
-    template<int NA, int NB, int T>
-    void registerGrad() {
-        table_[NA][NB][T] = [](const Vec8d& pa, const Vec8d& pb, const Vec8d& p) -> Vec8d {
-            return mcmd::HermiteDerivPA<NA, NB, T>::compute(pa, pb, p);
-        };
-    }
+    TMPGradPADispatcher(const TMPGradPADispatcher&) = delete;
+    TMPGradPADispatcher& operator=(const TMPGradPADispatcher&) = delete;
 
-    template<int NA, int NB, int T>
-    struct RegisterT {
-        static void apply(TMPGradPADispatcher* d) {
-            if constexpr (T <= NA + NB && T <= MAX_N) {
-                d->registerGrad<NA, NB, T>();
-                if constexpr (T + 1 <= NA + NB && T + 1 <= MAX_N) {
-                    RegisterT<NA, NB, T + 1>::apply(d);
-                }
-            }
-        }
-    };
-
-    template<int NA, int NB>
-    struct RegisterNB {
-        static void apply(TMPGradPADispatcher* d) {
-            RegisterT<NA, NB, 0>::apply(d);
-            if constexpr (NB + 1 <= MAX_NB) {
-                RegisterNB<NA, NB + 1>::apply(d);
-            }
-        }
-    };
+private:
+    TMPGradPADispatcher() = default;
 
-    template<int NA>
-    struct RegisterNA {
-        static void apply(TMPGradPADispatcher* d) {
-            RegisterNB<NA, 0>::apply(d);
-            if constexpr (NA + 1 <= MAX_NA) {
-                RegisterNA<NA + 1>::apply(d);
-            }
-        }
+    // Filled at compile time; slots with t > nA + nB are nullptr
+    static constexpr CoeffFunction table_[TABLE_SIZE] = {
+        // nA = 0, nB = 0
+        &detail::tmp_hermite_dE_dPA<0, 0, 0>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 1
+        &detail::tmp_hermite_dE_dPA<0, 1, 0>, &detail::tmp_hermite_dE_dPA<0, 1, 1>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 2
+        &detail::tmp_hermite_dE_dPA<0, 2, 0>, &detail::tmp_hermite_dE_dPA<0, 2, 1>, &detail::tmp_hermite_dE_dPA<0, 2, 2>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 3
+        &detail::tmp_hermite_dE_dPA<0, 3, 0>, &detail::tmp_hermite_dE_dPA<0, 3, 1>, &detail::tmp_hermite_dE_dPA<0, 3, 2>, &detail::tmp_hermite_dE_dPA<0, 3, 3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 4
+        &detail::tmp_hermite_dE_dPA<0, 4, 0>, &detail::tmp_hermite_dE_dPA<0, 4, 1>, &detail::tmp_hermite_dE_dPA<0, 4, 2>, &detail::tmp_hermite_dE_dPA<0, 4, 3>, &detail::tmp_hermite_dE_dPA<0, 4, 4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 0
+        &detail::tmp_hermite_dE_dPA<1, 0, 0>, &detail::tmp_hermite_dE_dPA<1, 0, 1>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 1
+        &detail::tmp_hermite_dE_dPA<1, 1, 0>, &detail::tmp_hermite_dE_dPA<1, 1, 1>, &detail::tmp_hermite_dE_dPA<1, 1, 2>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 2
+        &detail::tmp_hermite_dE_dPA<1, 2, 0>, &detail::tmp_hermite_dE_dPA<1, 2, 1>, &detail::tmp_hermite_dE_dPA<1, 2, 2>, &detail::tmp_hermite_dE_dPA<1, 2, 3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 3
+        &detail::tmp_hermite_dE_dPA<1, 3, 0>, &detail::tmp_hermite_dE_dPA<1, 3, 1>, &detail::tmp_hermite_dE_dPA<1, 3, 2>, &detail::tmp_hermite_dE_dPA<1, 3, 3>, &detail::tmp_hermite_dE_dPA<1, 3, 4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 4
+        &detail::tmp_hermite_dE_dPA<1, 4, 0>, &detail::tmp_hermite_dE_dPA<1, 4, 1>, &detail::tmp_hermite_dE_dPA<1, 4, 2>, &detail::tmp_hermite_dE_dPA<1, 4, 3>, &detail::tmp_hermite_dE_dPA<1, 4, 4>, &detail::tmp_hermite_dE_dPA<1, 4, 5>, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 0
+        &detail::tmp_hermite_dE_dPA<2, 0, 0>, &detail::tmp_hermite_dE_dPA<2, 0, 1>, &detail::tmp_hermite_dE_dPA<2, 0, 2>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 1
+        &detail::tmp_hermite_dE_dPA<2, 1, 0>, &detail::tmp_hermite_dE_dPA<2, 1, 1>, &detail::tmp_hermite_dE_dPA<2, 1, 2>, &detail::tmp_hermite_dE_dPA<2, 1, 3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 2
+        &detail::tmp_hermite_dE_dPA<2, 2, 0>, &detail::tmp_hermite_dE_dPA<2, 2, 1>, &detail::tmp_hermite_dE_dPA<2, 2, 2>, &detail::tmp_hermite_dE_dPA<2, 2, 3>, &detail::tmp_hermite_dE_dPA<2, 2, 4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 3
+        &detail::tmp_hermite_dE_dPA<2, 3, 0>, &detail::tmp_hermite_dE_dPA<2, 3, 1>, &detail::tmp_hermite_dE_dPA<2, 3, 2>, &detail::tmp_hermite_dE_dPA<2, 3, 3>, &detail::tmp_hermite_dE_dPA<2, 3, 4>, &detail::tmp_hermite_dE_dPA<2, 3, 5>, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 4
+        &detail::tmp_hermite_dE_dPA<2, 4, 0>, &detail::tmp_hermite_dE_dPA<2, 4, 1>, &detail::tmp_hermite_dE_dPA<2, 4, 2>, &detail::tmp_hermite_dE_dPA<2, 4, 3>, &detail::tmp_hermite_dE_dPA<2, 4, 4>, &detail::tmp_hermite_dE_dPA<2, 4, 5>, &detail::tmp_hermite_dE_dPA<2, 4, 6>, nullptr, nullptr,
+        // nA = 3, nB = 0
+        &detail::tmp_hermite_dE_dPA<3, 0, 0>, &detail::tmp_hermite_dE_dPA<3, 0, 1>, &detail::tmp_hermite_dE_dPA<3, 0, 2>, &detail::tmp_hermite_dE_dPA<3, 0, 3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 3, nB = 1
+        &detail::tmp_hermite_dE_dPA<3, 1, 0>, &detail::tmp_hermite_dE_dPA<3, 1, 1>, &detail::tmp_hermite_dE_dPA<3, 1, 2>, &detail::tmp_hermite_dE_dPA<3, 1, 3>, &detail::tmp_hermite_dE_dPA<3, 1, 4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 3, nB = 2
+        &detail::tmp_hermite_dE_dPA<3, 2, 0>, &detail::tmp_hermite_dE_dPA<3, 2, 1>, &detail::tmp_hermite_dE_dPA<3, 2, 2>, &detail::tmp_hermite_dE_dPA<3, 2, 3>, &detail::tmp_hermite_dE_dPA<3, 2, 4>, &detail::tmp_hermite_dE_dPA<3, 2, 5>, nullptr, nullptr, nullptr,
+        // nA = 3, nB = 3
+        &detail::tmp_hermite_dE_dPA<3, 3, 0>, &detail::tmp_hermite_dE_dPA<3, 3, 1>, &detail::tmp_hermite_dE_dPA<3, 3, 2>, &detail::tmp_hermite_dE_dPA<3, 3, 3>, &detail::tmp_hermite_dE_dPA<3, 3, 4>, &detail::tmp_hermite_dE_dPA<3, 3, 5>, &detail::tmp_hermite_dE_dPA<3, 3, 6>, nullptr, nullptr,
+        // nA = 3, nB = 4
+        &detail::tmp_hermite_dE_dPA<3, 4, 0>, &detail::tmp_hermite_dE_dPA<3, 4, 1>, &detail::tmp_hermite_dE_dPA<3, 4, 2>, &detail::tmp_hermite_dE_dPA<3, 4, 3>, &detail::tmp_hermite_dE_dPA<3, 4, 4>, &detail::tmp_hermite_dE_dPA<3, 4, 5>, &detail::tmp_hermite_dE_dPA<3, 4, 6>, &detail::tmp_hermite_dE_dPA<3, 4, 7>, nullptr,
+        // nA = 4, nB = 0
+        &detail::tmp_hermite_dE_dPA<4, 0, 0>, &detail::tmp_hermite_dE_dPA<4, 0, 1>, &detail::tmp_hermite_dE_dPA<4, 0, 2>, &detail::tmp_hermite_dE_dPA<4, 0, 3>, &detail::tmp_hermite_dE_dPA<4, 0, 4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 4, nB = 1
+        &detail::tmp_hermite_dE_dPA<4, 1, 0>, &detail::tmp_hermite_dE_dPA<4, 1, 1>, &detail::tmp_hermite_dE_dPA<4, 1, 2>, &detail::tmp_hermite_dE_dPA<4, 1, 3>, &detail::tmp_hermite_dE_dPA<4, 1, 4>, &detail::tmp_hermite_dE_dPA<4, 1, 5>, nullptr, nullptr, nullptr,
+        // nA = 4, nB = 2
+        &detail::tmp_hermite_dE_dPA<4, 2, 0>, &detail::tmp_hermite_dE_dPA<4, 2, 1>, &detail::tmp_hermite_dE_dPA<4, 2, 2>, &detail::tmp_hermite_dE_dPA<4, 2, 3>, &detail::tmp_hermite_dE_dPA<4, 2, 4>, &detail::tmp_hermite_dE_dPA<4, 2, 5>, &detail::tmp_hermite_dE_dPA<4, 2, 6>, nullptr, nullptr,
+        // nA = 4, nB = 3
+        &detail::tmp_hermite_dE_dPA<4, 3, 0>, &detail::tmp_hermite_dE_dPA<4, 3, 1>, &detail::tmp_hermite_dE_dPA<4, 3, 2>, &detail::tmp_hermite_dE_dPA<4, 3, 3>, &detail::tmp_hermite_dE_dPA<4, 3, 4>, &detail::tmp_hermite_dE_dPA<4, 3, 5>, &detail::tmp_hermite_dE_dPA<4, 3, 6>, &detail::tmp_hermite_dE_dPA<4, 3, 7>, nullptr,
+        // nA = 4, nB = 4
+        &detail::tmp_hermite_dE_dPA<4, 4, 0>, &detail::tmp_hermite_dE_dPA<4, 4, 1>, &detail::tmp_hermite_dE_dPA<4, 4, 2>, &detail::tmp_hermite_dE_dPA<4, 4, 3>, &detail::tmp_hermite_dE_dPA<4, 4, 4>, &detail::tmp_hermite_dE_dPA<4, 4, 5>, &detail::tmp_hermite_dE_dPA<4, 4, 6>, &detail::tmp_hermite_dE_dPA<4, 4, 7>, &detail::tmp_hermite_dE_dPA<4, 4, 8>,
     };
-
-    void registerAll() {
-        RegisterNA<0>::apply(this);
-    }
-
-    DispatchTable table_;
 };
 
 /**
@@ -667,418 +472,861 @@ public:
     static constexpr int MAX_NB = BENCH_MAX_L;
     static constexpr int MAX_N = BENCH_MAX_N;
 
-    using NTable = std::array<CoeffFunction, MAX_N + 1>;
-    using NBTable = std::array<NTable, MAX_NB + 1>;
-    using DispatchTable = std::array<NBTable, MAX_NA + 1>;
+    static constexpr unsigned STRIDE_NB = MAX_N + 1;
+    static constexpr unsigned STRIDE_NA = (MAX_NB + 1) * STRIDE_NB;
+    static constexpr unsigned TABLE_SIZE = (MAX_NA + 1) * STRIDE_NA;
 
     static const SymbolicGradPADispatcher& instance() {
         static SymbolicGradPADispatcher dispatcher;
         return dispatcher;
     }
 
+    /**
+     * Indices outside 0 <= nA <= MAX_NA, 0 <= nB <= MAX_NB, 0 <= t <= MAX_N
+     * (negative ones wrap to large unsigned values) and t > nA + nB yield zero.
+     */
     Vec8d compute(int nA, int nB, int t,
                   const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p) const {
-        if (nA < 0 || nA > MAX_NA || nB < 0 || nB > MAX_NB ||
-            t < 0 || t > MAX_N || t > nA + nB) {
-            return Vec8d(0.0);
-        }
-        const auto& func = table_[nA][nB][t];
-        if (!func) return Vec8d(0.0);
-        return func(PA, PB, one_over_2p);
+        // Each index is bounded on its own: a packed-index check alone would
+        // let an out-of-range nB or t alias into a neighbouring row
+        if (static_cast<unsigned>(nA) > static_cast<unsigned>(MAX_NA) ||
+            static_cast<unsigned>(nB) > static_cast<unsigned>(MAX_NB) ||
+            static_cast<unsigned>(t) > static_cast<unsigned>(MAX_N)) return Vec8d(0.0);
+        const unsigned idx = nA * STRIDE_NA + nB * STRIDE_NB + t;
+        if (!table_[idx]) return Vec8d(0.0);
+        return table_[idx](PA, PB, one_over_2p);
     }
 
+    SymbolicGradPADispatcher(const SymbolicGradPADispatcher&) = delete;
+    SymbolicGradPADispatcher& operator=(const SymbolicGradPADispatcher&) = delete;
+
 private:
-    SymbolicGradPADispatcher() {
-        for (auto& na_slice : table_) {
-            for (auto& nb_slice : na_slice) {
-                for (auto& func : nb_slice) {
-                    func = nullptr;
-                }
+    SymbolicGradPADispatcher() = default;
+
+    // Filled at compile time; slots with t > nA + nB are nullptr
+    static constexpr CoeffFunction table_[TABLE_SIZE] = {
+        // nA = 0, nB = 0
+        &detail::by_ref<&symbolic::hermite_dE_dPA_0_0_0>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 1
+        &detail::by_ref<&symbolic::hermite_dE_dPA_0_1_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_0_1_1>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 2
+        &detail::by_ref<&symbolic::hermite_dE_dPA_0_2_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_0_2_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_0_2_2>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 3
+        &detail::by_ref<&symbolic::hermite_dE_dPA_0_3_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_0_3_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_0_3_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_0_3_3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 0, nB = 4
+        &detail::by_ref<&symbolic::hermite_dE_dPA_0_4_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_0_4_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_0_4_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_0_4_3>, &detail::by_ref<&symbolic::hermite_dE_dPA_0_4_4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 0
+        &detail::by_ref<&symbolic::hermite_dE_dPA_1_0_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_1_0_1>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 1
+        &detail::by_ref<&symbolic::hermite_dE_dPA_1_1_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_1_1_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_1_1_2>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 2
+        &detail::by_ref<&symbolic::hermite_dE_dPA_1_2_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_1_2_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_1_2_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_1_2_3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 3
+        &detail::by_ref<&symbolic::hermite_dE_dPA_1_3_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_1_3_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_1_3_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_1_3_3>, &detail::by_ref<&symbolic::hermite_dE_dPA_1_3_4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 1, nB = 4
+        &detail::by_ref<&symbolic::hermite_dE_dPA_1_4_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_1_4_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_1_4_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_1_4_3>, &detail::by_ref<&symbolic::hermite_dE_dPA_1_4_4>, &detail::by_ref<&symbolic::hermite_dE_dPA_1_4_5>, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 0
+        &detail::by_ref<&symbolic::hermite_dE_dPA_2_0_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_0_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_0_2>, nullptr, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 1
+        &detail::by_ref<&symbolic::hermite_dE_dPA_2_1_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_1_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_1_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_1_3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 2
+        &detail::by_ref<&symbolic::hermite_dE_dPA_2_2_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_2_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_2_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_2_3>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_2_4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 3
+        &detail::by_ref<&symbolic::hermite_dE_dPA_2_3_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_3_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_3_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_3_3>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_3_4>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_3_5>, nullptr, nullptr, nullptr,
+        // nA = 2, nB = 4
+        &detail::by_ref<&symbolic::hermite_dE_dPA_2_4_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_4_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_4_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_4_3>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_4_4>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_4_5>, &detail::by_ref<&symbolic::hermite_dE_dPA_2_4_6>, nullptr, nullptr,
+        // nA = 3, nB = 0
+        &detail::by_ref<&symbolic::hermite_dE_dPA_3_0_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_0_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_0_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_0_3>, nullptr, nullptr, nullptr, nullptr, nullptr,
+        // nA = 3, nB = 1
+        &detail::by_ref<&symbolic::hermite_dE_dPA_3_1_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_1_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_1_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_1_3>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_1_4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 3, nB = 2
+        &detail::by_ref<&symbolic::hermite_dE_dPA_3_2_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_2_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_2_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_2_3>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_2_4>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_2_5>, nullptr, nullptr, nullptr,
+        // nA = 3, nB = 3
+        &detail::by_ref<&symbolic::hermite_dE_dPA_3_3_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_3_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_3_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_3_3>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_3_4>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_3_5>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_3_6>, nullptr, nullptr,
+        // nA = 3, nB = 4
+        &detail::by_ref<&symbolic::hermite_dE_dPA_3_4_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_4_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_4_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_4_3>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_4_4>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_4_5>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_4_6>, &detail::by_ref<&symbolic::hermite_dE_dPA_3_4_7>, nullptr,
+        // nA = 4, nB = 0
+        &detail::by_ref<&symbolic::hermite_dE_dPA_4_0_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_0_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_0_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_0_3>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_0_4>, nullptr, nullptr, nullptr, nullptr,
+        // nA = 4, nB = 1
+        &detail::by_ref<&symbolic::hermite_dE_dPA_4_1_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_1_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_1_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_1_3>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_1_4>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_1_5>, nullptr, nullptr, nullptr,
+        // nA = 4, nB = 2
+        &detail::by_ref<&symbolic::hermite_dE_dPA_4_2_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_2_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_2_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_2_3>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_2_4>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_2_5>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_2_6>, nullptr, nullptr,
+        // nA = 4, nB = 3
+        &detail::by_ref<&symbolic::hermite_dE_dPA_4_3_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_3_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_3_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_3_3>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_3_4>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_3_5>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_3_6>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_3_7>, nullptr,
+        // nA = 4, nB = 4
+        &detail::by_ref<&symbolic::hermite_dE_dPA_4_4_0>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_4_1>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_4_2>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_4_3>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_4_4>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_4_5>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_4_6>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_4_7>, &detail::by_ref<&symbolic::hermite_dE_dPA_4_4_8>,
+    };
+};
+
+// =============================================================================
+// SWITCH DISPATCH
+// =============================================================================
+
+/**
+ * @brief Symbolic E^{nA,nB}_t through nested switches (direct calls)
+ */
+inline Vec8d dispatch_hermite_e_switch(int nA, int nB, int t,
+                                       const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p) {
+    switch (nA) {
+    case 0:
+        switch (nB) {
+        case 0:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_0_0_0(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
             }
+        case 1:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_0_1_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_0_1_1(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 2:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_0_2_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_0_2_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_0_2_2(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 3:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_0_3_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_0_3_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_0_3_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_0_3_3(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 4:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_0_4_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_0_4_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_0_4_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_0_4_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_e_symbolic_0_4_4(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        default: return Vec8d(0.0);
         }
-        registerAll();
+    case 1:
+        switch (nB) {
+        case 0:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_1_0_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_1_0_1(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 1:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_1_1_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_1_1_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_1_1_2(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 2:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_1_2_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_1_2_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_1_2_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_1_2_3(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 3:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_1_3_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_1_3_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_1_3_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_1_3_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_e_symbolic_1_3_4(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 4:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_1_4_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_1_4_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_1_4_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_1_4_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_e_symbolic_1_4_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_e_symbolic_1_4_5(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        default: return Vec8d(0.0);
+        }
+    case 2:
+        switch (nB) {
+        case 0:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_2_0_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_2_0_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_2_0_2(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 1:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_2_1_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_2_1_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_2_1_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_2_1_3(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 2:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_2_2_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_2_2_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_2_2_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_2_2_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_e_symbolic_2_2_4(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 3:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_2_3_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_2_3_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_2_3_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_2_3_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_e_symbolic_2_3_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_e_symbolic_2_3_5(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 4:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_2_4_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_2_4_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_2_4_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_2_4_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_e_symbolic_2_4_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_e_symbolic_2_4_5(PA, PB, one_over_2p);
+            case 6: return symbolic::hermite_e_symbolic_2_4_6(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        default: return Vec8d(0.0);
+        }
+    case 3:
+        switch (nB) {
+        case 0:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_3_0_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_3_0_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_3_0_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_3_0_3(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 1:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_3_1_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_3_1_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_3_1_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_3_1_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_e_symbolic_3_1_4(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 2:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_3_2_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_3_2_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_3_2_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_3_2_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_e_symbolic_3_2_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_e_symbolic_3_2_5(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 3:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_3_3_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_3_3_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_3_3_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_3_3_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_e_symbolic_3_3_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_e_symbolic_3_3_5(PA, PB, one_over_2p);
+            case 6: return symbolic::hermite_e_symbolic_3_3_6(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 4:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_3_4_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_3_4_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_3_4_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_3_4_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_e_symbolic_3_4_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_e_symbolic_3_4_5(PA, PB, one_over_2p);
+            case 6: return symbolic::hermite_e_symbolic_3_4_6(PA, PB, one_over_2p);
+            case 7: return symbolic::hermite_e_symbolic_3_4_7(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        default: return Vec8d(0.0);
+        }
+    case 4:
+        switch (nB) {
+        case 0:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_4_0_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_4_0_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_4_0_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_4_0_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_e_symbolic_4_0_4(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 1:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_4_1_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_4_1_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_4_1_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_4_1_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_e_symbolic_4_1_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_e_symbolic_4_1_5(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 2:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_4_2_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_4_2_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_4_2_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_4_2_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_e_symbolic_4_2_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_e_symbolic_4_2_5(PA, PB, one_over_2p);
+            case 6: return symbolic::hermite_e_symbolic_4_2_6(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 3:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_4_3_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_4_3_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_4_3_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_4_3_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_e_symbolic_4_3_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_e_symbolic_4_3_5(PA, PB, one_over_2p);
+            case 6: return symbolic::hermite_e_symbolic_4_3_6(PA, PB, one_over_2p);
+            case 7: return symbolic::hermite_e_symbolic_4_3_7(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 4:
+            switch (t) {
+            case 0: return symbolic::hermite_e_symbolic_4_4_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_e_symbolic_4_4_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_e_symbolic_4_4_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_e_symbolic_4_4_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_e_symbolic_4_4_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_e_symbolic_4_4_5(PA, PB, one_over_2p);
+            case 6: return symbolic::hermite_e_symbolic_4_4_6(PA, PB, one_over_2p);
+            case 7: return symbolic::hermite_e_symbolic_4_4_7(PA, PB, one_over_2p);
+            case 8: return symbolic::hermite_e_symbolic_4_4_8(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        default: return Vec8d(0.0);
+        }
+    default: return Vec8d(0.0);
     }
+}
 
-    void registerAll() {
-        table_[0][0][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_0_0_0(PA, PB, p);
-        };
-        table_[0][1][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_0_1_0(PA, PB, p);
-        };
-        table_[0][1][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_0_1_1(PA, PB, p);
-        };
-        table_[0][2][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_0_2_0(PA, PB, p);
-        };
-        table_[0][2][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_0_2_1(PA, PB, p);
-        };
-        table_[0][2][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_0_2_2(PA, PB, p);
-        };
-        table_[0][3][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_0_3_0(PA, PB, p);
-        };
-        table_[0][3][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_0_3_1(PA, PB, p);
-        };
-        table_[0][3][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_0_3_2(PA, PB, p);
-        };
-        table_[0][3][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_0_3_3(PA, PB, p);
-        };
-        table_[0][4][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_0_4_0(PA, PB, p);
-        };
-        table_[0][4][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_0_4_1(PA, PB, p);
-        };
-        table_[0][4][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_0_4_2(PA, PB, p);
-        };
-        table_[0][4][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_0_4_3(PA, PB, p);
-        };
-        table_[0][4][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_0_4_4(PA, PB, p);
-        };
-        table_[1][0][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_0_0(PA, PB, p);
-        };
-        table_[1][0][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_0_1(PA, PB, p);
-        };
-        table_[1][1][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_1_0(PA, PB, p);
-        };
-        table_[1][1][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_1_1(PA, PB, p);
-        };
-        table_[1][1][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_1_2(PA, PB, p);
-        };
-        table_[1][2][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_2_0(PA, PB, p);
-        };
-        table_[1][2][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_2_1(PA, PB, p);
-        };
-        table_[1][2][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_2_2(PA, PB, p);
-        };
-        table_[1][2][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_2_3(PA, PB, p);
-        };
-        table_[1][3][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_3_0(PA, PB, p);
-        };
-        table_[1][3][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_3_1(PA, PB, p);
-        };
-        table_[1][3][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_3_2(PA, PB, p);
-        };
-        table_[1][3][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_3_3(PA, PB, p);
-        };
-        table_[1][3][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_3_4(PA, PB, p);
-        };
-        table_[1][4][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_4_0(PA, PB, p);
-        };
-        table_[1][4][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_4_1(PA, PB, p);
-        };
-        table_[1][4][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_4_2(PA, PB, p);
-        };
-        table_[1][4][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_4_3(PA, PB, p);
-        };
-        table_[1][4][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_4_4(PA, PB, p);
-        };
-        table_[1][4][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_1_4_5(PA, PB, p);
-        };
-        table_[2][0][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_0_0(PA, PB, p);
-        };
-        table_[2][0][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_0_1(PA, PB, p);
-        };
-        table_[2][0][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_0_2(PA, PB, p);
-        };
-        table_[2][1][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_1_0(PA, PB, p);
-        };
-        table_[2][1][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_1_1(PA, PB, p);
-        };
-        table_[2][1][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_1_2(PA, PB, p);
-        };
-        table_[2][1][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_1_3(PA, PB, p);
-        };
-        table_[2][2][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_2_0(PA, PB, p);
-        };
-        table_[2][2][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_2_1(PA, PB, p);
-        };
-        table_[2][2][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_2_2(PA, PB, p);
-        };
-        table_[2][2][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_2_3(PA, PB, p);
-        };
-        table_[2][2][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_2_4(PA, PB, p);
-        };
-        table_[2][3][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_3_0(PA, PB, p);
-        };
-        table_[2][3][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_3_1(PA, PB, p);
-        };
-        table_[2][3][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_3_2(PA, PB, p);
-        };
-        table_[2][3][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_3_3(PA, PB, p);
-        };
-        table_[2][3][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_3_4(PA, PB, p);
-        };
-        table_[2][3][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_3_5(PA, PB, p);
-        };
-        table_[2][4][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_4_0(PA, PB, p);
-        };
-        table_[2][4][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_4_1(PA, PB, p);
-        };
-        table_[2][4][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_4_2(PA, PB, p);
-        };
-        table_[2][4][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_4_3(PA, PB, p);
-        };
-        table_[2][4][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_4_4(PA, PB, p);
-        };
-        table_[2][4][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_4_5(PA, PB, p);
-        };
-        table_[2][4][6] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_2_4_6(PA, PB, p);
-        };
-        table_[3][0][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_0_0(PA, PB, p);
-        };
-        table_[3][0][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_0_1(PA, PB, p);
-        };
-        table_[3][0][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_0_2(PA, PB, p);
-        };
-        table_[3][0][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_0_3(PA, PB, p);
-        };
-        table_[3][1][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_1_0(PA, PB, p);
-        };
-        table_[3][1][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_1_1(PA, PB, p);
-        };
-        table_[3][1][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_1_2(PA, PB, p);
-        };
-        table_[3][1][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_1_3(PA, PB, p);
-        };
-        table_[3][1][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_1_4(PA, PB, p);
-        };
-        table_[3][2][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_2_0(PA, PB, p);
-        };
-        table_[3][2][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_2_1(PA, PB, p);
-        };
-        table_[3][2][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_2_2(PA, PB, p);
-        };
-        table_[3][2][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_2_3(PA, PB, p);
-        };
-        table_[3][2][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_2_4(PA, PB, p);
-        };
-        table_[3][2][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_2_5(PA, PB, p);
-        };
-        table_[3][3][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_3_0(PA, PB, p);
-        };
-        table_[3][3][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_3_1(PA, PB, p);
-        };
-        table_[3][3][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_3_2(PA, PB, p);
-        };
-        table_[3][3][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_3_3(PA, PB, p);
-        };
-        table_[3][3][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_3_4(PA, PB, p);
-        };
-        table_[3][3][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_3_5(PA, PB, p);
-        };
-        table_[3][3][6] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_3_6(PA, PB, p);
-        };
-        table_[3][4][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_4_0(PA, PB, p);
-        };
-        table_[3][4][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_4_1(PA, PB, p);
-        };
-        table_[3][4][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_4_2(PA, PB, p);
-        };
-        table_[3][4][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_4_3(PA, PB, p);
-        };
-        table_[3][4][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_4_4(PA, PB, p);
-        };
-        table_[3][4][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_4_5(PA, PB, p);
-        };
-        table_[3][4][6] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_4_6(PA, PB, p);
-        };
-        table_[3][4][7] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_3_4_7(PA, PB, p);
-        };
-        table_[4][0][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_0_0(PA, PB, p);
-        };
-        table_[4][0][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_0_1(PA, PB, p);
-        };
-        table_[4][0][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_0_2(PA, PB, p);
-        };
-        table_[4][0][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_0_3(PA, PB, p);
-        };
-        table_[4][0][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_0_4(PA, PB, p);
-        };
-        table_[4][1][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_1_0(PA, PB, p);
-        };
-        table_[4][1][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_1_1(PA, PB, p);
-        };
-        table_[4][1][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_1_2(PA, PB, p);
-        };
-        table_[4][1][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_1_3(PA, PB, p);
-        };
-        table_[4][1][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_1_4(PA, PB, p);
-        };
-        table_[4][1][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_1_5(PA, PB, p);
-        };
-        table_[4][2][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_2_0(PA, PB, p);
-        };
-        table_[4][2][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_2_1(PA, PB, p);
-        };
-        table_[4][2][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_2_2(PA, PB, p);
-        };
-        table_[4][2][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_2_3(PA, PB, p);
-        };
-        table_[4][2][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_2_4(PA, PB, p);
-        };
-        table_[4][2][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_2_5(PA, PB, p);
-        };
-        table_[4][2][6] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_2_6(PA, PB, p);
-        };
-        table_[4][3][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_3_0(PA, PB, p);
-        };
-        table_[4][3][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_3_1(PA, PB, p);
-        };
-        table_[4][3][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_3_2(PA, PB, p);
-        };
-        table_[4][3][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_3_3(PA, PB, p);
-        };
-        table_[4][3][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_3_4(PA, PB, p);
-        };
-        table_[4][3][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_3_5(PA, PB, p);
-        };
-        table_[4][3][6] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_3_6(PA, PB, p);
-        };
-        table_[4][3][7] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_3_7(PA, PB, p);
-        };
-        table_[4][4][0] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_4_0(PA, PB, p);
-        };
-        table_[4][4][1] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_4_1(PA, PB, p);
-        };
-        table_[4][4][2] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_4_2(PA, PB, p);
-        };
-        table_[4][4][3] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_4_3(PA, PB, p);
-        };
-        table_[4][4][4] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_4_4(PA, PB, p);
-        };
-        table_[4][4][5] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_4_5(PA, PB, p);
-        };
-        table_[4][4][6] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_4_6(PA, PB, p);
-        };
-        table_[4][4][7] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_4_7(PA, PB, p);
-        };
-        table_[4][4][8] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {
-            return symbolic::hermite_dE_dPA_4_4_8(PA, PB, p);
-        };
+/**
+ * @brief Symbolic dE/dPA through nested switches (direct calls)
+ */
+inline Vec8d dispatch_dE_dPA_switch(int nA, int nB, int t,
+                                    const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p) {
+    switch (nA) {
+    case 0:
+        switch (nB) {
+        case 0:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_0_0_0(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 1:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_0_1_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_0_1_1(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 2:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_0_2_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_0_2_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_0_2_2(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 3:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_0_3_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_0_3_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_0_3_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_0_3_3(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 4:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_0_4_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_0_4_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_0_4_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_0_4_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_dE_dPA_0_4_4(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        default: return Vec8d(0.0);
+        }
+    case 1:
+        switch (nB) {
+        case 0:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_1_0_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_1_0_1(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 1:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_1_1_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_1_1_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_1_1_2(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 2:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_1_2_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_1_2_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_1_2_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_1_2_3(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 3:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_1_3_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_1_3_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_1_3_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_1_3_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_dE_dPA_1_3_4(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 4:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_1_4_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_1_4_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_1_4_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_1_4_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_dE_dPA_1_4_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_dE_dPA_1_4_5(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        default: return Vec8d(0.0);
+        }
+    case 2:
+        switch (nB) {
+        case 0:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_2_0_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_2_0_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_2_0_2(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 1:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_2_1_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_2_1_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_2_1_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_2_1_3(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 2:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_2_2_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_2_2_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_2_2_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_2_2_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_dE_dPA_2_2_4(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 3:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_2_3_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_2_3_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_2_3_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_2_3_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_dE_dPA_2_3_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_dE_dPA_2_3_5(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 4:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_2_4_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_2_4_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_2_4_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_2_4_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_dE_dPA_2_4_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_dE_dPA_2_4_5(PA, PB, one_over_2p);
+            case 6: return symbolic::hermite_dE_dPA_2_4_6(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        default: return Vec8d(0.0);
+        }
+    case 3:
+        switch (nB) {
+        case 0:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_3_0_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_3_0_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_3_0_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_3_0_3(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 1:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_3_1_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_3_1_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_3_1_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_3_1_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_dE_dPA_3_1_4(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 2:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_3_2_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_3_2_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_3_2_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_3_2_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_dE_dPA_3_2_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_dE_dPA_3_2_5(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 3:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_3_3_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_3_3_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_3_3_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_3_3_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_dE_dPA_3_3_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_dE_dPA_3_3_5(PA, PB, one_over_2p);
+            case 6: return symbolic::hermite_dE_dPA_3_3_6(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 4:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_3_4_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_3_4_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_3_4_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_3_4_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_dE_dPA_3_4_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_dE_dPA_3_4_5(PA, PB, one_over_2p);
+            case 6: return symbolic::hermite_dE_dPA_3_4_6(PA, PB, one_over_2p);
+            case 7: return symbolic::hermite_dE_dPA_3_4_7(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        default: return Vec8d(0.0);
+        }
+    case 4:
+        switch (nB) {
+        case 0:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_4_0_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_4_0_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_4_0_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_4_0_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_dE_dPA_4_0_4(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 1:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_4_1_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_4_1_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_4_1_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_4_1_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_dE_dPA_4_1_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_dE_dPA_4_1_5(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 2:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_4_2_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_4_2_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_4_2_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_4_2_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_dE_dPA_4_2_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_dE_dPA_4_2_5(PA, PB, one_over_2p);
+            case 6: return symbolic::hermite_dE_dPA_4_2_6(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 3:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_4_3_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_4_3_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_4_3_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_4_3_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_dE_dPA_4_3_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_dE_dPA_4_3_5(PA, PB, one_over_2p);
+            case 6: return symbolic::hermite_dE_dPA_4_3_6(PA, PB, one_over_2p);
+            case 7: return symbolic::hermite_dE_dPA_4_3_7(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        case 4:
+            switch (t) {
+            case 0: return symbolic::hermite_dE_dPA_4_4_0(PA, PB, one_over_2p);
+            case 1: return symbolic::hermite_dE_dPA_4_4_1(PA, PB, one_over_2p);
+            case 2: return symbolic::hermite_dE_dPA_4_4_2(PA, PB, one_over_2p);
+            case 3: return symbolic::hermite_dE_dPA_4_4_3(PA, PB, one_over_2p);
+            case 4: return symbolic::hermite_dE_dPA_4_4_4(PA, PB, one_over_2p);
+            case 5: return symbolic::hermite_dE_dPA_4_4_5(PA, PB, one_over_2p);
+            case 6: return symbolic::hermite_dE_dPA_4_4_6(PA, PB, one_over_2p);
+            case 7: return symbolic::hermite_dE_dPA_4_4_7(PA, PB, one_over_2p);
+            case 8: return symbolic::hermite_dE_dPA_4_4_8(PA, PB, one_over_2p);
+            default: return Vec8d(0.0);
+            }
+        default: return Vec8d(0.0);
+        }
+    default: return Vec8d(0.0);
     }
+}
 
-    DispatchTable table_;
-};
+/**
+ * @brief Symbolic dE/dPA and dE/dPB with shared CSE (direct calls)
+ */
+inline void dispatch_dE_both_switch(int nA, int nB, int t,
+                                    const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p,
+                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    switch (nA) {
+    case 0:
+        switch (nB) {
+        case 0:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_0_0_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 1:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_0_1_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_0_1_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 2:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_0_2_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_0_2_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_0_2_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 3:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_0_3_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_0_3_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_0_3_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_0_3_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 4:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_0_4_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_0_4_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_0_4_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_0_4_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 4: symbolic::hermite_dE_both_0_4_4(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+        }
+    case 1:
+        switch (nB) {
+        case 0:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_1_0_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_1_0_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 1:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_1_1_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_1_1_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_1_1_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 2:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_1_2_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_1_2_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_1_2_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_1_2_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 3:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_1_3_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_1_3_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_1_3_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_1_3_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 4: symbolic::hermite_dE_both_1_3_4(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 4:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_1_4_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_1_4_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_1_4_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_1_4_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 4: symbolic::hermite_dE_both_1_4_4(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 5: symbolic::hermite_dE_both_1_4_5(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+        }
+    case 2:
+        switch (nB) {
+        case 0:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_2_0_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_2_0_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_2_0_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 1:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_2_1_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_2_1_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_2_1_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_2_1_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 2:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_2_2_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_2_2_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_2_2_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_2_2_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 4: symbolic::hermite_dE_both_2_2_4(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 3:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_2_3_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_2_3_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_2_3_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_2_3_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 4: symbolic::hermite_dE_both_2_3_4(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 5: symbolic::hermite_dE_both_2_3_5(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 4:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_2_4_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_2_4_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_2_4_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_2_4_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 4: symbolic::hermite_dE_both_2_4_4(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 5: symbolic::hermite_dE_both_2_4_5(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 6: symbolic::hermite_dE_both_2_4_6(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+        }
+    case 3:
+        switch (nB) {
+        case 0:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_3_0_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_3_0_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_3_0_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_3_0_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 1:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_3_1_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_3_1_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_3_1_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_3_1_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 4: symbolic::hermite_dE_both_3_1_4(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 2:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_3_2_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_3_2_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_3_2_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_3_2_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 4: symbolic::hermite_dE_both_3_2_4(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 5: symbolic::hermite_dE_both_3_2_5(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 3:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_3_3_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_3_3_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_3_3_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_3_3_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 4: symbolic::hermite_dE_both_3_3_4(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 5: symbolic::hermite_dE_both_3_3_5(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 6: symbolic::hermite_dE_both_3_3_6(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 4:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_3_4_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_3_4_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_3_4_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_3_4_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 4: symbolic::hermite_dE_both_3_4_4(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 5: symbolic::hermite_dE_both_3_4_5(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 6: symbolic::hermite_dE_both_3_4_6(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 7: symbolic::hermite_dE_both_3_4_7(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+        }
+    case 4:
+        switch (nB) {
+        case 0:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_4_0_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_4_0_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_4_0_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_4_0_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 4: symbolic::hermite_dE_both_4_0_4(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 1:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_4_1_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_4_1_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_4_1_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_4_1_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 4: symbolic::hermite_dE_both_4_1_4(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 5: symbolic::hermite_dE_both_4_1_5(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 2:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_4_2_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_4_2_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_4_2_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_4_2_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 4: symbolic::hermite_dE_both_4_2_4(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 5: symbolic::hermite_dE_both_4_2_5(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 6: symbolic::hermite_dE_both_4_2_6(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 3:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_4_3_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_4_3_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_4_3_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_4_3_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 4: symbolic::hermite_dE_both_4_3_4(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 5: symbolic::hermite_dE_both_4_3_5(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 6: symbolic::hermite_dE_both_4_3_6(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 7: symbolic::hermite_dE_both_4_3_7(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        case 4:
+            switch (t) {
+            case 0: symbolic::hermite_dE_both_4_4_0(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 1: symbolic::hermite_dE_both_4_4_1(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 2: symbolic::hermite_dE_both_4_4_2(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 3: symbolic::hermite_dE_both_4_4_3(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 4: symbolic::hermite_dE_both_4_4_4(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 5: symbolic::hermite_dE_both_4_4_5(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 6: symbolic::hermite_dE_both_4_4_6(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 7: symbolic::hermite_dE_both_4_4_7(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            case 8: symbolic::hermite_dE_both_4_4_8(PA, PB, one_over_2p, dE_dPA, dE_dPB); return;
+            default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+            }
+        default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+        }
+    default: dE_dPA = dE_dPB = Vec8d(0.0); return;
+    }
+}
 
 // =============================================================================
 // CONVENIENCE FUNCTIONS
@@ -1091,7 +1339,17 @@ inline Vec8d computeTMP(int nA, int nB, int t,
 
 inline Vec8d computeSymbolic(int nA, int nB, int t,
                              const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p) {
+#ifdef RECURSUM_USE_TABLE_DISPATCH
     return SymbolicDispatcher::instance().compute(nA, nB, t, PA, PB, one_over_2p);
+#else
+    return dispatch_hermite_e_switch(nA, nB, t, PA, PB, one_over_2p);
+#endif
+}
+
+inline int computeSymbolicLayer(int nA, int nB,
+                                const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p,
+                                Vec8d* E) {
+    return SymbolicLayerDispatcher::instance().compute(nA, nB, PA, PB, one_over_2p, E);
 }
 
 inline Vec8d computeTMPGradPA(int nA, int nB, int t,
@@ -1101,7 +1359,17 @@ inline Vec8d computeTMPGradPA(int nA, int nB, int t,
 
 inline Vec8d computeSymbolicGradPA(int nA, int nB, int t,
                                    const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p) {
+#ifdef RECURSUM_USE_TABLE_DISPATCH
     return SymbolicGradPADispatcher::instance().compute(nA, nB, t, PA, PB, one_over_2p);
+#else
+    return dispatch_dE_dPA_switch(nA, nB, t, PA, PB, one_over_2p);
+#endif
+}
+
+inline void computeSymbolicGradBoth(int nA, int nB, int t,
+                                    const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p,
+                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dispatch_dE_both_switch(nA, nB, t, PA, PB, one_over_2p, dE_dPA, dE_dPB);
 }
 
 } // namespace benchmark
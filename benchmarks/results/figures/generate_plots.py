@@ -6,19 +6,22 @@ This script follows the scientific plotting guidelines at:
 ~/Research/Writing/scientific_plotting_agent_guide.md
 """
 
-import json
+import functools
+import multiprocessing
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
 from pathlib import Path
-from collections import defaultdict
+
+from benchmark_json import load_or_parse
 
 # ============================================================================
 # Publication Style Configuration (from plotting guide)
 # ============================================================================
 
 # Okabe-Ito colorblind-safe palette
-OKABE_ITO_CYCLE = [
+OKABE_ITO_CYCLE = (
     '#0072B2',  # blue
     '#E69F00',  # orange
     '#009E73',  # green
@@ -27,7 +30,10 @@ OKABE_ITO_CYCLE = [
     '#56B4E9',  # sky blue
     '#F0E442',  # yellow
     '#000000',  # black
-]
+)
+
+# Built once and shared by every rcParams update
+_PROP_CYCLE = plt.cycler(color=OKABE_ITO_CYCLE)
 
 # Journal column widths (Nature)
 COLUMN_WIDTH_SINGLE = 3.46  # inches
@@ -54,7 +60,7 @@ def configure_publication_style(font_scale=1.2):
         'axes.labelpad': 4,
         'axes.spines.top': False,
         'axes.spines.right': False,
-        'axes.prop_cycle': plt.cycler(color=OKABE_ITO_CYCLE),
+        'axes.prop_cycle': _PROP_CYCLE,
 
         # Tick configuration
         'xtick.major.width': 0.8,
@@ -80,73 +86,92 @@ def configure_publication_style(font_scale=1.2):
         'lines.markersize': 6,
 
         # Figure configuration
-        'figure.dpi': 150,
+        'figure.dpi': 72,
         'savefig.dpi': 300,
-        'savefig.bbox': 'tight',
-        'savefig.pad_inches': 0.02,
     })
 
-def save_figure(fig, filename, output_dir):
-    """Save figure in both PDF and PNG formats."""
+def save_figure(fig, filename, output_dir, formats=('png',)):
+    """Save figure in each requested format (PNG only by default)."""
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    for fmt in ['pdf', 'png']:
+    for fmt in formats:
         filepath = output_path / f"{filename}.{fmt}"
-        fig.savefig(filepath, format=fmt, dpi=300, bbox_inches='tight', pad_inches=0.02)
+        fig.savefig(filepath, format=fmt, dpi=300)
         print(f"Saved: {filepath}")
 
 # ============================================================================
 # Data Loading and Processing
 # ============================================================================
 
-def load_benchmark_data(filepath):
-    """Load Google Benchmark JSON data."""
-    with open(filepath, 'r') as f:
-        data = json.load(f)
-    return data['benchmarks']
-
-def parse_hermite_data(benchmarks):
+def load_stats(filepath, parse, cache_dir=None):
     """
-    Parse hermite coefficients benchmark data.
+    Return load_or_parse(filepath, parse, cache_dir), memoized per process.
 
-    Returns:
-        dict: Nested dict with structure [impl][shell_pair] = {'mean': float, 'std': float}
+    The memo is keyed on the file's mtime and size, so callers importing this
+    module do not reload an unchanged file.
     """
-    # Group data by implementation and shell pair
-    data = defaultdict(lambda: defaultdict(list))
+    filepath = Path(filepath)
+    st = filepath.stat()
+    return _load_stats_cached(filepath, st.st_mtime_ns, st.st_size, parse, cache_dir)
 
-    for bench in benchmarks:
-        if bench['run_type'] != 'iteration':
-            continue
+@functools.lru_cache(maxsize=4)
+def _load_stats_cached(filepath, mtime_ns, size, parse, cache_dir):
+    """Uncached body of load_stats; mtime_ns and size only key the memo."""
+    return load_or_parse(filepath, parse, cache_dir)
 
-        impl = int(bench['impl'])
-        nA = int(bench['nA'])
-        nB = int(bench['nB'])
-        L = int(bench['L'])
-        time_ns = bench['real_time']
+# Shell letter for angular momentum 0..6; only used to label plot axes
+SHELL_LABELS = 'spdfghi'
 
-        # Create shell pair label
-        shells = ['s', 'p', 'd', 'f', 'g', 'h', 'i']
-        shell_pair = f"{shells[nA]}{shells[nB]}"
+def iteration_columns(benchmarks, fields):
+    """Gather `fields` of every iteration entry into one (n_entries, n_fields) array."""
+    rows = [[bench[f] for f in fields] for bench in benchmarks
+            if bench['run_type'] == 'iteration']
+    return np.array(rows, dtype=np.float64).reshape(-1, len(fields))
 
-        data[impl][(L, shell_pair, nA, nB)].append(time_ns)
+def group_statistics(keys, times):
+    """
+    Group `times` by the unique rows of `keys` in a single vectorized pass.
+
+    Returns:
+        tuple: (unique_keys, inverse, mean, std, count) where inverse maps
+        each entry to its group and std uses ddof=1
+    """
+    # Pack each key row into a single integer code (the NumPy analogue of a
+    # categorical dtype) so the group-by sorts a flat int64 array, not rows
+    extent = keys.max(axis=0, initial=0) + 1
+    codes = np.ravel_multi_index(keys.T, extent)
+    unique_codes, inverse = np.unique(codes, return_inverse=True)
+    unique_keys = np.column_stack(np.unravel_index(unique_codes, extent))
+    counts = np.bincount(inverse)
+    mean = np.bincount(inverse, weights=times) / counts
+    residual = times - mean[inverse]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        std = np.sqrt(np.bincount(inverse, weights=residual * residual) / (counts - 1))
+    return unique_keys, inverse, mean, std, counts
+
+def parse_hermite_data(benchmarks):
+    """
+    Parse hermite coefficients benchmark data.
+
+    Returns:
+        dict: Nested dict with structure [impl][(nA, nB)] = {'mean': float, 'std': float, 'count': int}
+    """
+    cols = iteration_columns(benchmarks, ('impl', 'L', 'nA', 'nB', 'real_time'))
+    keys, _, means, stds, counts = group_statistics(cols[:, :4].astype(np.int64), cols[:, 4])
 
-    # Calculate statistics
     stats = {}
-    for impl in data:
-        stats[impl] = {}
-        for key, times in data[impl].items():
-            L, shell_pair, nA, nB = key
-            stats[impl][key] = {
-                'L': L,
-                'shell_pair': shell_pair,
-                'nA': nA,
-                'nB': nB,
-                'mean': np.mean(times),
-                'std': np.std(times, ddof=1),
-                'times': times
-            }
+    for (impl, L, nA, nB), mean, std, count in zip(
+            keys.tolist(), means.tolist(), stds.tolist(), counts.tolist()):
+        # (nA, nB) fixes both L and the shell pair, so it is a unique key
+        stats.setdefault(impl, {})[(nA, nB)] = {
+            'L': L,
+            'nA': nA,
+            'nB': nB,
+            'mean': mean,
+            'std': std,
+            'count': count
+        }
 
     return stats
 
@@ -155,34 +180,24 @@ def parse_coulomb_data(benchmarks):
     Parse coulomb hermite benchmark data.
 
     Returns:
-        dict: Nested dict with structure [impl][L_total] = {'mean': float, 'std': float, 'n_integrals': int}
+        dict: Nested dict with structure [impl][L_total] = {'mean': float, 'std': float, 'n_integrals': int, 'count': int}
     """
-    data = defaultdict(lambda: defaultdict(list))
-    n_integrals_map = {}
-
-    for bench in benchmarks:
-        if bench['run_type'] != 'iteration':
-            continue
+    cols = iteration_columns(benchmarks, ('impl', 'L_total', 'n_integrals', 'real_time'))
+    keys, inverse, means, stds, counts = group_statistics(cols[:, :2].astype(np.int64), cols[:, 3])
 
-        impl = int(bench['impl'])
-        L_total = int(bench['L_total'])
-        time_ns = bench['real_time']
-        n_integrals = int(bench['n_integrals'])
+    # n_integrals is constant within an (impl, L_total) group
+    n_integrals = np.zeros(len(keys), dtype=np.int64)
+    n_integrals[inverse] = cols[:, 2]
 
-        data[impl][L_total].append(time_ns)
-        n_integrals_map[(impl, L_total)] = n_integrals
-
-    # Calculate statistics
     stats = {}
-    for impl in data:
-        stats[impl] = {}
-        for L_total, times in data[impl].items():
-            stats[impl][L_total] = {
-                'mean': np.mean(times),
-                'std': np.std(times, ddof=1),
-                'n_integrals': n_integrals_map[(impl, L_total)],
-                'times': times
-            }
+    for (impl, L_total), n_int, mean, std, count in zip(
+            keys.tolist(), n_integrals.tolist(), means.tolist(), stds.tolist(), counts.tolist()):
+        stats.setdefault(impl, {})[L_total] = {
+            'mean': mean,
+            'std': std,
+            'n_integrals': n_int,
+            'count': count
+        }
 
     return stats
 
@@ -190,17 +205,17 @@ def parse_coulomb_data(benchmarks):
 # Plot 1: Hermite Coefficients Comparison (Bar Chart)
 # ============================================================================
 
-def plot_hermite_comparison(hermite_stats, output_dir):
+def plot_hermite_comparison(hermite_stats, output_dir, formats=('png',)):
     """
     Bar chart comparing TMP, Layered CSE, and Symbolic implementations.
     """
     configure_publication_style(font_scale=1.2)
 
     # Create figure
-    fig, ax = plt.subplots(figsize=(COLUMN_WIDTH_DOUBLE, COLUMN_WIDTH_DOUBLE * 0.4))
+    fig, ax = plt.subplots(figsize=(COLUMN_WIDTH_DOUBLE, COLUMN_WIDTH_DOUBLE * 0.4), layout='tight')
 
     # Define shell pairs to plot (ordered by complexity)
-    shell_pairs_order = ['ss', 'sp', 'pp', 'sd', 'pd', 'dd', 'ff', 'gg']
+    shell_pairs_order = [(0, 0), (0, 1), (1, 1), (0, 2), (1, 2), (2, 2), (3, 3), (4, 4)]
 
     # Implementation labels
     impl_labels = {
@@ -214,19 +229,11 @@ def plot_hermite_comparison(hermite_stats, output_dir):
 
     for shell_pair in shell_pairs_order:
         for impl in [0, 1, 2]:
-            # Find matching data
-            found = False
-            for key, stats in hermite_stats[impl].items():
-                if stats['shell_pair'] == shell_pair:
-                    plot_data[impl].append({
-                        'mean': stats['mean'],
-                        'std': stats['std'],
-                        'shell_pair': shell_pair
-                    })
-                    found = True
-                    break
-            if not found:
-                plot_data[impl].append({'mean': np.nan, 'std': np.nan, 'shell_pair': shell_pair})
+            stats = hermite_stats[impl].get(shell_pair, {'mean': np.nan, 'std': np.nan})
+            plot_data[impl].append({
+                'mean': stats['mean'],
+                'std': stats['std'],
+            })
 
     # Plot bars
     x = np.arange(len(shell_pairs_order))
@@ -248,40 +255,38 @@ def plot_hermite_comparison(hermite_stats, output_dir):
     ax.set_xlabel('Shell Pair')
     ax.set_ylabel('Execution Time (ns)')
     ax.set_xticks(x)
-    ax.set_xticklabels(shell_pairs_order)
+    ax.set_xticklabels([SHELL_LABELS[nA] + SHELL_LABELS[nB] for nA, nB in shell_pairs_order])
     ax.legend(loc='upper left', ncol=3)
     ax.grid(axis='y', alpha=0.3, linewidth=0.5)
 
     # Save
-    save_figure(fig, 'hermite_coefficients_comparison', output_dir)
+    save_figure(fig, 'hermite_coefficients_comparison', output_dir, formats)
     plt.close(fig)
 
 # ============================================================================
 # Plot 2: Hermite Coefficients vs L (Line Plot)
 # ============================================================================
 
-def plot_hermite_vs_L(hermite_stats, output_dir):
+def plot_hermite_vs_L(hermite_stats, output_dir, formats=('png',)):
     """
     Line plot showing execution time vs total angular momentum L.
     """
     configure_publication_style(font_scale=1.2)
 
-    fig, ax = plt.subplots(figsize=(COLUMN_WIDTH_SINGLE, COLUMN_WIDTH_SINGLE * 0.75))
+    fig, ax = plt.subplots(figsize=(COLUMN_WIDTH_SINGLE, COLUMN_WIDTH_SINGLE * 0.75), layout='tight')
 
     impl_labels = {0: 'TMP', 1: 'Layered CSE', 2: 'Symbolic'}
     markers = ['o', 's', '^']
 
     for impl_idx, impl in enumerate([0, 1, 2]):
-        # Group by L
-        L_data = defaultdict(list)
-        for key, stats in hermite_stats[impl].items():
-            L = stats['L']
-            L_data[L].append(stats['mean'])
-
-        # Calculate mean for each L
-        L_values = sorted(L_data.keys())
-        means = [np.mean(L_data[L]) for L in L_values]
-        stds = [np.std(L_data[L]) for L in L_values]
+        # Group shell-pair means by L and reduce each group in one pass
+        entries = hermite_stats[impl].values()
+        L_all = np.fromiter((st['L'] for st in entries), dtype=np.int64, count=len(entries))
+        mean_all = np.fromiter((st['mean'] for st in entries), dtype=np.float64, count=len(entries))
+        L_values, inverse = np.unique(L_all, return_inverse=True)
+        counts = np.bincount(inverse)
+        means = np.bincount(inverse, weights=mean_all) / counts
+        stds = np.sqrt(np.bincount(inverse, weights=(mean_all - means[inverse]) ** 2) / counts)
 
         ax.errorbar(L_values, means, yerr=stds,
                    label=impl_labels[impl],
@@ -302,20 +307,20 @@ def plot_hermite_vs_L(hermite_stats, output_dir):
     ax.grid(True, alpha=0.3, linewidth=0.5, which='both')
     ax.minorticks_on()
 
-    save_figure(fig, 'hermite_coefficients_vs_L', output_dir)
+    save_figure(fig, 'hermite_coefficients_vs_L', output_dir, formats)
     plt.close(fig)
 
 # ============================================================================
 # Plot 3: Coulomb Hermite Comparison (Bar Chart)
 # ============================================================================
 
-def plot_coulomb_comparison(coulomb_stats, output_dir):
+def plot_coulomb_comparison(coulomb_stats, output_dir, formats=('png',)):
     """
     Bar chart comparing TMP and Layered CSE for Coulomb Hermite integrals.
     """
     configure_publication_style(font_scale=1.2)
 
-    fig, ax = plt.subplots(figsize=(COLUMN_WIDTH_DOUBLE, COLUMN_WIDTH_DOUBLE * 0.4))
+    fig, ax = plt.subplots(figsize=(COLUMN_WIDTH_DOUBLE, COLUMN_WIDTH_DOUBLE * 0.4), layout='tight')
 
     impl_labels = {0: 'TMP', 1: 'Layered CSE'}
 
@@ -327,8 +332,9 @@ def plot_coulomb_comparison(coulomb_stats, output_dir):
     width = 0.35
 
     for impl_idx, impl in enumerate([0, 1]):
-        means = [coulomb_stats[impl].get(L, {'mean': np.nan})['mean'] for L in L_values]
-        stds = [coulomb_stats[impl].get(L, {'std': 0})['std'] for L in L_values]
+        impl_stats = coulomb_stats[impl]
+        means, stds = np.array([(impl_stats[L]['mean'], impl_stats[L]['std']) if L in impl_stats
+                                else (np.nan, 0.0) for L in L_values]).T
 
         offset = (impl_idx - 0.5) * width
         ax.bar(x + offset, means, width, yerr=stds,
@@ -346,39 +352,31 @@ def plot_coulomb_comparison(coulomb_stats, output_dir):
     ax.legend(loc='upper left')
     ax.grid(axis='y', alpha=0.3, linewidth=0.5)
 
-    save_figure(fig, 'coulomb_hermite_comparison', output_dir)
+    save_figure(fig, 'coulomb_hermite_comparison', output_dir, formats)
     plt.close(fig)
 
 # ============================================================================
 # Plot 4: Coulomb Hermite Scaling (Line Plot)
 # ============================================================================
 
-def plot_coulomb_scaling(coulomb_stats, output_dir):
+def plot_coulomb_scaling(coulomb_stats, output_dir, formats=('png',)):
     """
     Line plot showing cost per integral vs L_total.
     """
     configure_publication_style(font_scale=1.2)
 
-    fig, ax = plt.subplots(figsize=(COLUMN_WIDTH_SINGLE, COLUMN_WIDTH_SINGLE * 0.75))
+    fig, ax = plt.subplots(figsize=(COLUMN_WIDTH_SINGLE, COLUMN_WIDTH_SINGLE * 0.75), layout='tight')
 
     impl_labels = {0: 'TMP', 1: 'Layered CSE'}
     markers = ['o', 's']
 
     for impl_idx, impl in enumerate([0, 1]):
-        L_values = sorted(coulomb_stats[impl].keys())
-
-        # Calculate cost per integral
-        cost_per_integral = []
-        cost_per_integral_std = []
-
-        for L in L_values:
-            stats = coulomb_stats[impl][L]
-            n_integrals = stats['n_integrals']
-            mean_time = stats['mean']
-            std_time = stats['std']
-
-            cost_per_integral.append(mean_time / n_integrals)
-            cost_per_integral_std.append(std_time / n_integrals)
+        # Calculate cost per integral from one (L, mean, std, n_integrals) row per L_total
+        arr = np.array([(L, st['mean'], st['std'], st['n_integrals'])
+                        for L, st in sorted(coulomb_stats[impl].items())], dtype=np.float64)
+        L_values = arr[:, 0]
+        cost_per_integral = arr[:, 1] / arr[:, 3]
+        cost_per_integral_std = arr[:, 2] / arr[:, 3]
 
         ax.errorbar(L_values, cost_per_integral, yerr=cost_per_integral_std,
                    label=impl_labels[impl],
@@ -399,54 +397,76 @@ def plot_coulomb_scaling(coulomb_stats, output_dir):
     ax.grid(True, alpha=0.3, linewidth=0.5, which='both')
     ax.minorticks_on()
 
-    save_figure(fig, 'coulomb_hermite_scaling', output_dir)
+    save_figure(fig, 'coulomb_hermite_scaling', output_dir, formats)
     plt.close(fig)
 
 # ============================================================================
 # Main Execution
 # ============================================================================
 
+def run_task(func, args):
+    """Call func(*args); module-level so it can be sent to worker processes."""
+    return func(*args)
+
 def main():
     """Generate all plots."""
+    import argparse
+    parser = argparse.ArgumentParser(description='Generate McMurchie-Davidson benchmark plots')
+    parser.add_argument('--formats', default='png',
+                        help='Comma-separated figure formats, e.g. png,pdf (default: png)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always re-parse the benchmark JSON instead of using cached statistics')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Worker processes for plot generation (default: 1, render in this process)')
+    args = parser.parse_args()
+    formats = args.formats.split(',')
+
     # Paths
     data_dir = Path('/home/ruben/Research/Science/Projects/RECURSUM/benchmarks/results/raw')
     output_dir = Path('/home/ruben/Research/Science/Projects/RECURSUM/benchmarks/results/figures')
 
     hermite_file = data_dir / 'hermite_coefficients.json'
     coulomb_file = data_dir / 'coulomb_hermite.json'
+    cache_dir = None if args.no_cache else data_dir / '.stats_cache'
 
     print("=" * 70)
     print("Generating Publication-Ready McMurchie-Davidson Benchmark Plots")
     print("=" * 70)
 
-    # Load and parse data
-    print("\nLoading data...")
-    hermite_benchmarks = load_benchmark_data(hermite_file)
-    coulomb_benchmarks = load_benchmark_data(coulomb_file)
-
-    print(f"  Hermite coefficients: {len(hermite_benchmarks)} benchmark entries")
-    print(f"  Coulomb Hermite: {len(coulomb_benchmarks)} benchmark entries")
+    # Load and parse data (reusing cached statistics when the JSON is unchanged)
+    print("\nLoading and parsing benchmark results...")
+    hermite_stats = load_stats(hermite_file, parse_hermite_data, cache_dir)
+    coulomb_stats = load_stats(coulomb_file, parse_coulomb_data, cache_dir)
 
-    print("\nParsing benchmark results...")
-    hermite_stats = parse_hermite_data(hermite_benchmarks)
-    coulomb_stats = parse_coulomb_data(coulomb_benchmarks)
+    print(f"  Hermite coefficients: {sum(map(len, hermite_stats.values()))} benchmark configurations")
+    print(f"  Coulomb Hermite: {sum(map(len, coulomb_stats.values()))} benchmark configurations")
 
     print(f"  Hermite implementations: {list(hermite_stats.keys())}")
     print(f"  Coulomb implementations: {list(coulomb_stats.keys())}")
 
-    # Generate plots
+    # Generate plots; each one reads its own slice of the stats and writes
+    # its own files, so they can be rendered in parallel
     print("\nGenerating plots...")
-    print("\n[1/4] Hermite Coefficients Comparison (Bar Chart)")
-    plot_hermite_comparison(hermite_stats, output_dir)
-
-    print("\n[2/4] Hermite Coefficients vs L (Line Plot)")
-    plot_hermite_vs_L(hermite_stats, output_dir)
-
-    print("\n[3/4] Coulomb Hermite Comparison (Bar Chart)")
-    plot_coulomb_comparison(coulomb_stats, output_dir)
-
-    print("\n[4/4] Coulomb Hermite Scaling (Line Plot)")
-    plot_coulomb_scaling(coulomb_stats, output_dir)
+    tasks = [
+        ('Hermite Coefficients Comparison (Bar Chart)', plot_hermite_comparison,
+         (hermite_stats, output_dir, formats)),
+        ('Hermite Coefficients vs L (Line Plot)', plot_hermite_vs_L,
+         (hermite_stats, output_dir, formats)),
+        ('Coulomb Hermite Comparison (Bar Chart)', plot_coulomb_comparison,
+         (coulomb_stats, output_dir, formats)),
+        ('Coulomb Hermite Scaling (Line Plot)', plot_coulomb_scaling,
+         (coulomb_stats, output_dir, formats)),
+    ]
+    jobs = min(args.jobs, len(tasks))
+    if jobs > 1:
+        # spawn avoids forking a process that has already initialized matplotlib
+        print(f"Rendering {len(tasks)} plots with {jobs} worker processes")
+        with multiprocessing.get_context('spawn').Pool(jobs) as pool:
+            pool.starmap(run_task, [(func, func_args) for _, func, func_args in tasks])
+    else:
+        for i, (label, func, func_args) in enumerate(tasks, 1):
+            print(f"\n[{i}/{len(tasks)}] {label}")
+            run_task(func, func_args)
 
     print("\n" + "=" * 70)
     print("All plots generated successfully!")
@@ -10,19 +10,23 @@ This script follows the scientific plotting guidelines and uses:
 - Error bars (±1σ standard deviation)
 """
 
-import json
+import math
+import multiprocessing
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
 from pathlib import Path
 from collections import defaultdict
 
+from benchmark_json import load_or_parse
+
 # ============================================================================
 # Publication Style Configuration
 # ============================================================================
 
 # Okabe-Ito colorblind-safe palette
-OKABE_ITO_CYCLE = [
+OKABE_ITO_CYCLE = (
     '#0072B2',  # blue
     '#E69F00',  # orange
     '#009E73',  # green
@@ -31,59 +35,67 @@ OKABE_ITO_CYCLE = [
     '#56B4E9',  # sky blue
     '#F0E442',  # yellow
     '#000000',  # black
-]
+)
+
+# Built once and shared by every rcParams update
+_PROP_CYCLE = plt.cycler(color=OKABE_ITO_CYCLE)
+
+# Style settings that do not depend on the font scale; applied once at import
+# so each plot only has to touch the font-size keys
+_BASE_RC = {
+    # Font configuration
+    'font.family': 'sans-serif',
+    'font.sans-serif': ['Arial', 'Helvetica', 'DejaVu Sans'],
+    'mathtext.fontset': 'dejavusans',
+
+    # Axes configuration
+    'axes.linewidth': 0.8,
+    'axes.labelpad': 3,
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'axes.prop_cycle': _PROP_CYCLE,
+
+    # Tick configuration
+    'xtick.major.width': 0.8,
+    'xtick.minor.width': 0.6,
+    'ytick.major.width': 0.8,
+    'ytick.minor.width': 0.6,
+    'xtick.major.size': 3.5,
+    'xtick.minor.size': 2,
+    'ytick.major.size': 3.5,
+    'ytick.minor.size': 2,
+    'xtick.direction': 'out',
+    'ytick.direction': 'out',
+
+    # Legend configuration
+    'legend.frameon': False,
+    'legend.borderpad': 0.3,
+    'legend.handlelength': 1.5,
+    'legend.handletextpad': 0.5,
+    'legend.columnspacing': 1.0,
+
+    # Line configuration
+    'lines.linewidth': 1.5,
+    'lines.markersize': 5,
+
+    # Figure configuration
+    'figure.dpi': 150,
+    'savefig.dpi': 300,
+    'savefig.bbox': 'tight',
+    'savefig.pad_inches': 0.02,
+}
+
+plt.rcParams.update(_BASE_RC)
 
 def configure_publication_style(font_scale=1.1):
-    """Configure matplotlib for publication-quality figures with smaller fonts."""
+    """Set the publication font sizes (smaller fonts) for the given scale."""
     plt.rcParams.update({
-        # Font configuration
-        'font.family': 'sans-serif',
-        'font.sans-serif': ['Arial', 'Helvetica', 'DejaVu Sans'],
-        'mathtext.fontset': 'dejavusans',
-
-        # Font sizes - SMALLER than before
         'font.size': 9 * font_scale,
         'axes.labelsize': 10 * font_scale,
         'axes.titlesize': 11 * font_scale,
         'xtick.labelsize': 8 * font_scale,
         'ytick.labelsize': 8 * font_scale,
         'legend.fontsize': 8 * font_scale,
-
-        # Axes configuration
-        'axes.linewidth': 0.8,
-        'axes.labelpad': 3,
-        'axes.spines.top': False,
-        'axes.spines.right': False,
-        'axes.prop_cycle': plt.cycler(color=OKABE_ITO_CYCLE),
-
-        # Tick configuration
-        'xtick.major.width': 0.8,
-        'xtick.minor.width': 0.6,
-        'ytick.major.width': 0.8,
-        'ytick.minor.width': 0.6,
-        'xtick.major.size': 3.5,
-        'xtick.minor.size': 2,
-        'ytick.major.size': 3.5,
-        'ytick.minor.size': 2,
-        'xtick.direction': 'out',
-        'ytick.direction': 'out',
-
-        # Legend configuration
-        'legend.frameon': False,
-        'legend.borderpad': 0.3,
-        'legend.handlelength': 1.5,
-        'legend.handletextpad': 0.5,
-        'legend.columnspacing': 1.0,
-
-        # Line configuration
-        'lines.linewidth': 1.5,
-        'lines.markersize': 5,
-
-        # Figure configuration
-        'figure.dpi': 150,
-        'savefig.dpi': 300,
-        'savefig.bbox': 'tight',
-        'savefig.pad_inches': 0.02,
     })
 
 def save_figure(fig, filename, output_dir):
@@ -91,30 +103,47 @@ def save_figure(fig, filename, output_dir):
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
+    # Compute the padded tight bounding box once, at the output resolution;
+    # passing it explicitly stops each savefig call from re-running the
+    # tight-bbox layout pass
+    screen_dpi = fig.dpi
+    fig.set_dpi(300)
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.02)
+    fig.set_dpi(screen_dpi)
+
     for fmt in ['pdf', 'png']:
         filepath = output_path / f"{filename}.{fmt}"
-        fig.savefig(filepath, format=fmt, dpi=300, bbox_inches='tight', pad_inches=0.02)
+        fig.savefig(filepath, format=fmt, dpi=300, bbox_inches=bbox)
         print(f"  Saved: {filepath}")
 
 # ============================================================================
 # Data Loading and Processing
 # ============================================================================
 
-def load_benchmark_data(filepath):
-    """Load Google Benchmark JSON data."""
-    with open(filepath, 'r') as f:
-        data = json.load(f)
-    return data['benchmarks']
+def welford_update(state, x):
+    """Fold sample x into a running [count, mean, M2] accumulator in place."""
+    state[0] += 1
+    delta = x - state[1]
+    state[1] += delta / state[0]
+    state[2] += delta * (x - state[1])
+
+def welford_std(count, m2):
+    """Sample standard deviation (ddof=1) from a Welford accumulator; 0.0 for one sample."""
+    return math.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+
+# Shell letter for angular momentum 0..6; only used to label plot axes
+SHELL_LABELS = 'spdfghi'
 
 def parse_hermite_data(benchmarks):
     """
     Parse hermite coefficients benchmark data.
 
     Returns:
-        dict: Nested dict with structure [impl][shell_pair] = {'mean': float, 'std': float}
+        dict: Nested dict with structure [impl][(nA, nB)] = {'mean': float, 'std': float, 'count': int}
     """
-    # Group data by implementation and shell pair
-    data = defaultdict(lambda: defaultdict(list))
+    # Running [count, mean, M2] per implementation and (nA, nB) (Welford);
+    # (nA, nB) fixes both L and the shell pair
+    acc = defaultdict(lambda: defaultdict(lambda: [0, 0.0, 0.0]))
 
     for bench in benchmarks:
         if bench['run_type'] != 'iteration':
@@ -123,29 +152,22 @@ def parse_hermite_data(benchmarks):
         impl = int(bench['impl'])
         nA = int(bench['nA'])
         nB = int(bench['nB'])
-        L = int(bench['L'])
         time_ns = bench['real_time']
 
-        # Create shell pair label
-        shells = ['s', 'p', 'd', 'f', 'g', 'h', 'i']
-        shell_pair = f"{shells[nA]}{shells[nB]}"
-
-        data[impl][(L, shell_pair, nA, nB)].append(time_ns)
+        welford_update(acc[impl][(nA, nB)], time_ns)
 
     # Calculate statistics
     stats = {}
-    for impl in data:
+    for impl in acc:
         stats[impl] = {}
-        for key, times in data[impl].items():
-            L, shell_pair, nA, nB = key
-            stats[impl][key] = {
-                'L': L,
-                'shell_pair': shell_pair,
+        for (nA, nB), (count, mean, m2) in acc[impl].items():
+            stats[impl][(nA, nB)] = {
+                'L': nA + nB,
                 'nA': nA,
                 'nB': nB,
-                'mean': np.mean(times),
-                'std': np.std(times, ddof=1),
-                'times': times
+                'mean': mean,
+                'std': welford_std(count, m2),
+                'count': count
             }
 
     return stats
@@ -155,10 +177,11 @@ def parse_coulomb_data(benchmarks):
     Parse coulomb hermite benchmark data.
 
     Returns:
-        dict: Nested dict with structure [impl][L_total] = {'mean': float, 'std': float, 'n_integrals': int}
+        dict: Nested dict with structure [impl][L_total] = {'mean': float, 'std': float, 'n_integrals': int, 'count': int}
     """
-    data = defaultdict(lambda: defaultdict(list))
-    n_integrals_map = {}
+    # Running [count, mean, M2, n_integrals] per (implementation, L_total);
+    # n_integrals is constant within a group so it is recorded once
+    acc = defaultdict(lambda: [0, 0.0, 0.0, None])
 
     for bench in benchmarks:
         if bench['run_type'] != 'iteration':
@@ -167,22 +190,21 @@ def parse_coulomb_data(benchmarks):
         impl = int(bench['impl'])
         L_total = int(bench['L_total'])
         time_ns = bench['real_time']
-        n_integrals = int(bench['n_integrals'])
 
-        data[impl][L_total].append(time_ns)
-        n_integrals_map[(impl, L_total)] = n_integrals
+        state = acc[(impl, L_total)]
+        if state[3] is None:
+            state[3] = int(bench['n_integrals'])
+        welford_update(state, time_ns)
 
     # Calculate statistics
     stats = {}
-    for impl in data:
-        stats[impl] = {}
-        for L_total, times in data[impl].items():
-            stats[impl][L_total] = {
-                'mean': np.mean(times),
-                'std': np.std(times, ddof=1),
-                'n_integrals': n_integrals_map[(impl, L_total)],
-                'times': times
-            }
+    for (impl, L_total), (count, mean, m2, n_integrals) in acc.items():
+        stats.setdefault(impl, {})[L_total] = {
+            'mean': mean,
+            'std': welford_std(count, m2),
+            'n_integrals': n_integrals,
+            'count': count
+        }
 
     return stats
 
@@ -200,7 +222,7 @@ def plot_hermite_comparison(hermite_stats, output_dir):
     fig, ax = plt.subplots(figsize=(7.5, 4.5))
 
     # Define shell pairs to plot (ordered by complexity)
-    shell_pairs_order = ['ss', 'sp', 'pp', 'sd', 'pd', 'dd', 'ff', 'gg']
+    shell_pairs_order = [(0, 0), (0, 1), (1, 1), (0, 2), (1, 2), (2, 2), (3, 3), (4, 4)]
 
     # Implementation labels and styles
     impl_info = {
@@ -220,23 +242,19 @@ def plot_hermite_comparison(hermite_stats, output_dir):
         L_values = []
 
         for shell_pair in shell_pairs_order:
-            # Find matching data
-            found = False
-            for key, stats in hermite_stats[impl].items():
-                if stats['shell_pair'] == shell_pair:
-                    means.append(stats['mean'])
-                    stds.append(stats['std'])
-                    L_values.append(stats['L'])
-                    found = True
-                    break
-
-            if not found:
+            stats = hermite_stats[impl].get(shell_pair)
+            if stats:
+                means.append(stats['mean'])
+                stds.append(stats['std'])
+                L_values.append(stats['L'])
+            else:
                 means.append(np.nan)
                 stds.append(0)
                 L_values.append(0)
 
         # Create x-axis labels with L values
-        x_labels = [f"{sp}\nL={L}" for sp, L in zip(shell_pairs_order, L_values)]
+        x_labels = [f"{SHELL_LABELS[nA]}{SHELL_LABELS[nB]}\nL={L}"
+                    for (nA, nB), L in zip(shell_pairs_order, L_values)]
 
         # Plot line with error bars
         x = np.arange(len(shell_pairs_order))
@@ -291,16 +309,14 @@ def plot_hermite_vs_L(hermite_stats, output_dir):
         if impl not in hermite_stats:
             continue
 
-        # Group by L
-        L_data = defaultdict(list)
-        for key, stats in hermite_stats[impl].items():
-            L = stats['L']
-            L_data[L].append(stats['mean'])
-
-        # Calculate mean for each L
-        L_values = sorted(L_data.keys())
-        means = [np.mean(L_data[L]) for L in L_values]
-        stds = [np.std(L_data[L]) if len(L_data[L]) > 1 else 0 for L in L_values]
+        # Group shell-pair means by L and reduce each group in one pass
+        entries = hermite_stats[impl].values()
+        L_all = np.fromiter((st['L'] for st in entries), dtype=np.int64, count=len(entries))
+        mean_all = np.fromiter((st['mean'] for st in entries), dtype=np.float64, count=len(entries))
+        L_values, inverse = np.unique(L_all, return_inverse=True)
+        counts = np.bincount(inverse)
+        means = np.bincount(inverse, weights=mean_all) / counts
+        stds = np.sqrt(np.bincount(inverse, weights=(mean_all - means[inverse]) ** 2) / counts)
 
         ax.errorbar(L_values, means, yerr=stds,
                    label=impl_info[impl]['label'],
@@ -342,10 +358,9 @@ def plot_layered_codegen_speedup(hermite_stats, output_dir):
     for impl in [0, 1, 2, 3]:
         if impl not in hermite_stats:
             continue
-        for key, stats in hermite_stats[impl].items():
-            if stats['shell_pair'] == 'ss':
-                ss_times[impl] = stats['mean']
-                break
+        stats = hermite_stats[impl].get((0, 0))
+        if stats:
+            ss_times[impl] = stats['mean']
 
     # Calculate speedups (LayeredCodegen vs others)
     if 3 in ss_times:
@@ -416,14 +431,16 @@ def plot_coulomb_comparison(coulomb_stats, output_dir):
     for impl in [0, 1, 3]:
         if impl in coulomb_stats:
             all_L.update(coulomb_stats[impl].keys())
-    L_values = sorted(all_L)
+    L_keys = sorted(all_L)
+    L_values = np.asarray(L_keys, dtype=np.float64)
 
     for impl_idx, impl in enumerate([0, 1, 3]):
         if impl not in coulomb_stats:
             continue
 
-        means = [coulomb_stats[impl].get(L, {'mean': np.nan})['mean'] for L in L_values]
-        stds = [coulomb_stats[impl].get(L, {'std': 0})['std'] for L in L_values]
+        impl_stats = coulomb_stats[impl]
+        means, stds = np.array([(impl_stats[L]['mean'], impl_stats[L]['std']) if L in impl_stats
+                                else (np.nan, 0.0) for L in L_keys], dtype=np.float64).T
 
         ax.errorbar(L_values, means, yerr=stds,
                    label=impl_info[impl]['label'],
@@ -470,19 +487,12 @@ def plot_coulomb_scaling(coulomb_stats, output_dir):
         if impl not in coulomb_stats:
             continue
 
-        L_values = sorted(coulomb_stats[impl].keys())
+        # One (n_integrals, mean, std) row per L_total, sliced into columns
+        n_integrals, means, stds = np.array(
+            [(stats['n_integrals'], stats['mean'], stats['std'])
+             for _, stats in sorted(coulomb_stats[impl].items())], dtype=np.float64).T
 
-        n_integrals_list = []
-        means = []
-        stds = []
-
-        for L in L_values:
-            stats = coulomb_stats[impl][L]
-            n_integrals_list.append(stats['n_integrals'])
-            means.append(stats['mean'])
-            stds.append(stats['std'])
-
-        ax.errorbar(n_integrals_list, means, yerr=stds,
+        ax.errorbar(n_integrals, means, yerr=stds,
                    label=impl_info[impl]['label'],
                    color=OKABE_ITO_CYCLE[impl_idx],
                    marker=impl_info[impl]['marker'],
@@ -510,51 +520,64 @@ def plot_coulomb_scaling(coulomb_stats, output_dir):
 # Main Execution
 # ============================================================================
 
+def run_task(func, args):
+    """Call func(*args); module-level so it can be sent to worker processes."""
+    return func(*args)
+
 def main():
     """Generate all 5 plots with publication-quality formatting."""
+    import argparse
+    parser = argparse.ArgumentParser(description='Regenerate all 5 benchmark plots')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always re-parse the benchmark JSON instead of using cached statistics')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Worker processes for plot generation (default: 1, render in this process)')
+    args = parser.parse_args()
+
     # Paths
     data_dir = Path('/home/ruben/Research/Science/Projects/RECURSUM/benchmarks/results/raw')
     output_dir = Path('/home/ruben/Research/Science/Projects/RECURSUM/benchmarks/results/figures')
 
     hermite_file = data_dir / 'hermite_coefficients.json'
     coulomb_file = data_dir / 'coulomb_hermite.json'
+    cache_dir = None if args.no_cache else data_dir / '.stats_cache'
 
     print("=" * 70)
     print("Regenerating All 5 Benchmark Plots with Larger Font Sizes")
     print("=" * 70)
 
     # Load and parse data
-    print("\nLoading data...")
-    hermite_benchmarks = load_benchmark_data(hermite_file)
-    coulomb_benchmarks = load_benchmark_data(coulomb_file)
+    print("\nLoading and parsing benchmark results...")
+    hermite_stats = load_or_parse(hermite_file, parse_hermite_data, cache_dir)
+    coulomb_stats = load_or_parse(coulomb_file, parse_coulomb_data, cache_dir)
 
-    print(f"  Hermite coefficients: {len(hermite_benchmarks)} benchmark entries")
-    print(f"  Coulomb Hermite: {len(coulomb_benchmarks)} benchmark entries")
-
-    print("\nParsing benchmark results...")
-    hermite_stats = parse_hermite_data(hermite_benchmarks)
-    coulomb_stats = parse_coulomb_data(coulomb_benchmarks)
+    print(f"  Hermite coefficients: {sum(map(len, hermite_stats.values()))} benchmark configurations")
+    print(f"  Coulomb Hermite: {sum(map(len, coulomb_stats.values()))} benchmark configurations")
 
     print(f"  Hermite implementations found: {sorted(hermite_stats.keys())}")
     print(f"  Coulomb implementations found: {sorted(coulomb_stats.keys())}")
 
     # Generate plots
     print("\nGenerating plots with smaller fonts...")
-
-    print("\n[1/5] Hermite Coefficients Comparison (4-way)")
-    plot_hermite_comparison(hermite_stats, output_dir)
-
-    print("\n[2/5] Hermite Coefficients vs L")
-    plot_hermite_vs_L(hermite_stats, output_dir)
-
-    print("\n[3/5] LayeredCodegen Speedup")
-    plot_layered_codegen_speedup(hermite_stats, output_dir)
-
-    print("\n[4/5] Coulomb Hermite Comparison")
-    plot_coulomb_comparison(coulomb_stats, output_dir)
-
-    print("\n[5/5] Coulomb Hermite Scaling")
-    plot_coulomb_scaling(coulomb_stats, output_dir)
+    # The plots are independent, so they can be rendered in parallel
+    tasks = [
+        ('Hermite Coefficients Comparison (4-way)', plot_hermite_comparison,
+         (hermite_stats, output_dir)),
+        ('Hermite Coefficients vs L', plot_hermite_vs_L, (hermite_stats, output_dir)),
+        ('LayeredCodegen Speedup', plot_layered_codegen_speedup, (hermite_stats, output_dir)),
+        ('Coulomb Hermite Comparison', plot_coulomb_comparison, (coulomb_stats, output_dir)),
+        ('Coulomb Hermite Scaling', plot_coulomb_scaling, (coulomb_stats, output_dir)),
+    ]
+    jobs = min(args.jobs, len(tasks))
+    if jobs > 1:
+        # spawn avoids forking a process that has already initialized matplotlib
+        print(f"Rendering {len(tasks)} plots with {jobs} worker processes")
+        with multiprocessing.get_context('spawn').Pool(jobs) as pool:
+            pool.starmap(run_task, [(func, func_args) for _, func, func_args in tasks])
+    else:
+        for i, (label, func, func_args) in enumerate(tasks, 1):
+            print(f"\n[{i}/{len(tasks)}] {label}")
+            run_task(func, func_args)
 
     print("\n" + "=" * 70)
     print("All 5 plots regenerated successfully with larger font sizes (30% increase)!")
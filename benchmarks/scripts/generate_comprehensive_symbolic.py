@@ -4,7 +4,7 @@ Generate comprehensive symbolic code for ALL McMurchie-Davidson recurrences.
 
 Coverage:
 - Hermite E coefficients: E^{0,0}_0 to E^{4,4}_8 (ss to gg shell pairs)
-- Hermite gradients: ∂E/∂PA, ∂E/∂PB (direct differentiation)
+- Hermite gradients: ∂E/∂PA, ∂E/∂PB (Helgaker-Taylor closed form)
 - Nuclear gradients: ∂E/∂A, ∂E/∂B (chain rule)
 - Coulomb R integrals: R_{0,0,0} to R_{16,16,16} (for (gg|gg) ERIs)
 
@@ -12,11 +12,15 @@ Output files:
 - symbolic_generated/hermite_e_symbolic.hpp
 - symbolic_generated/hermite_grad_symbolic.hpp
 - symbolic_generated/coulomb_r_symbolic.hpp
+- symbolic_generated/symbolic_all.hpp (umbrella, suitable as a precompiled header)
 """
 
 import sympy as sp
 from sympy import symbols, expand, diff, factorial, binomial, sqrt, pi, exp, cse
+from sympy.printing.c import C99CodePrinter
 from typing import Dict, Tuple, List
+from functools import lru_cache
+import multiprocessing
 import os
 import argparse
 
@@ -24,28 +28,40 @@ import argparse
 # PART 1: Hermite E Coefficients
 # =============================================================================
 
-def generate_hermite_e(max_L: int) -> Dict[Tuple[int, int, int], sp.Expr]:
+# Polynomial in (PA, PB, one_over_2p) as {(a, b, c): coeff} for PA^a PB^b one_over_2p^c
+Monomials = Dict[Tuple[int, int, int], int]
+
+
+def _accumulate(target: Monomials, source: Monomials, scale: int = 1,
+                shift: Tuple[int, int, int] = (0, 0, 0)) -> None:
+    """Add scale * PA^da PB^db one_over_2p^dc * source into target in place."""
+    da, db, dc = shift
+    for (a, b, c), coeff in source.items():
+        key = (a + da, b + db, c + dc)
+        target[key] = target.get(key, 0) + scale * coeff
+
+
+def generate_hermite_e_monomials(max_L: int) -> Dict[Tuple[int, int, int], Monomials]:
     """
-    Generate symbolic expressions for Hermite E coefficients E^{nA,nB}_t.
+    Build Hermite E coefficients as integer monomial maps.
 
-    Uses Helgaker-Taylor (1992) recurrence:
-        E^{i+1,j}_t = (1/2p) * E^{i,j}_{t-1} + PA * E^{i,j}_t + (t+1) * E^{i,j}_{t+1}
+    Every E^{nA,nB}_t is a polynomial in PA, PB and one_over_2p with integer
+    coefficients, so the recurrence reduces to merging monomial dicts. The
+    result is already in expanded canonical form.
 
     Args:
         max_L: Maximum angular momentum (4 for g orbitals)
 
     Returns:
-        Dictionary mapping (nA, nB, t) -> symbolic expression
+        Dictionary mapping (nA, nB, t) -> monomial map
     """
-    PA, PB, one_over_2p = symbols('PA PB one_over_2p', real=True)
-
-    E: Dict[Tuple[int, int, int], sp.Expr] = {}
-    E[(0, 0, 0)] = sp.Integer(1)
+    E: Dict[Tuple[int, int, int], Monomials] = {(0, 0, 0): {(0, 0, 0): 1}}
+    empty: Monomials = {}
 
-    def get_E(nA: int, nB: int, t: int) -> sp.Expr:
+    def get_E(nA: int, nB: int, t: int) -> Monomials:
         if nA < 0 or nB < 0 or t < 0 or t > nA + nB:
-            return sp.Integer(0)
-        return E.get((nA, nB, t), sp.Integer(0))
+            return empty
+        return E.get((nA, nB, t), empty)
 
     # Build all coefficients up to max_L
     for total_L in range(1, 2 * max_L + 1):
@@ -54,54 +70,82 @@ def generate_hermite_e(max_L: int) -> Dict[Tuple[int, int, int], sp.Expr]:
             if nB < 0 or nB > max_L:
                 continue
 
+            # Choose recurrence direction: A-side from E^{nA-1,nB}_*,
+            # B-side from E^{0,nB-1}_*
+            if nA > 0:
+                src, gen = (nA - 1, nB), (1, 0, 0)
+            else:
+                src, gen = (0, nB - 1), (0, 1, 0)
+
             for t in range(nA + nB + 1):
                 if (nA, nB, t) in E:
                     continue
 
-                # Choose recurrence direction
-                if nA > 0:
-                    # A-side: E^{nA,nB}_t from E^{nA-1,nB}_*
-                    if t == 0:
-                        E[(nA, nB, 0)] = PA * get_E(nA-1, nB, 0) + get_E(nA-1, nB, 1)
-                    else:
-                        E[(nA, nB, t)] = (one_over_2p * get_E(nA-1, nB, t-1)
-                                         + PA * get_E(nA-1, nB, t)
-                                         + (t + 1) * get_E(nA-1, nB, t+1))
-                elif nB > 0:
-                    # B-side: E^{0,nB}_t from E^{0,nB-1}_*
-                    if t == 0:
-                        E[(0, nB, 0)] = PB * get_E(0, nB-1, 0) + get_E(0, nB-1, 1)
-                    else:
-                        E[(0, nB, t)] = (one_over_2p * get_E(0, nB-1, t-1)
-                                        + PB * get_E(0, nB-1, t)
-                                        + (t + 1) * get_E(0, nB-1, t+1))
-
-    # Expand all expressions
-    for key in E:
-        E[key] = expand(E[key])
+                # E_t = one_over_2p * E'_{t-1} + P * E'_t + (t+1) * E'_{t+1}
+                m: Monomials = {}
+                _accumulate(m, get_E(*src, t - 1), shift=(0, 0, 1))
+                _accumulate(m, get_E(*src, t), shift=gen)
+                _accumulate(m, get_E(*src, t + 1), scale=t + 1)
+                E[(nA, nB, t)] = m
 
     return E
 
 
-def generate_hermite_gradients(E_coeffs: Dict[Tuple[int, int, int], sp.Expr]) -> Dict:
+def generate_hermite_e(max_L: int) -> Dict[Tuple[int, int, int], sp.Expr]:
+    """
+    Generate symbolic expressions for Hermite E coefficients E^{nA,nB}_t.
+
+    Uses Helgaker-Taylor (1992) recurrence:
+        E^{i+1,j}_t = (1/2p) * E^{i,j}_{t-1} + PA * E^{i,j}_t + (t+1) * E^{i,j}_{t+1}
+
+    The recurrence runs on integer monomial maps (see
+    generate_hermite_e_monomials); SymPy is only used to build the final,
+    already expanded expressions for code generation.
+
+    Args:
+        max_L: Maximum angular momentum (4 for g orbitals)
+
+    Returns:
+        Dictionary mapping (nA, nB, t) -> symbolic expression
+    """
+    PA, PB, one_over_2p = symbols('PA PB one_over_2p', real=True)
+
+    return {key: sp.Poly.from_dict(m, PA, PB, one_over_2p).as_expr()
+            for key, m in generate_hermite_e_monomials(max_L).items()}
+
+
+def generate_hermite_gradients(E_coeffs: Dict[Tuple[int, int, int], sp.Expr],
+                               verify: bool = False) -> Dict:
     """
-    Generate symbolic gradient expressions using direct differentiation.
+    Generate symbolic gradient expressions from the Helgaker-Taylor closed form.
 
     Helgaker-Taylor direct formulas:
         ∂E^{nA,nB}_t/∂PA = nA × E^{nA-1,nB}_t
         ∂E^{nA,nB}_t/∂PB = nB × E^{nA,nB-1}_t
 
-    We also compute these by direct differentiation to verify.
-    """
-    PA, PB, one_over_2p = symbols('PA PB one_over_2p', real=True)
+    Args:
+        E_coeffs: Dictionary of (nA, nB, t) -> expanded symbolic expression
+        verify: If True, also differentiate every coefficient directly and
+            check that it matches the closed form
 
+    Returns:
+        Dictionary with 'dE_dPA' and 'dE_dPB' mappings (nA, nB, t) -> expression
+    """
+    zero = sp.S.Zero
     dE_dPA = {}
     dE_dPB = {}
 
-    for (nA, nB, t), expr in E_coeffs.items():
-        # Direct differentiation
-        dE_dPA[(nA, nB, t)] = expand(diff(expr, PA))
-        dE_dPB[(nA, nB, t)] = expand(diff(expr, PB))
+    for (nA, nB, t) in E_coeffs:
+        # An integer times an expanded sum stays expanded
+        dE_dPA[(nA, nB, t)] = nA * E_coeffs.get((nA - 1, nB, t), zero)
+        dE_dPB[(nA, nB, t)] = nB * E_coeffs.get((nA, nB - 1, t), zero)
+
+    if verify:
+        PA, PB, one_over_2p = symbols('PA PB one_over_2p', real=True)
+        for key, expr in E_coeffs.items():
+            if (expand(diff(expr, PA) - dE_dPA[key]) != 0
+                    or expand(diff(expr, PB) - dE_dPB[key]) != 0):
+                raise ValueError(f"Closed-form gradient mismatch for E^{{{key[0]},{key[1]}}}_{key[2]}")
 
     return {'dE_dPA': dE_dPA, 'dE_dPB': dE_dPB}
 
@@ -110,7 +154,13 @@ def generate_hermite_gradients(E_coeffs: Dict[Tuple[int, int, int], sp.Expr]) ->
 # PART 2: Coulomb R Integrals
 # =============================================================================
 
-def generate_coulomb_R(max_index: int) -> Dict[Tuple[int, int, int, int], sp.Expr]:
+def coulomb_r_symbol(t: int, u: int, v: int, N: int) -> sp.Symbol:
+    """Symbol standing for R_{t,u,v}^{(N)} in recurrence-form definitions."""
+    return symbols(f'R_{t}_{u}_{v}_{N}', real=True)
+
+
+def generate_coulomb_R(max_index: int, jobs: int = 1,
+                       expanded: bool = True) -> Dict[Tuple[int, int, int, int], sp.Expr]:
     """
     Generate symbolic expressions for Coulomb R integrals R_{t,u,v}^{(N)}.
 
@@ -125,6 +175,11 @@ def generate_coulomb_R(max_index: int) -> Dict[Tuple[int, int, int, int], sp.Exp
 
     Args:
         max_index: Maximum index for t, u, v (16 for gg|gg)
+        jobs: Worker processes for the final expand pass (1 = serial)
+        expanded: If False, skip expansion and return each entry's one-step
+            recurrence in terms of coulomb_r_symbol() references to earlier
+            entries (and F_N for the base cases). Entries are in dependency
+            order.
 
     Returns:
         Dictionary mapping (t, u, v, N) -> symbolic expression
@@ -144,12 +199,19 @@ def generate_coulomb_R(max_index: int) -> Dict[Tuple[int, int, int, int], sp.Exp
     for N in range(max_N + 1):
         R[(0, 0, 0, N)] = F[N]
 
+    # Hoisted out of get_R, which runs for every recurrence term
+    zero = sp.S.Zero
+
+    # What a recurrence step refers to: the full expression when expanding,
+    # otherwise the entry's symbol (base cases stay F_N)
+    refs = R if expanded else dict(R)
+
     def get_R(t: int, u: int, v: int, N: int) -> sp.Expr:
         if t < 0 or u < 0 or v < 0 or N < 0:
-            return sp.Integer(0)
+            return zero
         if N > max_N:
-            return sp.Integer(0)  # Truncate at max order
-        return R.get((t, u, v, N), sp.Integer(0))
+            return zero  # Truncate at max order
+        return refs.get((t, u, v, N), zero)
 
     # Build R integrals using recurrence
     # We need to be careful about the order of computation
@@ -172,91 +234,247 @@ def generate_coulomb_R(max_index: int) -> Dict[Tuple[int, int, int, int], sp.Exp
                     # Choose recurrence direction based on largest index
                     if t > 0:
                         # X recurrence: R_{t,u,v}^{(N)} from R_{t-1,u,v}^{(N+1)}
-                        R[(t, u, v, N)] = ((t - 1) * get_R(t-2, u, v, N+1)
-                                          + X_PC * get_R(t-1, u, v, N+1))
+                        n, lower, prev, PC = t - 1, get_R(t-2, u, v, N+1), get_R(t-1, u, v, N+1), X_PC
                     elif u > 0:
                         # Y recurrence
-                        R[(t, u, v, N)] = ((u - 1) * get_R(t, u-2, v, N+1)
-                                          + Y_PC * get_R(t, u-1, v, N+1))
+                        n, lower, prev, PC = u - 1, get_R(t, u-2, v, N+1), get_R(t, u-1, v, N+1), Y_PC
                     elif v > 0:
                         # Z recurrence
-                        R[(t, u, v, N)] = ((v - 1) * get_R(t, u, v-2, N+1)
-                                          + Z_PC * get_R(t, u, v-1, N+1))
+                        n, lower, prev, PC = v - 1, get_R(t, u, v-2, N+1), get_R(t, u, v-1, N+1), Z_PC
+                    else:
+                        continue
+
+                    # Skip vanishing terms so expand never has to collapse them
+                    terms = []
+                    if n != 0 and lower is not zero:
+                        terms.append(n * lower)
+                    if prev is not zero:
+                        terms.append(PC * prev)
+                    R[(t, u, v, N)] = sp.Add(*terms) if terms else zero
+                    if not expanded and terms:
+                        refs[(t, u, v, N)] = coulomb_r_symbol(t, u, v, N)
+
+    if not expanded:
+        return R
 
-    # Expand all expressions
-    for key in R:
-        R[key] = expand(R[key])
+    # Expand all expressions; they are independent of each other, so the
+    # pass can be spread over worker processes
+    keys = list(R)
+    if jobs > 1:
+        # spawn, as in the plotting scripts; workers only need SymPy
+        with multiprocessing.get_context('spawn').Pool(jobs) as pool:
+            results = pool.map(expand, [R[key] for key in keys], chunksize=64)
+    else:
+        results = [expand(R[key]) for key in keys]
 
-    return R
+    return dict(zip(keys, results))
 
 
 # =============================================================================
 # PART 3: C++ Code Generation
 # =============================================================================
 
-def expr_to_cpp(expr: sp.Expr) -> str:
-    """Convert SymPy expression to C++ code."""
-    from sympy import ccode
-    code = ccode(expr)
-
-    # Optimize power expressions
-    for var in ['PA', 'PB', 'one_over_2p', 'X_PC', 'Y_PC', 'Z_PC']:
-        for n in range(2, 9):
-            old = f'pow({var}, {n})'
-            if n == 2:
-                new = f'({var}*{var})'
-            elif n == 3:
-                new = f'({var}*{var}*{var})'
-            elif n == 4:
-                new = f'(({var}*{var})*({var}*{var}))'
-            elif n == 5:
-                new = f'(({var}*{var})*({var}*{var})*{var})'
-            elif n == 6:
-                new = f'(({var}*{var}*{var})*({var}*{var}*{var}))'
-            elif n == 7:
-                new = f'(({var}*{var}*{var})*({var}*{var}*{var})*{var})'
-            elif n == 8:
-                new = f'((({var}*{var})*({var}*{var}))*(({var}*{var})*({var}*{var})))'
-            code = code.replace(old, new)
-
-    return code
-
-
-def generate_hermite_e_header(E_coeffs: Dict, output_path: str, use_cse: bool = True):
-    """Generate C++ header for Hermite E coefficients.
+# Prolog of every header holding kernels; RECURSUM_FORCEINLINE is guarded the
+# same way as in recursum/codegen, so these headers combine with the library's
+_KERNEL_MACROS = '''// Portable force-inline macro for performance-critical compute methods
+#ifndef RECURSUM_FORCEINLINE
+  #ifdef _MSC_VER
+    #define RECURSUM_FORCEINLINE __forceinline
+  #elif defined(__GNUC__) || defined(__clang__)
+    #define RECURSUM_FORCEINLINE inline __attribute__((always_inline))
+  #else
+    #define RECURSUM_FORCEINLINE inline
+  #endif
+#endif
+
+// Portable no-alias qualifier for pointer parameters
+#ifndef RECURSUM_RESTRICT
+  #ifdef _MSC_VER
+    #define RECURSUM_RESTRICT __restrict
+  #else
+    #define RECURSUM_RESTRICT __restrict__
+  #endif
+#endif
+'''
+
+# Integer powers of a symbol as balanced multiplication trees; also used by
+# generate_symbolic_code.py
+POW_PATTERNS = {
+    2: '({x}*{x})',
+    3: '({x}*{x}*{x})',
+    4: '(({x}*{x})*({x}*{x}))',
+    5: '(({x}*{x})*({x}*{x})*{x})',
+    6: '(({x}*{x}*{x})*({x}*{x}*{x}))',
+    7: '(({x}*{x}*{x})*({x}*{x}*{x})*{x})',
+    8: '((({x}*{x})*({x}*{x}))*(({x}*{x})*({x}*{x})))',
+}
+
+
+class _CppPrinter(C99CodePrinter):
+    """C99 printer that writes small integer powers of symbols as multiplications."""
+
+    def _print_Pow(self, expr):
+        base, exponent = expr.args
+        if base.is_Symbol and exponent.is_Integer and int(exponent) in POW_PATTERNS:
+            return POW_PATTERNS[int(exponent)].format(x=self._print(base))
+        return super()._print_Pow(expr)
+
+
+class _FmaCppPrinter(_CppPrinter):
+    """_CppPrinter that folds the products of a sum into chained VCL mul_add / nmul_add calls."""
+
+    def _print_Add(self, expr, order=None):
+        products, rest = [], []
+        for term in self._as_ordered_terms(expr, order=order):
+            negated = term.could_extract_minus_sign()
+            magnitude = -term if negated else term
+            if magnitude.is_Mul:
+                products.append((negated, magnitude))
+            else:
+                rest.append(term)
+        if not products:
+            return super()._print_Add(expr, order=order)
+        if rest:
+            acc = self._print(sp.Add(*rest))
+        else:
+            negated, magnitude = products.pop()
+            acc = self._print(-magnitude if negated else magnitude)
+        for negated, magnitude in reversed(products):
+            a, b = magnitude.as_two_terms()
+            acc = f'{"nmul_add" if negated else "mul_add"}({self._print(a)}, {self._print(b)}, {acc})'
+        return acc
+
+
+_CPP_PRINTER = _CppPrinter()
+_FMA_CPP_PRINTER = _FmaCppPrinter()
+
+
+def to_horner(expr: sp.Expr, gens: Tuple[sp.Symbol, ...]) -> sp.Expr:
+    """Nest a polynomial in Horner form over gens, so each degree step is one multiply-add."""
+    return sp.horner(expr, *gens) if expr.free_symbols & set(gens) else expr
+
+
+@lru_cache(maxsize=None)
+def expr_to_cpp(expr: sp.Expr, fma: bool = False) -> str:
+    """Convert SymPy expression to C++ code (memoized; CSE temporaries recur across functions).
+
+    With fma=True every product inside a sum is written as an explicit
+    mul_add / nmul_add, so the fused multiply-add does not depend on the
+    compiler contracting a*b + c (-ffp-contract).
+    """
+    return (_FMA_CPP_PRINTER if fma else _CPP_PRINTER).doprint(expr)
+
+
+def generate_hermite_e_layers(E_coeffs: Dict, fma: bool = False) -> Dict[Tuple[int, int], str]:
+    """Generate C++ functions computing every E^{nA,nB}_t of a shell pair at once.
+
+    CSE runs jointly over the whole t-family of each (nA, nB), so powers and
+    products such as PA*PA or PA*one_over_2p are evaluated once per layer
+    instead of once per coefficient.
 
     Args:
         E_coeffs: Dictionary of (nA, nB, t) -> symbolic expression
-        output_path: Path to write the header file
-        use_cse: If True, apply Common Subexpression Elimination
+        fma: If True, write sums of products as explicit mul_add calls
+
+    Returns:
+        Dictionary of (nA, nB) -> C++ source for hermite_e_symbolic_layer_{nA}_{nB}
     """
-    cse_mode = "with CSE" if use_cse else "expanded form"
+    layers = {}
+    for (nA, nB, t) in sorted(E_coeffs.keys()):
+        layers.setdefault((nA, nB), []).append(E_coeffs[(nA, nB, t)])
 
-    cpp = f'''/**
- * @file hermite_e_symbolic.hpp
- * @brief Symbolically-generated Hermite E coefficients ({cse_mode})
- *
- * AUTO-GENERATED - DO NOT EDIT MANUALLY
- * Coverage: E^{{0,0}}_0 to E^{{4,4}}_8 (ss to gg shell pairs)
+    sources = {}
+    for (nA, nB), exprs in layers.items():
+        # Canonical ordering keeps the temporaries stable between runs
+        intermediates, reduced = cse(exprs, optimizations='basic', order='canonical')
+
+        chunks = [f'''/**
+ * @brief Symbolic E^{{{nA},{nB}}}_t for t = 0..{len(exprs) - 1} (shared CSE)
+ */
+RECURSUM_FORCEINLINE void hermite_e_symbolic_layer_{nA}_{nB}(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* RECURSUM_RESTRICT E) {{
+''']
+        for sym, sub_expr in intermediates:
+            chunks.append(f'    const Vec8d {sym.name} = {expr_to_cpp(sub_expr, fma)};\n')
+        for t, expr in enumerate(reduced):
+            chunks.append(f'    E[{t}] = {expr_to_cpp(expr, fma)};\n')
+        chunks.append('}\n\n')
+        sources[(nA, nB)] = ''.join(chunks)
+
+    return sources
+
+
+def generate_hermite_e_all(E_coeffs: Dict, fma: bool = False) -> str:
+    """Generate one C++ function computing every E coefficient with a single global CSE.
+
+    All coefficients share monomials in (PA, PB, one_over_2p), so one cse()
+    over the whole set evaluates each shared subexpression once for all
+    shell pairs instead of once per function or per layer.
+
+    Args:
+        E_coeffs: Dictionary of (nA, nB, t) -> symbolic expression
+        fma: If True, write sums of products as explicit mul_add calls
+
+    Returns:
+        C++ source for hermite_e_symbolic_all and its output size constant
+    """
+    all_keys = sorted(E_coeffs.keys())
+    intermediates, reduced = cse([E_coeffs[k] for k in all_keys],
+                                 optimizations='basic', order='canonical')
+
+    chunks = [f'''/// Number of outputs written by hermite_e_symbolic_all
+constexpr int hermite_e_symbolic_count = {len(all_keys)};
+
+/**
+ * @brief All symbolic E^{{nA,nB}}_t at once (global CSE)
  *
- * Optimization: {"CSE (Common Subexpression Elimination) applied" if use_cse else "No optimization"}
+ * E[i] holds the i-th coefficient in (nA, nB, t) lexicographic order, as
+ * listed next to each assignment.
  */
+inline void hermite_e_symbolic_all(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* E) {{
+''']
+    for sym, sub_expr in intermediates:
+        chunks.append(f'    const Vec8d {sym.name} = {expr_to_cpp(sub_expr, fma)};\n')
+    for i, ((nA, nB, t), expr) in enumerate(zip(all_keys, reduced)):
+        chunks.append(f'    E[{i}] = {expr_to_cpp(expr, fma)};  // E^{{{nA},{nB}}}_{t}\n')
+    chunks.append('}\n\n')
 
-#pragma once
+    return ''.join(chunks)
 
-#ifndef RECURSUM_VEC_TYPE
-#include <recursum/vectorclass.h>
-#endif
 
-namespace recursum {{
-namespace symbolic {{
+def generate_hermite_e_header(E_coeffs: Dict, output_path: str, use_cse: bool = True,
+                              horner: bool = False, fma: bool = False):
+    """Generate C++ headers for Hermite E coefficients.
 
-'''
+    Each shell pair gets its own hermite_e_symbolic_{nA}_{nB}.hpp, next to
+    output_path, with its per-t functions and its fused layer. The file at
+    output_path includes all of them and adds hermite_e_symbolic_all and
+    the runtime dispatcher. A translation unit that uses only a few shell
+    pairs can include just those headers and skip parsing the rest.
+
+    Args:
+        E_coeffs: Dictionary of (nA, nB, t) -> symbolic expression
+        output_path: Path to write the umbrella header file
+        use_cse: If True, apply Common Subexpression Elimination
+        horner: If True, write each per-coefficient function in Horner form
+            over (PA, PB, one_over_2p) instead of as a flat sum of monomials
+        fma: If True, write sums of products as explicit mul_add calls
+    """
+    if horner:
+        cse_mode = "with CSE, Horner form" if use_cse else "Horner form"
+    else:
+        cse_mode = "with CSE" if use_cse else "expanded form"
+    optimization = "CSE (Common Subexpression Elimination) applied" if use_cse else "No optimization"
+    gens = symbols('PA PB one_over_2p', real=True)
+    output_dir = os.path.dirname(output_path)
 
     sorted_keys = sorted(E_coeffs.keys())
+    pair_chunks = {}
 
     for (nA, nB, t) in sorted_keys:
+        chunks = pair_chunks.setdefault((nA, nB), [])
         expr = E_coeffs[(nA, nB, t)]
+        if horner:
+            expr = to_horner(expr, gens)
 
         if use_cse:
             # Apply CSE to the expression
@@ -266,73 +484,144 @@ namespace symbolic {{
 
             if intermediates:
                 # Generate function with intermediate variables
-                cpp += f'''/**
+                chunks.append(f'''/**
  * @brief Symbolic E^{{{nA},{nB}}}_{t} (CSE optimized)
  */
-inline Vec8d hermite_e_symbolic_{nA}_{nB}_{t}(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {{
-'''
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_{nA}_{nB}_{t}(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {{
+''')
                 for sym, sub_expr in intermediates:
-                    cpp += f'    Vec8d {sym.name} = {expr_to_cpp(sub_expr)};\n'
-                cpp += f'    return {expr_to_cpp(final_expr)};\n'
-                cpp += '}\n\n'
+                    chunks.append(f'    Vec8d {sym.name} = {expr_to_cpp(sub_expr, fma)};\n')
+                chunks.append(f'    return {expr_to_cpp(final_expr, fma)};\n')
+                chunks.append('}\n\n')
             else:
                 # No CSE needed, simple return
-                cpp += f'''/**
+                chunks.append(f'''/**
  * @brief Symbolic E^{{{nA},{nB}}}_{t}
  */
-inline Vec8d hermite_e_symbolic_{nA}_{nB}_{t}(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {{
-    return {expr_to_cpp(expr)};
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_{nA}_{nB}_{t}(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {{
+    return {expr_to_cpp(expr, fma)};
 }}
 
-'''
+''')
         else:
             # No CSE - simple expanded form
-            cpp += f'''/**
+            chunks.append(f'''/**
  * @brief Symbolic E^{{{nA},{nB}}}_{t}
  */
-inline Vec8d hermite_e_symbolic_{nA}_{nB}_{t}(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {{
-    return {expr_to_cpp(expr)};
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_{nA}_{nB}_{t}(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {{
+    return {expr_to_cpp(expr, fma)};
 }}
 
+''')
+
+    # Layers are emitted with or without use_cse: the layer dispatcher in
+    # benchmark_dispatcher.hpp references every one of them
+    for pair, source in generate_hermite_e_layers(E_coeffs, fma).items():
+        pair_chunks[pair].append(source)
+
+    for (nA, nB), chunks in pair_chunks.items():
+        pair_header = f'''/**
+ * @file hermite_e_symbolic_{nA}_{nB}.hpp
+ * @brief Symbolically-generated Hermite E^{{{nA},{nB}}}_t coefficients ({cse_mode})
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Optimization: {optimization}
+ */
+
+#pragma once
+
+#ifndef RECURSUM_VEC_TYPE
+#include <recursum/vectorclass.h>
+#endif
+
+{_KERNEL_MACROS}
+namespace recursum {{
+namespace symbolic {{
+
+{''.join(chunks)}}} // namespace symbolic
+}} // namespace recursum
 '''
+        with open(os.path.join(output_dir, f'hermite_e_symbolic_{nA}_{nB}.hpp'), 'w') as f:
+            f.write(pair_header)
+
+    chunks = [f'''/**
+ * @file hermite_e_symbolic.hpp
+ * @brief Symbolically-generated Hermite E coefficients ({cse_mode})
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ * Coverage: E^{{0,0}}_0 to E^{{4,4}}_8 (ss to gg shell pairs)
+ *
+ * Optimization: {optimization}
+ *
+ * Umbrella header: the per-coefficient functions and fused layers of each
+ * shell pair live in hermite_e_symbolic_{{nA}}_{{nB}}.hpp, which can also be
+ * included on its own.
+ */
+
+#pragma once
+
+#ifndef RECURSUM_VEC_TYPE
+#include <recursum/vectorclass.h>
+#endif
+
+''']
+    chunks.extend(f'#include "hermite_e_symbolic_{nA}_{nB}.hpp"\n' for (nA, nB) in pair_chunks)
+    chunks.append('''
+namespace recursum {
+namespace symbolic {
+
+''')
+
+    if use_cse:
+        chunks.append(generate_hermite_e_all(E_coeffs, fma))
 
     # Add dispatcher
-    cpp += '''/**
+    chunks.append('''/**
  * @brief Runtime dispatcher for symbolic Hermite E coefficients
  */
 inline Vec8d dispatch_hermite_e_symbolic(int nA, int nB, int t,
                                           Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-'''
+''')
     for (nA, nB, t) in sorted_keys:
-        cpp += f'    if (nA == {nA} && nB == {nB} && t == {t}) return hermite_e_symbolic_{nA}_{nB}_{t}(PA, PB, one_over_2p);\n'
+        chunks.append(f'    if (nA == {nA} && nB == {nB} && t == {t}) return hermite_e_symbolic_{nA}_{nB}_{t}(PA, PB, one_over_2p);\n')
 
-    cpp += '''    return Vec8d(0.0);  // Invalid indices
+    chunks.append('''    return Vec8d(0.0);  // Invalid indices
 }
 
 } // namespace symbolic
 } // namespace recursum
-'''
+''')
 
     with open(output_path, 'w') as f:
-        f.write(cpp)
-    print(f"Generated: {output_path} ({len(E_coeffs)} coefficients, CSE={'ON' if use_cse else 'OFF'})")
+        f.write(''.join(chunks))
+    print(f"Generated: {output_path} ({len(E_coeffs)} coefficients in {len(pair_chunks)} shell-pair headers, "
+          f"CSE={'ON' if use_cse else 'OFF'})")
+
 
+def generate_hermite_grad_header(gradients: Dict, output_path: str, fma: bool = False):
+    """Generate C++ header for Hermite gradients.
 
-def generate_hermite_grad_header(gradients: Dict, output_path: str):
-    """Generate C++ header for Hermite gradients."""
+    Args:
+        gradients: Dictionary with 'dE_dPA' and 'dE_dPB' coefficient maps
+        output_path: Path to write the header file
+        fma: If True, write sums of products as explicit mul_add calls
+    """
 
     dE_dPA = gradients['dE_dPA']
     dE_dPB = gradients['dE_dPB']
 
-    cpp = '''/**
+    chunks = ['''/**
  * @file hermite_grad_symbolic.hpp
  * @brief Symbolically-generated Hermite E gradients
  *
  * AUTO-GENERATED - DO NOT EDIT MANUALLY
  *
- * Gradients computed by direct differentiation:
- *   dE_dPA[(nA,nB,t)] = ∂E^{nA,nB}_t/∂PA
- *   dE_dPB[(nA,nB,t)] = ∂E^{nA,nB}_t/∂PB
+ * Gradients from the Helgaker-Taylor closed form:
+ *   dE_dPA[(nA,nB,t)] = ∂E^{nA,nB}_t/∂PA = nA * E^{nA-1,nB}_t
+ *   dE_dPB[(nA,nB,t)] = ∂E^{nA,nB}_t/∂PB = nB * E^{nA,nB-1}_t
+ *
+ * hermite_dE_both_{nA}_{nB}_{t} returns both with one shared CSE.
  */
 
 #pragma once
@@ -341,6 +630,7 @@ def generate_hermite_grad_header(gradients: Dict, output_path: str):
 #include <recursum/vectorclass.h>
 #endif
 
+''' + _KERNEL_MACROS + '''
 namespace recursum {
 namespace symbolic {
 
@@ -348,42 +638,64 @@ namespace symbolic {
 // ∂E/∂PA Gradients
 // =============================================================================
 
-'''
+''']
 
     sorted_keys = sorted(dE_dPA.keys())
 
     for (nA, nB, t) in sorted_keys:
         expr = dE_dPA[(nA, nB, t)]
-        cpp += f'''inline Vec8d hermite_dE_dPA_{nA}_{nB}_{t}(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {{
-    return {expr_to_cpp(expr)};
+        chunks.append(f'''RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_{nA}_{nB}_{t}(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {{
+    return {expr_to_cpp(expr, fma)};
 }}
 
-'''
+''')
 
-    cpp += '''// =============================================================================
+    chunks.append('''// =============================================================================
 // ∂E/∂PB Gradients
 // =============================================================================
 
-'''
+''')
 
     for (nA, nB, t) in sorted_keys:
         expr = dE_dPB[(nA, nB, t)]
-        cpp += f'''inline Vec8d hermite_dE_dPB_{nA}_{nB}_{t}(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {{
-    return {expr_to_cpp(expr)};
+        chunks.append(f'''RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_{nA}_{nB}_{t}(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {{
+    return {expr_to_cpp(expr, fma)};
 }}
 
-'''
+''')
+
+    chunks.append('''// =============================================================================
+// Joint ∂E/∂PA, ∂E/∂PB (shared CSE)
+// =============================================================================
+
+''')
+
+    # Both derivatives of one E share most of their monomials, so a joint CSE
+    # evaluates them once for callers that need the pair
+    for (nA, nB, t) in sorted_keys:
+        intermediates, (reduced_PA, reduced_PB) = cse(
+            [dE_dPA[(nA, nB, t)], dE_dPB[(nA, nB, t)]], optimizations='basic', order='canonical')
+        chunks.append(f'''RECURSUM_FORCEINLINE void hermite_dE_both_{nA}_{nB}_{t}(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {{
+''')
+        for sym, sub_expr in intermediates:
+            chunks.append(f'    const Vec8d {sym.name} = {expr_to_cpp(sub_expr, fma)};\n')
+        chunks.append(f'''    dE_dPA = {expr_to_cpp(reduced_PA, fma)};
+    dE_dPB = {expr_to_cpp(reduced_PB, fma)};
+}}
+
+''')
 
     # Add dispatchers
-    cpp += '''/**
+    chunks.append('''/**
  * @brief Runtime dispatcher for ∂E/∂PA
  */
 inline Vec8d dispatch_dE_dPA(int nA, int nB, int t,
                               Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-'''
+''')
     for (nA, nB, t) in sorted_keys:
-        cpp += f'    if (nA == {nA} && nB == {nB} && t == {t}) return hermite_dE_dPA_{nA}_{nB}_{t}(PA, PB, one_over_2p);\n'
-    cpp += '''    return Vec8d(0.0);
+        chunks.append(f'    if (nA == {nA} && nB == {nB} && t == {t}) return hermite_dE_dPA_{nA}_{nB}_{t}(PA, PB, one_over_2p);\n')
+    chunks.append('''    return Vec8d(0.0);
 }
 
 /**
@@ -391,25 +703,56 @@ inline Vec8d dispatch_dE_dPA(int nA, int nB, int t,
  */
 inline Vec8d dispatch_dE_dPB(int nA, int nB, int t,
                               Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-'''
+''')
     for (nA, nB, t) in sorted_keys:
-        cpp += f'    if (nA == {nA} && nB == {nB} && t == {t}) return hermite_dE_dPB_{nA}_{nB}_{t}(PA, PB, one_over_2p);\n'
-    cpp += '''    return Vec8d(0.0);
+        chunks.append(f'    if (nA == {nA} && nB == {nB} && t == {t}) return hermite_dE_dPB_{nA}_{nB}_{t}(PA, PB, one_over_2p);\n')
+    chunks.append('''    return Vec8d(0.0);
 }
 
 } // namespace symbolic
 } // namespace recursum
-'''
+''')
 
     with open(output_path, 'w') as f:
-        f.write(cpp)
+        f.write(''.join(chunks))
     print(f"Generated: {output_path} ({len(dE_dPA)} dE/dPA + {len(dE_dPB)} dE/dPB)")
 
 
-def generate_coulomb_r_header(R_coeffs: Dict, output_path: str):
-    """Generate C++ header for Coulomb R integrals."""
+def _coulomb_r_dependencies(R_coeffs: Dict, key: Tuple[int, int, int, int],
+                            by_symbol: Dict[sp.Symbol, Tuple[int, int, int, int]]) -> set:
+    """Keys of every recurrence-form entry that R_coeffs[key] transitively refers to."""
+    needed = set()
+    stack = [key]
+    while stack:
+        for sym in R_coeffs[stack.pop()].free_symbols:
+            dep = by_symbol.get(sym)
+            if dep is not None and dep not in needed:
+                needed.add(dep)
+                stack.append(dep)
+    return needed
 
-    cpp = '''/**
+
+def generate_coulomb_r_header(R_coeffs: Dict, output_path: str, recurrence: bool = False,
+                              horner: bool = False, fma: bool = False):
+    """Generate C++ header for Coulomb R integrals.
+
+    Args:
+        R_coeffs: Dictionary of (t, u, v, N) -> symbolic expression
+        output_path: Path to write the header file
+        recurrence: If True, R_coeffs holds recurrence-form definitions
+            (generate_coulomb_R(..., expanded=False)); each function then
+            evaluates the intermediate R values it needs as a sequence of
+            assignments instead of one expanded polynomial
+        horner: If True, write each expanded R polynomial in Horner form over
+            (X_PC, Y_PC, Z_PC); ignored for the recurrence form
+        fma: If True, write sums of products as explicit mul_add calls
+    """
+    gens = symbols('X_PC Y_PC Z_PC', real=True)
+    if recurrence:
+        order = {key: i for i, key in enumerate(R_coeffs)}
+        by_symbol = {coulomb_r_symbol(*key): key for key in R_coeffs}
+
+    chunks = ['''/**
  * @file coulomb_r_symbolic.hpp
  * @brief Symbolically-generated Coulomb R integrals
  *
@@ -417,6 +760,9 @@ def generate_coulomb_r_header(R_coeffs: Dict, output_path: str):
  *
  * R_{t,u,v}^{(N)} expressed in terms of Boys functions F_N(T)
  * and Gaussian center differences X_PC, Y_PC, Z_PC.
+ *
+ * Boys values are passed as one array (F[n] = F_n(T)) rather than as
+ * t+u+v+1 separate Vec8d arguments, which would spill to the stack.
  */
 
 #pragma once
@@ -425,6 +771,7 @@ def generate_coulomb_r_header(R_coeffs: Dict, output_path: str):
 #include <recursum/vectorclass.h>
 #endif
 
+''' + _KERNEL_MACROS + '''
 namespace recursum {
 namespace symbolic {
 
@@ -435,7 +782,7 @@ namespace symbolic {
  * F[n] = F_n(T) where T = p * |P-C|^2
  */
 
-'''
+''']
 
     # Group by (t,u,v) and generate for N=0 (most commonly used)
     tuv_keys = set((t, u, v) for (t, u, v, N) in R_coeffs.keys())
@@ -447,29 +794,73 @@ namespace symbolic {
             continue
 
         expr = R_coeffs[(t, u, v, 0)]
+        if horner and not recurrence:
+            expr = to_horner(expr, gens)
+
+        deps = []
+        if recurrence:
+            # Dependencies come before their users in R_coeffs order
+            deps = sorted(_coulomb_r_dependencies(R_coeffs, (t, u, v, 0), by_symbol), key=order.get)
 
-        # Determine which F_n are needed
-        max_n = t + u + v
-        F_params = ', '.join([f'Vec8d F_{n}' for n in range(max_n + 1)])
+        # Load only the F_n this function reads, F_0..F_{t+u+v} at most
+        used = set().union(expr.free_symbols, *(R_coeffs[dep].free_symbols for dep in deps))
+        boys_n = sorted(n for n in range(t + u + v + 1) if symbols(f'F_{n}', real=True) in used)
 
-        cpp += f'''/**
+        chunks.append(f'''/**
  * @brief Symbolic R_{{{t},{u},{v}}}^{{(0)}}
+ *
+ * @param F Boys function values F[0..{t + u + v}]
  */
-inline Vec8d coulomb_r_symbolic_{t}_{u}_{v}(Vec8d X_PC, Vec8d Y_PC, Vec8d Z_PC, {F_params}) {{
-    return {expr_to_cpp(expr)};
+RECURSUM_FORCEINLINE Vec8d coulomb_r_symbolic_{t}_{u}_{v}(Vec8d X_PC, Vec8d Y_PC, Vec8d Z_PC, const Vec8d* RECURSUM_RESTRICT F) {{
+''')
+        for n in boys_n:
+            chunks.append(f'    const Vec8d F_{n} = F[{n}];\n')
+        for dep in deps:
+            chunks.append(f'    const Vec8d {coulomb_r_symbol(*dep).name} = {expr_to_cpp(R_coeffs[dep], fma)};\n')
+        chunks.append(f'''    return {expr_to_cpp(expr, fma)};
 }}
 
-'''
+''')
 
-    cpp += '''} // namespace symbolic
+    chunks.append('''} // namespace symbolic
 } // namespace recursum
-'''
+''')
 
     with open(output_path, 'w') as f:
-        f.write(cpp)
+        f.write(''.join(chunks))
     print(f"Generated: {output_path} ({len(tuv_keys)} R integrals)")
 
 
+def generate_symbolic_umbrella(output_dir: str):
+    """Generate symbolic_all.hpp, which includes every generated symbolic header.
+
+    The headers hold hundreds of KB of inline kernels, so translation units
+    that need most of them are best served by precompiling this file once
+    (e.g. CMake target_precompile_headers) instead of re-parsing it per TU.
+    """
+    path = os.path.join(output_dir, 'symbolic_all.hpp')
+    with open(path, 'w') as f:
+        f.write('''/**
+ * @file symbolic_all.hpp
+ * @brief All symbolically-generated McMurchie-Davidson kernels
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Include order: Hermite E, Hermite gradients, Coulomb R. Each header is
+ * self-contained and #pragma once, so this file can be precompiled, e.g.
+ *   target_precompile_headers(<target> PRIVATE symbolic_generated/symbolic_all.hpp)
+ * or included alongside any of the individual headers.
+ */
+
+#pragma once
+
+#include "hermite_e_symbolic.hpp"
+#include "hermite_grad_symbolic.hpp"
+#include "coulomb_r_symbolic.hpp"
+''')
+    print(f"Generated: {path}")
+
+
 # =============================================================================
 # Main Entry Point
 # =============================================================================
@@ -487,7 +878,20 @@ def main():
                         help='Enable CSE optimization (default: True)')
     parser.add_argument('--no-cse', action='store_false', dest='cse',
                         help='Disable CSE optimization')
+    parser.add_argument('--verify', action='store_true',
+                        help='Check closed-form gradients against direct differentiation')
+    parser.add_argument('--r-form', choices=['expanded', 'recurrence'], default='expanded',
+                        help='Emit R integrals as expanded polynomials or as recurrence '
+                             'assignment sequences (default: expanded)')
+    parser.add_argument('--horner', action='store_true',
+                        help='Emit E and expanded R polynomials in Horner (FMA-friendly) form')
+    parser.add_argument('--fma', action='store_true',
+                        help='Write sums of products as explicit VCL mul_add calls '
+                             '(FMA regardless of -ffp-contract)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Worker processes for symbolic expansion (default: CPU count)')
     args = parser.parse_args()
+    jobs = args.jobs or os.cpu_count() or 1
 
     script_dir = os.path.dirname(os.path.abspath(__file__))
     output_dir = os.path.join(script_dir, args.output_dir)
@@ -509,21 +913,25 @@ def main():
 
     # Generate gradients
     print("Generating Hermite gradients...")
-    gradients = generate_hermite_gradients(E_coeffs)
+    gradients = generate_hermite_gradients(E_coeffs, verify=args.verify)
     print(f"  Generated {len(gradients['dE_dPA'])} dE/dPA gradients")
     print(f"  Generated {len(gradients['dE_dPB'])} dE/dPB gradients")
 
     # Generate Coulomb R integrals
     print("Generating Coulomb R integrals...")
-    R_coeffs = generate_coulomb_R(args.max_R)
+    R_coeffs = generate_coulomb_R(args.max_R, jobs=jobs, expanded=args.r_form == 'expanded')
     print(f"  Generated {len(R_coeffs)} R integrals")
 
     # Write headers
     print()
     print("Writing C++ headers...")
-    generate_hermite_e_header(E_coeffs, os.path.join(output_dir, 'hermite_e_symbolic.hpp'), use_cse=args.cse)
-    generate_hermite_grad_header(gradients, os.path.join(output_dir, 'hermite_grad_symbolic.hpp'))
-    generate_coulomb_r_header(R_coeffs, os.path.join(output_dir, 'coulomb_r_symbolic.hpp'))
+    generate_hermite_e_header(E_coeffs, os.path.join(output_dir, 'hermite_e_symbolic.hpp'), use_cse=args.cse,
+                              horner=args.horner, fma=args.fma)
+    generate_hermite_grad_header(gradients, os.path.join(output_dir, 'hermite_grad_symbolic.hpp'),
+                                 fma=args.fma)
+    generate_coulomb_r_header(R_coeffs, os.path.join(output_dir, 'coulomb_r_symbolic.hpp'),
+                              recurrence=args.r_form == 'recurrence', horner=args.horner, fma=args.fma)
+    generate_symbolic_umbrella(output_dir)
 
     print()
     print("=" * 70)
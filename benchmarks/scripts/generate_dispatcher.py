@@ -5,6 +5,183 @@ Generate comprehensive dispatcher header for all coefficients up to L=4 (gg).
 
 import os
 
+
+def generate_table(coeffs, entry, max_L: int) -> str:
+    """Aggregate initializer for a flat function-pointer table.
+
+    Slot (nA, nB, t) lives at nA * STRIDE_NA + nB * STRIDE_NB + t, so one row
+    of 2*max_L + 1 entries is laid out per (nA, nB) pair.
+
+    Args:
+        coeffs: (nA, nB, t) combinations to fill
+        entry: Callable (nA, nB, t) -> C++ function-pointer expression
+        max_L: Maximum nA and nB covered by the table
+
+    Slots not listed in coeffs (t > nA + nB) are nullptr.
+    """
+    filled = set(coeffs)
+    lines = ['{']
+    for nA in range(max_L + 1):
+        for nB in range(max_L + 1):
+            row = [entry(nA, nB, t) if (nA, nB, t) in filled else 'nullptr'
+                   for t in range(2 * max_L + 1)]
+            lines.append(f'        // nA = {nA}, nB = {nB}')
+            lines.append(f'        {", ".join(row)},')
+    lines.append('    }')
+    return '\n'.join(lines)
+
+
+def generate_dispatcher_class(name: str, brief: str, table: str, param: str) -> str:
+    """C++ dispatcher class backed by a flat constexpr function-pointer table."""
+    return f'''/**
+ * @class {name}
+ * @brief {brief}
+ */
+class {name} {{
+public:
+    static constexpr int MAX_NA = BENCH_MAX_L;
+    static constexpr int MAX_NB = BENCH_MAX_L;
+    static constexpr int MAX_N = BENCH_MAX_N;
+
+    static constexpr unsigned STRIDE_NB = MAX_N + 1;
+    static constexpr unsigned STRIDE_NA = (MAX_NB + 1) * STRIDE_NB;
+    static constexpr unsigned TABLE_SIZE = (MAX_NA + 1) * STRIDE_NA;
+
+    static const {name}& instance() {{
+        static {name} dispatcher;
+        return dispatcher;
+    }}
+
+    /**
+     * Indices outside 0 <= nA <= MAX_NA, 0 <= nB <= MAX_NB, 0 <= t <= MAX_N
+     * (negative ones wrap to large unsigned values) and t > nA + nB yield zero.
+     */
+    Vec8d compute(int nA, int nB, int t,
+                  const Vec8d& PA, const Vec8d& PB, const Vec8d& {param}) const {{
+        // Each index is bounded on its own: a packed-index check alone would
+        // let an out-of-range nB or t alias into a neighbouring row
+        if (static_cast<unsigned>(nA) > static_cast<unsigned>(MAX_NA) ||
+            static_cast<unsigned>(nB) > static_cast<unsigned>(MAX_NB) ||
+            static_cast<unsigned>(t) > static_cast<unsigned>(MAX_N)) return Vec8d(0.0);
+        const unsigned idx = nA * STRIDE_NA + nB * STRIDE_NB + t;
+        if (!table_[idx]) return Vec8d(0.0);
+        return table_[idx](PA, PB, {param});
+    }}
+
+    {name}(const {name}&) = delete;
+    {name}& operator=(const {name}&) = delete;
+
+private:
+    {name}() = default;
+
+    // Filled at compile time; slots with t > nA + nB are nullptr
+    static constexpr CoeffFunction table_[TABLE_SIZE] = {table};
+}};
+
+'''
+
+
+def generate_switch_dispatch(name: str, brief: str, coeffs, kernel: str, outputs=()) -> str:
+    """Inline C++ function dispatching (nA, nB, t) through nested switches.
+
+    Every leaf is a direct call, so a caller with compile-time indices folds
+    to that call and a runtime caller gets jump tables instead of an
+    indirect call through a data-dependent pointer.
+
+    Args:
+        name: Name of the emitted function
+        brief: Doxygen @brief line
+        coeffs: (nA, nB, t) combinations to dispatch, in lexicographic order
+        kernel: Format string for the leaf function name, taking nA, nB and t
+        outputs: Names of Vec8d& output parameters; if given, the function
+            returns void and the kernels write through them (zero when the
+            indices are out of range) instead of returning a Vec8d
+    """
+    by_pair = {}
+    for nA, nB, t in coeffs:
+        by_pair.setdefault(nA, {}).setdefault(nB, []).append(t)
+
+    if outputs:
+        ret = 'void'
+        indent = ' ' * (len(ret) + len(name) + 9)
+        params = ',\n' + indent + ', '.join(f'Vec8d& {out}' for out in outputs)
+        args = ''.join(f', {out}' for out in outputs)
+        zero = f'{" = ".join(outputs)} = Vec8d(0.0); return;'
+    else:
+        ret, params, args, zero = 'Vec8d', '', '', 'return Vec8d(0.0);'
+    # Leaves call the kernel directly: void kernels return afterwards
+    leaf = '{call}(PA, PB, one_over_2p' + args + ('); return' if outputs else ')')
+
+    lines = [f'''/**
+ * @brief {brief}
+ */
+inline {ret} {name}(int nA, int nB, int t,
+{' ' * (len(ret) + len(name) + 9)}const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p{params}) {{
+    switch (nA) {{''']
+    for nA, nb_rows in by_pair.items():
+        lines.append(f'    case {nA}:')
+        lines.append('        switch (nB) {')
+        for nB, ts in nb_rows.items():
+            lines.append(f'        case {nB}:')
+            lines.append('            switch (t) {')
+            for t in ts:
+                call = leaf.format(call=kernel.format(nA=nA, nB=nB, t=t))
+                lines.append(f'            case {t}: {call if outputs else "return " + call};')
+            lines.append(f'            default: {zero}')
+            lines.append('            }')
+        lines.append(f'        default: {zero}')
+        lines.append('        }')
+    lines.append(f'    default: {zero}')
+    lines.append('    }')
+    lines.append('}')
+    return '\n'.join(lines) + '\n\n'
+
+
+def generate_layer_dispatcher_class(max_L: int) -> str:
+    """C++ dispatcher over the fused per-(nA, nB) symbolic E layers."""
+    entries = [f'&symbolic::hermite_e_symbolic_layer_{nA}_{nB}'
+               for nA in range(max_L + 1) for nB in range(max_L + 1)]
+    table = '{\n        ' + ',\n        '.join(entries) + ',\n    }'
+    return f'''/**
+ * @class SymbolicLayerDispatcher
+ * @brief Dispatcher for fused Symbolic E layers (all t of one shell pair per call)
+ */
+class SymbolicLayerDispatcher {{
+public:
+    static constexpr int MAX_NA = BENCH_MAX_L;
+    static constexpr int MAX_NB = BENCH_MAX_L;
+
+    static constexpr unsigned TABLE_SIZE = (MAX_NA + 1) * (MAX_NB + 1);
+
+    static const SymbolicLayerDispatcher& instance() {{
+        static SymbolicLayerDispatcher dispatcher;
+        return dispatcher;
+    }}
+
+    /**
+     * Writes E^{{nA,nB}}_t for t = 0..nA+nB into E and returns the number of
+     * values written (0 for an out-of-range or negative shell pair).
+     */
+    int compute(int nA, int nB,
+                const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p, Vec8d* E) const {{
+        if (static_cast<unsigned>(nA) > static_cast<unsigned>(MAX_NA) ||
+            static_cast<unsigned>(nB) > static_cast<unsigned>(MAX_NB)) return 0;
+        table_[nA * (MAX_NB + 1) + nB](PA, PB, one_over_2p, E);
+        return nA + nB + 1;
+    }}
+
+    SymbolicLayerDispatcher(const SymbolicLayerDispatcher&) = delete;
+    SymbolicLayerDispatcher& operator=(const SymbolicLayerDispatcher&) = delete;
+
+private:
+    SymbolicLayerDispatcher() = default;
+
+    static constexpr LayerFunction table_[TABLE_SIZE] = {table};
+}};
+
+'''
+
+
 def generate_dispatcher_header(max_L: int = 4):
     """Generate benchmark_dispatcher.hpp with all coefficients."""
 
@@ -17,19 +194,30 @@ def generate_dispatcher_header(max_L: int = 4):
             for t in range(nA + nB + 1):
                 coeffs.append((nA, nB, t))
 
-    header = f'''/**
+    # Only the per-shell-pair E headers, not the hermite_e_symbolic.hpp umbrella
+    pair_includes = '\n'.join(f'#include "hermite_e_symbolic_{nA}_{nB}.hpp"'
+                              for nA in range(max_L + 1) for nB in range(max_L + 1))
+
+    chunks = [f'''/**
  * @file benchmark_dispatcher.hpp
  * @brief Comprehensive dispatchers for TMP and Symbolic Hermite E benchmarks
  *
  * AUTO-GENERATED - DO NOT EDIT MANUALLY
  *
  * Coverage: E^{{0,0}}_0 to E^{{{max_L},{max_L}}}_{{{2*max_L}}} ({len(coeffs)} coefficients)
- * Also includes gradient dispatchers for dE/dPA, dE/dPB
+ * Also includes gradient dispatchers for dE/dPA, dE/dPB, and a layer
+ * dispatcher that fills every t of one (nA, nB) with a single fused call
+ *
+ * Each dispatcher is a flat constexpr table of plain function pointers indexed
+ * by nA * STRIDE_NA + nB * STRIDE_NB + t, so a call is one unsigned compare
+ * and a single indirect call. computeSymbolic and computeSymbolicGradPA
+ * instead go through nested switches of direct calls, which fold away for
+ * compile-time indices; define RECURSUM_USE_TABLE_DISPATCH to route them
+ * through the tables.
  */
 
 #pragma once
 
-#include <functional>
 #include <array>
 #include <stdexcept>
 
@@ -39,7 +227,7 @@ def generate_dispatcher_header(max_L: int = 4):
 
 #include <recursum/mcmd/hermite_e.hpp>
 #include <recursum/mcmd/hermite_grad.hpp>
-#include "hermite_e_symbolic.hpp"
+{pair_includes}
 #include "hermite_grad_symbolic.hpp"
 
 namespace recursum {{
@@ -52,322 +240,102 @@ constexpr int BENCH_MAX_N = 2 * BENCH_MAX_L;  // Max t index = {max_N}
 /**
  * @brief Function signature for coefficient evaluation
  */
-using CoeffFunction = std::function<Vec8d(const Vec8d&, const Vec8d&, const Vec8d&)>;
+using CoeffFunction = Vec8d (*)(const Vec8d&, const Vec8d&, const Vec8d&);
 
 /**
  * @brief Function signature for gradient evaluation (5 params)
  */
-using GradFunction = std::function<Vec8d(const Vec8d&, const Vec8d&, const Vec8d&, const Vec8d&, const Vec8d&)>;
-
-// =============================================================================
-// TMP DISPATCHER
-// =============================================================================
+using GradFunction = Vec8d (*)(const Vec8d&, const Vec8d&, const Vec8d&, const Vec8d&, const Vec8d&);
 
 /**
- * @class TMPDispatcher
- * @brief Dispatcher for TMP HermiteE template functions
+ * @brief Function signature for a fused layer writing E^{{nA,nB}}_t for every t
  */
-class TMPDispatcher {{
-public:
-    static constexpr int MAX_NA = BENCH_MAX_L;
-    static constexpr int MAX_NB = BENCH_MAX_L;
-    static constexpr int MAX_N = BENCH_MAX_N;
-
-    using NTable = std::array<CoeffFunction, MAX_N + 1>;
-    using NBTable = std::array<NTable, MAX_NB + 1>;
-    using DispatchTable = std::array<NBTable, MAX_NA + 1>;
+using LayerFunction = void (*)(Vec8d, Vec8d, Vec8d, Vec8d*);
 
-    static const TMPDispatcher& instance() {{
-        static TMPDispatcher dispatcher;
-        return dispatcher;
-    }}
-
-    Vec8d compute(int nA, int nB, int t,
-                  const Vec8d& PA, const Vec8d& PB, const Vec8d& p) const {{
-        if (nA < 0 || nA > MAX_NA || nB < 0 || nB > MAX_NB ||
-            t < 0 || t > MAX_N || t > nA + nB) {{
-            return Vec8d(0.0);
-        }}
-        const auto& func = table_[nA][nB][t];
-        if (!func) return Vec8d(0.0);
-        return func(PA, PB, p);
-    }}
+namespace detail {{
 
-    TMPDispatcher(const TMPDispatcher&) = delete;
-    TMPDispatcher& operator=(const TMPDispatcher&) = delete;
+// Free-function adapters with the CoeffFunction signature, one instantiation
+// per table slot
 
-private:
-    TMPDispatcher() {{
-        for (auto& na_slice : table_) {{
-            for (auto& nb_slice : na_slice) {{
-                for (auto& func : nb_slice) {{
-                    func = nullptr;
-                }}
-            }}
-        }}
-        registerAll();
-    }}
+template<int NA, int NB, int T>
+inline Vec8d tmp_hermite_e(const Vec8d& pa, const Vec8d& pb, const Vec8d& p) {{
+    return mcmd::HermiteE<NA, NB, T>::compute(pa, pb, p);
+}}
 
-    template<int NA, int NB, int T>
-    void registerCoeff() {{
-        table_[NA][NB][T] = [](const Vec8d& pa, const Vec8d& pb, const Vec8d& p) -> Vec8d {{
-            return mcmd::HermiteE<NA, NB, T>::compute(pa, pb, p);
-        }};
-    }}
+template<int NA, int NB, int T>
+inline Vec8d tmp_hermite_dE_dPA(const Vec8d& pa, const Vec8d& pb, const Vec8d& p) {{
+    return mcmd::HermiteDerivPA<NA, NB, T>::compute(pa, pb, p);
+}}
 
-    template<int NA, int NB, int T>
-    struct RegisterT {{
-        static void apply(TMPDispatcher* d) {{
-            if constexpr (T <= NA + NB && T <= MAX_N) {{
-                d->registerCoeff<NA, NB, T>();
-                if constexpr (T + 1 <= NA + NB && T + 1 <= MAX_N) {{
-                    RegisterT<NA, NB, T + 1>::apply(d);
-                }}
-            }}
-        }}
-    }};
-
-    template<int NA, int NB>
-    struct RegisterNB {{
-        static void apply(TMPDispatcher* d) {{
-            RegisterT<NA, NB, 0>::apply(d);
-            if constexpr (NB + 1 <= MAX_NB) {{
-                RegisterNB<NA, NB + 1>::apply(d);
-            }}
-        }}
-    }};
-
-    template<int NA>
-    struct RegisterNA {{
-        static void apply(TMPDispatcher* d) {{
-            RegisterNB<NA, 0>::apply(d);
-            if constexpr (NA + 1 <= MAX_NA) {{
-                RegisterNA<NA + 1>::apply(d);
-            }}
-        }}
-    }};
-
-    void registerAll() {{
-        RegisterNA<0>::apply(this);
-    }}
+// The symbolic kernels take their arguments by value
+template<Vec8d (*F)(Vec8d, Vec8d, Vec8d)>
+inline Vec8d by_ref(const Vec8d& pa, const Vec8d& pb, const Vec8d& p) {{
+    return F(pa, pb, p);
+}}
 
-    DispatchTable table_;
-}};
+}} // namespace detail
 
 // =============================================================================
-// SYMBOLIC DISPATCHER
+// TMP DISPATCHER
 // =============================================================================
 
-/**
- * @class SymbolicDispatcher
- * @brief Dispatcher for Symbolic (SymPy-generated) functions
- */
-class SymbolicDispatcher {{
-public:
-    static constexpr int MAX_NA = BENCH_MAX_L;
-    static constexpr int MAX_NB = BENCH_MAX_L;
-    static constexpr int MAX_N = BENCH_MAX_N;
-
-    using NTable = std::array<CoeffFunction, MAX_N + 1>;
-    using NBTable = std::array<NTable, MAX_NB + 1>;
-    using DispatchTable = std::array<NBTable, MAX_NA + 1>;
+''']
 
-    static const SymbolicDispatcher& instance() {{
-        static SymbolicDispatcher dispatcher;
-        return dispatcher;
-    }}
+    chunks.append(generate_dispatcher_class(
+        'TMPDispatcher', 'Dispatcher for TMP HermiteE template functions',
+        generate_table(coeffs, lambda nA, nB, t: f'&detail::tmp_hermite_e<{nA}, {nB}, {t}>', max_L),
+        'p'))
 
-    Vec8d compute(int nA, int nB, int t,
-                  const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p) const {{
-        if (nA < 0 || nA > MAX_NA || nB < 0 || nB > MAX_NB ||
-            t < 0 || t > MAX_N || t > nA + nB) {{
-            return Vec8d(0.0);
-        }}
-        const auto& func = table_[nA][nB][t];
-        if (!func) return Vec8d(0.0);
-        return func(PA, PB, one_over_2p);
-    }}
-
-    SymbolicDispatcher(const SymbolicDispatcher&) = delete;
-    SymbolicDispatcher& operator=(const SymbolicDispatcher&) = delete;
-
-private:
-    SymbolicDispatcher() {{
-        for (auto& na_slice : table_) {{
-            for (auto& nb_slice : na_slice) {{
-                for (auto& func : nb_slice) {{
-                    func = nullptr;
-                }}
-            }}
-        }}
-        registerAll();
-    }}
-
-    void registerAll() {{
-'''
+    chunks.append('''// =============================================================================
+// SYMBOLIC DISPATCHER
+// =============================================================================
 
-    # Generate registration for all coefficients
-    for nA, nB, t in coeffs:
-        header += f'''        table_[{nA}][{nB}][{t}] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {{
-            return symbolic::hermite_e_symbolic_{nA}_{nB}_{t}(PA, PB, p);
-        }};
-'''
+''')
 
-    header += '''    }
+    chunks.append(generate_dispatcher_class(
+        'SymbolicDispatcher', 'Dispatcher for Symbolic (SymPy-generated) functions',
+        generate_table(coeffs, lambda nA, nB, t:
+                       f'&detail::by_ref<&symbolic::hermite_e_symbolic_{nA}_{nB}_{t}>', max_L),
+        'one_over_2p'))
 
-    DispatchTable table_;
-};
+    chunks.append(generate_layer_dispatcher_class(max_L))
 
-// =============================================================================
+    chunks.append('''// =============================================================================
 // GRADIENT DISPATCHERS
 // =============================================================================
 
-/**
- * @class TMPGradPADispatcher
- * @brief Dispatcher for TMP dE/dPA gradients
- */
-class TMPGradPADispatcher {
-public:
-    static constexpr int MAX_NA = BENCH_MAX_L;
-    static constexpr int MAX_NB = BENCH_MAX_L;
-    static constexpr int MAX_N = BENCH_MAX_N;
-
-    using NTable = std::array<CoeffFunction, MAX_N + 1>;
-    using NBTable = std::array<NTable, MAX_NB + 1>;
-    using DispatchTable = std::array<NBTable, MAX_NA + 1>;
-
-    static const TMPGradPADispatcher& instance() {
-        static TMPGradPADispatcher dispatcher;
-        return dispatcher;
-    }
-
-    Vec8d compute(int nA, int nB, int t,
-                  const Vec8d& PA, const Vec8d& PB, const Vec8d& p) const {
-        if (nA < 0 || nA > MAX_NA || nB < 0 || nB > MAX_NB ||
-            t < 0 || t > MAX_N || t > nA + nB) {
-            return Vec8d(0.0);
-        }
-        const auto& func = table_[nA][nB][t];
-        if (!func) return Vec8d(0.0);
-        return func(PA, PB, p);
-    }
-
-private:
-    TMPGradPADispatcher() {
-        for (auto& na_slice : table_) {
-            for (auto& nb_slice : na_slice) {
-                for (auto& func : nb_slice) {
-                    func = nullptr;
-                }
-            }
-        }
-        registerAll();
-    }
-
-    template<int NA, int NB, int T>
-    void registerGrad() {
-        table_[NA][NB][T] = [](const Vec8d& pa, const Vec8d& pb, const Vec8d& p) -> Vec8d {
-            return mcmd::HermiteDerivPA<NA, NB, T>::compute(pa, pb, p);
-        };
-    }
-
-    template<int NA, int NB, int T>
-    struct RegisterT {
-        static void apply(TMPGradPADispatcher* d) {
-            if constexpr (T <= NA + NB && T <= MAX_N) {
-                d->registerGrad<NA, NB, T>();
-                if constexpr (T + 1 <= NA + NB && T + 1 <= MAX_N) {
-                    RegisterT<NA, NB, T + 1>::apply(d);
-                }
-            }
-        }
-    };
-
-    template<int NA, int NB>
-    struct RegisterNB {
-        static void apply(TMPGradPADispatcher* d) {
-            RegisterT<NA, NB, 0>::apply(d);
-            if constexpr (NB + 1 <= MAX_NB) {
-                RegisterNB<NA, NB + 1>::apply(d);
-            }
-        }
-    };
-
-    template<int NA>
-    struct RegisterNA {
-        static void apply(TMPGradPADispatcher* d) {
-            RegisterNB<NA, 0>::apply(d);
-            if constexpr (NA + 1 <= MAX_NA) {
-                RegisterNA<NA + 1>::apply(d);
-            }
-        }
-    };
-
-    void registerAll() {
-        RegisterNA<0>::apply(this);
-    }
-
-    DispatchTable table_;
-};
-
-/**
- * @class SymbolicGradPADispatcher
- * @brief Dispatcher for Symbolic dE/dPA gradients
- */
-class SymbolicGradPADispatcher {
-public:
-    static constexpr int MAX_NA = BENCH_MAX_L;
-    static constexpr int MAX_NB = BENCH_MAX_L;
-    static constexpr int MAX_N = BENCH_MAX_N;
+''')
 
-    using NTable = std::array<CoeffFunction, MAX_N + 1>;
-    using NBTable = std::array<NTable, MAX_NB + 1>;
-    using DispatchTable = std::array<NBTable, MAX_NA + 1>;
+    chunks.append(generate_dispatcher_class(
+        'TMPGradPADispatcher', 'Dispatcher for TMP dE/dPA gradients',
+        generate_table(coeffs, lambda nA, nB, t: f'&detail::tmp_hermite_dE_dPA<{nA}, {nB}, {t}>', max_L),
+        'p'))
 
-    static const SymbolicGradPADispatcher& instance() {
-        static SymbolicGradPADispatcher dispatcher;
-        return dispatcher;
-    }
+    chunks.append(generate_dispatcher_class(
+        'SymbolicGradPADispatcher', 'Dispatcher for Symbolic dE/dPA gradients',
+        generate_table(coeffs, lambda nA, nB, t:
+                       f'&detail::by_ref<&symbolic::hermite_dE_dPA_{nA}_{nB}_{t}>', max_L),
+        'one_over_2p'))
 
-    Vec8d compute(int nA, int nB, int t,
-                  const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p) const {
-        if (nA < 0 || nA > MAX_NA || nB < 0 || nB > MAX_NB ||
-            t < 0 || t > MAX_N || t > nA + nB) {
-            return Vec8d(0.0);
-        }
-        const auto& func = table_[nA][nB][t];
-        if (!func) return Vec8d(0.0);
-        return func(PA, PB, one_over_2p);
-    }
+    chunks.append('''// =============================================================================
+// SWITCH DISPATCH
+// =============================================================================
 
-private:
-    SymbolicGradPADispatcher() {
-        for (auto& na_slice : table_) {
-            for (auto& nb_slice : na_slice) {
-                for (auto& func : nb_slice) {
-                    func = nullptr;
-                }
-            }
-        }
-        registerAll();
-    }
-
-    void registerAll() {
-'''
+''')
 
-    # Generate registration for all gradient coefficients
-    for nA, nB, t in coeffs:
-        header += f'''        table_[{nA}][{nB}][{t}] = [](const Vec8d& PA, const Vec8d& PB, const Vec8d& p) {{
-            return symbolic::hermite_dE_dPA_{nA}_{nB}_{t}(PA, PB, p);
-        }};
-'''
+    chunks.append(generate_switch_dispatch(
+        'dispatch_hermite_e_switch', 'Symbolic E^{nA,nB}_t through nested switches (direct calls)',
+        coeffs, 'symbolic::hermite_e_symbolic_{nA}_{nB}_{t}'))
 
-    header += '''    }
+    chunks.append(generate_switch_dispatch(
+        'dispatch_dE_dPA_switch', 'Symbolic dE/dPA through nested switches (direct calls)',
+        coeffs, 'symbolic::hermite_dE_dPA_{nA}_{nB}_{t}'))
 
-    DispatchTable table_;
-};
+    chunks.append(generate_switch_dispatch(
+        'dispatch_dE_both_switch', 'Symbolic dE/dPA and dE/dPB with shared CSE (direct calls)',
+        coeffs, 'symbolic::hermite_dE_both_{nA}_{nB}_{t}', outputs=('dE_dPA', 'dE_dPB')))
 
-// =============================================================================
+    chunks.append('''// =============================================================================
 // CONVENIENCE FUNCTIONS
 // =============================================================================
 
@@ -378,7 +346,17 @@ inline Vec8d computeTMP(int nA, int nB, int t,
 
 inline Vec8d computeSymbolic(int nA, int nB, int t,
                              const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p) {
+#ifdef RECURSUM_USE_TABLE_DISPATCH
     return SymbolicDispatcher::instance().compute(nA, nB, t, PA, PB, one_over_2p);
+#else
+    return dispatch_hermite_e_switch(nA, nB, t, PA, PB, one_over_2p);
+#endif
+}
+
+inline int computeSymbolicLayer(int nA, int nB,
+                                const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p,
+                                Vec8d* E) {
+    return SymbolicLayerDispatcher::instance().compute(nA, nB, PA, PB, one_over_2p, E);
 }
 
 inline Vec8d computeTMPGradPA(int nA, int nB, int t,
@@ -388,14 +366,24 @@ inline Vec8d computeTMPGradPA(int nA, int nB, int t,
 
 inline Vec8d computeSymbolicGradPA(int nA, int nB, int t,
                                    const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p) {
+#ifdef RECURSUM_USE_TABLE_DISPATCH
     return SymbolicGradPADispatcher::instance().compute(nA, nB, t, PA, PB, one_over_2p);
+#else
+    return dispatch_dE_dPA_switch(nA, nB, t, PA, PB, one_over_2p);
+#endif
+}
+
+inline void computeSymbolicGradBoth(int nA, int nB, int t,
+                                    const Vec8d& PA, const Vec8d& PB, const Vec8d& one_over_2p,
+                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dispatch_dE_both_switch(nA, nB, t, PA, PB, one_over_2p, dE_dPA, dE_dPB);
 }
 
 } // namespace benchmark
 } // namespace recursum
-'''
+''')
 
-    return header
+    return ''.join(chunks)
 
 
 def main():
@@ -9,11 +9,16 @@ symbolic algebra system (like SymPy) would produce after optimization.
 Output: benchmarks/symbolic_generated/hermite_e_symbolic.hpp
 """
 
+from functools import lru_cache
+import re
+
 import sympy as sp
 from sympy import symbols, ccode, simplify, expand
 from typing import Dict, Tuple, List
 import os
 
+from generate_comprehensive_symbolic import POW_PATTERNS
+
 
 def generate_hermite_e_recurrence(max_nA: int, max_nB: int) -> Dict[Tuple[int, int, int], sp.Expr]:
     """
@@ -77,29 +82,25 @@ def generate_hermite_e_recurrence(max_nA: int, max_nB: int) -> Dict[Tuple[int, i
     return E
 
 
+_POW_RE = re.compile(r'pow\(([A-Za-z_]\w*), (\d+)\)')
+
+
+def _expand_pow(match: re.Match) -> str:
+    pattern = POW_PATTERNS.get(int(match.group(2)))
+    return pattern.format(x=match.group(1)) if pattern else match.group(0)
+
+
+@lru_cache(maxsize=None)
 def expr_to_cpp(expr: sp.Expr) -> str:
-    """Convert SymPy expression to C++ code with Vec8d operations."""
-    code = ccode(expr)
-    # Replace pow with explicit multiplications for small powers
-    code = code.replace('pow(PA, 2)', '(PA*PA)')
-    code = code.replace('pow(PB, 2)', '(PB*PB)')
-    code = code.replace('pow(one_over_2p, 2)', '(one_over_2p*one_over_2p)')
-    code = code.replace('pow(PA, 3)', '(PA*PA*PA)')
-    code = code.replace('pow(PB, 3)', '(PB*PB*PB)')
-    code = code.replace('pow(one_over_2p, 3)', '(one_over_2p*one_over_2p*one_over_2p)')
-    code = code.replace('pow(PA, 4)', '((PA*PA)*(PA*PA))')
-    code = code.replace('pow(PB, 4)', '((PB*PB)*(PB*PB))')
-    code = code.replace('pow(PA, 5)', '((PA*PA)*(PA*PA)*PA)')
-    code = code.replace('pow(PB, 5)', '((PB*PB)*(PB*PB)*PB)')
-    code = code.replace('pow(PA, 6)', '((PA*PA*PA)*(PA*PA*PA))')
-    code = code.replace('pow(PB, 6)', '((PB*PB*PB)*(PB*PB*PB))')
-    return code
+    """Convert SymPy expression to C++ code with Vec8d operations (memoized)."""
+    # Replace pow with explicit multiplications for small powers, in one pass
+    return _POW_RE.sub(_expand_pow, ccode(expr))
 
 
 def generate_cpp_code(expressions: Dict[Tuple[int, int, int], sp.Expr]) -> str:
     """Generate C++ header with all coefficient functions."""
 
-    cpp = '''/**
+    chunks = ['''/**
  * @file hermite_e_symbolic.hpp
  * @brief Symbolically-generated Hermite E coefficients (expanded form)
  *
@@ -119,7 +120,7 @@ def generate_cpp_code(expressions: Dict[Tuple[int, int, int], sp.Expr]) -> str:
 namespace recursum {
 namespace symbolic {
 
-'''
+''']
 
     # Sort by (nA, nB, t)
     sorted_keys = sorted(expressions.keys())
@@ -128,35 +129,35 @@ namespace symbolic {
         nA, nB, t = key
         expr = expressions[key]
 
-        cpp += f'''/**
+        chunks.append(f'''/**
  * @brief Symbolic E^{{{nA},{nB}}}_{t}
  */
 inline Vec8d hermite_e_symbolic_{nA}_{nB}_{t}(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {{
     return {expr_to_cpp(expr)};
 }}
 
-'''
+''')
 
     # Add dispatcher function
-    cpp += '''/**
+    chunks.append('''/**
  * @brief Runtime dispatcher for symbolic Hermite E coefficients
  */
 inline Vec8d dispatch_hermite_e_symbolic(int nA, int nB, int t,
                                           Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-'''
+''')
 
     for key in sorted_keys:
         nA, nB, t = key
-        cpp += f'    if (nA == {nA} && nB == {nB} && t == {t}) return hermite_e_symbolic_{nA}_{nB}_{t}(PA, PB, one_over_2p);\n'
+        chunks.append(f'    if (nA == {nA} && nB == {nB} && t == {t}) return hermite_e_symbolic_{nA}_{nB}_{t}(PA, PB, one_over_2p);\n')
 
-    cpp += '''    return Vec8d(0.0);  // Invalid indices
+    chunks.append('''    return Vec8d(0.0);  // Invalid indices
 }
 
 } // namespace symbolic
 } // namespace recursum
-'''
+''')
 
-    return cpp
+    return ''.join(chunks)
 
 
 def main():
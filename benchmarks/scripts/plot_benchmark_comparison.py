@@ -11,12 +11,24 @@ Author: Generated with Claude Code
 Date: 2026-01-15
 """
 
+import functools
 import json
+import os
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
 from pathlib import Path
-from collections import defaultdict
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None
+
+# Lives in benchmarks/analysis, which must be on PYTHONPATH
+from benchmark_json import NanToNullReader
 
 # =============================================================================
 # Configuration following scientific plotting guide
@@ -42,6 +54,17 @@ OKABE_ITO_CYCLE = [
     '#F0E442',  # yellow
     '#000000',  # black
 ]
+_OKABE_ITO_CYCLER = plt.cycler(color=OKABE_ITO_CYCLE)
+
+# Sans-serif font list per journal, with a fallback that is always installed
+_JOURNAL_FONTS = {
+    'nature': ['Helvetica', 'DejaVu Sans'],
+    'science': ['Arial', 'DejaVu Sans'],
+    'aps': ['Helvetica', 'DejaVu Sans'],
+    'acs': ['Arial', 'DejaVu Sans'],
+    'elsevier': ['Arial', 'DejaVu Sans'],
+}
+_DEFAULT_FONTS = ['Arial', 'DejaVu Sans']
 
 # Line styles for additional differentiation
 LINE_STYLES = ['-', '--', '-.', ':']
@@ -62,8 +85,9 @@ def get_font_scale(fig_width_inches, target_min_font=6):
     return max(1.0, min(scale, 2.5))
 
 
-def configure_publication_style(journal='aps', font_scale=1.0):
-    """Configure matplotlib for publication-quality figures."""
+@functools.lru_cache(maxsize=8)
+def _build_rcparams(journal, font_scale):
+    """rcParams for configure_publication_style; the returned dict is shared, do not mutate."""
     base_sizes = {
         'axes.labelsize': 10,
         'axes.titlesize': 11,
@@ -76,17 +100,9 @@ def configure_publication_style(journal='aps', font_scale=1.0):
 
     scaled_sizes = {k: v * font_scale for k, v in base_sizes.items()}
 
-    font_families = {
-        'nature': 'Helvetica',
-        'science': 'Arial',
-        'aps': 'Helvetica',
-        'acs': 'Arial',
-        'elsevier': 'Arial',
-    }
-
-    plt.rcParams.update({
+    return {
         'font.family': 'sans-serif',
-        'font.sans-serif': [font_families.get(journal, 'Arial'), 'DejaVu Sans'],
+        'font.sans-serif': _JOURNAL_FONTS.get(journal, _DEFAULT_FONTS),
         'mathtext.fontset': 'dejavusans',
         **scaled_sizes,
         'axes.linewidth': 0.8,
@@ -114,13 +130,27 @@ def configure_publication_style(journal='aps', font_scale=1.0):
         'savefig.dpi': 300,
         'savefig.bbox': 'tight',
         'savefig.pad_inches': 0.02,
-    })
+        'axes.prop_cycle': _OKABE_ITO_CYCLER,
+    }
 
-    plt.rcParams['axes.prop_cycle'] = plt.cycler(color=OKABE_ITO_CYCLE)
+
+def configure_publication_style(journal='aps', font_scale=1.0):
+    """
+    Configure matplotlib for publication-quality figures.
+
+    The settings are pushed on every call, even when the arguments repeat:
+    other code in the same process may have restyled matplotlib since.
+    """
+    plt.rcParams.update(_build_rcparams(journal, font_scale))
 
 
 def save_publication_figure(fig, filename, formats=('pdf', 'png'), dpi=300):
-    """Save figure in multiple formats for publication."""
+    """
+    Save figure in multiple formats for publication.
+
+    Returns the paths of the files written.
+    """
+    saved = []
     for fmt in formats:
         output_path = f'{filename}.{fmt}'
         kwargs = {
@@ -134,7 +164,8 @@ def save_publication_figure(fig, filename, formats=('pdf', 'png'), dpi=300):
             kwargs['dpi'] = dpi
 
         fig.savefig(output_path, format=fmt, **kwargs)
-        print(f'Saved: {output_path}')
+        saved.append(output_path)
+    return saved
 
 
 # =============================================================================
@@ -142,31 +173,51 @@ def save_publication_figure(fig, filename, formats=('pdf', 'png'), dpi=300):
 # =============================================================================
 
 def load_benchmark_data(json_path):
-    """Load Google Benchmark JSON and extract aggregate statistics."""
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+    """
+    Load Google Benchmark JSON and extract aggregate statistics.
+
+    With ijson installed the entries are streamed, so the per-iteration rows
+    are discarded as they are read instead of being decoded all at once.
+    Results are cached on the file's path, mtime and size, so re-running
+    main() in one session only re-parses files that changed; the returned
+    dict is shared between calls and must not be modified.
+    """
+    st = os.stat(json_path)
+    return _load_aggregates(os.fspath(json_path), st.st_mtime_ns, st.st_size)
+
 
+@functools.lru_cache(maxsize=16)
+def _load_aggregates(json_path, mtime_ns, size):
+    """Uncached body of load_benchmark_data; mtime_ns and size only key the cache."""
     # Extract only aggregate entries (mean and stddev)
-    aggregates = defaultdict(dict)
+    aggregates = {}
 
-    for entry in data['benchmarks']:
+    for entry in iter_benchmarks(json_path):
         if entry.get('run_type') != 'aggregate':
             continue
 
-        name = entry['run_name']
         agg_name = entry.get('aggregate_name', '')
 
         if agg_name in ('mean', 'stddev'):
-            if name not in aggregates:
-                aggregates[name] = {}
-            aggregates[name][agg_name] = entry
+            aggregates.setdefault(entry['run_name'], {})[agg_name] = entry
 
     return aggregates
 
 
+def iter_benchmarks(json_path):
+    """Yield the entries of the 'benchmarks' array, streaming them when ijson is available."""
+    if not IJSON_AVAILABLE:
+        with open(json_path, 'r') as f:
+            yield from json.load(f)['benchmarks']
+        return
+    with open(json_path, 'rb') as f:
+        yield from ijson.items(NanToNullReader(f), 'benchmarks.item', use_float=True)
+
+
 def parse_hermite_data(aggregates):
     """Parse Hermite coefficient benchmark data into structured format."""
     shell_pairs = ['ss', 'sp', 'pp', 'sd', 'pd', 'dd', 'ff', 'gg']
+    shell_rank = {shell: rank for rank, shell in enumerate(shell_pairs)}
     impl_names = {0: 'TMP', 1: 'Layered', 2: 'Symbolic'}
 
     results = {impl: {'shells': [], 'L': [], 'mean': [], 'std': [], 'n_coeffs': []}
@@ -179,16 +230,14 @@ def parse_hermite_data(aggregates):
         mean_entry = agg_data['mean']
         std_entry = agg_data.get('stddev', {})
 
-        # Extract implementation and shell pair from name
+        # Extract the shell pair from name; names with fewer than three
+        # components leave shell empty and are skipped below
         # Format: HermiteE/TMP/ss/min_time:1.000
-        parts = name.split('/')
-        if len(parts) < 3:
-            continue
-
-        impl_str = parts[1]
-        shell = parts[2]
+        _, _, rest = name.partition('/')
+        _, _, rest = rest.partition('/')
+        shell, _, _ = rest.partition('/')
 
-        if shell not in shell_pairs:
+        if shell not in shell_rank:
             continue
 
         impl_id = int(mean_entry.get('impl', -1))
@@ -203,13 +252,22 @@ def parse_hermite_data(aggregates):
         results[impl_name]['std'].append(std_entry.get('cpu_time', 0))
         results[impl_name]['n_coeffs'].append(int(mean_entry.get('n_coeffs', 1)))
 
-    # Sort by shell pair order
+    # Sort by shell pair order: one permutation, applied to every field
     for impl in results:
-        if results[impl]['shells']:
-            indices = [shell_pairs.index(s) for s in results[impl]['shells']]
-            sorted_idx = np.argsort(indices)
-            for key in results[impl]:
-                results[impl][key] = [results[impl][key][i] for i in sorted_idx]
+        fields = results[impl]
+        # Timings scattered into shell_pairs order, NaN where a shell is missing
+        mean_by_shell = np.full(len(shell_pairs), np.nan)
+        std_by_shell = np.full(len(shell_pairs), np.nan)
+        if fields['shells']:
+            ranks = np.fromiter((shell_rank[s] for s in fields['shells']),
+                                dtype=np.int32, count=len(fields['shells']))
+            order = np.argsort(ranks, kind='stable')
+            for key in fields:
+                fields[key] = np.asarray(fields[key])[order].tolist()
+            mean_by_shell[ranks[order]] = fields['mean']
+            std_by_shell[ranks[order]] = fields['std']
+        fields['mean_by_shell'] = mean_by_shell
+        fields['std_by_shell'] = std_by_shell
 
     return results, shell_pairs
 
@@ -242,9 +300,9 @@ def parse_coulomb_data(aggregates):
     # Sort by L_total
     for impl in results:
         if results[impl]['L_total']:
-            sorted_idx = np.argsort(results[impl]['L_total'])
+            order = np.argsort(np.asarray(results[impl]['L_total']), kind='stable')
             for key in results[impl]:
-                results[impl][key] = [results[impl][key][i] for i in sorted_idx]
+                results[impl][key] = np.asarray(results[impl][key])[order].tolist()
 
     return results
 
@@ -269,10 +327,9 @@ def plot_hermite_bar_comparison(hermite_data, shell_pairs, output_dir):
     colors = OKABE_ITO_CYCLE[:3]
 
     # Get shells that exist in all implementations
-    available_shells = []
-    for shell in shell_pairs:
-        if all(shell in hermite_data[impl]['shells'] for impl in implementations):
-            available_shells.append(shell)
+    available = np.logical_and.reduce(
+        [~np.isnan(hermite_data[impl]['mean_by_shell']) for impl in implementations])
+    available_shells = [shell for shell, ok in zip(shell_pairs, available) if ok]
 
     n_shells = len(available_shells)
     n_impl = len(implementations)
@@ -280,12 +337,8 @@ def plot_hermite_bar_comparison(hermite_data, shell_pairs, output_dir):
     x = np.arange(n_shells)
 
     for i, (impl, color) in enumerate(zip(implementations, colors)):
-        means = []
-        stds = []
-        for shell in available_shells:
-            idx = hermite_data[impl]['shells'].index(shell)
-            means.append(hermite_data[impl]['mean'][idx])
-            stds.append(hermite_data[impl]['std'][idx])
+        means = hermite_data[impl]['mean_by_shell'][available]
+        stds = hermite_data[impl]['std_by_shell'][available]
 
         offset = (i - n_impl/2 + 0.5) * bar_width
         bars = ax.bar(x + offset, means, bar_width, yerr=stds,
@@ -306,10 +359,10 @@ def plot_hermite_bar_comparison(hermite_data, shell_pairs, output_dir):
     fig.tight_layout()
 
     output_path = output_dir / 'hermite_coefficients_comparison'
-    save_publication_figure(fig, str(output_path))
+    saved = save_publication_figure(fig, str(output_path))
     plt.close(fig)
 
-    return str(output_path)
+    return saved
 
 
 def plot_hermite_scaling(hermite_data, output_dir):
@@ -329,17 +382,13 @@ def plot_hermite_scaling(hermite_data, output_dir):
     linestyles = ['-', '--', '-.']
 
     for impl, color, marker, ls in zip(implementations, colors, markers, linestyles):
-        L_vals = np.array(hermite_data[impl]['L'])
-        means = np.array(hermite_data[impl]['mean'])
-        stds = np.array(hermite_data[impl]['std'])
+        rec = np.rec.fromarrays([hermite_data[impl]['L'], hermite_data[impl]['mean'],
+                                 hermite_data[impl]['std']], names='L,mean,std')
 
-        # Sort by L
-        sorted_idx = np.argsort(L_vals)
-        L_vals = L_vals[sorted_idx]
-        means = means[sorted_idx]
-        stds = stds[sorted_idx]
+        # Sort by L; one gather moves every field (ties keep parse order)
+        rec = rec[np.argsort(rec['L'], kind='stable')]
 
-        ax.errorbar(L_vals, means, yerr=stds,
+        ax.errorbar(rec['L'], rec['mean'], yerr=rec['std'],
                     label=impl, color=color, marker=marker,
                     linestyle=ls, markersize=6, capsize=2,
                     markerfacecolor=color, markeredgecolor='white',
@@ -361,10 +410,10 @@ def plot_hermite_scaling(hermite_data, output_dir):
     fig.tight_layout()
 
     output_path = output_dir / 'hermite_coefficients_vs_L'
-    save_publication_figure(fig, str(output_path))
+    saved = save_publication_figure(fig, str(output_path))
     plt.close(fig)
 
-    return str(output_path)
+    return saved
 
 
 def plot_coulomb_bar_comparison(coulomb_data, output_dir):
@@ -388,12 +437,12 @@ def plot_coulomb_bar_comparison(coulomb_data, output_dir):
     x = np.arange(n_L)
 
     for i, (impl, color) in enumerate(zip(implementations, colors)):
-        means = []
-        stds = []
-        for L in L_values:
-            idx = coulomb_data[impl]['L_total'].index(L)
-            means.append(coulomb_data[impl]['mean'][idx])
-            stds.append(coulomb_data[impl]['std'][idx])
+        # First entry per L_total; an L this implementation lacks is drawn as NaN
+        by_L = {}
+        for L, mean, std in zip(coulomb_data[impl]['L_total'],
+                                coulomb_data[impl]['mean'], coulomb_data[impl]['std']):
+            by_L.setdefault(L, (mean, std))
+        means, stds = np.array([by_L.get(L, (np.nan, np.nan)) for L in L_values]).reshape(-1, 2).T
 
         offset = (i - n_impl/2 + 0.5) * bar_width
         bars = ax.bar(x + offset, means, bar_width, yerr=stds,
@@ -413,10 +462,10 @@ def plot_coulomb_bar_comparison(coulomb_data, output_dir):
     fig.tight_layout()
 
     output_path = output_dir / 'coulomb_hermite_comparison'
-    save_publication_figure(fig, str(output_path))
+    saved = save_publication_figure(fig, str(output_path))
     plt.close(fig)
 
-    return str(output_path)
+    return saved
 
 
 def plot_coulomb_scaling(coulomb_data, output_dir):
@@ -435,22 +484,18 @@ def plot_coulomb_scaling(coulomb_data, output_dir):
     linestyles = ['-', '--']
 
     for impl, color, marker, ls in zip(implementations, colors, markers, linestyles):
-        L_vals = np.array(coulomb_data[impl]['L_total'])
-        means = np.array(coulomb_data[impl]['mean'])
-        stds = np.array(coulomb_data[impl]['std'])
-        n_integrals = np.array(coulomb_data[impl]['n_integrals'])
+        rec = np.rec.fromarrays([coulomb_data[impl]['L_total'], coulomb_data[impl]['mean'],
+                                 coulomb_data[impl]['std'], coulomb_data[impl]['n_integrals']],
+                                names='L,mean,std,n_integrals')
 
-        # Calculate time per integral
-        time_per_integral = means / n_integrals
-        std_per_integral = stds / n_integrals
+        # Sort by L; one gather moves every field (ties keep parse order)
+        rec = rec[np.argsort(rec['L'], kind='stable')]
 
-        # Sort by L
-        sorted_idx = np.argsort(L_vals)
-        L_vals = L_vals[sorted_idx]
-        time_per_integral = time_per_integral[sorted_idx]
-        std_per_integral = std_per_integral[sorted_idx]
+        # Calculate time per integral
+        time_per_integral = rec['mean'] / rec['n_integrals']
+        std_per_integral = rec['std'] / rec['n_integrals']
 
-        ax.errorbar(L_vals, time_per_integral, yerr=std_per_integral,
+        ax.errorbar(rec['L'], time_per_integral, yerr=std_per_integral,
                     label=impl, color=color, marker=marker,
                     linestyle=ls, markersize=6, capsize=2,
                     markerfacecolor=color, markeredgecolor='white',
@@ -475,10 +520,10 @@ def plot_coulomb_scaling(coulomb_data, output_dir):
     fig.tight_layout()
 
     output_path = output_dir / 'coulomb_hermite_scaling'
-    save_publication_figure(fig, str(output_path))
+    saved = save_publication_figure(fig, str(output_path))
     plt.close(fig)
 
-    return str(output_path)
+    return saved
 
 
 # =============================================================================
@@ -516,27 +561,25 @@ def main():
     print("Generating plots...")
     print("-" * 60)
 
+    saved = []
     print("\nPlot 1: Hermite coefficients bar comparison")
-    path1 = plot_hermite_bar_comparison(hermite_data, shell_pairs, output_dir)
+    saved += plot_hermite_bar_comparison(hermite_data, shell_pairs, output_dir)
 
     print("\nPlot 2: Hermite coefficients scaling with L")
-    path2 = plot_hermite_scaling(hermite_data, output_dir)
+    saved += plot_hermite_scaling(hermite_data, output_dir)
 
     print("\nPlot 3: Coulomb integrals bar comparison")
-    path3 = plot_coulomb_bar_comparison(coulomb_data, output_dir)
+    saved += plot_coulomb_bar_comparison(coulomb_data, output_dir)
 
     print("\nPlot 4: Coulomb integrals scaling")
-    path4 = plot_coulomb_scaling(coulomb_data, output_dir)
+    saved += plot_coulomb_scaling(coulomb_data, output_dir)
 
     print("\n" + "=" * 60)
     print("All plots generated successfully!")
     print("=" * 60)
     print(f"\nOutput directory: {output_dir}")
     print("\nGenerated files:")
-    print(f"  - {path1}.pdf/.png")
-    print(f"  - {path2}.pdf/.png")
-    print(f"  - {path3}.pdf/.png")
-    print(f"  - {path4}.pdf/.png")
+    print('\n'.join(f"  - {path}" for path in saved))
 
 
 if __name__ == '__main__':
@@ -10,8 +10,13 @@ Author: Scientific Plotting Agent
 Date: 2026-01-14
 """
 
+import functools
 import json
+import os
+import re
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from pathlib import Path
 from collections import defaultdict
@@ -45,8 +50,9 @@ COLORS = {
 }
 
 
-def configure_publication_style(journal='nature', font_scale=1.0):
-    """Configure matplotlib for publication-quality figures."""
+@functools.lru_cache(maxsize=8)
+def _build_rcparams(journal, font_scale):
+    """Style settings per (journal, font_scale); callers must not mutate the dict."""
     base_sizes = {
         'axes.labelsize': 10,
         'axes.titlesize': 11,
@@ -58,7 +64,7 @@ def configure_publication_style(journal='nature', font_scale=1.0):
     }
     scaled_sizes = {k: v * font_scale for k, v in base_sizes.items()}
 
-    plt.rcParams.update({
+    return {
         'font.family': 'serif',
         'font.serif': ['Times New Roman', 'DejaVu Serif', 'serif'],
         'mathtext.fontset': 'cm',  # Computer Modern for math
@@ -93,7 +99,12 @@ def configure_publication_style(journal='nature', font_scale=1.0):
         'savefig.dpi': 300,
         'savefig.bbox': 'tight',
         'savefig.pad_inches': 0.02,
-    })
+    }
+
+
+def configure_publication_style(journal='nature', font_scale=1.0):
+    """Configure matplotlib for publication-quality figures."""
+    plt.rcParams.update(_build_rcparams(journal, font_scale))
 
 
 def get_figsize(journal='nature', width='single', aspect=0.75):
@@ -116,6 +127,13 @@ def add_panel_label(ax, label, fontsize=12, fontweight='bold', offset=(-0.12, 1.
             fontsize=fontsize, fontweight=fontweight, va='top', ha='left')
 
 
+def save_pdf_and_png(fig, output_path, dpi=300):
+    """Save fig as output_path.pdf and output_path.png."""
+    fig.savefig(f'{output_path}.pdf', dpi=dpi, bbox_inches='tight')
+    fig.savefig(f'{output_path}.png', dpi=dpi, bbox_inches='tight')
+    print(f"Saved: {output_path}.pdf and {output_path}.png")
+
+
 # ==============================================================================
 # Data Loading and Parsing
 # ==============================================================================
@@ -123,15 +141,28 @@ def add_panel_label(ax, label, fontsize=12, fontweight='bold', offset=(-0.12, 1.
 def load_benchmark_data(json_path):
     """Load and parse benchmark JSON file.
 
-    Handles NaN values which are invalid JSON by replacing them with null.
+    NaN/Infinity values (undefined statistics) are decoded as None. Bare
+    nan/-nan, which older Google Benchmark releases wrote and which is
+    invalid JSON, is only rewritten to null when the direct parse fails.
+    Results are cached on the file's path, mtime and size; the returned
+    dict is shared between calls and must not be modified.
     """
-    import re
+    st = os.stat(json_path)
+    return _load_json(os.fspath(json_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_json(json_path, mtime_ns, size):
+    """Uncached body of load_benchmark_data; mtime_ns and size only key the cache."""
     with open(json_path, 'r') as f:
         content = f.read()
+    try:
+        return json.loads(content, parse_constant=lambda _: None)
+    except json.JSONDecodeError:
+        pass
     # Replace NaN values with null (valid JSON)
     content = re.sub(r':\s*-?nan\b', ': null', content, flags=re.IGNORECASE)
-    data = json.loads(content)
-    return data
+    return json.loads(content, parse_constant=lambda _: None)
 
 
 def extract_comparison_benchmarks(data):
@@ -229,6 +260,51 @@ def extract_scaling_benchmarks(data):
     return dict(results)
 
 
+# Representative coefficients for the execution-time bar chart
+# Focus on diagonal cases (nA=nB) which are most commonly used
+SELECTED_COEFFICIENTS = (
+    (0, 0, 0),  # E^{0,0}_0 - simplest
+    (1, 1, 0),  # E^{1,1}_0
+    (1, 1, 2),  # E^{1,1}_2 - max t for (1,1)
+    (2, 2, 0),  # E^{2,2}_0
+    (2, 2, 2),  # E^{2,2}_2
+    (2, 2, 4),  # E^{2,2}_4 - max t for (2,2)
+    (3, 3, 0),  # E^{3,3}_0
+    (3, 3, 1),  # E^{3,3}_1
+    (3, 3, 2),  # E^{3,3}_2
+    (3, 3, 3),  # E^{3,3}_3
+    (3, 3, 4),  # E^{3,3}_4
+    (3, 3, 5),  # E^{3,3}_5
+)
+
+# E^{3,3}_t series used to show the TMP/Symbolic crossover
+E33_COEFFICIENTS = tuple((3, 3, t) for t in range(7))
+
+
+def complete_pair(entry):
+    """
+    Return the (TMP, Symbolic) aggregate dicts of an extracted entry.
+
+    Returns None unless both implementations are present and have a mean.
+    """
+    tmp = entry.get('TMP')
+    sym = entry.get('Symbolic')
+    if tmp is None or sym is None or 'mean' not in tmp or 'mean' not in sym:
+        return None
+    return tmp, sym
+
+
+def select_complete_pairs(comparison_data, keys):
+    """Return (key, tmp, sym) for each of keys with a complete TMP/Symbolic pair, in order."""
+    selected = []
+    for key in keys:
+        entry = comparison_data.get(key)
+        pair = complete_pair(entry) if entry is not None else None
+        if pair is not None:
+            selected.append((key, *pair))
+    return selected
+
+
 # ==============================================================================
 # Plotting Functions
 # ==============================================================================
@@ -240,27 +316,7 @@ def plot_execution_time_comparison(comparison_data, output_dir, journal='nature'
     Shows key coefficients: E^{0,0}_0, E^{1,1}_0, E^{1,1}_2, E^{2,2}_2, E^{2,2}_4,
     and E^{3,3}_t for t=0,1,2,3,4,5
     """
-    # Select representative coefficients for visualization
-    # Focus on diagonal cases (nA=nB) which are most commonly used
-    selected_coefficients = [
-        (0, 0, 0),  # E^{0,0}_0 - simplest
-        (1, 1, 0),  # E^{1,1}_0
-        (1, 1, 2),  # E^{1,1}_2 - max t for (1,1)
-        (2, 2, 0),  # E^{2,2}_0
-        (2, 2, 2),  # E^{2,2}_2
-        (2, 2, 4),  # E^{2,2}_4 - max t for (2,2)
-        (3, 3, 0),  # E^{3,3}_0
-        (3, 3, 1),  # E^{3,3}_1
-        (3, 3, 2),  # E^{3,3}_2
-        (3, 3, 3),  # E^{3,3}_3
-        (3, 3, 4),  # E^{3,3}_4
-        (3, 3, 5),  # E^{3,3}_5
-    ]
-
-    # Filter to only coefficients that exist in data
-    available = [c for c in selected_coefficients if c in comparison_data]
-
-    if not available:
+    if not any(c in comparison_data for c in SELECTED_COEFFICIENTS):
         print("Warning: No comparison data found for selected coefficients")
         return None
 
@@ -271,16 +327,12 @@ def plot_execution_time_comparison(comparison_data, output_dir, journal='nature'
     sym_means = []
     sym_stds = []
 
-    for (nA, nB, t) in available:
-        entry = comparison_data[(nA, nB, t)]
-
-        if 'TMP' in entry and 'Symbolic' in entry:
-            if 'mean' in entry['TMP'] and 'mean' in entry['Symbolic']:
-                labels.append(f'$E^{{{nA},{nB}}}_{{{t}}}$')
-                tmp_means.append(entry['TMP']['mean'])
-                tmp_stds.append(entry['TMP'].get('stddev', 0))
-                sym_means.append(entry['Symbolic']['mean'])
-                sym_stds.append(entry['Symbolic'].get('stddev', 0))
+    for (nA, nB, t), tmp, sym in select_complete_pairs(comparison_data, SELECTED_COEFFICIENTS):
+        labels.append(f'$E^{{{nA},{nB}}}_{{{t}}}$')
+        tmp_means.append(tmp['mean'])
+        tmp_stds.append(tmp.get('stddev', 0))
+        sym_means.append(sym['mean'])
+        sym_stds.append(sym.get('stddev', 0))
 
     if not labels:
         print("Warning: No complete TMP/Symbolic pairs found")
@@ -322,9 +374,7 @@ def plot_execution_time_comparison(comparison_data, output_dir, journal='nature'
 
     # Save
     output_path = output_dir / 'hermite_e_execution_times'
-    fig.savefig(f'{output_path}.pdf', dpi=300, bbox_inches='tight')
-    fig.savefig(f'{output_path}.png', dpi=300, bbox_inches='tight')
-    print(f"Saved: {output_path}.pdf and {output_path}.png")
+    save_pdf_and_png(fig, output_path)
 
     return fig
 
@@ -337,27 +387,21 @@ def plot_speedup_analysis(comparison_data, output_dir, journal='nature'):
     Values > 1 mean Symbolic is faster; < 1 mean TMP is faster.
     """
     # Focus on E^{3,3}_t series to show crossover clearly
-    e33_coefficients = [(3, 3, t) for t in range(7)]
-    available = [c for c in e33_coefficients if c in comparison_data]
-
-    if not available:
+    if not any(c in comparison_data for c in E33_COEFFICIENTS):
         print("Warning: No E^{3,3}_t data found")
         return None
 
     t_values = []
     speedup_ratios = []  # TMP/Symbolic (>1 means TMP slower, Symbolic wins)
 
-    for (nA, nB, t) in available:
-        entry = comparison_data[(nA, nB, t)]
-        if 'TMP' in entry and 'Symbolic' in entry:
-            if 'mean' in entry['TMP'] and 'mean' in entry['Symbolic']:
-                tmp_time = entry['TMP']['mean']
-                sym_time = entry['Symbolic']['mean']
-                if sym_time > 0:
-                    t_values.append(t)
-                    # Speedup = TMP_time / Symbolic_time
-                    # >1 means Symbolic is faster
-                    speedup_ratios.append(tmp_time / sym_time)
+    for (nA, nB, t), tmp, sym in select_complete_pairs(comparison_data, E33_COEFFICIENTS):
+        tmp_time = tmp['mean']
+        sym_time = sym['mean']
+        if sym_time > 0:
+            t_values.append(t)
+            # Speedup = TMP_time / Symbolic_time
+            # >1 means Symbolic is faster
+            speedup_ratios.append(tmp_time / sym_time)
 
     if not t_values:
         print("Warning: Could not compute speedup ratios")
@@ -389,21 +433,23 @@ def plot_speedup_analysis(comparison_data, output_dir, journal='nature'):
     ax.set_xticks(t_values)
 
     # Add value labels on bars
-    for bar, ratio in zip(bars, speedup_ratios):
-        height = bar.get_height()
-        ax.annotate(f'{ratio:.2f}',
-                    xy=(bar.get_x() + bar.get_width() / 2, height),
-                    xytext=(0, 3),
-                    textcoords="offset points",
-                    ha='center', va='bottom', fontsize=7)
+    ratio_labels = [f'{ratio:.2f}' for ratio in speedup_ratios]
+    if hasattr(ax, 'bar_label'):
+        ax.bar_label(bars, labels=ratio_labels, padding=3, fontsize=7)
+    else:
+        # Matplotlib < 3.4
+        for bar, label in zip(bars, ratio_labels):
+            ax.annotate(label,
+                        xy=(bar.get_x() + bar.get_width() / 2, bar.get_height()),
+                        xytext=(0, 3),
+                        textcoords="offset points",
+                        ha='center', va='bottom', fontsize=7)
 
     plt.tight_layout()
 
     # Save
     output_path = output_dir / 'hermite_e_speedup_e33'
-    fig.savefig(f'{output_path}.pdf', dpi=300, bbox_inches='tight')
-    fig.savefig(f'{output_path}.png', dpi=300, bbox_inches='tight')
-    print(f"Saved: {output_path}.pdf and {output_path}.png")
+    save_pdf_and_png(fig, output_path)
 
     return fig
 
@@ -427,14 +473,16 @@ def plot_scaling_analysis(scaling_data, output_dir, journal='nature'):
     valid_L = []
 
     for L in L_values:
-        entry = scaling_data[L]
-        if 'TMP' in entry and 'Symbolic' in entry:
-            if 'mean' in entry['TMP'] and 'mean' in entry['Symbolic']:
-                valid_L.append(L)
-                tmp_means.append(entry['TMP']['mean'])
-                tmp_stds.append(entry['TMP'].get('stddev', 0))
-                sym_means.append(entry['Symbolic']['mean'])
-                sym_stds.append(entry['Symbolic'].get('stddev', 0))
+        pair = complete_pair(scaling_data[L])
+        if pair is None:
+            continue
+        tmp, sym = pair
+
+        valid_L.append(L)
+        tmp_means.append(tmp['mean'])
+        tmp_stds.append(tmp.get('stddev', 0))
+        sym_means.append(sym['mean'])
+        sym_stds.append(sym.get('stddev', 0))
 
     if not valid_L:
         print("Warning: No complete scaling data found")
@@ -471,9 +519,7 @@ def plot_scaling_analysis(scaling_data, output_dir, journal='nature'):
 
     # Save
     output_path = output_dir / 'hermite_e_scaling'
-    fig.savefig(f'{output_path}.pdf', dpi=300, bbox_inches='tight')
-    fig.savefig(f'{output_path}.png', dpi=300, bbox_inches='tight')
-    print(f"Saved: {output_path}.pdf and {output_path}.png")
+    save_pdf_and_png(fig, output_path)
 
     return fig
 
@@ -496,7 +542,8 @@ def plot_comprehensive_comparison(comparison_data, scaling_data, output_dir, jou
 
     # ===== Panel (a): Execution times for E^{3,3}_t =====
     ax = axes[0]
-    e33_coefficients = [(3, 3, t) for t in range(6)]  # t=0 to 5
+    # Shared with panel (b)
+    e33_pairs = select_complete_pairs(comparison_data, E33_COEFFICIENTS[:6])  # t=0 to 5
 
     labels = []
     tmp_means = []
@@ -504,16 +551,12 @@ def plot_comprehensive_comparison(comparison_data, scaling_data, output_dir, jou
     sym_means = []
     sym_stds = []
 
-    for (nA, nB, t) in e33_coefficients:
-        if (nA, nB, t) in comparison_data:
-            entry = comparison_data[(nA, nB, t)]
-            if 'TMP' in entry and 'Symbolic' in entry:
-                if 'mean' in entry['TMP'] and 'mean' in entry['Symbolic']:
-                    labels.append(f'$t={t}$')
-                    tmp_means.append(entry['TMP']['mean'])
-                    tmp_stds.append(entry['TMP'].get('stddev', 0))
-                    sym_means.append(entry['Symbolic']['mean'])
-                    sym_stds.append(entry['Symbolic'].get('stddev', 0))
+    for (nA, nB, t), tmp, sym in e33_pairs:
+        labels.append(f'$t={t}$')
+        tmp_means.append(tmp['mean'])
+        tmp_stds.append(tmp.get('stddev', 0))
+        sym_means.append(sym['mean'])
+        sym_stds.append(sym.get('stddev', 0))
 
     if labels:
         x = np.arange(len(labels))
@@ -537,16 +580,12 @@ def plot_comprehensive_comparison(comparison_data, scaling_data, output_dir, jou
     t_values = []
     speedup_ratios = []
 
-    for t in range(6):
-        if (3, 3, t) in comparison_data:
-            entry = comparison_data[(3, 3, t)]
-            if 'TMP' in entry and 'Symbolic' in entry:
-                if 'mean' in entry['TMP'] and 'mean' in entry['Symbolic']:
-                    tmp_time = entry['TMP']['mean']
-                    sym_time = entry['Symbolic']['mean']
-                    if sym_time > 0:
-                        t_values.append(t)
-                        speedup_ratios.append(tmp_time / sym_time)
+    for (nA, nB, t), tmp, sym in e33_pairs:
+        tmp_time = tmp['mean']
+        sym_time = sym['mean']
+        if sym_time > 0:
+            t_values.append(t)
+            speedup_ratios.append(tmp_time / sym_time)
 
     if t_values:
         colors = [COLORS['Symbolic'] if s > 1 else COLORS['TMP'] for s in speedup_ratios]
@@ -576,14 +615,16 @@ def plot_comprehensive_comparison(comparison_data, scaling_data, output_dir, jou
         valid_L = []
 
         for L in L_values:
-            entry = scaling_data[L]
-            if 'TMP' in entry and 'Symbolic' in entry:
-                if 'mean' in entry['TMP'] and 'mean' in entry['Symbolic']:
-                    valid_L.append(L)
-                    tmp_means.append(entry['TMP']['mean'])
-                    tmp_stds.append(entry['TMP'].get('stddev', 0))
-                    sym_means.append(entry['Symbolic']['mean'])
-                    sym_stds.append(entry['Symbolic'].get('stddev', 0))
+            pair = complete_pair(scaling_data[L])
+            if pair is None:
+                continue
+            tmp, sym = pair
+
+            valid_L.append(L)
+            tmp_means.append(tmp['mean'])
+            tmp_stds.append(tmp.get('stddev', 0))
+            sym_means.append(sym['mean'])
+            sym_stds.append(sym.get('stddev', 0))
 
         if valid_L:
             ax.errorbar(valid_L, tmp_means, yerr=tmp_stds,
@@ -605,53 +646,57 @@ def plot_comprehensive_comparison(comparison_data, scaling_data, output_dir, jou
 
     # Save
     output_path = output_dir / 'hermite_e_comprehensive'
-    fig.savefig(f'{output_path}.pdf', dpi=300, bbox_inches='tight')
-    fig.savefig(f'{output_path}.png', dpi=300, bbox_inches='tight')
-    print(f"Saved: {output_path}.pdf and {output_path}.png")
+    save_pdf_and_png(fig, output_path)
 
     return fig
 
 
 def print_data_summary(comparison_data, scaling_data):
     """Print summary of extracted benchmark data."""
-    print("\n" + "="*70)
-    print("BENCHMARK DATA SUMMARY")
-    print("="*70)
-
-    print("\n--- Comparison Benchmarks (TMP vs Symbolic) ---")
-    print(f"Total coefficient combinations: {len(comparison_data)}")
-
-    # Print E^{3,3}_t series details
-    print("\nE^{3,3}_t series (key comparison):")
-    print(f"{'Coeff':<12} {'TMP (ns)':<15} {'Symbolic (ns)':<15} {'Speedup':<10}")
-    print("-" * 52)
+    # Collected and written in one print call
+    lines = [
+        "\n" + "="*70,
+        "BENCHMARK DATA SUMMARY",
+        "="*70,
+        "\n--- Comparison Benchmarks (TMP vs Symbolic) ---",
+        f"Total coefficient combinations: {len(comparison_data)}",
+        # E^{3,3}_t series details
+        "\nE^{3,3}_t series (key comparison):",
+        f"{'Coeff':<12} {'TMP (ns)':<15} {'Symbolic (ns)':<15} {'Speedup':<10}",
+        "-" * 52,
+    ]
 
     for t in range(7):
-        key = (3, 3, t)
-        if key in comparison_data:
-            entry = comparison_data[key]
-            if 'TMP' in entry and 'Symbolic' in entry:
-                tmp = entry['TMP'].get('mean', 0)
-                sym = entry['Symbolic'].get('mean', 0)
+        entry = comparison_data.get((3, 3, t))
+        if entry is not None:
+            tmp_entry = entry.get('TMP')
+            sym_entry = entry.get('Symbolic')
+            if tmp_entry is not None and sym_entry is not None:
+                tmp = tmp_entry.get('mean', 0)
+                sym = sym_entry.get('mean', 0)
                 speedup = tmp / sym if sym > 0 else 0
                 winner = "Sym" if speedup > 1 else "TMP"
-                print(f"E^{{3,3}}_{t:<5} {tmp:<15.3f} {sym:<15.3f} {speedup:<6.2f} ({winner})")
+                lines.append(f"E^{{3,3}}_{t:<5} {tmp:<15.3f} {sym:<15.3f} {speedup:<6.2f} ({winner})")
 
-    print("\n--- Scaling Benchmarks ---")
+    lines.append("\n--- Scaling Benchmarks ---")
     if scaling_data:
-        print(f"L_total values: {sorted(scaling_data.keys())}")
-        print("\nScaling data:")
-        print(f"{'L_total':<10} {'TMP (ns)':<15} {'Symbolic (ns)':<15}")
-        print("-" * 40)
-        for L in sorted(scaling_data.keys()):
+        L_values = sorted(scaling_data.keys())
+        lines += [
+            f"L_total values: {L_values}",
+            "\nScaling data:",
+            f"{'L_total':<10} {'TMP (ns)':<15} {'Symbolic (ns)':<15}",
+            "-" * 40,
+        ]
+        for L in L_values:
             entry = scaling_data[L]
             tmp = entry.get('TMP', {}).get('mean', 0)
             sym = entry.get('Symbolic', {}).get('mean', 0)
-            print(f"{L:<10} {tmp:<15.3f} {sym:<15.3f}")
+            lines.append(f"{L:<10} {tmp:<15.3f} {sym:<15.3f}")
     else:
-        print("No scaling data found")
+        lines.append("No scaling data found")
 
-    print("="*70 + "\n")
+    lines.append("="*70 + "\n")
+    print('\n'.join(lines))
 
 
 # ==============================================================================
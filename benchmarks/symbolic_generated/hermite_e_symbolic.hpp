@@ -1,9 +1,15 @@
 /**
  * @file hermite_e_symbolic.hpp
- * @brief Symbolically-generated Hermite E coefficients (expanded form)
+ * @brief Symbolically-generated Hermite E coefficients (with CSE)
  *
  * AUTO-GENERATED - DO NOT EDIT MANUALLY
  * Coverage: E^{0,0}_0 to E^{4,4}_8 (ss to gg shell pairs)
+ *
+ * Optimization: CSE (Common Subexpression Elimination) applied
+ *
+ * Umbrella header: the per-coefficient functions and fused layers of each
+ * shell pair live in hermite_e_symbolic_{nA}_{nB}.hpp, which can also be
+ * included on its own.
  */
 
 #pragma once
@@ -12,882 +18,314 @@
 #include <recursum/vectorclass.h>
 #endif
 
+#include "hermite_e_symbolic_0_0.hpp"
+#include "hermite_e_symbolic_0_1.hpp"
+#include "hermite_e_symbolic_0_2.hpp"
+#include "hermite_e_symbolic_0_3.hpp"
+#include "hermite_e_symbolic_0_4.hpp"
+#include "hermite_e_symbolic_1_0.hpp"
+#include "hermite_e_symbolic_1_1.hpp"
+#include "hermite_e_symbolic_1_2.hpp"
+#include "hermite_e_symbolic_1_3.hpp"
+#include "hermite_e_symbolic_1_4.hpp"
+#include "hermite_e_symbolic_2_0.hpp"
+#include "hermite_e_symbolic_2_1.hpp"
+#include "hermite_e_symbolic_2_2.hpp"
+#include "hermite_e_symbolic_2_3.hpp"
+#include "hermite_e_symbolic_2_4.hpp"
+#include "hermite_e_symbolic_3_0.hpp"
+#include "hermite_e_symbolic_3_1.hpp"
+#include "hermite_e_symbolic_3_2.hpp"
+#include "hermite_e_symbolic_3_3.hpp"
+#include "hermite_e_symbolic_3_4.hpp"
+#include "hermite_e_symbolic_4_0.hpp"
+#include "hermite_e_symbolic_4_1.hpp"
+#include "hermite_e_symbolic_4_2.hpp"
+#include "hermite_e_symbolic_4_3.hpp"
+#include "hermite_e_symbolic_4_4.hpp"
+
 namespace recursum {
 namespace symbolic {
 
-/**
- * @brief Symbolic E^{0,0}_0
- */
-inline Vec8d hermite_e_symbolic_0_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 1;
-}
-
-/**
- * @brief Symbolic E^{0,1}_0
- */
-inline Vec8d hermite_e_symbolic_0_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return PB;
-}
-
-/**
- * @brief Symbolic E^{0,1}_1
- */
-inline Vec8d hermite_e_symbolic_0_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return one_over_2p;
-}
-
-/**
- * @brief Symbolic E^{0,2}_0
- */
-inline Vec8d hermite_e_symbolic_0_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PB*PB) + one_over_2p;
-}
-
-/**
- * @brief Symbolic E^{0,2}_1
- */
-inline Vec8d hermite_e_symbolic_0_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 2*PB*one_over_2p;
-}
-
-/**
- * @brief Symbolic E^{0,2}_2
- */
-inline Vec8d hermite_e_symbolic_0_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{0,3}_0
- */
-inline Vec8d hermite_e_symbolic_0_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PB*PB*PB) + 3*PB*one_over_2p;
-}
-
-/**
- * @brief Symbolic E^{0,3}_1
- */
-inline Vec8d hermite_e_symbolic_0_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*(PB*PB)*one_over_2p + 3*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{0,3}_2
- */
-inline Vec8d hermite_e_symbolic_0_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*PB*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{0,3}_3
- */
-inline Vec8d hermite_e_symbolic_0_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{0,4}_0
- */
-inline Vec8d hermite_e_symbolic_0_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((PB*PB)*(PB*PB)) + 6*(PB*PB)*one_over_2p + 3*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{0,4}_1
- */
-inline Vec8d hermite_e_symbolic_0_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*(PB*PB*PB)*one_over_2p + 12*PB*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{0,4}_2
- */
-inline Vec8d hermite_e_symbolic_0_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 6*(PB*PB)*(one_over_2p*one_over_2p) + 6*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{0,4}_3
- */
-inline Vec8d hermite_e_symbolic_0_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*PB*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{0,4}_4
- */
-inline Vec8d hermite_e_symbolic_0_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{1,0}_0
- */
-inline Vec8d hermite_e_symbolic_1_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return PA;
-}
-
-/**
- * @brief Symbolic E^{1,0}_1
- */
-inline Vec8d hermite_e_symbolic_1_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return one_over_2p;
-}
-
-/**
- * @brief Symbolic E^{1,1}_0
- */
-inline Vec8d hermite_e_symbolic_1_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return PA*PB + one_over_2p;
-}
-
-/**
- * @brief Symbolic E^{1,1}_1
- */
-inline Vec8d hermite_e_symbolic_1_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return PA*one_over_2p + PB*one_over_2p;
-}
-
-/**
- * @brief Symbolic E^{1,1}_2
- */
-inline Vec8d hermite_e_symbolic_1_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{1,2}_0
- */
-inline Vec8d hermite_e_symbolic_1_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return PA*(PB*PB) + PA*one_over_2p + 2*PB*one_over_2p;
-}
-
-/**
- * @brief Symbolic E^{1,2}_1
- */
-inline Vec8d hermite_e_symbolic_1_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 2*PA*PB*one_over_2p + (PB*PB)*one_over_2p + 3*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{1,2}_2
- */
-inline Vec8d hermite_e_symbolic_1_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return PA*(one_over_2p*one_over_2p) + 2*PB*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{1,2}_3
- */
-inline Vec8d hermite_e_symbolic_1_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{1,3}_0
- */
-inline Vec8d hermite_e_symbolic_1_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return PA*(PB*PB*PB) + 3*PA*PB*one_over_2p + 3*(PB*PB)*one_over_2p + 3*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{1,3}_1
- */
-inline Vec8d hermite_e_symbolic_1_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*PA*(PB*PB)*one_over_2p + 3*PA*(one_over_2p*one_over_2p) + (PB*PB*PB)*one_over_2p + 9*PB*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{1,3}_2
- */
-inline Vec8d hermite_e_symbolic_1_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*PA*PB*(one_over_2p*one_over_2p) + 3*(PB*PB)*(one_over_2p*one_over_2p) + 6*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{1,3}_3
- */
-inline Vec8d hermite_e_symbolic_1_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return PA*(one_over_2p*one_over_2p*one_over_2p) + 3*PB*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{1,3}_4
- */
-inline Vec8d hermite_e_symbolic_1_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{1,4}_0
- */
-inline Vec8d hermite_e_symbolic_1_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return PA*((PB*PB)*(PB*PB)) + 6*PA*(PB*PB)*one_over_2p + 3*PA*(one_over_2p*one_over_2p) + 4*(PB*PB*PB)*one_over_2p + 12*PB*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{1,4}_1
- */
-inline Vec8d hermite_e_symbolic_1_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*PA*(PB*PB*PB)*one_over_2p + 12*PA*PB*(one_over_2p*one_over_2p) + ((PB*PB)*(PB*PB))*one_over_2p + 18*(PB*PB)*(one_over_2p*one_over_2p) + 15*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{1,4}_2
- */
-inline Vec8d hermite_e_symbolic_1_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 6*PA*(PB*PB)*(one_over_2p*one_over_2p) + 6*PA*(one_over_2p*one_over_2p*one_over_2p) + 4*(PB*PB*PB)*(one_over_2p*one_over_2p) + 24*PB*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{1,4}_3
- */
-inline Vec8d hermite_e_symbolic_1_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 6*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 10*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{1,4}_4
- */
-inline Vec8d hermite_e_symbolic_1_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 4*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{1,4}_5
- */
-inline Vec8d hermite_e_symbolic_1_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,0}_0
- */
-inline Vec8d hermite_e_symbolic_2_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA) + one_over_2p;
-}
-
-/**
- * @brief Symbolic E^{2,0}_1
- */
-inline Vec8d hermite_e_symbolic_2_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 2*PA*one_over_2p;
-}
-
-/**
- * @brief Symbolic E^{2,0}_2
- */
-inline Vec8d hermite_e_symbolic_2_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,1}_0
- */
-inline Vec8d hermite_e_symbolic_2_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA)*PB + 2*PA*one_over_2p + PB*one_over_2p;
-}
-
-/**
- * @brief Symbolic E^{2,1}_1
- */
-inline Vec8d hermite_e_symbolic_2_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA)*one_over_2p + 2*PA*PB*one_over_2p + 3*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,1}_2
- */
-inline Vec8d hermite_e_symbolic_2_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 2*PA*(one_over_2p*one_over_2p) + PB*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,1}_3
- */
-inline Vec8d hermite_e_symbolic_2_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,2}_0
- */
-inline Vec8d hermite_e_symbolic_2_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA)*(PB*PB) + (PA*PA)*one_over_2p + 4*PA*PB*one_over_2p + (PB*PB)*one_over_2p + 3*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,2}_1
- */
-inline Vec8d hermite_e_symbolic_2_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 2*(PA*PA)*PB*one_over_2p + 2*PA*(PB*PB)*one_over_2p + 6*PA*(one_over_2p*one_over_2p) + 6*PB*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,2}_2
- */
-inline Vec8d hermite_e_symbolic_2_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA)*(one_over_2p*one_over_2p) + 4*PA*PB*(one_over_2p*one_over_2p) + (PB*PB)*(one_over_2p*one_over_2p) + 6*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,2}_3
- */
-inline Vec8d hermite_e_symbolic_2_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 2*PA*(one_over_2p*one_over_2p*one_over_2p) + 2*PB*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,2}_4
- */
-inline Vec8d hermite_e_symbolic_2_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{2,3}_0
- */
-inline Vec8d hermite_e_symbolic_2_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA)*(PB*PB*PB) + 3*(PA*PA)*PB*one_over_2p + 6*PA*(PB*PB)*one_over_2p + 6*PA*(one_over_2p*one_over_2p) + (PB*PB*PB)*one_over_2p + 9*PB*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,3}_1
- */
-inline Vec8d hermite_e_symbolic_2_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*(PA*PA)*(PB*PB)*one_over_2p + 3*(PA*PA)*(one_over_2p*one_over_2p) + 2*PA*(PB*PB*PB)*one_over_2p + 18*PA*PB*(one_over_2p*one_over_2p) + 9*(PB*PB)*(one_over_2p*one_over_2p) + 15*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,3}_2
- */
-inline Vec8d hermite_e_symbolic_2_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*(PA*PA)*PB*(one_over_2p*one_over_2p) + 6*PA*(PB*PB)*(one_over_2p*one_over_2p) + 12*PA*(one_over_2p*one_over_2p*one_over_2p) + (PB*PB*PB)*(one_over_2p*one_over_2p) + 18*PB*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,3}_3
- */
-inline Vec8d hermite_e_symbolic_2_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 6*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 3*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 10*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{2,3}_4
- */
-inline Vec8d hermite_e_symbolic_2_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 2*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 3*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{2,3}_5
- */
-inline Vec8d hermite_e_symbolic_2_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,4}_0
- */
-inline Vec8d hermite_e_symbolic_2_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA)*((PB*PB)*(PB*PB)) + 6*(PA*PA)*(PB*PB)*one_over_2p + 3*(PA*PA)*(one_over_2p*one_over_2p) + 8*PA*(PB*PB*PB)*one_over_2p + 24*PA*PB*(one_over_2p*one_over_2p) + ((PB*PB)*(PB*PB))*one_over_2p + 18*(PB*PB)*(one_over_2p*one_over_2p) + 15*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,4}_1
- */
-inline Vec8d hermite_e_symbolic_2_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*(PA*PA)*(PB*PB*PB)*one_over_2p + 12*(PA*PA)*PB*(one_over_2p*one_over_2p) + 2*PA*((PB*PB)*(PB*PB))*one_over_2p + 36*PA*(PB*PB)*(one_over_2p*one_over_2p) + 30*PA*(one_over_2p*one_over_2p*one_over_2p) + 12*(PB*PB*PB)*(one_over_2p*one_over_2p) + 60*PB*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,4}_2
- */
-inline Vec8d hermite_e_symbolic_2_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 6*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 6*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 8*PA*(PB*PB*PB)*(one_over_2p*one_over_2p) + 48*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + ((PB*PB)*(PB*PB))*(one_over_2p*one_over_2p) + 36*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 45*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{2,4}_3
- */
-inline Vec8d hermite_e_symbolic_2_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*(PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 12*PA*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 20*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 4*(PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 40*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{2,4}_4
- */
-inline Vec8d hermite_e_symbolic_2_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 8*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 6*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 15*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,4}_5
- */
-inline Vec8d hermite_e_symbolic_2_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 2*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 4*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{2,4}_6
- */
-inline Vec8d hermite_e_symbolic_2_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{3,0}_0
- */
-inline Vec8d hermite_e_symbolic_3_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA*PA) + 3*PA*one_over_2p;
-}
-
-/**
- * @brief Symbolic E^{3,0}_1
- */
-inline Vec8d hermite_e_symbolic_3_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*(PA*PA)*one_over_2p + 3*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,0}_2
- */
-inline Vec8d hermite_e_symbolic_3_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*PA*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,0}_3
- */
-inline Vec8d hermite_e_symbolic_3_0_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,1}_0
- */
-inline Vec8d hermite_e_symbolic_3_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA*PA)*PB + 3*(PA*PA)*one_over_2p + 3*PA*PB*one_over_2p + 3*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,1}_1
- */
-inline Vec8d hermite_e_symbolic_3_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA*PA)*one_over_2p + 3*(PA*PA)*PB*one_over_2p + 9*PA*(one_over_2p*one_over_2p) + 3*PB*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,1}_2
- */
-inline Vec8d hermite_e_symbolic_3_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*(PA*PA)*(one_over_2p*one_over_2p) + 3*PA*PB*(one_over_2p*one_over_2p) + 6*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,1}_3
- */
-inline Vec8d hermite_e_symbolic_3_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*PA*(one_over_2p*one_over_2p*one_over_2p) + PB*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,1}_4
- */
-inline Vec8d hermite_e_symbolic_3_1_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{3,2}_0
- */
-inline Vec8d hermite_e_symbolic_3_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA*PA)*(PB*PB) + (PA*PA*PA)*one_over_2p + 6*(PA*PA)*PB*one_over_2p + 3*PA*(PB*PB)*one_over_2p + 9*PA*(one_over_2p*one_over_2p) + 6*PB*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,2}_1
- */
-inline Vec8d hermite_e_symbolic_3_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 2*(PA*PA*PA)*PB*one_over_2p + 3*(PA*PA)*(PB*PB)*one_over_2p + 9*(PA*PA)*(one_over_2p*one_over_2p) + 18*PA*PB*(one_over_2p*one_over_2p) + 3*(PB*PB)*(one_over_2p*one_over_2p) + 15*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,2}_2
- */
-inline Vec8d hermite_e_symbolic_3_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA*PA)*(one_over_2p*one_over_2p) + 6*(PA*PA)*PB*(one_over_2p*one_over_2p) + 3*PA*(PB*PB)*(one_over_2p*one_over_2p) + 18*PA*(one_over_2p*one_over_2p*one_over_2p) + 12*PB*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,2}_3
- */
-inline Vec8d hermite_e_symbolic_3_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 6*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + (PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 10*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{3,2}_4
- */
-inline Vec8d hermite_e_symbolic_3_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 2*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{3,2}_5
- */
-inline Vec8d hermite_e_symbolic_3_2_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,3}_0
- */
-inline Vec8d hermite_e_symbolic_3_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA*PA)*(PB*PB*PB) + 3*(PA*PA*PA)*PB*one_over_2p + 9*(PA*PA)*(PB*PB)*one_over_2p + 9*(PA*PA)*(one_over_2p*one_over_2p) + 3*PA*(PB*PB*PB)*one_over_2p + 27*PA*PB*(one_over_2p*one_over_2p) + 9*(PB*PB)*(one_over_2p*one_over_2p) + 15*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,3}_1
- */
-inline Vec8d hermite_e_symbolic_3_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*(PA*PA*PA)*(PB*PB)*one_over_2p + 3*(PA*PA*PA)*(one_over_2p*one_over_2p) + 3*(PA*PA)*(PB*PB*PB)*one_over_2p + 27*(PA*PA)*PB*(one_over_2p*one_over_2p) + 27*PA*(PB*PB)*(one_over_2p*one_over_2p) + 45*PA*(one_over_2p*one_over_2p*one_over_2p) + 3*(PB*PB*PB)*(one_over_2p*one_over_2p) + 45*PB*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,3}_2
- */
-inline Vec8d hermite_e_symbolic_3_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*(PA*PA*PA)*PB*(one_over_2p*one_over_2p) + 9*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 18*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 3*PA*(PB*PB*PB)*(one_over_2p*one_over_2p) + 54*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 18*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 45*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{3,3}_3
- */
-inline Vec8d hermite_e_symbolic_3_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 9*(PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 9*PA*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 30*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + (PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 30*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{3,3}_4
- */
-inline Vec8d hermite_e_symbolic_3_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 9*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 3*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 15*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,3}_5
- */
-inline Vec8d hermite_e_symbolic_3_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 3*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,3}_6
- */
-inline Vec8d hermite_e_symbolic_3_3_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{3,4}_0
- */
-inline Vec8d hermite_e_symbolic_3_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA*PA)*((PB*PB)*(PB*PB)) + 6*(PA*PA*PA)*(PB*PB)*one_over_2p + 3*(PA*PA*PA)*(one_over_2p*one_over_2p) + 12*(PA*PA)*(PB*PB*PB)*one_over_2p + 36*(PA*PA)*PB*(one_over_2p*one_over_2p) + 3*PA*((PB*PB)*(PB*PB))*one_over_2p + 54*PA*(PB*PB)*(one_over_2p*one_over_2p) + 45*PA*(one_over_2p*one_over_2p*one_over_2p) + 12*(PB*PB*PB)*(one_over_2p*one_over_2p) + 60*PB*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,4}_1
- */
-inline Vec8d hermite_e_symbolic_3_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*(PA*PA*PA)*(PB*PB*PB)*one_over_2p + 12*(PA*PA*PA)*PB*(one_over_2p*one_over_2p) + 3*(PA*PA)*((PB*PB)*(PB*PB))*one_over_2p + 54*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 45*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 36*PA*(PB*PB*PB)*(one_over_2p*one_over_2p) + 180*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 3*((PB*PB)*(PB*PB))*(one_over_2p*one_over_2p) + 90*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 105*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{3,4}_2
- */
-inline Vec8d hermite_e_symbolic_3_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 6*(PA*PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 6*(PA*PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 12*(PA*PA)*(PB*PB*PB)*(one_over_2p*one_over_2p) + 72*(PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 3*PA*((PB*PB)*(PB*PB))*(one_over_2p*one_over_2p) + 108*PA*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 135*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 24*(PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 180*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{3,4}_3
- */
-inline Vec8d hermite_e_symbolic_3_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*(PA*PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 18*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 30*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 12*PA*(PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 120*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + ((PB*PB)*(PB*PB))*(one_over_2p*one_over_2p*one_over_2p) + 60*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 105*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,4}_4
- */
-inline Vec8d hermite_e_symbolic_3_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (PA*PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 12*(PA*PA)*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 18*PA*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 45*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 4*(PB*PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 60*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{3,4}_5
- */
-inline Vec8d hermite_e_symbolic_3_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 12*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 6*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 21*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{3,4}_6
- */
-inline Vec8d hermite_e_symbolic_3_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*PA*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)) + 4*PB*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{3,4}_7
- */
-inline Vec8d hermite_e_symbolic_3_4_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,0}_0
- */
-inline Vec8d hermite_e_symbolic_4_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((PA*PA)*(PA*PA)) + 6*(PA*PA)*one_over_2p + 3*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,0}_1
- */
-inline Vec8d hermite_e_symbolic_4_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*(PA*PA*PA)*one_over_2p + 12*PA*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,0}_2
- */
-inline Vec8d hermite_e_symbolic_4_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 6*(PA*PA)*(one_over_2p*one_over_2p) + 6*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,0}_3
- */
-inline Vec8d hermite_e_symbolic_4_0_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*PA*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,0}_4
- */
-inline Vec8d hermite_e_symbolic_4_0_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{4,1}_0
- */
-inline Vec8d hermite_e_symbolic_4_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((PA*PA)*(PA*PA))*PB + 4*(PA*PA*PA)*one_over_2p + 6*(PA*PA)*PB*one_over_2p + 12*PA*(one_over_2p*one_over_2p) + 3*PB*(one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,1}_1
- */
-inline Vec8d hermite_e_symbolic_4_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((PA*PA)*(PA*PA))*one_over_2p + 4*(PA*PA*PA)*PB*one_over_2p + 18*(PA*PA)*(one_over_2p*one_over_2p) + 12*PA*PB*(one_over_2p*one_over_2p) + 15*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,1}_2
- */
-inline Vec8d hermite_e_symbolic_4_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*(PA*PA*PA)*(one_over_2p*one_over_2p) + 6*(PA*PA)*PB*(one_over_2p*one_over_2p) + 24*PA*(one_over_2p*one_over_2p*one_over_2p) + 6*PB*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,1}_3
- */
-inline Vec8d hermite_e_symbolic_4_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 6*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 4*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 10*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{4,1}_4
- */
-inline Vec8d hermite_e_symbolic_4_1_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{4,1}_5
- */
-inline Vec8d hermite_e_symbolic_4_1_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,2}_0
- */
-inline Vec8d hermite_e_symbolic_4_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((PA*PA)*(PA*PA))*(PB*PB) + ((PA*PA)*(PA*PA))*one_over_2p + 8*(PA*PA*PA)*PB*one_over_2p + 6*(PA*PA)*(PB*PB)*one_over_2p + 18*(PA*PA)*(one_over_2p*one_over_2p) + 24*PA*PB*(one_over_2p*one_over_2p) + 3*(PB*PB)*(one_over_2p*one_over_2p) + 15*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,2}_1
- */
-inline Vec8d hermite_e_symbolic_4_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 2*((PA*PA)*(PA*PA))*PB*one_over_2p + 4*(PA*PA*PA)*(PB*PB)*one_over_2p + 12*(PA*PA*PA)*(one_over_2p*one_over_2p) + 36*(PA*PA)*PB*(one_over_2p*one_over_2p) + 12*PA*(PB*PB)*(one_over_2p*one_over_2p) + 60*PA*(one_over_2p*one_over_2p*one_over_2p) + 30*PB*(one_over_2p*one_over_2p*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,2}_2
- */
-inline Vec8d hermite_e_symbolic_4_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((PA*PA)*(PA*PA))*(one_over_2p*one_over_2p) + 8*(PA*PA*PA)*PB*(one_over_2p*one_over_2p) + 6*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 36*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 48*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 6*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 45*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{4,2}_3
- */
-inline Vec8d hermite_e_symbolic_4_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*(PA*PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 12*(PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 4*PA*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 40*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 20*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{4,2}_4
- */
-inline Vec8d hermite_e_symbolic_4_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 6*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 8*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + (PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 15*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,2}_5
- */
-inline Vec8d hermite_e_symbolic_4_2_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 2*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,2}_6
- */
-inline Vec8d hermite_e_symbolic_4_2_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{4,3}_0
- */
-inline Vec8d hermite_e_symbolic_4_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((PA*PA)*(PA*PA))*(PB*PB*PB) + 3*((PA*PA)*(PA*PA))*PB*one_over_2p + 12*(PA*PA*PA)*(PB*PB)*one_over_2p + 12*(PA*PA*PA)*(one_over_2p*one_over_2p) + 6*(PA*PA)*(PB*PB*PB)*one_over_2p + 54*(PA*PA)*PB*(one_over_2p*one_over_2p) + 36*PA*(PB*PB)*(one_over_2p*one_over_2p) + 60*PA*(one_over_2p*one_over_2p*one_over_2p) + 3*(PB*PB*PB)*(one_over_2p*one_over_2p) + 45*PB*(one_over_2p*one_over_2p*one_over_2p);
-}
+/// Number of outputs written by hermite_e_symbolic_all
+constexpr int hermite_e_symbolic_count = 125;
 
 /**
- * @brief Symbolic E^{4,3}_1
- */
-inline Vec8d hermite_e_symbolic_4_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*((PA*PA)*(PA*PA))*(PB*PB)*one_over_2p + 3*((PA*PA)*(PA*PA))*(one_over_2p*one_over_2p) + 4*(PA*PA*PA)*(PB*PB*PB)*one_over_2p + 36*(PA*PA*PA)*PB*(one_over_2p*one_over_2p) + 54*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 90*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 12*PA*(PB*PB*PB)*(one_over_2p*one_over_2p) + 180*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 45*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 105*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{4,3}_2
- */
-inline Vec8d hermite_e_symbolic_4_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 3*((PA*PA)*(PA*PA))*PB*(one_over_2p*one_over_2p) + 12*(PA*PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 24*(PA*PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 6*(PA*PA)*(PB*PB*PB)*(one_over_2p*one_over_2p) + 108*(PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 72*PA*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 180*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 6*(PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 135*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{4,3}_3
- */
-inline Vec8d hermite_e_symbolic_4_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((PA*PA)*(PA*PA))*(one_over_2p*one_over_2p*one_over_2p) + 12*(PA*PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 18*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 60*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 4*PA*(PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 120*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 30*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 105*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,3}_4
- */
-inline Vec8d hermite_e_symbolic_4_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*(PA*PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 18*(PA*PA)*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 12*PA*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 60*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + (PB*PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 45*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,3}_5
- */
-inline Vec8d hermite_e_symbolic_4_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 6*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 12*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 3*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 21*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{4,3}_6
- */
-inline Vec8d hermite_e_symbolic_4_3_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*PA*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)) + 3*PB*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{4,3}_7
- */
-inline Vec8d hermite_e_symbolic_4_3_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,4}_0
- */
-inline Vec8d hermite_e_symbolic_4_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((PA*PA)*(PA*PA))*((PB*PB)*(PB*PB)) + 6*((PA*PA)*(PA*PA))*(PB*PB)*one_over_2p + 3*((PA*PA)*(PA*PA))*(one_over_2p*one_over_2p) + 16*(PA*PA*PA)*(PB*PB*PB)*one_over_2p + 48*(PA*PA*PA)*PB*(one_over_2p*one_over_2p) + 6*(PA*PA)*((PB*PB)*(PB*PB))*one_over_2p + 108*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 90*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 48*PA*(PB*PB*PB)*(one_over_2p*one_over_2p) + 240*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 3*((PB*PB)*(PB*PB))*(one_over_2p*one_over_2p) + 90*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 105*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{4,4}_1
- */
-inline Vec8d hermite_e_symbolic_4_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*((PA*PA)*(PA*PA))*(PB*PB*PB)*one_over_2p + 12*((PA*PA)*(PA*PA))*PB*(one_over_2p*one_over_2p) + 4*(PA*PA*PA)*((PB*PB)*(PB*PB))*one_over_2p + 72*(PA*PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 60*(PA*PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 72*(PA*PA)*(PB*PB*PB)*(one_over_2p*one_over_2p) + 360*(PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 12*PA*((PB*PB)*(PB*PB))*(one_over_2p*one_over_2p) + 360*PA*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 420*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 60*(PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 420*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{4,4}_2
- */
-inline Vec8d hermite_e_symbolic_4_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 6*((PA*PA)*(PA*PA))*(PB*PB)*(one_over_2p*one_over_2p) + 6*((PA*PA)*(PA*PA))*(one_over_2p*one_over_2p*one_over_2p) + 16*(PA*PA*PA)*(PB*PB*PB)*(one_over_2p*one_over_2p) + 96*(PA*PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 6*(PA*PA)*((PB*PB)*(PB*PB))*(one_over_2p*one_over_2p) + 216*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 270*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 96*PA*(PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 720*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 6*((PB*PB)*(PB*PB))*(one_over_2p*one_over_2p*one_over_2p) + 270*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 420*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,4}_3
- */
-inline Vec8d hermite_e_symbolic_4_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*((PA*PA)*(PA*PA))*PB*(one_over_2p*one_over_2p*one_over_2p) + 24*(PA*PA*PA)*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 40*(PA*PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 24*(PA*PA)*(PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 240*(PA*PA)*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 4*PA*((PB*PB)*(PB*PB))*(one_over_2p*one_over_2p*one_over_2p) + 240*PA*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 420*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 40*(PB*PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 420*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,4}_4
- */
-inline Vec8d hermite_e_symbolic_4_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return ((PA*PA)*(PA*PA))*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 16*(PA*PA*PA)*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 36*(PA*PA)*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 90*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 16*PA*(PB*PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 240*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + ((PB*PB)*(PB*PB))*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 90*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 210*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{4,4}_5
- */
-inline Vec8d hermite_e_symbolic_4_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*(PA*PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 24*(PA*PA)*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 24*PA*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 84*PA*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)) + 4*(PB*PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 84*PB*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
-}
-
-/**
- * @brief Symbolic E^{4,4}_6
- */
-inline Vec8d hermite_e_symbolic_4_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 6*(PA*PA)*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)) + 16*PA*PB*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)) + 6*(PB*PB)*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)) + 28*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,4}_7
- */
-inline Vec8d hermite_e_symbolic_4_4_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return 4*PA*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p) + 4*PB*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p);
-}
-
-/**
- * @brief Symbolic E^{4,4}_8
- */
-inline Vec8d hermite_e_symbolic_4_4_8(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
-    return (((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p))*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)));
+ * @brief All symbolic E^{nA,nB}_t at once (global CSE)
+ *
+ * E[i] holds the i-th coefficient in (nA, nB, t) lexicographic order, as
+ * listed next to each assignment.
+ */
+inline void hermite_e_symbolic_all(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* E) {
+    const Vec8d x0 = (PB*PB);
+    const Vec8d x1 = one_over_2p + x0;
+    const Vec8d x2 = 2*PB;
+    const Vec8d x3 = one_over_2p*x2;
+    const Vec8d x4 = (one_over_2p*one_over_2p);
+    const Vec8d x5 = 3*one_over_2p;
+    const Vec8d x6 = x0 + x5;
+    const Vec8d x7 = PB*x6;
+    const Vec8d x8 = 3*x4;
+    const Vec8d x9 = PB*x8;
+    const Vec8d x10 = (one_over_2p*one_over_2p*one_over_2p);
+    const Vec8d x11 = ((PB*PB)*(PB*PB));
+    const Vec8d x12 = one_over_2p*x0;
+    const Vec8d x13 = 6*x12;
+    const Vec8d x14 = 4*one_over_2p;
+    const Vec8d x15 = 6*x4;
+    const Vec8d x16 = 4*PB;
+    const Vec8d x17 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    const Vec8d x18 = PA*PB;
+    const Vec8d x19 = PA + PB;
+    const Vec8d x20 = PA*one_over_2p;
+    const Vec8d x21 = PA*x0;
+    const Vec8d x22 = 2*x18;
+    const Vec8d x23 = PA + x2;
+    const Vec8d x24 = (PB*PB*PB);
+    const Vec8d x25 = PA*x24;
+    const Vec8d x26 = x0*x5;
+    const Vec8d x27 = x18*x5 + x8;
+    const Vec8d x28 = PB*one_over_2p;
+    const Vec8d x29 = 9*x28;
+    const Vec8d x30 = PA*x5;
+    const Vec8d x31 = 3*x21;
+    const Vec8d x32 = x30 + x31;
+    const Vec8d x33 = 2*one_over_2p;
+    const Vec8d x34 = x18 + x33;
+    const Vec8d x35 = 3*PB;
+    const Vec8d x36 = PA*x11;
+    const Vec8d x37 = PA*x8;
+    const Vec8d x38 = PB*x4;
+    const Vec8d x39 = one_over_2p*x24;
+    const Vec8d x40 = 6*x0;
+    const Vec8d x41 = x20*x40;
+    const Vec8d x42 = 4*x25;
+    const Vec8d x43 = 18*x12;
+    const Vec8d x44 = 15*x4;
+    const Vec8d x45 = one_over_2p*x18;
+    const Vec8d x46 = x44 + 12*x45;
+    const Vec8d x47 = 2*x24;
+    const Vec8d x48 = 12*x28;
+    const Vec8d x49 = 2*x4;
+    const Vec8d x50 = 3*x0;
+    const Vec8d x51 = 5*one_over_2p;
+    const Vec8d x52 = x22 + x51;
+    const Vec8d x53 = 2*x10;
+    const Vec8d x54 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    const Vec8d x55 = (PA*PA);
+    const Vec8d x56 = one_over_2p + x55;
+    const Vec8d x57 = 2*x20;
+    const Vec8d x58 = PB*x55;
+    const Vec8d x59 = x5 + x55;
+    const Vec8d x60 = 2*PA;
+    const Vec8d x61 = PB + x60;
+    const Vec8d x62 = one_over_2p*x55;
+    const Vec8d x63 = 4*x18;
+    const Vec8d x64 = x0*x55;
+    const Vec8d x65 = PB*x5;
+    const Vec8d x66 = 6*one_over_2p;
+    const Vec8d x67 = x0 + x55;
+    const Vec8d x68 = x24*x55;
+    const Vec8d x69 = x39 + x68;
+    const Vec8d x70 = x5*x55;
+    const Vec8d x71 = x44 + 18*x45 + x50*x55;
+    const Vec8d x72 = x35*x55;
+    const Vec8d x73 = 12*x20;
+    const Vec8d x74 = 18*x28;
+    const Vec8d x75 = 6*x21 + x24;
+    const Vec8d x76 = 10*one_over_2p;
+    const Vec8d x77 = 6*x18 + x76;
+    const Vec8d x78 = x11*x55;
+    const Vec8d x79 = x0*x4;
+    const Vec8d x80 = x20*x24;
+    const Vec8d x81 = 15*x10;
+    const Vec8d x82 = x18*x4;
+    const Vec8d x83 = x40*x62 + x81 + 24*x82;
+    const Vec8d x84 = PA*x44;
+    const Vec8d x85 = 18*x20;
+    const Vec8d x86 = 6*x55;
+    const Vec8d x87 = x28*x86;
+    const Vec8d x88 = x47*x55;
+    const Vec8d x89 = 6*x62;
+    const Vec8d x90 = 45*x4;
+    const Vec8d x91 = 48*x45 + 6*x64 + x90;
+    const Vec8d x92 = 4*x10;
+    const Vec8d x93 = 8*x18;
+    const Vec8d x94 = 15*one_over_2p + x93;
+    const Vec8d x95 = 2*x54;
+    const Vec8d x96 = ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
+    const Vec8d x97 = (PA*PA*PA);
+    const Vec8d x98 = PB*x97;
+    const Vec8d x99 = 9*x20;
+    const Vec8d x100 = x65 + x72;
+    const Vec8d x101 = 3*PA;
+    const Vec8d x102 = 9*x4;
+    const Vec8d x103 = one_over_2p*x97;
+    const Vec8d x104 = x0*x97;
+    const Vec8d x105 = x103 + x104;
+    const Vec8d x106 = 9*x62;
+    const Vec8d x107 = 6*x58 + x97;
+    const Vec8d x108 = 3*x55;
+    const Vec8d x109 = x24*x97;
+    const Vec8d x110 = PB*x44;
+    const Vec8d x111 = 3*x54;
+    const Vec8d x112 = 12*x4;
+    const Vec8d x113 = 45*x10;
+    const Vec8d x114 = 60*x10;
+    const Vec8d x115 = 36*x4;
+    const Vec8d x116 = 54*x4;
+    const Vec8d x117 = x11*x97 + x36*x5;
+    const Vec8d x118 = x11*x5 + 3*x78;
+    const Vec8d x119 = 105*x10;
+    const Vec8d x120 = x0*x62;
+    const Vec8d x121 = 4*x109 + x119 + 54*x120 + 180*x82;
+    const Vec8d x122 = x0*x20;
+    const Vec8d x123 = x28*x55;
+    const Vec8d x124 = 2*x104;
+    const Vec8d x125 = x16*x97;
+    const Vec8d x126 = 105*x4;
+    const Vec8d x127 = x126 + 120*x45 + 18*x64;
+    const Vec8d x128 = 60*x28;
+    const Vec8d x129 = 7*one_over_2p + x63;
+    const Vec8d x130 = ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p);
+    const Vec8d x131 = ((PA*PA)*(PA*PA));
+    const Vec8d x132 = 4*PA;
+    const Vec8d x133 = PB*x131;
+    const Vec8d x134 = 18*x62;
+    const Vec8d x135 = x4*x55;
+    const Vec8d x136 = x28*x97;
+    const Vec8d x137 = PA*x4;
+    const Vec8d x138 = x131*x24 + x133*x5;
+    const Vec8d x139 = x131*x5 + x131*x50;
+    const Vec8d x140 = 60*x20;
+    const Vec8d x141 = 90*x10;
+    const Vec8d x142 = 48*x4;
+    const Vec8d x143 = 90*x4;
+    E[0] = 1;  // E^{0,0}_0
+    E[1] = PB;  // E^{0,1}_0
+    E[2] = one_over_2p;  // E^{0,1}_1
+    E[3] = x1;  // E^{0,2}_0
+    E[4] = x3;  // E^{0,2}_1
+    E[5] = x4;  // E^{0,2}_2
+    E[6] = x7;  // E^{0,3}_0
+    E[7] = x1*x5;  // E^{0,3}_1
+    E[8] = x9;  // E^{0,3}_2
+    E[9] = x10;  // E^{0,3}_3
+    E[10] = x11 + x13 + x8;  // E^{0,4}_0
+    E[11] = x14*x7;  // E^{0,4}_1
+    E[12] = x1*x15;  // E^{0,4}_2
+    E[13] = x10*x16;  // E^{0,4}_3
+    E[14] = x17;  // E^{0,4}_4
+    E[15] = PA;  // E^{1,0}_0
+    E[16] = one_over_2p;  // E^{1,0}_1
+    E[17] = one_over_2p + x18;  // E^{1,1}_0
+    E[18] = one_over_2p*x19;  // E^{1,1}_1
+    E[19] = x4;  // E^{1,1}_2
+    E[20] = x20 + x21 + x3;  // E^{1,2}_0
+    E[21] = one_over_2p*(x22 + x6);  // E^{1,2}_1
+    E[22] = x23*x4;  // E^{1,2}_2
+    E[23] = x10;  // E^{1,2}_3
+    E[24] = x25 + x26 + x27;  // E^{1,3}_0
+    E[25] = one_over_2p*(x24 + x29 + x32);  // E^{1,3}_1
+    E[26] = x8*(x0 + x34);  // E^{1,3}_2
+    E[27] = x10*(PA + x35);  // E^{1,3}_3
+    E[28] = x17;  // E^{1,3}_4
+    E[29] = x36 + x37 + 12*x38 + 4*x39 + x41;  // E^{1,4}_0
+    E[30] = one_over_2p*(x11 + x42 + x43 + x46);  // E^{1,4}_1
+    E[31] = x49*(x32 + x47 + x48);  // E^{1,4}_2
+    E[32] = x53*(x50 + x52);  // E^{1,4}_3
+    E[33] = x17*(PA + x16);  // E^{1,4}_4
+    E[34] = x54;  // E^{1,4}_5
+    E[35] = x56;  // E^{2,0}_0
+    E[36] = x57;  // E^{2,0}_1
+    E[37] = x4;  // E^{2,0}_2
+    E[38] = x28 + x57 + x58;  // E^{2,1}_0
+    E[39] = one_over_2p*(x22 + x59);  // E^{2,1}_1
+    E[40] = x4*x61;  // E^{2,1}_2
+    E[41] = x10;  // E^{2,1}_3
+    E[42] = one_over_2p*x63 + x12 + x62 + x64 + x8;  // E^{2,2}_0
+    E[43] = x33*(x21 + x30 + x58 + x65);  // E^{2,2}_1
+    E[44] = x4*(x63 + x66 + x67);  // E^{2,2}_2
+    E[45] = x19*x53;  // E^{2,2}_3
+    E[46] = x17;  // E^{2,2}_4
+    E[47] = PA*x15 + 9*x38 + x41 + x5*x58 + x69;  // E^{2,3}_0
+    E[48] = one_over_2p*(9*x12 + 2*x25 + x70 + x71);  // E^{2,3}_1
+    E[49] = x4*(x72 + x73 + x74 + x75);  // E^{2,3}_2
+    E[50] = x10*(x50 + x55 + x77);  // E^{2,3}_3
+    E[51] = x17*(x35 + x60);  // E^{2,3}_4
+    E[52] = x54;  // E^{2,3}_5
+    E[53] = one_over_2p*x11 + x55*x8 + x78 + 18*x79 + 8*x80 + x83;  // E^{2,4}_0
+    E[54] = x33*(x0*x85 + x24*x66 + x36 + 30*x38 + x84 + x87 + x88);  // E^{2,4}_1
+    E[55] = x4*(x11 + 36*x12 + 8*x25 + x89 + x91);  // E^{2,4}_2
+    E[56] = x92*(5*x20 + x24 + 10*x28 + x31 + x58);  // E^{2,4}_3
+    E[57] = x17*(x40 + x55 + x94);  // E^{2,4}_4
+    E[58] = x23*x95;  // E^{2,4}_5
+    E[59] = x96;  // E^{2,4}_6
+    E[60] = PA*x59;  // E^{3,0}_0
+    E[61] = x5*x56;  // E^{3,0}_1
+    E[62] = x37;  // E^{3,0}_2
+    E[63] = x10;  // E^{3,0}_3
+    E[64] = x27 + x70 + x98;  // E^{3,1}_0
+    E[65] = one_over_2p*(x100 + x97 + x99);  // E^{3,1}_1
+    E[66] = x8*(x34 + x55);  // E^{3,1}_2
+    E[67] = x10*(PB + x101);  // E^{3,1}_3
+    E[68] = x17;  // E^{3,1}_4
+    E[69] = PA*x102 + PB*x15 + x105 + x21*x5 + x87;  // E^{3,2}_0
+    E[70] = one_over_2p*(x106 + x2*x97 + x26 + x71);  // E^{3,2}_1
+    E[71] = x4*(x107 + x31 + x48 + x85);  // E^{3,2}_2
+    E[72] = x10*(x0 + x108 + x77);  // E^{3,2}_3
+    E[73] = x17*(x101 + x2);  // E^{3,2}_4
+    E[74] = x54;  // E^{3,2}_5
+    E[75] = x0*x106 + x102*x55 + x109 + x25*x5 + x5*x98 + 9*x79 + x81 + 27*x82;  // E^{3,3}_0
+    E[76] = x5*(x0*x99 + x105 + x110 + x29*x55 + x69 + x84);  // E^{3,3}_1
+    E[77] = x8*(x13 + x25 + x71 + x89 + x98);  // E^{3,3}_2
+    E[78] = x10*(30*x20 + 9*x21 + x24 + 30*x28 + 9*x58 + x97);  // E^{3,3}_3
+    E[79] = 3*x17*(3*x18 + x51 + x67);  // E^{3,3}_4
+    E[80] = x111*x19;  // E^{3,3}_5
+    E[81] = x96;  // E^{3,3}_6
+    E[82] = PA*x113 + PB*x114 + x112*x24 + x115*x58 + x116*x21 + x117 + x13*x97 + 12*x24*x62 + x8*x97;  // E^{3,4}_0
+    E[83] = one_over_2p*(x118 + x121 + x48*x97 + x55*x90 + 90*x79 + 36*x80);  // E^{3,4}_1
+    E[84] = x8*(PA*x90 + 36*x122 + 24*x123 + x124 + x33*x97 + x36 + 60*x38 + 8*x39 + 4*x68);  // E^{3,4}_2
+    E[85] = x10*(x11 + 60*x12 + x125 + x127 + 12*x25 + 30*x62);  // E^{3,4}_3
+    E[86] = x17*(x128 + 45*x20 + 18*x21 + 4*x24 + 12*x58 + x97);  // E^{3,4}_4
+    E[87] = x111*(2*x0 + x129 + x55);  // E^{3,4}_5
+    E[88] = x96*(x101 + x16);  // E^{3,4}_6
+    E[89] = x130;  // E^{3,4}_7
+    E[90] = x131 + x8 + x89;  // E^{4,0}_0
+    E[91] = 4*x20*x59;  // E^{4,0}_1
+    E[92] = x15*x56;  // E^{4,0}_2
+    E[93] = x10*x132;  // E^{4,0}_3
+    E[94] = x17;  // E^{4,0}_4
+    E[95] = PA*x112 + 4*x103 + x133 + x87 + x9;  // E^{4,1}_0
+    E[96] = one_over_2p*(x125 + x131 + x134 + x46);  // E^{4,1}_1
+    E[97] = x49*(x100 + x73 + 2*x97);  // E^{4,1}_2
+    E[98] = x53*(x108 + x52);  // E^{4,1}_3
+    E[99] = x17*(PB + x132);  // E^{4,1}_4
+    E[100] = x54;  // E^{4,1}_5
+    E[101] = one_over_2p*x131 + x0*x131 + x0*x8 + 18*x135 + 8*x136 + x83;  // E^{4,2}_0
+    E[102] = x33*(x110 + x124 + x133 + 30*x137 + x41 + x55*x74 + x66*x97);  // E^{4,2}_1
+    E[103] = x4*(x13 + x131 + 36*x62 + x91 + 8*x98);  // E^{4,2}_2
+    E[104] = x92*(PB*x51 + 10*x20 + x21 + x72 + x97);  // E^{4,2}_3
+    E[105] = x17*(x0 + x86 + x94);  // E^{4,2}_4
+    E[106] = x61*x95;  // E^{4,2}_5
+    E[107] = x96;  // E^{4,2}_6
+    E[108] = PA*x114 + PB*x113 + x112*x97 + x115*x21 + x116*x58 + 12*x12*x97 + x138 + x24*x8 + x24*x89;  // E^{4,3}_0
+    E[109] = one_over_2p*(x0*x90 + x121 + 90*x135 + 36*x136 + x139 + x24*x73);  // E^{4,3}_1
+    E[110] = x8*(PB*x90 + 8*x103 + 4*x104 + 24*x122 + 36*x123 + x133 + 60*x137 + x24*x33 + x88);  // E^{4,3}_2
+    E[111] = x10*(30*x12 + x127 + x131 + x42 + 60*x62 + 12*x98);  // E^{4,3}_3
+    E[112] = x17*(x140 + 12*x21 + x24 + 45*x28 + 18*x58 + 4*x97);  // E^{4,3}_4
+    E[113] = x111*(x0 + x129 + 2*x55);  // E^{4,3}_5
+    E[114] = x96*(x132 + x35);  // E^{4,3}_6
+    E[115] = x130;  // E^{4,3}_7
+    E[116] = x0*x141 + 240*x10*x18 + x11*x131 + x11*x8 + x11*x89 + x13*x131 + x131*x8 + x141*x55 + x142*x25 + x142*x98 + 105*x17 + 16*x39*x97 + 108*x4*x64;  // E^{4,4}_0
+    E[117] = x14*(PA*x119 + PB*x119 + x117 + x134*x24 + x138 + x143*x21 + x143*x58 + x24*x44 + x43*x97 + x44*x97);  // E^{4,4}_1
+    E[118] = x49*(210*x10 + 8*x109 + x118 + 108*x120 + 135*x135 + 48*x136 + x139 + 135*x79 + 48*x80 + 360*x82);  // E^{4,4}_2
+    E[119] = x92*(PA*x126 + PB*x126 + x0*x140 + x128*x55 + x133 + x36 + 10*x39 + x40*x97 + 6*x68 + x76*x97);  // E^{4,4}_3
+    E[120] = x17*(x11 + 90*x12 + x131 + 16*x25 + 210*x4 + 240*x45 + 90*x62 + 36*x64 + 16*x98);  // E^{4,4}_4
+    E[121] = 4*x54*(x107 + 21*x20 + 21*x28 + x75);  // E^{4,4}_5
+    E[122] = 2*x96*(14*one_over_2p + x108 + x50 + x93);  // E^{4,4}_6
+    E[123] = 4*x130*x19;  // E^{4,4}_7
+    E[124] = (((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p))*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)));  // E^{4,4}_8
 }
 
 /**
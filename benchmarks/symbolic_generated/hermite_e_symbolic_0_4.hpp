@@ -0,0 +1,89 @@
+/**
+ * @file hermite_e_symbolic_0_4.hpp
+ * @brief Symbolically-generated Hermite E^{0,4}_t coefficients (with CSE)
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Optimization: CSE (Common Subexpression Elimination) applied
+ */
+
+#pragma once
+
+#ifndef RECURSUM_VEC_TYPE
+#include <recursum/vectorclass.h>
+#endif
+
+// Portable force-inline macro for performance-critical compute methods
+#ifndef RECURSUM_FORCEINLINE
+  #ifdef _MSC_VER
+    #define RECURSUM_FORCEINLINE __forceinline
+  #elif defined(__GNUC__) || defined(__clang__)
+    #define RECURSUM_FORCEINLINE inline __attribute__((always_inline))
+  #else
+    #define RECURSUM_FORCEINLINE inline
+  #endif
+#endif
+
+// Portable no-alias qualifier for pointer parameters
+#ifndef RECURSUM_RESTRICT
+  #ifdef _MSC_VER
+    #define RECURSUM_RESTRICT __restrict
+  #else
+    #define RECURSUM_RESTRICT __restrict__
+  #endif
+#endif
+
+namespace recursum {
+namespace symbolic {
+
+/**
+ * @brief Symbolic E^{0,4}_0
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_0_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return ((PB*PB)*(PB*PB)) + 6*(PB*PB)*one_over_2p + 3*(one_over_2p*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{0,4}_1
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_0_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return 4*(PB*PB*PB)*one_over_2p + 12*PB*(one_over_2p*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{0,4}_2
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_0_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return 6*(PB*PB)*(one_over_2p*one_over_2p) + 6*(one_over_2p*one_over_2p*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{0,4}_3
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_0_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return 4*PB*(one_over_2p*one_over_2p*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{0,4}_4
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_0_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+}
+
+/**
+ * @brief Symbolic E^{0,4}_t for t = 0..4 (shared CSE)
+ */
+RECURSUM_FORCEINLINE void hermite_e_symbolic_layer_0_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* RECURSUM_RESTRICT E) {
+    const Vec8d x0 = (one_over_2p*one_over_2p);
+    const Vec8d x1 = (PB*PB);
+    const Vec8d x2 = 4*PB;
+    E[0] = ((PB*PB)*(PB*PB)) + 6*one_over_2p*x1 + 3*x0;
+    E[1] = one_over_2p*x2*(3*one_over_2p + x1);
+    E[2] = 6*x0*(one_over_2p + x1);
+    E[3] = (one_over_2p*one_over_2p*one_over_2p)*x2;
+    E[4] = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+}
+
+} // namespace symbolic
+} // namespace recursum
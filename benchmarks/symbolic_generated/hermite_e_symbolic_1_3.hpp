@@ -0,0 +1,96 @@
+/**
+ * @file hermite_e_symbolic_1_3.hpp
+ * @brief Symbolically-generated Hermite E^{1,3}_t coefficients (with CSE)
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Optimization: CSE (Common Subexpression Elimination) applied
+ */
+
+#pragma once
+
+#ifndef RECURSUM_VEC_TYPE
+#include <recursum/vectorclass.h>
+#endif
+
+// Portable force-inline macro for performance-critical compute methods
+#ifndef RECURSUM_FORCEINLINE
+  #ifdef _MSC_VER
+    #define RECURSUM_FORCEINLINE __forceinline
+  #elif defined(__GNUC__) || defined(__clang__)
+    #define RECURSUM_FORCEINLINE inline __attribute__((always_inline))
+  #else
+    #define RECURSUM_FORCEINLINE inline
+  #endif
+#endif
+
+// Portable no-alias qualifier for pointer parameters
+#ifndef RECURSUM_RESTRICT
+  #ifdef _MSC_VER
+    #define RECURSUM_RESTRICT __restrict
+  #else
+    #define RECURSUM_RESTRICT __restrict__
+  #endif
+#endif
+
+namespace recursum {
+namespace symbolic {
+
+/**
+ * @brief Symbolic E^{1,3}_0 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_1_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = 3*one_over_2p;
+    return PA*(PB*PB*PB) + PA*PB*x0 + (PB*PB)*x0 + 3*(one_over_2p*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{1,3}_1 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_1_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p);
+    Vec8d x1 = 3*PA;
+    return (PB*PB*PB)*one_over_2p + (PB*PB)*one_over_2p*x1 + 9*PB*x0 + x0*x1;
+}
+
+/**
+ * @brief Symbolic E^{1,3}_2 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_1_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = 3*(one_over_2p*one_over_2p);
+    return PA*PB*x0 + (PB*PB)*x0 + 6*(one_over_2p*one_over_2p*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{1,3}_3 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_1_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    return PA*x0 + 3*PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{1,3}_4
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_1_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+}
+
+/**
+ * @brief Symbolic E^{1,3}_t for t = 0..4 (shared CSE)
+ */
+RECURSUM_FORCEINLINE void hermite_e_symbolic_layer_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* RECURSUM_RESTRICT E) {
+    const Vec8d x0 = 3*(one_over_2p*one_over_2p);
+    const Vec8d x1 = (PB*PB*PB);
+    const Vec8d x2 = PA*PB;
+    const Vec8d x3 = 3*one_over_2p;
+    const Vec8d x4 = (PB*PB);
+    E[0] = PA*x1 + x0 + x2*x3 + x3*x4;
+    E[1] = one_over_2p*(PA*x3 + 3*PA*x4 + 9*PB*one_over_2p + x1);
+    E[2] = x0*(2*one_over_2p + x2 + x4);
+    E[3] = (one_over_2p*one_over_2p*one_over_2p)*(PA + 3*PB);
+    E[4] = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+}
+
+} // namespace symbolic
+} // namespace recursum
@@ -0,0 +1,111 @@
+/**
+ * @file hermite_e_symbolic_1_4.hpp
+ * @brief Symbolically-generated Hermite E^{1,4}_t coefficients (with CSE)
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Optimization: CSE (Common Subexpression Elimination) applied
+ */
+
+#pragma once
+
+#ifndef RECURSUM_VEC_TYPE
+#include <recursum/vectorclass.h>
+#endif
+
+// Portable force-inline macro for performance-critical compute methods
+#ifndef RECURSUM_FORCEINLINE
+  #ifdef _MSC_VER
+    #define RECURSUM_FORCEINLINE __forceinline
+  #elif defined(__GNUC__) || defined(__clang__)
+    #define RECURSUM_FORCEINLINE inline __attribute__((always_inline))
+  #else
+    #define RECURSUM_FORCEINLINE inline
+  #endif
+#endif
+
+// Portable no-alias qualifier for pointer parameters
+#ifndef RECURSUM_RESTRICT
+  #ifdef _MSC_VER
+    #define RECURSUM_RESTRICT __restrict
+  #else
+    #define RECURSUM_RESTRICT __restrict__
+  #endif
+#endif
+
+namespace recursum {
+namespace symbolic {
+
+/**
+ * @brief Symbolic E^{1,4}_0 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_1_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p);
+    return PA*((PB*PB)*(PB*PB)) + 6*PA*(PB*PB)*one_over_2p + 3*PA*x0 + 4*(PB*PB*PB)*one_over_2p + 12*PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{1,4}_1 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_1_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p);
+    return 4*PA*(PB*PB*PB)*one_over_2p + 12*PA*PB*x0 + ((PB*PB)*(PB*PB))*one_over_2p + 18*(PB*PB)*x0 + 15*(one_over_2p*one_over_2p*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{1,4}_2 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_1_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x1 = 6*PA;
+    Vec8d x2 = (one_over_2p*one_over_2p);
+    return 4*(PB*PB*PB)*x2 + (PB*PB)*x1*x2 + 24*PB*x0 + x0*x1;
+}
+
+/**
+ * @brief Symbolic E^{1,4}_3 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_1_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    return 4*PA*PB*x0 + 6*(PB*PB)*x0 + 10*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+}
+
+/**
+ * @brief Symbolic E^{1,4}_4 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_1_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    return PA*x0 + 4*PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{1,4}_5
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_1_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{1,4}_t for t = 0..5 (shared CSE)
+ */
+RECURSUM_FORCEINLINE void hermite_e_symbolic_layer_1_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* RECURSUM_RESTRICT E) {
+    const Vec8d x0 = ((PB*PB)*(PB*PB));
+    const Vec8d x1 = (one_over_2p*one_over_2p);
+    const Vec8d x2 = 3*PA;
+    const Vec8d x3 = 12*PB;
+    const Vec8d x4 = (PB*PB*PB);
+    const Vec8d x5 = 4*x4;
+    const Vec8d x6 = (PB*PB);
+    const Vec8d x7 = one_over_2p*x6;
+    const Vec8d x8 = one_over_2p*x3;
+    const Vec8d x9 = 3*x6;
+    E[0] = PA*x0 + 6*PA*x7 + one_over_2p*x5 + x1*x2 + x1*x3;
+    E[1] = one_over_2p*(PA*x5 + PA*x8 + x0 + 15*x1 + 18*x7);
+    E[2] = 2*x1*(PA*x9 + one_over_2p*x2 + 2*x4 + x8);
+    E[3] = 2*(one_over_2p*one_over_2p*one_over_2p)*(2*PA*PB + 5*one_over_2p + x9);
+    E[4] = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p))*(PA + 4*PB);
+    E[5] = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+}
+
+} // namespace symbolic
+} // namespace recursum
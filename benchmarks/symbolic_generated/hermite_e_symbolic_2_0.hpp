@@ -0,0 +1,70 @@
+/**
+ * @file hermite_e_symbolic_2_0.hpp
+ * @brief Symbolically-generated Hermite E^{2,0}_t coefficients (with CSE)
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Optimization: CSE (Common Subexpression Elimination) applied
+ */
+
+#pragma once
+
+#ifndef RECURSUM_VEC_TYPE
+#include <recursum/vectorclass.h>
+#endif
+
+// Portable force-inline macro for performance-critical compute methods
+#ifndef RECURSUM_FORCEINLINE
+  #ifdef _MSC_VER
+    #define RECURSUM_FORCEINLINE __forceinline
+  #elif defined(__GNUC__) || defined(__clang__)
+    #define RECURSUM_FORCEINLINE inline __attribute__((always_inline))
+  #else
+    #define RECURSUM_FORCEINLINE inline
+  #endif
+#endif
+
+// Portable no-alias qualifier for pointer parameters
+#ifndef RECURSUM_RESTRICT
+  #ifdef _MSC_VER
+    #define RECURSUM_RESTRICT __restrict
+  #else
+    #define RECURSUM_RESTRICT __restrict__
+  #endif
+#endif
+
+namespace recursum {
+namespace symbolic {
+
+/**
+ * @brief Symbolic E^{2,0}_0
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_2_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return (PA*PA) + one_over_2p;
+}
+
+/**
+ * @brief Symbolic E^{2,0}_1
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_2_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return 2*PA*one_over_2p;
+}
+
+/**
+ * @brief Symbolic E^{2,0}_2
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_2_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return (one_over_2p*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{2,0}_t for t = 0..2 (shared CSE)
+ */
+RECURSUM_FORCEINLINE void hermite_e_symbolic_layer_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* RECURSUM_RESTRICT E) {
+    E[0] = (PA*PA) + one_over_2p;
+    E[1] = 2*PA*one_over_2p;
+    E[2] = (one_over_2p*one_over_2p);
+}
+
+} // namespace symbolic
+} // namespace recursum
@@ -0,0 +1,97 @@
+/**
+ * @file hermite_e_symbolic_2_2.hpp
+ * @brief Symbolically-generated Hermite E^{2,2}_t coefficients (with CSE)
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Optimization: CSE (Common Subexpression Elimination) applied
+ */
+
+#pragma once
+
+#ifndef RECURSUM_VEC_TYPE
+#include <recursum/vectorclass.h>
+#endif
+
+// Portable force-inline macro for performance-critical compute methods
+#ifndef RECURSUM_FORCEINLINE
+  #ifdef _MSC_VER
+    #define RECURSUM_FORCEINLINE __forceinline
+  #elif defined(__GNUC__) || defined(__clang__)
+    #define RECURSUM_FORCEINLINE inline __attribute__((always_inline))
+  #else
+    #define RECURSUM_FORCEINLINE inline
+  #endif
+#endif
+
+// Portable no-alias qualifier for pointer parameters
+#ifndef RECURSUM_RESTRICT
+  #ifdef _MSC_VER
+    #define RECURSUM_RESTRICT __restrict
+  #else
+    #define RECURSUM_RESTRICT __restrict__
+  #endif
+#endif
+
+namespace recursum {
+namespace symbolic {
+
+/**
+ * @brief Symbolic E^{2,2}_0 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_2_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (PA*PA);
+    Vec8d x1 = (PB*PB);
+    return 4*PA*PB*one_over_2p + 3*(one_over_2p*one_over_2p) + one_over_2p*x0 + one_over_2p*x1 + x0*x1;
+}
+
+/**
+ * @brief Symbolic E^{2,2}_1 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_2_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = 6*(one_over_2p*one_over_2p);
+    Vec8d x1 = 2*one_over_2p;
+    return (PA*PA)*PB*x1 + PA*(PB*PB)*x1 + PA*x0 + PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{2,2}_2 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_2_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p);
+    return (PA*PA)*x0 + 4*PA*PB*x0 + (PB*PB)*x0 + 6*(one_over_2p*one_over_2p*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{2,2}_3 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_2_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = 2*(one_over_2p*one_over_2p*one_over_2p);
+    return PA*x0 + PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{2,2}_4
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_2_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+}
+
+/**
+ * @brief Symbolic E^{2,2}_t for t = 0..4 (shared CSE)
+ */
+RECURSUM_FORCEINLINE void hermite_e_symbolic_layer_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* RECURSUM_RESTRICT E) {
+    const Vec8d x0 = (one_over_2p*one_over_2p);
+    const Vec8d x1 = (PA*PA);
+    const Vec8d x2 = (PB*PB);
+    const Vec8d x3 = 4*PA*PB;
+    const Vec8d x4 = 3*one_over_2p;
+    E[0] = one_over_2p*x1 + one_over_2p*x2 + one_over_2p*x3 + 3*x0 + x1*x2;
+    E[1] = 2*one_over_2p*(PA*x2 + PA*x4 + PB*x1 + PB*x4);
+    E[2] = x0*(6*one_over_2p + x1 + x2 + x3);
+    E[3] = 2*(one_over_2p*one_over_2p*one_over_2p)*(PA + PB);
+    E[4] = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+}
+
+} // namespace symbolic
+} // namespace recursum
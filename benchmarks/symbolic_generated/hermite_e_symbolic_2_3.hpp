@@ -0,0 +1,117 @@
+/**
+ * @file hermite_e_symbolic_2_3.hpp
+ * @brief Symbolically-generated Hermite E^{2,3}_t coefficients (with CSE)
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Optimization: CSE (Common Subexpression Elimination) applied
+ */
+
+#pragma once
+
+#ifndef RECURSUM_VEC_TYPE
+#include <recursum/vectorclass.h>
+#endif
+
+// Portable force-inline macro for performance-critical compute methods
+#ifndef RECURSUM_FORCEINLINE
+  #ifdef _MSC_VER
+    #define RECURSUM_FORCEINLINE __forceinline
+  #elif defined(__GNUC__) || defined(__clang__)
+    #define RECURSUM_FORCEINLINE inline __attribute__((always_inline))
+  #else
+    #define RECURSUM_FORCEINLINE inline
+  #endif
+#endif
+
+// Portable no-alias qualifier for pointer parameters
+#ifndef RECURSUM_RESTRICT
+  #ifdef _MSC_VER
+    #define RECURSUM_RESTRICT __restrict
+  #else
+    #define RECURSUM_RESTRICT __restrict__
+  #endif
+#endif
+
+namespace recursum {
+namespace symbolic {
+
+/**
+ * @brief Symbolic E^{2,3}_0 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_2_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (PB*PB*PB);
+    Vec8d x1 = (one_over_2p*one_over_2p);
+    Vec8d x2 = 6*PA;
+    Vec8d x3 = (PA*PA);
+    return (PB*PB)*one_over_2p*x2 + 3*PB*one_over_2p*x3 + 9*PB*x1 + one_over_2p*x0 + x0*x3 + x1*x2;
+}
+
+/**
+ * @brief Symbolic E^{2,3}_1 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_2_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p);
+    Vec8d x1 = 3*(PA*PA);
+    Vec8d x2 = (PB*PB);
+    return 2*PA*(PB*PB*PB)*one_over_2p + 18*PA*PB*x0 + 15*(one_over_2p*one_over_2p*one_over_2p) + one_over_2p*x1*x2 + x0*x1 + 9*x0*x2;
+}
+
+/**
+ * @brief Symbolic E^{2,3}_2 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_2_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x1 = (one_over_2p*one_over_2p);
+    return 3*(PA*PA)*PB*x1 + 6*PA*(PB*PB)*x1 + 12*PA*x0 + (PB*PB*PB)*x1 + 18*PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{2,3}_3 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_2_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    return (PA*PA)*x0 + 6*PA*PB*x0 + 3*(PB*PB)*x0 + 10*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+}
+
+/**
+ * @brief Symbolic E^{2,3}_4 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_2_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    return 2*PA*x0 + 3*PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{2,3}_5
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_2_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{2,3}_t for t = 0..5 (shared CSE)
+ */
+RECURSUM_FORCEINLINE void hermite_e_symbolic_layer_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* RECURSUM_RESTRICT E) {
+    const Vec8d x0 = (PB*PB*PB);
+    const Vec8d x1 = (one_over_2p*one_over_2p);
+    const Vec8d x2 = 6*PA;
+    const Vec8d x3 = (PA*PA);
+    const Vec8d x4 = (PB*PB);
+    const Vec8d x5 = one_over_2p*x4;
+    const Vec8d x6 = 3*PB;
+    const Vec8d x7 = one_over_2p*x3;
+    const Vec8d x8 = PA*one_over_2p;
+    const Vec8d x9 = 18*PB;
+    const Vec8d x10 = 2*PA;
+    const Vec8d x11 = 3*x4;
+    E[0] = 9*PB*x1 + one_over_2p*x0 + x0*x3 + x1*x2 + x2*x5 + x6*x7;
+    E[1] = one_over_2p*(x0*x10 + 15*x1 + x11*x3 + 9*x5 + 3*x7 + x8*x9);
+    E[2] = x1*(one_over_2p*x9 + x0 + x2*x4 + x3*x6 + 12*x8);
+    E[3] = (one_over_2p*one_over_2p*one_over_2p)*(PB*x2 + 10*one_over_2p + x11 + x3);
+    E[4] = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p))*(x10 + x6);
+    E[5] = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+}
+
+} // namespace symbolic
+} // namespace recursum
@@ -0,0 +1,80 @@
+/**
+ * @file hermite_e_symbolic_3_0.hpp
+ * @brief Symbolically-generated Hermite E^{3,0}_t coefficients (with CSE)
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Optimization: CSE (Common Subexpression Elimination) applied
+ */
+
+#pragma once
+
+#ifndef RECURSUM_VEC_TYPE
+#include <recursum/vectorclass.h>
+#endif
+
+// Portable force-inline macro for performance-critical compute methods
+#ifndef RECURSUM_FORCEINLINE
+  #ifdef _MSC_VER
+    #define RECURSUM_FORCEINLINE __forceinline
+  #elif defined(__GNUC__) || defined(__clang__)
+    #define RECURSUM_FORCEINLINE inline __attribute__((always_inline))
+  #else
+    #define RECURSUM_FORCEINLINE inline
+  #endif
+#endif
+
+// Portable no-alias qualifier for pointer parameters
+#ifndef RECURSUM_RESTRICT
+  #ifdef _MSC_VER
+    #define RECURSUM_RESTRICT __restrict
+  #else
+    #define RECURSUM_RESTRICT __restrict__
+  #endif
+#endif
+
+namespace recursum {
+namespace symbolic {
+
+/**
+ * @brief Symbolic E^{3,0}_0
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return (PA*PA*PA) + 3*PA*one_over_2p;
+}
+
+/**
+ * @brief Symbolic E^{3,0}_1
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return 3*(PA*PA)*one_over_2p + 3*(one_over_2p*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{3,0}_2
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return 3*PA*(one_over_2p*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{3,0}_3
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_0_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return (one_over_2p*one_over_2p*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{3,0}_t for t = 0..3 (shared CSE)
+ */
+RECURSUM_FORCEINLINE void hermite_e_symbolic_layer_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* RECURSUM_RESTRICT E) {
+    const Vec8d x0 = (PA*PA);
+    const Vec8d x1 = 3*one_over_2p;
+    E[0] = PA*(x0 + x1);
+    E[1] = x1*(one_over_2p + x0);
+    E[2] = 3*PA*(one_over_2p*one_over_2p);
+    E[3] = (one_over_2p*one_over_2p*one_over_2p);
+}
+
+} // namespace symbolic
+} // namespace recursum
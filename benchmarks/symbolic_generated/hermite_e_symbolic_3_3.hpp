@@ -0,0 +1,147 @@
+/**
+ * @file hermite_e_symbolic_3_3.hpp
+ * @brief Symbolically-generated Hermite E^{3,3}_t coefficients (with CSE)
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Optimization: CSE (Common Subexpression Elimination) applied
+ */
+
+#pragma once
+
+#ifndef RECURSUM_VEC_TYPE
+#include <recursum/vectorclass.h>
+#endif
+
+// Portable force-inline macro for performance-critical compute methods
+#ifndef RECURSUM_FORCEINLINE
+  #ifdef _MSC_VER
+    #define RECURSUM_FORCEINLINE __forceinline
+  #elif defined(__GNUC__) || defined(__clang__)
+    #define RECURSUM_FORCEINLINE inline __attribute__((always_inline))
+  #else
+    #define RECURSUM_FORCEINLINE inline
+  #endif
+#endif
+
+// Portable no-alias qualifier for pointer parameters
+#ifndef RECURSUM_RESTRICT
+  #ifdef _MSC_VER
+    #define RECURSUM_RESTRICT __restrict
+  #else
+    #define RECURSUM_RESTRICT __restrict__
+  #endif
+#endif
+
+namespace recursum {
+namespace symbolic {
+
+/**
+ * @brief Symbolic E^{3,3}_0 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (PA*PA*PA);
+    Vec8d x1 = (PB*PB*PB);
+    Vec8d x2 = (one_over_2p*one_over_2p);
+    Vec8d x3 = 3*one_over_2p;
+    Vec8d x4 = (PA*PA);
+    Vec8d x5 = 9*x2;
+    Vec8d x6 = (PB*PB);
+    return 27*PA*PB*x2 + PA*x1*x3 + PB*x0*x3 + 15*(one_over_2p*one_over_2p*one_over_2p) + 9*one_over_2p*x4*x6 + x0*x1 + x4*x5 + x5*x6;
+}
+
+/**
+ * @brief Symbolic E^{3,3}_1 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = 45*(one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x1 = (PA*PA*PA);
+    Vec8d x2 = (one_over_2p*one_over_2p);
+    Vec8d x3 = 3*x2;
+    Vec8d x4 = (PB*PB*PB);
+    Vec8d x5 = (PB*PB);
+    Vec8d x6 = 27*x2;
+    Vec8d x7 = (PA*PA);
+    Vec8d x8 = 3*one_over_2p;
+    return PA*x0 + PA*x5*x6 + PB*x0 + PB*x6*x7 + x1*x3 + x1*x5*x8 + x3*x4 + x4*x7*x8;
+}
+
+/**
+ * @brief Symbolic E^{3,3}_2 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x1 = (PA*PA);
+    Vec8d x2 = 18*x0;
+    Vec8d x3 = (PB*PB);
+    Vec8d x4 = (one_over_2p*one_over_2p);
+    Vec8d x5 = 3*x4;
+    return (PA*PA*PA)*PB*x5 + PA*(PB*PB*PB)*x5 + 54*PA*PB*x0 + 45*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + x1*x2 + 9*x1*x3*x4 + x2*x3;
+}
+
+/**
+ * @brief Symbolic E^{3,3}_3 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = 30*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    Vec8d x1 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x2 = 9*x1;
+    return (PA*PA*PA)*x1 + (PA*PA)*PB*x2 + PA*(PB*PB)*x2 + PA*x0 + (PB*PB*PB)*x1 + PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{3,3}_4 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    Vec8d x1 = 3*x0;
+    return (PA*PA)*x1 + 9*PA*PB*x0 + (PB*PB)*x1 + 15*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{3,3}_5 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = 3*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    return PA*x0 + PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{3,3}_6
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_3_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
+}
+
+/**
+ * @brief Symbolic E^{3,3}_t for t = 0..6 (shared CSE)
+ */
+RECURSUM_FORCEINLINE void hermite_e_symbolic_layer_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* RECURSUM_RESTRICT E) {
+    const Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    const Vec8d x1 = (PA*PA*PA);
+    const Vec8d x2 = (PB*PB*PB);
+    const Vec8d x3 = (one_over_2p*one_over_2p);
+    const Vec8d x4 = PA*PB;
+    const Vec8d x5 = one_over_2p*x2;
+    const Vec8d x6 = 3*PA;
+    const Vec8d x7 = one_over_2p*x1;
+    const Vec8d x8 = (PA*PA);
+    const Vec8d x9 = 9*x3;
+    const Vec8d x10 = (PB*PB);
+    const Vec8d x11 = x10*x8;
+    const Vec8d x12 = 15*x3;
+    const Vec8d x13 = 9*PA*x10;
+    const Vec8d x14 = 9*PB*x8;
+    const Vec8d x15 = 6*one_over_2p;
+    const Vec8d x16 = 30*one_over_2p;
+    E[0] = 3*PB*x7 + 9*one_over_2p*x11 + 15*x0 + x1*x2 + x10*x9 + 27*x3*x4 + x5*x6 + x8*x9;
+    E[1] = 3*one_over_2p*(PA*x12 + PB*x12 + one_over_2p*x13 + one_over_2p*x14 + x1*x10 + x2*x8 + x5 + x7);
+    E[2] = 3*x3*(PA*x2 + PB*x1 + 18*one_over_2p*x4 + x10*x15 + 3*x11 + x12 + x15*x8);
+    E[3] = x0*(PA*x16 + PB*x16 + x1 + x13 + x14 + x2);
+    E[4] = 3*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p))*(PB*x6 + 5*one_over_2p + x10 + x8);
+    E[5] = 3*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p)*(PA + PB);
+    E[6] = ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
+}
+
+} // namespace symbolic
+} // namespace recursum
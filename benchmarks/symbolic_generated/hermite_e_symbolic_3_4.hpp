@@ -0,0 +1,165 @@
+/**
+ * @file hermite_e_symbolic_3_4.hpp
+ * @brief Symbolically-generated Hermite E^{3,4}_t coefficients (with CSE)
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Optimization: CSE (Common Subexpression Elimination) applied
+ */
+
+#pragma once
+
+#ifndef RECURSUM_VEC_TYPE
+#include <recursum/vectorclass.h>
+#endif
+
+// Portable force-inline macro for performance-critical compute methods
+#ifndef RECURSUM_FORCEINLINE
+  #ifdef _MSC_VER
+    #define RECURSUM_FORCEINLINE __forceinline
+  #elif defined(__GNUC__) || defined(__clang__)
+    #define RECURSUM_FORCEINLINE inline __attribute__((always_inline))
+  #else
+    #define RECURSUM_FORCEINLINE inline
+  #endif
+#endif
+
+// Portable no-alias qualifier for pointer parameters
+#ifndef RECURSUM_RESTRICT
+  #ifdef _MSC_VER
+    #define RECURSUM_RESTRICT __restrict
+  #else
+    #define RECURSUM_RESTRICT __restrict__
+  #endif
+#endif
+
+namespace recursum {
+namespace symbolic {
+
+/**
+ * @brief Symbolic E^{3,4}_0 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x1 = (PA*PA*PA);
+    Vec8d x2 = ((PB*PB)*(PB*PB));
+    Vec8d x3 = (one_over_2p*one_over_2p);
+    Vec8d x4 = 12*(PB*PB*PB);
+    Vec8d x5 = (PB*PB);
+    Vec8d x6 = (PA*PA);
+    return 3*PA*one_over_2p*x2 + 45*PA*x0 + 54*PA*x3*x5 + 60*PB*x0 + 36*PB*x3*x6 + 6*one_over_2p*x1*x5 + one_over_2p*x4*x6 + x1*x2 + 3*x1*x3 + x3*x4;
+}
+
+/**
+ * @brief Symbolic E^{3,4}_1 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x1 = (PA*PA);
+    Vec8d x2 = (PB*PB);
+    Vec8d x3 = (one_over_2p*one_over_2p);
+    Vec8d x4 = 3*((PB*PB)*(PB*PB));
+    Vec8d x5 = (PB*PB*PB);
+    Vec8d x6 = (PA*PA*PA);
+    return 180*PA*PB*x0 + 36*PA*x3*x5 + 12*PB*x3*x6 + 105*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + one_over_2p*x1*x4 + 4*one_over_2p*x5*x6 + 45*x0*x1 + 90*x0*x2 + 54*x1*x2*x3 + x3*x4;
+}
+
+/**
+ * @brief Symbolic E^{3,4}_2 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    Vec8d x1 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x2 = 6*(PA*PA*PA);
+    Vec8d x3 = (PB*PB*PB);
+    Vec8d x4 = (PB*PB);
+    Vec8d x5 = (one_over_2p*one_over_2p);
+    Vec8d x6 = (PA*PA);
+    return 3*PA*((PB*PB)*(PB*PB))*x5 + 135*PA*x0 + 108*PA*x1*x4 + 180*PB*x0 + 72*PB*x1*x6 + x1*x2 + 24*x1*x3 + x2*x4*x5 + 12*x3*x5*x6;
+}
+
+/**
+ * @brief Symbolic E^{3,4}_3 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x1 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    Vec8d x2 = (PA*PA);
+    Vec8d x3 = (PB*PB);
+    return 4*(PA*PA*PA)*PB*x0 + 12*PA*(PB*PB*PB)*x0 + 120*PA*PB*x1 + ((PB*PB)*(PB*PB))*x0 + 105*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 18*x0*x2*x3 + 30*x1*x2 + 60*x1*x3;
+}
+
+/**
+ * @brief Symbolic E^{3,4}_4 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    Vec8d x1 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    return (PA*PA*PA)*x1 + 12*(PA*PA)*PB*x1 + 18*PA*(PB*PB)*x1 + 45*PA*x0 + 4*(PB*PB*PB)*x1 + 60*PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{3,4}_5 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    return 3*(PA*PA)*x0 + 12*PA*PB*x0 + 6*(PB*PB)*x0 + 21*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
+}
+
+/**
+ * @brief Symbolic E^{3,4}_6 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
+    return 3*PA*x0 + 4*PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{3,4}_7
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_3_4_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{3,4}_t for t = 0..7 (shared CSE)
+ */
+RECURSUM_FORCEINLINE void hermite_e_symbolic_layer_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* RECURSUM_RESTRICT E) {
+    const Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    const Vec8d x1 = 45*PA;
+    const Vec8d x2 = 60*PB;
+    const Vec8d x3 = (PA*PA*PA);
+    const Vec8d x4 = ((PB*PB)*(PB*PB));
+    const Vec8d x5 = PA*x4;
+    const Vec8d x6 = (one_over_2p*one_over_2p);
+    const Vec8d x7 = 3*x6;
+    const Vec8d x8 = (PB*PB*PB);
+    const Vec8d x9 = 12*x8;
+    const Vec8d x10 = (PB*PB);
+    const Vec8d x11 = x10*x6;
+    const Vec8d x12 = (PA*PA);
+    const Vec8d x13 = x12*x6;
+    const Vec8d x14 = one_over_2p*x12;
+    const Vec8d x15 = one_over_2p*x3;
+    const Vec8d x16 = 3*x4;
+    const Vec8d x17 = PA*PB;
+    const Vec8d x18 = one_over_2p*x8;
+    const Vec8d x19 = 36*PA;
+    const Vec8d x20 = 12*PB;
+    const Vec8d x21 = 4*x8;
+    const Vec8d x22 = one_over_2p*x10;
+    const Vec8d x23 = 2*x10;
+    const Vec8d x24 = 4*PB;
+    const Vec8d x25 = 18*x10;
+    E[0] = 54*PA*x11 + 36*PB*x13 + 3*one_over_2p*x5 + x0*x1 + x0*x2 + 6*x10*x15 + x14*x9 + x3*x4 + x3*x7 + x6*x9;
+    E[1] = one_over_2p*(one_over_2p*x16 + 105*x0 + 54*x10*x14 + 90*x11 + x12*x16 + 45*x13 + x15*x20 + 180*x17*x6 + x18*x19 + x21*x3);
+    E[2] = x7*(24*PB*x14 + x1*x6 + x12*x21 + 2*x15 + 8*x18 + x19*x22 + x2*x6 + x23*x3 + x5);
+    E[3] = x0*(PA*x9 + 120*one_over_2p*x17 + x12*x25 + 30*x14 + 60*x22 + x24*x3 + x4 + 105*x6);
+    E[4] = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p))*(PA*x25 + one_over_2p*x1 + one_over_2p*x2 + x12*x20 + x21 + x3);
+    E[5] = 3*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p)*(PA*x24 + 7*one_over_2p + x12 + x23);
+    E[6] = ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p))*(3*PA + x24);
+    E[7] = ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p);
+}
+
+} // namespace symbolic
+} // namespace recursum
@@ -0,0 +1,111 @@
+/**
+ * @file hermite_e_symbolic_4_1.hpp
+ * @brief Symbolically-generated Hermite E^{4,1}_t coefficients (with CSE)
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Optimization: CSE (Common Subexpression Elimination) applied
+ */
+
+#pragma once
+
+#ifndef RECURSUM_VEC_TYPE
+#include <recursum/vectorclass.h>
+#endif
+
+// Portable force-inline macro for performance-critical compute methods
+#ifndef RECURSUM_FORCEINLINE
+  #ifdef _MSC_VER
+    #define RECURSUM_FORCEINLINE __forceinline
+  #elif defined(__GNUC__) || defined(__clang__)
+    #define RECURSUM_FORCEINLINE inline __attribute__((always_inline))
+  #else
+    #define RECURSUM_FORCEINLINE inline
+  #endif
+#endif
+
+// Portable no-alias qualifier for pointer parameters
+#ifndef RECURSUM_RESTRICT
+  #ifdef _MSC_VER
+    #define RECURSUM_RESTRICT __restrict
+  #else
+    #define RECURSUM_RESTRICT __restrict__
+  #endif
+#endif
+
+namespace recursum {
+namespace symbolic {
+
+/**
+ * @brief Symbolic E^{4,1}_0 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p);
+    return ((PA*PA)*(PA*PA))*PB + 4*(PA*PA*PA)*one_over_2p + 6*(PA*PA)*PB*one_over_2p + 12*PA*x0 + 3*PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{4,1}_1 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p);
+    return ((PA*PA)*(PA*PA))*one_over_2p + 4*(PA*PA*PA)*PB*one_over_2p + 18*(PA*PA)*x0 + 12*PA*PB*x0 + 15*(one_over_2p*one_over_2p*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{4,1}_2 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x1 = 6*PB;
+    Vec8d x2 = (one_over_2p*one_over_2p);
+    return 4*(PA*PA*PA)*x2 + (PA*PA)*x1*x2 + 24*PA*x0 + x0*x1;
+}
+
+/**
+ * @brief Symbolic E^{4,1}_3 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    return 6*(PA*PA)*x0 + 4*PA*PB*x0 + 10*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+}
+
+/**
+ * @brief Symbolic E^{4,1}_4 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_1_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    return 4*PA*x0 + PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{4,1}_5
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_1_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{4,1}_t for t = 0..5 (shared CSE)
+ */
+RECURSUM_FORCEINLINE void hermite_e_symbolic_layer_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* RECURSUM_RESTRICT E) {
+    const Vec8d x0 = ((PA*PA)*(PA*PA));
+    const Vec8d x1 = (one_over_2p*one_over_2p);
+    const Vec8d x2 = 12*PA;
+    const Vec8d x3 = (PA*PA*PA);
+    const Vec8d x4 = 4*x3;
+    const Vec8d x5 = 3*PB;
+    const Vec8d x6 = (PA*PA);
+    const Vec8d x7 = one_over_2p*x6;
+    const Vec8d x8 = one_over_2p*x2;
+    const Vec8d x9 = 3*x6;
+    E[0] = PB*x0 + 6*PB*x7 + one_over_2p*x4 + x1*x2 + x1*x5;
+    E[1] = one_over_2p*(PB*x4 + PB*x8 + x0 + 15*x1 + 18*x7);
+    E[2] = 2*x1*(PB*x9 + one_over_2p*x5 + 2*x3 + x8);
+    E[3] = 2*(one_over_2p*one_over_2p*one_over_2p)*(2*PA*PB + 5*one_over_2p + x9);
+    E[4] = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p))*(4*PA + PB);
+    E[5] = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+}
+
+} // namespace symbolic
+} // namespace recursum
@@ -0,0 +1,135 @@
+/**
+ * @file hermite_e_symbolic_4_2.hpp
+ * @brief Symbolically-generated Hermite E^{4,2}_t coefficients (with CSE)
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Optimization: CSE (Common Subexpression Elimination) applied
+ */
+
+#pragma once
+
+#ifndef RECURSUM_VEC_TYPE
+#include <recursum/vectorclass.h>
+#endif
+
+// Portable force-inline macro for performance-critical compute methods
+#ifndef RECURSUM_FORCEINLINE
+  #ifdef _MSC_VER
+    #define RECURSUM_FORCEINLINE __forceinline
+  #elif defined(__GNUC__) || defined(__clang__)
+    #define RECURSUM_FORCEINLINE inline __attribute__((always_inline))
+  #else
+    #define RECURSUM_FORCEINLINE inline
+  #endif
+#endif
+
+// Portable no-alias qualifier for pointer parameters
+#ifndef RECURSUM_RESTRICT
+  #ifdef _MSC_VER
+    #define RECURSUM_RESTRICT __restrict
+  #else
+    #define RECURSUM_RESTRICT __restrict__
+  #endif
+#endif
+
+namespace recursum {
+namespace symbolic {
+
+/**
+ * @brief Symbolic E^{4,2}_0 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((PA*PA)*(PA*PA));
+    Vec8d x1 = (PB*PB);
+    Vec8d x2 = (one_over_2p*one_over_2p);
+    Vec8d x3 = (PA*PA);
+    return 8*(PA*PA*PA)*PB*one_over_2p + 24*PA*PB*x2 + 15*(one_over_2p*one_over_2p*one_over_2p) + one_over_2p*x0 + 6*one_over_2p*x1*x3 + x0*x1 + 3*x1*x2 + 18*x2*x3;
+}
+
+/**
+ * @brief Symbolic E^{4,2}_1 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x1 = (PA*PA*PA);
+    Vec8d x2 = (one_over_2p*one_over_2p);
+    Vec8d x3 = 12*x2;
+    Vec8d x4 = (PB*PB);
+    return 2*((PA*PA)*(PA*PA))*PB*one_over_2p + 36*(PA*PA)*PB*x2 + 60*PA*x0 + PA*x3*x4 + 30*PB*x0 + 4*one_over_2p*x1*x4 + x1*x3;
+}
+
+/**
+ * @brief Symbolic E^{4,2}_2 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p);
+    Vec8d x1 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x2 = (PA*PA);
+    Vec8d x3 = 6*(PB*PB);
+    return ((PA*PA)*(PA*PA))*x0 + 8*(PA*PA*PA)*PB*x0 + 48*PA*PB*x1 + 45*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + x0*x2*x3 + 36*x1*x2 + x1*x3;
+}
+
+/**
+ * @brief Symbolic E^{4,2}_3 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    Vec8d x1 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x2 = 4*x1;
+    return (PA*PA*PA)*x2 + 12*(PA*PA)*PB*x1 + PA*(PB*PB)*x2 + 40*PA*x0 + 20*PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{4,2}_4 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    return 6*(PA*PA)*x0 + 8*PA*PB*x0 + (PB*PB)*x0 + 15*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{4,2}_5 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_2_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    return 4*PA*x0 + 2*PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{4,2}_6
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_2_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
+}
+
+/**
+ * @brief Symbolic E^{4,2}_t for t = 0..6 (shared CSE)
+ */
+RECURSUM_FORCEINLINE void hermite_e_symbolic_layer_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* RECURSUM_RESTRICT E) {
+    const Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    const Vec8d x1 = ((PA*PA)*(PA*PA));
+    const Vec8d x2 = (PB*PB);
+    const Vec8d x3 = (one_over_2p*one_over_2p);
+    const Vec8d x4 = PB*x3;
+    const Vec8d x5 = (PA*PA*PA);
+    const Vec8d x6 = 8*PB;
+    const Vec8d x7 = x5*x6;
+    const Vec8d x8 = (PA*PA);
+    const Vec8d x9 = 18*x8;
+    const Vec8d x10 = 6*x8;
+    const Vec8d x11 = x10*x2;
+    const Vec8d x12 = 6*one_over_2p;
+    const Vec8d x13 = PA*x2;
+    const Vec8d x14 = PB*one_over_2p;
+    E[0] = 24*PA*x4 + one_over_2p*x1 + one_over_2p*x11 + one_over_2p*x7 + 15*x0 + x1*x2 + 3*x2*x3 + x3*x9;
+    E[1] = 2*one_over_2p*(30*PA*x3 + PB*x1 + x12*x13 + x12*x5 + x14*x9 + 2*x2*x5 + 15*x4);
+    E[2] = x3*(48*PA*x14 + 36*one_over_2p*x8 + x1 + x11 + x12*x2 + 45*x3 + x7);
+    E[3] = 4*x0*(10*PA*one_over_2p + 3*PB*x8 + x13 + 5*x14 + x5);
+    E[4] = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p))*(PA*x6 + 15*one_over_2p + x10 + x2);
+    E[5] = 2*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p)*(2*PA + PB);
+    E[6] = ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
+}
+
+} // namespace symbolic
+} // namespace recursum
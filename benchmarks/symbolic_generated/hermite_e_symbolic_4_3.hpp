@@ -0,0 +1,165 @@
+/**
+ * @file hermite_e_symbolic_4_3.hpp
+ * @brief Symbolically-generated Hermite E^{4,3}_t coefficients (with CSE)
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Optimization: CSE (Common Subexpression Elimination) applied
+ */
+
+#pragma once
+
+#ifndef RECURSUM_VEC_TYPE
+#include <recursum/vectorclass.h>
+#endif
+
+// Portable force-inline macro for performance-critical compute methods
+#ifndef RECURSUM_FORCEINLINE
+  #ifdef _MSC_VER
+    #define RECURSUM_FORCEINLINE __forceinline
+  #elif defined(__GNUC__) || defined(__clang__)
+    #define RECURSUM_FORCEINLINE inline __attribute__((always_inline))
+  #else
+    #define RECURSUM_FORCEINLINE inline
+  #endif
+#endif
+
+// Portable no-alias qualifier for pointer parameters
+#ifndef RECURSUM_RESTRICT
+  #ifdef _MSC_VER
+    #define RECURSUM_RESTRICT __restrict
+  #else
+    #define RECURSUM_RESTRICT __restrict__
+  #endif
+#endif
+
+namespace recursum {
+namespace symbolic {
+
+/**
+ * @brief Symbolic E^{4,3}_0 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x1 = ((PA*PA)*(PA*PA));
+    Vec8d x2 = (PB*PB*PB);
+    Vec8d x3 = (one_over_2p*one_over_2p);
+    Vec8d x4 = 12*(PA*PA*PA);
+    Vec8d x5 = (PB*PB);
+    Vec8d x6 = (PA*PA);
+    return 60*PA*x0 + 36*PA*x3*x5 + 3*PB*one_over_2p*x1 + 45*PB*x0 + 54*PB*x3*x6 + 6*one_over_2p*x2*x6 + one_over_2p*x4*x5 + x1*x2 + 3*x2*x3 + x3*x4;
+}
+
+/**
+ * @brief Symbolic E^{4,3}_1 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x1 = (PA*PA);
+    Vec8d x2 = (one_over_2p*one_over_2p);
+    Vec8d x3 = 3*((PA*PA)*(PA*PA));
+    Vec8d x4 = (PB*PB);
+    Vec8d x5 = (PB*PB*PB);
+    Vec8d x6 = (PA*PA*PA);
+    return 180*PA*PB*x0 + 12*PA*x2*x5 + 36*PB*x2*x6 + 105*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + one_over_2p*x3*x4 + 4*one_over_2p*x5*x6 + 90*x0*x1 + 45*x0*x4 + 54*x1*x2*x4 + x2*x3;
+}
+
+/**
+ * @brief Symbolic E^{4,3}_2 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    Vec8d x1 = (PA*PA*PA);
+    Vec8d x2 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x3 = 6*(PB*PB*PB);
+    Vec8d x4 = (PB*PB);
+    Vec8d x5 = (PA*PA);
+    Vec8d x6 = (one_over_2p*one_over_2p);
+    return 3*((PA*PA)*(PA*PA))*PB*x6 + 180*PA*x0 + 72*PA*x2*x4 + 135*PB*x0 + 108*PB*x2*x5 + 24*x1*x2 + 12*x1*x4*x6 + x2*x3 + x3*x5*x6;
+}
+
+/**
+ * @brief Symbolic E^{4,3}_3 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x1 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    Vec8d x2 = (PA*PA);
+    Vec8d x3 = (PB*PB);
+    return ((PA*PA)*(PA*PA))*x0 + 12*(PA*PA*PA)*PB*x0 + 4*PA*(PB*PB*PB)*x0 + 120*PA*PB*x1 + 105*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 18*x0*x2*x3 + 60*x1*x2 + 30*x1*x3;
+}
+
+/**
+ * @brief Symbolic E^{4,3}_4 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    Vec8d x1 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    return 4*(PA*PA*PA)*x1 + 18*(PA*PA)*PB*x1 + 12*PA*(PB*PB)*x1 + 60*PA*x0 + (PB*PB*PB)*x1 + 45*PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{4,3}_5 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    return 6*(PA*PA)*x0 + 12*PA*PB*x0 + 3*(PB*PB)*x0 + 21*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
+}
+
+/**
+ * @brief Symbolic E^{4,3}_6 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_3_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
+    return 4*PA*x0 + 3*PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{4,3}_7
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_3_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{4,3}_t for t = 0..7 (shared CSE)
+ */
+RECURSUM_FORCEINLINE void hermite_e_symbolic_layer_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* RECURSUM_RESTRICT E) {
+    const Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    const Vec8d x1 = 60*PA;
+    const Vec8d x2 = 45*PB;
+    const Vec8d x3 = ((PA*PA)*(PA*PA));
+    const Vec8d x4 = (PB*PB*PB);
+    const Vec8d x5 = PB*x3;
+    const Vec8d x6 = (one_over_2p*one_over_2p);
+    const Vec8d x7 = (PA*PA*PA);
+    const Vec8d x8 = 12*x7;
+    const Vec8d x9 = 3*x6;
+    const Vec8d x10 = (PB*PB);
+    const Vec8d x11 = x10*x6;
+    const Vec8d x12 = (PA*PA);
+    const Vec8d x13 = x12*x6;
+    const Vec8d x14 = one_over_2p*x4;
+    const Vec8d x15 = one_over_2p*x10;
+    const Vec8d x16 = 3*x3;
+    const Vec8d x17 = PA*PB;
+    const Vec8d x18 = 12*PA;
+    const Vec8d x19 = one_over_2p*x7;
+    const Vec8d x20 = 36*PB;
+    const Vec8d x21 = 4*x7;
+    const Vec8d x22 = one_over_2p*x12;
+    const Vec8d x23 = 2*x12;
+    const Vec8d x24 = 4*PA;
+    const Vec8d x25 = 18*x12;
+    E[0] = 36*PA*x11 + 54*PB*x13 + 3*one_over_2p*x5 + x0*x1 + x0*x2 + 6*x12*x14 + x15*x8 + x3*x4 + x4*x9 + x6*x8;
+    E[1] = one_over_2p*(one_over_2p*x16 + 105*x0 + x10*x16 + 45*x11 + 54*x12*x15 + 90*x13 + x14*x18 + 180*x17*x6 + x19*x20 + x21*x4);
+    E[2] = x9*(24*PA*x15 + x1*x6 + x10*x21 + 2*x14 + 8*x19 + x2*x6 + x20*x22 + x23*x4 + x5);
+    E[3] = x0*(PB*x8 + 120*one_over_2p*x17 + x10*x25 + 30*x15 + 60*x22 + x24*x4 + x3 + 105*x6);
+    E[4] = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p))*(PB*x25 + one_over_2p*x1 + one_over_2p*x2 + x10*x18 + x21 + x4);
+    E[5] = 3*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p)*(PB*x24 + 7*one_over_2p + x10 + x23);
+    E[6] = ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p))*(3*PB + x24);
+    E[7] = ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p);
+}
+
+} // namespace symbolic
+} // namespace recursum
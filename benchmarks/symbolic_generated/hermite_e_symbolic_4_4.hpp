@@ -0,0 +1,220 @@
+/**
+ * @file hermite_e_symbolic_4_4.hpp
+ * @brief Symbolically-generated Hermite E^{4,4}_t coefficients (with CSE)
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Optimization: CSE (Common Subexpression Elimination) applied
+ */
+
+#pragma once
+
+#ifndef RECURSUM_VEC_TYPE
+#include <recursum/vectorclass.h>
+#endif
+
+// Portable force-inline macro for performance-critical compute methods
+#ifndef RECURSUM_FORCEINLINE
+  #ifdef _MSC_VER
+    #define RECURSUM_FORCEINLINE __forceinline
+  #elif defined(__GNUC__) || defined(__clang__)
+    #define RECURSUM_FORCEINLINE inline __attribute__((always_inline))
+  #else
+    #define RECURSUM_FORCEINLINE inline
+  #endif
+#endif
+
+// Portable no-alias qualifier for pointer parameters
+#ifndef RECURSUM_RESTRICT
+  #ifdef _MSC_VER
+    #define RECURSUM_RESTRICT __restrict
+  #else
+    #define RECURSUM_RESTRICT __restrict__
+  #endif
+#endif
+
+namespace recursum {
+namespace symbolic {
+
+/**
+ * @brief Symbolic E^{4,4}_0 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((PA*PA)*(PA*PA));
+    Vec8d x1 = ((PB*PB)*(PB*PB));
+    Vec8d x2 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x3 = (PA*PA);
+    Vec8d x4 = 90*x2;
+    Vec8d x5 = (one_over_2p*one_over_2p);
+    Vec8d x6 = 3*x5;
+    Vec8d x7 = (PB*PB);
+    Vec8d x8 = (PB*PB*PB);
+    Vec8d x9 = 48*x5;
+    Vec8d x10 = 6*one_over_2p;
+    Vec8d x11 = (PA*PA*PA);
+    return 240*PA*PB*x2 + PA*x8*x9 + PB*x11*x9 + 105*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 16*one_over_2p*x11*x8 + x0*x1 + x0*x10*x7 + x0*x6 + x1*x10*x3 + x1*x6 + x3*x4 + 108*x3*x5*x7 + x4*x7;
+}
+
+/**
+ * @brief Symbolic E^{4,4}_1 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = 420*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    Vec8d x1 = (PA*PA*PA);
+    Vec8d x2 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x3 = 60*x2;
+    Vec8d x4 = (PB*PB*PB);
+    Vec8d x5 = (PB*PB);
+    Vec8d x6 = 360*x2;
+    Vec8d x7 = ((PB*PB)*(PB*PB));
+    Vec8d x8 = (one_over_2p*one_over_2p);
+    Vec8d x9 = 12*x8;
+    Vec8d x10 = (PA*PA);
+    Vec8d x11 = 4*one_over_2p;
+    Vec8d x12 = ((PA*PA)*(PA*PA));
+    Vec8d x13 = 72*x8;
+    return PA*x0 + PA*x5*x6 + PA*x7*x9 + PB*x0 + PB*x10*x6 + PB*x12*x9 + x1*x11*x7 + x1*x13*x5 + x1*x3 + x10*x13*x4 + x11*x12*x4 + x3*x4;
+}
+
+/**
+ * @brief Symbolic E^{4,4}_2 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    Vec8d x1 = (PA*PA);
+    Vec8d x2 = 270*x0;
+    Vec8d x3 = ((PA*PA)*(PA*PA));
+    Vec8d x4 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x5 = 6*x4;
+    Vec8d x6 = (PB*PB);
+    Vec8d x7 = ((PB*PB)*(PB*PB));
+    Vec8d x8 = (PB*PB*PB);
+    Vec8d x9 = 96*x4;
+    Vec8d x10 = (PA*PA*PA);
+    Vec8d x11 = (one_over_2p*one_over_2p);
+    Vec8d x12 = 6*x11;
+    return 720*PA*PB*x0 + PA*x8*x9 + PB*x10*x9 + 420*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + x1*x12*x7 + x1*x2 + 216*x1*x4*x6 + 16*x10*x11*x8 + x12*x3*x6 + x2*x6 + x3*x5 + x5*x7;
+}
+
+/**
+ * @brief Symbolic E^{4,4}_3 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = 420*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    Vec8d x1 = (PA*PA*PA);
+    Vec8d x2 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    Vec8d x3 = 40*x2;
+    Vec8d x4 = (PB*PB*PB);
+    Vec8d x5 = (PB*PB);
+    Vec8d x6 = 240*x2;
+    Vec8d x7 = (one_over_2p*one_over_2p*one_over_2p);
+    Vec8d x8 = 4*x7;
+    Vec8d x9 = (PA*PA);
+    Vec8d x10 = 24*x7;
+    return ((PA*PA)*(PA*PA))*PB*x8 + PA*((PB*PB)*(PB*PB))*x8 + PA*x0 + PA*x5*x6 + PB*x0 + PB*x6*x9 + x1*x10*x5 + x1*x3 + x10*x4*x9 + x3*x4;
+}
+
+/**
+ * @brief Symbolic E^{4,4}_4 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    Vec8d x1 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    Vec8d x2 = (PA*PA);
+    Vec8d x3 = 90*x1;
+    Vec8d x4 = (PB*PB);
+    Vec8d x5 = 16*x0;
+    return ((PA*PA)*(PA*PA))*x0 + (PA*PA*PA)*PB*x5 + PA*(PB*PB*PB)*x5 + 240*PA*PB*x1 + ((PB*PB)*(PB*PB))*x0 + 210*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)) + 36*x0*x2*x4 + x2*x3 + x3*x4;
+}
+
+/**
+ * @brief Symbolic E^{4,4}_5 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = 84*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
+    Vec8d x1 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    Vec8d x2 = 4*x1;
+    Vec8d x3 = 24*x1;
+    return (PA*PA*PA)*x2 + (PA*PA)*PB*x3 + PA*(PB*PB)*x3 + PA*x0 + (PB*PB*PB)*x2 + PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{4,4}_6 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
+    Vec8d x1 = 6*x0;
+    return (PA*PA)*x1 + 16*PA*PB*x0 + (PB*PB)*x1 + 28*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p);
+}
+
+/**
+ * @brief Symbolic E^{4,4}_7 (CSE optimized)
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_4_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    Vec8d x0 = 4*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p);
+    return PA*x0 + PB*x0;
+}
+
+/**
+ * @brief Symbolic E^{4,4}_8
+ */
+RECURSUM_FORCEINLINE Vec8d hermite_e_symbolic_4_4_8(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+    return (((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p))*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)));
+}
+
+/**
+ * @brief Symbolic E^{4,4}_t for t = 0..8 (shared CSE)
+ */
+RECURSUM_FORCEINLINE void hermite_e_symbolic_layer_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p, Vec8d* RECURSUM_RESTRICT E) {
+    const Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    const Vec8d x1 = ((PA*PA)*(PA*PA));
+    const Vec8d x2 = ((PB*PB)*(PB*PB));
+    const Vec8d x3 = (one_over_2p*one_over_2p*one_over_2p);
+    const Vec8d x4 = PA*PB;
+    const Vec8d x5 = 240*x4;
+    const Vec8d x6 = (PA*PA);
+    const Vec8d x7 = 90*x3;
+    const Vec8d x8 = (one_over_2p*one_over_2p);
+    const Vec8d x9 = 3*x8;
+    const Vec8d x10 = (PB*PB);
+    const Vec8d x11 = (PB*PB*PB);
+    const Vec8d x12 = PA*x11;
+    const Vec8d x13 = 48*x8;
+    const Vec8d x14 = 6*x6;
+    const Vec8d x15 = (PA*PA*PA);
+    const Vec8d x16 = PB*x15;
+    const Vec8d x17 = x11*x15;
+    const Vec8d x18 = 6*x10;
+    const Vec8d x19 = x10*x6;
+    const Vec8d x20 = 108*x19;
+    const Vec8d x21 = 105*x3;
+    const Vec8d x22 = PA*x2;
+    const Vec8d x23 = 3*one_over_2p;
+    const Vec8d x24 = PB*x1;
+    const Vec8d x25 = 15*x8;
+    const Vec8d x26 = 90*x8;
+    const Vec8d x27 = PA*x10;
+    const Vec8d x28 = PB*x6;
+    const Vec8d x29 = 18*one_over_2p;
+    const Vec8d x30 = 48*one_over_2p;
+    const Vec8d x31 = 3*x6;
+    const Vec8d x32 = 135*x8;
+    const Vec8d x33 = 3*x10;
+    const Vec8d x34 = 105*x8;
+    const Vec8d x35 = 10*one_over_2p;
+    const Vec8d x36 = 60*one_over_2p;
+    const Vec8d x37 = 90*one_over_2p;
+    const Vec8d x38 = 21*one_over_2p;
+    E[0] = one_over_2p*x1*x18 + one_over_2p*x14*x2 + 16*one_over_2p*x17 + 105*x0 + x1*x2 + x1*x9 + x10*x7 + x12*x13 + x13*x16 + x2*x9 + x20*x8 + x3*x5 + x6*x7;
+    E[1] = 4*one_over_2p*(PA*x21 + PB*x21 + x1*x11 + x10*x15*x29 + x11*x25 + x11*x29*x6 + x15*x2 + x15*x25 + x22*x23 + x23*x24 + x26*x27 + x26*x28);
+    E[2] = 2*x8*(one_over_2p*x20 + x1*x23 + x1*x33 + x10*x32 + x12*x30 + x16*x30 + 8*x17 + x2*x23 + x2*x31 + 210*x3 + x32*x6 + 360*x4*x8);
+    E[3] = 4*x3*(PA*x34 + PB*x34 + x11*x14 + x11*x35 + x15*x18 + x15*x35 + x22 + x24 + x27*x36 + x28*x36);
+    E[4] = x0*(one_over_2p*x5 + x1 + x10*x37 + 16*x12 + 16*x16 + 36*x19 + x2 + x37*x6 + 210*x8);
+    E[5] = 4*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p)*(PA*x18 + PA*x38 + PB*x14 + PB*x38 + x11 + x15);
+    E[6] = 2*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p))*(14*one_over_2p + x31 + x33 + 8*x4);
+    E[7] = 4*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p)*(PA + PB);
+    E[8] = (((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p))*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)));
+}
+
+} // namespace symbolic
+} // namespace recursum
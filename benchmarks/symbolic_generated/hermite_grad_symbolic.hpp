@@ -4,9 +4,11 @@
  *
  * AUTO-GENERATED - DO NOT EDIT MANUALLY
  *
- * Gradients computed by direct differentiation:
- *   dE_dPA[(nA,nB,t)] = ∂E^{nA,nB}_t/∂PA
- *   dE_dPB[(nA,nB,t)] = ∂E^{nA,nB}_t/∂PB
+ * Gradients from the Helgaker-Taylor closed form:
+ *   dE_dPA[(nA,nB,t)] = ∂E^{nA,nB}_t/∂PA = nA * E^{nA-1,nB}_t
+ *   dE_dPB[(nA,nB,t)] = ∂E^{nA,nB}_t/∂PB = nB * E^{nA,nB-1}_t
+ *
+ * hermite_dE_both_{nA}_{nB}_{t} returns both with one shared CSE.
  */
 
 #pragma once
@@ -15,6 +17,26 @@
 #include <recursum/vectorclass.h>
 #endif
 
+// Portable force-inline macro for performance-critical compute methods
+#ifndef RECURSUM_FORCEINLINE
+  #ifdef _MSC_VER
+    #define RECURSUM_FORCEINLINE __forceinline
+  #elif defined(__GNUC__) || defined(__clang__)
+    #define RECURSUM_FORCEINLINE inline __attribute__((always_inline))
+  #else
+    #define RECURSUM_FORCEINLINE inline
+  #endif
+#endif
+
+// Portable no-alias qualifier for pointer parameters
+#ifndef RECURSUM_RESTRICT
+  #ifdef _MSC_VER
+    #define RECURSUM_RESTRICT __restrict
+  #else
+    #define RECURSUM_RESTRICT __restrict__
+  #endif
+#endif
+
 namespace recursum {
 namespace symbolic {
 
@@ -22,503 +44,503 @@ namespace symbolic {
 // ∂E/∂PA Gradients
 // =============================================================================
 
-inline Vec8d hermite_dE_dPA_0_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_0_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_0_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_0_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_0_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_0_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_0_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_0_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_0_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_0_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_0_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_0_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_0_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_0_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_0_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_0_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_0_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_0_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_0_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_0_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_0_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_0_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_0_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_0_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_0_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_0_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_0_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_0_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_0_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_0_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_1_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 1;
 }
 
-inline Vec8d hermite_dE_dPA_1_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_1_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return PB;
 }
 
-inline Vec8d hermite_dE_dPA_1_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPA_1_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_1_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return (PB*PB) + one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPA_1_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*PB*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPA_1_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return (one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_1_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_1_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return (PB*PB*PB) + 3*PB*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPA_1_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PB*PB)*one_over_2p + 3*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_1_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_1_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return (one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_1_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_1_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return ((PB*PB)*(PB*PB)) + 6*(PB*PB)*one_over_2p + 3*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_1_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PB*PB*PB)*one_over_2p + 12*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_1_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*(PB*PB)*(one_over_2p*one_over_2p) + 6*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_1_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_1_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_1_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_1_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_2_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*PA;
 }
 
-inline Vec8d hermite_dE_dPA_2_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPA_2_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_2_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*PA*PB + 2*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPA_2_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*PA*one_over_2p + 2*PB*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPA_2_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_2_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_2_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*PA*(PB*PB) + 2*PA*one_over_2p + 4*PB*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPA_2_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*PA*PB*one_over_2p + 2*(PB*PB)*one_over_2p + 6*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_2_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*PA*(one_over_2p*one_over_2p) + 4*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_2_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_2_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_2_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*PA*(PB*PB*PB) + 6*PA*PB*one_over_2p + 6*(PB*PB)*one_over_2p + 6*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_2_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*PA*(PB*PB)*one_over_2p + 6*PA*(one_over_2p*one_over_2p) + 2*(PB*PB*PB)*one_over_2p + 18*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_2_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*PA*PB*(one_over_2p*one_over_2p) + 6*(PB*PB)*(one_over_2p*one_over_2p) + 12*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_2_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*PA*(one_over_2p*one_over_2p*one_over_2p) + 6*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_2_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_2_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_2_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*PA*((PB*PB)*(PB*PB)) + 12*PA*(PB*PB)*one_over_2p + 6*PA*(one_over_2p*one_over_2p) + 8*(PB*PB*PB)*one_over_2p + 24*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_2_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 8*PA*(PB*PB*PB)*one_over_2p + 24*PA*PB*(one_over_2p*one_over_2p) + 2*((PB*PB)*(PB*PB))*one_over_2p + 36*(PB*PB)*(one_over_2p*one_over_2p) + 30*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_2_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*PA*(PB*PB)*(one_over_2p*one_over_2p) + 12*PA*(one_over_2p*one_over_2p*one_over_2p) + 8*(PB*PB*PB)*(one_over_2p*one_over_2p) + 48*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_2_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 8*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 12*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 20*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_2_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 8*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_2_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_2_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_2_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_3_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PA*PA) + 3*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPA_3_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*PA*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPA_3_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_0_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_0_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_3_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PA*PA)*PB + 6*PA*one_over_2p + 3*PB*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPA_3_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PA*PA)*one_over_2p + 6*PA*PB*one_over_2p + 9*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*PA*(one_over_2p*one_over_2p) + 3*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_1_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_1_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_3_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PA*PA)*(PB*PB) + 3*(PA*PA)*one_over_2p + 12*PA*PB*one_over_2p + 3*(PB*PB)*one_over_2p + 9*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*(PA*PA)*PB*one_over_2p + 6*PA*(PB*PB)*one_over_2p + 18*PA*(one_over_2p*one_over_2p) + 18*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PA*PA)*(one_over_2p*one_over_2p) + 12*PA*PB*(one_over_2p*one_over_2p) + 3*(PB*PB)*(one_over_2p*one_over_2p) + 18*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*PA*(one_over_2p*one_over_2p*one_over_2p) + 6*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_3_2_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_2_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_3_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PA*PA)*(PB*PB*PB) + 9*(PA*PA)*PB*one_over_2p + 18*PA*(PB*PB)*one_over_2p + 18*PA*(one_over_2p*one_over_2p) + 3*(PB*PB*PB)*one_over_2p + 27*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 9*(PA*PA)*(PB*PB)*one_over_2p + 9*(PA*PA)*(one_over_2p*one_over_2p) + 6*PA*(PB*PB*PB)*one_over_2p + 54*PA*PB*(one_over_2p*one_over_2p) + 27*(PB*PB)*(one_over_2p*one_over_2p) + 45*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 9*(PA*PA)*PB*(one_over_2p*one_over_2p) + 18*PA*(PB*PB)*(one_over_2p*one_over_2p) + 36*PA*(one_over_2p*one_over_2p*one_over_2p) + 3*(PB*PB*PB)*(one_over_2p*one_over_2p) + 54*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 18*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 9*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 30*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_3_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 9*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_3_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_3_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_3_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_3_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PA*PA)*((PB*PB)*(PB*PB)) + 18*(PA*PA)*(PB*PB)*one_over_2p + 9*(PA*PA)*(one_over_2p*one_over_2p) + 24*PA*(PB*PB*PB)*one_over_2p + 72*PA*PB*(one_over_2p*one_over_2p) + 3*((PB*PB)*(PB*PB))*one_over_2p + 54*(PB*PB)*(one_over_2p*one_over_2p) + 45*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA)*(PB*PB*PB)*one_over_2p + 36*(PA*PA)*PB*(one_over_2p*one_over_2p) + 6*PA*((PB*PB)*(PB*PB))*one_over_2p + 108*PA*(PB*PB)*(one_over_2p*one_over_2p) + 90*PA*(one_over_2p*one_over_2p*one_over_2p) + 36*(PB*PB*PB)*(one_over_2p*one_over_2p) + 180*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 18*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 18*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 24*PA*(PB*PB*PB)*(one_over_2p*one_over_2p) + 144*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 3*((PB*PB)*(PB*PB))*(one_over_2p*one_over_2p) + 108*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 135*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_3_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 36*PA*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 60*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 12*(PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 120*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_3_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 24*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 18*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 45*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 12*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_3_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_3_4_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_3_4_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_4_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PA*PA*PA) + 12*PA*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPA_4_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA)*one_over_2p + 12*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*PA*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_0_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_0_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_0_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_0_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_4_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PA*PA*PA)*PB + 12*(PA*PA)*one_over_2p + 12*PA*PB*one_over_2p + 12*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PA*PA*PA)*one_over_2p + 12*(PA*PA)*PB*one_over_2p + 36*PA*(one_over_2p*one_over_2p) + 12*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA)*(one_over_2p*one_over_2p) + 12*PA*PB*(one_over_2p*one_over_2p) + 24*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*PA*(one_over_2p*one_over_2p*one_over_2p) + 4*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_1_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_1_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_4_1_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_1_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_4_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PA*PA*PA)*(PB*PB) + 4*(PA*PA*PA)*one_over_2p + 24*(PA*PA)*PB*one_over_2p + 12*PA*(PB*PB)*one_over_2p + 36*PA*(one_over_2p*one_over_2p) + 24*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 8*(PA*PA*PA)*PB*one_over_2p + 12*(PA*PA)*(PB*PB)*one_over_2p + 36*(PA*PA)*(one_over_2p*one_over_2p) + 72*PA*PB*(one_over_2p*one_over_2p) + 12*(PB*PB)*(one_over_2p*one_over_2p) + 60*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PA*PA*PA)*(one_over_2p*one_over_2p) + 24*(PA*PA)*PB*(one_over_2p*one_over_2p) + 12*PA*(PB*PB)*(one_over_2p*one_over_2p) + 72*PA*(one_over_2p*one_over_2p*one_over_2p) + 48*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 24*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 4*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 40*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_4_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 8*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_4_2_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_2_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_2_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_2_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_4_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PA*PA*PA)*(PB*PB*PB) + 12*(PA*PA*PA)*PB*one_over_2p + 36*(PA*PA)*(PB*PB)*one_over_2p + 36*(PA*PA)*(one_over_2p*one_over_2p) + 12*PA*(PB*PB*PB)*one_over_2p + 108*PA*PB*(one_over_2p*one_over_2p) + 36*(PB*PB)*(one_over_2p*one_over_2p) + 60*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA*PA)*(PB*PB)*one_over_2p + 12*(PA*PA*PA)*(one_over_2p*one_over_2p) + 12*(PA*PA)*(PB*PB*PB)*one_over_2p + 108*(PA*PA)*PB*(one_over_2p*one_over_2p) + 108*PA*(PB*PB)*(one_over_2p*one_over_2p) + 180*PA*(one_over_2p*one_over_2p*one_over_2p) + 12*(PB*PB*PB)*(one_over_2p*one_over_2p) + 180*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA*PA)*PB*(one_over_2p*one_over_2p) + 36*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 72*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 12*PA*(PB*PB*PB)*(one_over_2p*one_over_2p) + 216*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 72*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 180*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_4_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PA*PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 36*(PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 36*PA*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 120*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 4*(PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 120*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_4_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 36*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 12*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 60*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 12*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_3_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_3_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_4_3_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_3_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPA_4_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PA*PA*PA)*((PB*PB)*(PB*PB)) + 24*(PA*PA*PA)*(PB*PB)*one_over_2p + 12*(PA*PA*PA)*(one_over_2p*one_over_2p) + 48*(PA*PA)*(PB*PB*PB)*one_over_2p + 144*(PA*PA)*PB*(one_over_2p*one_over_2p) + 12*PA*((PB*PB)*(PB*PB))*one_over_2p + 216*PA*(PB*PB)*(one_over_2p*one_over_2p) + 180*PA*(one_over_2p*one_over_2p*one_over_2p) + 48*(PB*PB*PB)*(one_over_2p*one_over_2p) + 240*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 16*(PA*PA*PA)*(PB*PB*PB)*one_over_2p + 48*(PA*PA*PA)*PB*(one_over_2p*one_over_2p) + 12*(PA*PA)*((PB*PB)*(PB*PB))*one_over_2p + 216*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 180*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 144*PA*(PB*PB*PB)*(one_over_2p*one_over_2p) + 720*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 12*((PB*PB)*(PB*PB))*(one_over_2p*one_over_2p) + 360*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 420*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_4_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 24*(PA*PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 24*(PA*PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 48*(PA*PA)*(PB*PB*PB)*(one_over_2p*one_over_2p) + 288*(PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 12*PA*((PB*PB)*(PB*PB))*(one_over_2p*one_over_2p) + 432*PA*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 540*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 96*(PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 720*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_4_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 16*(PA*PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 72*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 120*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 48*PA*(PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 480*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 4*((PB*PB)*(PB*PB))*(one_over_2p*one_over_2p*one_over_2p) + 240*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 420*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PA*PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 48*(PA*PA)*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 72*PA*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 180*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 16*(PB*PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 240*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 48*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 24*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 84*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_4_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*PA*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)) + 16*PB*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPA_4_4_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_4_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPA_4_4_8(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPA_4_4_8(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
@@ -526,506 +548,1558 @@ inline Vec8d hermite_dE_dPA_4_4_8(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
 // ∂E/∂PB Gradients
 // =============================================================================
 
-inline Vec8d hermite_dE_dPB_0_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_0_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_0_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_0_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 1;
 }
 
-inline Vec8d hermite_dE_dPB_0_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_0_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_0_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_0_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*PB;
 }
 
-inline Vec8d hermite_dE_dPB_0_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_0_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPB_0_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_0_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_0_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_0_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PB*PB) + 3*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPB_0_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_0_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*PB*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPB_0_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_0_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_0_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_0_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_0_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_0_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PB*PB*PB) + 12*PB*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPB_0_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_0_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PB*PB)*one_over_2p + 12*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_0_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_0_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_0_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_0_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_0_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_0_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_1_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_1_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_1_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return PA;
 }
 
-inline Vec8d hermite_dE_dPB_1_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPB_1_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_1_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*PA*PB + 2*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPB_1_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*PA*one_over_2p + 2*PB*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPB_1_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_1_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_1_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*PA*(PB*PB) + 3*PA*one_over_2p + 6*PB*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPB_1_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*PA*PB*one_over_2p + 3*(PB*PB)*one_over_2p + 9*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_1_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*PA*(one_over_2p*one_over_2p) + 6*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_1_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_1_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_1_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*PA*(PB*PB*PB) + 12*PA*PB*one_over_2p + 12*(PB*PB)*one_over_2p + 12*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_1_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*PA*(PB*PB)*one_over_2p + 12*PA*(one_over_2p*one_over_2p) + 4*(PB*PB*PB)*one_over_2p + 36*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_1_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*PA*PB*(one_over_2p*one_over_2p) + 12*(PB*PB)*(one_over_2p*one_over_2p) + 24*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_1_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*PA*(one_over_2p*one_over_2p*one_over_2p) + 12*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_1_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_1_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_1_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_2_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_2_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_2_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_2_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return (PA*PA) + one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPB_2_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*PA*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPB_2_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return (one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_2_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_2_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*(PA*PA)*PB + 4*PA*one_over_2p + 2*PB*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPB_2_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*(PA*PA)*one_over_2p + 4*PA*PB*one_over_2p + 6*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_2_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*PA*(one_over_2p*one_over_2p) + 2*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_2_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_2_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_2_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PA*PA)*(PB*PB) + 3*(PA*PA)*one_over_2p + 12*PA*PB*one_over_2p + 3*(PB*PB)*one_over_2p + 9*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_2_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*(PA*PA)*PB*one_over_2p + 6*PA*(PB*PB)*one_over_2p + 18*PA*(one_over_2p*one_over_2p) + 18*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_2_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PA*PA)*(one_over_2p*one_over_2p) + 12*PA*PB*(one_over_2p*one_over_2p) + 3*(PB*PB)*(one_over_2p*one_over_2p) + 18*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_2_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*PA*(one_over_2p*one_over_2p*one_over_2p) + 6*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_2_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_2_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_2_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PA*PA)*(PB*PB*PB) + 12*(PA*PA)*PB*one_over_2p + 24*PA*(PB*PB)*one_over_2p + 24*PA*(one_over_2p*one_over_2p) + 4*(PB*PB*PB)*one_over_2p + 36*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_2_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA)*(PB*PB)*one_over_2p + 12*(PA*PA)*(one_over_2p*one_over_2p) + 8*PA*(PB*PB*PB)*one_over_2p + 72*PA*PB*(one_over_2p*one_over_2p) + 36*(PB*PB)*(one_over_2p*one_over_2p) + 60*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_2_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA)*PB*(one_over_2p*one_over_2p) + 24*PA*(PB*PB)*(one_over_2p*one_over_2p) + 48*PA*(one_over_2p*one_over_2p*one_over_2p) + 4*(PB*PB*PB)*(one_over_2p*one_over_2p) + 72*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_2_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 24*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 12*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 40*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_2_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 8*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 12*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_2_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_2_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_2_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_3_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_3_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_3_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_3_0_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_0_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_3_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return (PA*PA*PA) + 3*PA*one_over_2p;
 }
 
-inline Vec8d hermite_dE_dPB_3_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PA*PA)*one_over_2p + 3*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_3_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*PA*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_3_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return (one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_3_1_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_1_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_3_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*(PA*PA*PA)*PB + 6*(PA*PA)*one_over_2p + 6*PA*PB*one_over_2p + 6*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_3_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*(PA*PA*PA)*one_over_2p + 6*(PA*PA)*PB*one_over_2p + 18*PA*(one_over_2p*one_over_2p) + 6*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_3_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*(PA*PA)*(one_over_2p*one_over_2p) + 6*PA*PB*(one_over_2p*one_over_2p) + 12*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_3_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*PA*(one_over_2p*one_over_2p*one_over_2p) + 2*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_3_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_3_2_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_2_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_3_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PA*PA*PA)*(PB*PB) + 3*(PA*PA*PA)*one_over_2p + 18*(PA*PA)*PB*one_over_2p + 9*PA*(PB*PB)*one_over_2p + 27*PA*(one_over_2p*one_over_2p) + 18*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_3_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*(PA*PA*PA)*PB*one_over_2p + 9*(PA*PA)*(PB*PB)*one_over_2p + 27*(PA*PA)*(one_over_2p*one_over_2p) + 54*PA*PB*(one_over_2p*one_over_2p) + 9*(PB*PB)*(one_over_2p*one_over_2p) + 45*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_3_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*(PA*PA*PA)*(one_over_2p*one_over_2p) + 18*(PA*PA)*PB*(one_over_2p*one_over_2p) + 9*PA*(PB*PB)*(one_over_2p*one_over_2p) + 54*PA*(one_over_2p*one_over_2p*one_over_2p) + 36*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_3_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 9*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 18*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 3*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 30*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_3_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 9*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 6*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_3_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_3_3_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_3_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_3_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PA*PA*PA)*(PB*PB*PB) + 12*(PA*PA*PA)*PB*one_over_2p + 36*(PA*PA)*(PB*PB)*one_over_2p + 36*(PA*PA)*(one_over_2p*one_over_2p) + 12*PA*(PB*PB*PB)*one_over_2p + 108*PA*PB*(one_over_2p*one_over_2p) + 36*(PB*PB)*(one_over_2p*one_over_2p) + 60*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_3_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA*PA)*(PB*PB)*one_over_2p + 12*(PA*PA*PA)*(one_over_2p*one_over_2p) + 12*(PA*PA)*(PB*PB*PB)*one_over_2p + 108*(PA*PA)*PB*(one_over_2p*one_over_2p) + 108*PA*(PB*PB)*(one_over_2p*one_over_2p) + 180*PA*(one_over_2p*one_over_2p*one_over_2p) + 12*(PB*PB*PB)*(one_over_2p*one_over_2p) + 180*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_3_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA*PA)*PB*(one_over_2p*one_over_2p) + 36*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 72*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 12*PA*(PB*PB*PB)*(one_over_2p*one_over_2p) + 216*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 72*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 180*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_3_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PA*PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 36*(PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 36*PA*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 120*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 4*(PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 120*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_3_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 36*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 12*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 60*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_3_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 12*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_3_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_3_4_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_3_4_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_4_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_4_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_4_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_4_0_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_0_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_4_0_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_0_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_4_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return ((PA*PA)*(PA*PA)) + 6*(PA*PA)*one_over_2p + 3*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*(PA*PA*PA)*one_over_2p + 12*PA*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*(PA*PA)*(one_over_2p*one_over_2p) + 6*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*PA*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_1_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_1_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_4_1_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_1_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_4_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*((PA*PA)*(PA*PA))*PB + 8*(PA*PA*PA)*one_over_2p + 12*(PA*PA)*PB*one_over_2p + 24*PA*(one_over_2p*one_over_2p) + 6*PB*(one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*((PA*PA)*(PA*PA))*one_over_2p + 8*(PA*PA*PA)*PB*one_over_2p + 36*(PA*PA)*(one_over_2p*one_over_2p) + 24*PA*PB*(one_over_2p*one_over_2p) + 30*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 8*(PA*PA*PA)*(one_over_2p*one_over_2p) + 12*(PA*PA)*PB*(one_over_2p*one_over_2p) + 48*PA*(one_over_2p*one_over_2p*one_over_2p) + 12*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 8*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 20*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_4_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 8*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 2*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_4_2_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_2_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 2*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_2_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_2_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_4_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*((PA*PA)*(PA*PA))*(PB*PB) + 3*((PA*PA)*(PA*PA))*one_over_2p + 24*(PA*PA*PA)*PB*one_over_2p + 18*(PA*PA)*(PB*PB)*one_over_2p + 54*(PA*PA)*(one_over_2p*one_over_2p) + 72*PA*PB*(one_over_2p*one_over_2p) + 9*(PB*PB)*(one_over_2p*one_over_2p) + 45*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 6*((PA*PA)*(PA*PA))*PB*one_over_2p + 12*(PA*PA*PA)*(PB*PB)*one_over_2p + 36*(PA*PA*PA)*(one_over_2p*one_over_2p) + 108*(PA*PA)*PB*(one_over_2p*one_over_2p) + 36*PA*(PB*PB)*(one_over_2p*one_over_2p) + 180*PA*(one_over_2p*one_over_2p*one_over_2p) + 90*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*((PA*PA)*(PA*PA))*(one_over_2p*one_over_2p) + 24*(PA*PA*PA)*PB*(one_over_2p*one_over_2p) + 18*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 108*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 144*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 18*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 135*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_4_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*(PA*PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 36*(PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 12*PA*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 120*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 60*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_4_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 18*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 24*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 3*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 45*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 6*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_3_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_3_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 3*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_4_3_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_3_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
-inline Vec8d hermite_dE_dPB_4_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*((PA*PA)*(PA*PA))*(PB*PB*PB) + 12*((PA*PA)*(PA*PA))*PB*one_over_2p + 48*(PA*PA*PA)*(PB*PB)*one_over_2p + 48*(PA*PA*PA)*(one_over_2p*one_over_2p) + 24*(PA*PA)*(PB*PB*PB)*one_over_2p + 216*(PA*PA)*PB*(one_over_2p*one_over_2p) + 144*PA*(PB*PB)*(one_over_2p*one_over_2p) + 240*PA*(one_over_2p*one_over_2p*one_over_2p) + 12*(PB*PB*PB)*(one_over_2p*one_over_2p) + 180*PB*(one_over_2p*one_over_2p*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*((PA*PA)*(PA*PA))*(PB*PB)*one_over_2p + 12*((PA*PA)*(PA*PA))*(one_over_2p*one_over_2p) + 16*(PA*PA*PA)*(PB*PB*PB)*one_over_2p + 144*(PA*PA*PA)*PB*(one_over_2p*one_over_2p) + 216*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 360*(PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 48*PA*(PB*PB*PB)*(one_over_2p*one_over_2p) + 720*PA*PB*(one_over_2p*one_over_2p*one_over_2p) + 180*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 420*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_4_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 12*((PA*PA)*(PA*PA))*PB*(one_over_2p*one_over_2p) + 48*(PA*PA*PA)*(PB*PB)*(one_over_2p*one_over_2p) + 96*(PA*PA*PA)*(one_over_2p*one_over_2p*one_over_2p) + 24*(PA*PA)*(PB*PB*PB)*(one_over_2p*one_over_2p) + 432*(PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 288*PA*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 720*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 24*(PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 540*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_4_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*((PA*PA)*(PA*PA))*(one_over_2p*one_over_2p*one_over_2p) + 48*(PA*PA*PA)*PB*(one_over_2p*one_over_2p*one_over_2p) + 72*(PA*PA)*(PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 240*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 16*PA*(PB*PB*PB)*(one_over_2p*one_over_2p*one_over_2p) + 480*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 120*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 420*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 16*(PA*PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 72*(PA*PA)*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 48*PA*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 240*PA*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 4*(PB*PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)) + 180*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 24*(PA*PA)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 48*PA*PB*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 12*(PB*PB)*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p) + 84*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_4_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 16*PA*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)) + 12*PB*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
 }
 
-inline Vec8d hermite_dE_dPB_4_4_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_4_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 4*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p);
 }
 
-inline Vec8d hermite_dE_dPB_4_4_8(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
+RECURSUM_FORCEINLINE Vec8d hermite_dE_dPB_4_4_8(Vec8d PA, Vec8d PB, Vec8d one_over_2p) {
     return 0;
 }
 
+// =============================================================================
+// Joint ∂E/∂PA, ∂E/∂PB (shared CSE)
+// =============================================================================
+
+RECURSUM_FORCEINLINE void hermite_dE_both_0_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_0_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 1;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_0_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_0_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 2*PB;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_0_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 2*one_over_2p;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_0_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_0_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 3*((PB*PB) + one_over_2p);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_0_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 6*PB*one_over_2p;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_0_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 3*(one_over_2p*one_over_2p);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_0_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_0_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 4*PB*((PB*PB) + 3*one_over_2p);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_0_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 12*one_over_2p*((PB*PB) + one_over_2p);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_0_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 12*PB*(one_over_2p*one_over_2p);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_0_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 4*(one_over_2p*one_over_2p*one_over_2p);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_0_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 1;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = PB;
+    dE_dPB = PA;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = one_over_2p;
+    dE_dPB = one_over_2p;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = (PB*PB) + one_over_2p;
+    dE_dPB = 2*(PA*PB + one_over_2p);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 2*one_over_2p;
+    dE_dPA = PB*x0;
+    dE_dPB = x0*(PA + PB);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p);
+    dE_dPA = x0;
+    dE_dPB = 2*x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (PB*PB);
+    dE_dPA = PB*(3*one_over_2p + x0);
+    dE_dPB = 3*PA*one_over_2p + 3*PA*x0 + 6*PB*one_over_2p;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (PB*PB);
+    const Vec8d x1 = 3*one_over_2p;
+    dE_dPA = x1*(one_over_2p + x0);
+    dE_dPB = x1*(2*PA*PB + x0 + x1);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 3*(one_over_2p*one_over_2p);
+    dE_dPA = PB*x0;
+    dE_dPB = x0*(PA + 2*PB);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    dE_dPA = x0;
+    dE_dPB = 3*x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 3*(one_over_2p*one_over_2p);
+    const Vec8d x1 = (PB*PB)*one_over_2p;
+    dE_dPA = ((PB*PB)*(PB*PB)) + x0 + 6*x1;
+    dE_dPB = 4*PA*(PB*PB*PB) + 12*PA*PB*one_over_2p + 4*x0 + 12*x1;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (PB*PB);
+    const Vec8d x1 = 3*one_over_2p;
+    const Vec8d x2 = PB*one_over_2p;
+    dE_dPA = 4*x2*(x0 + x1);
+    dE_dPB = 4*one_over_2p*(3*PA*x0 + PA*x1 + (PB*PB*PB) + 9*x2);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p);
+    const Vec8d x1 = (PB*PB);
+    dE_dPA = 6*x0*(one_over_2p + x1);
+    dE_dPB = 12*x0*(PA*PB + 2*one_over_2p + x1);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 4*(one_over_2p*one_over_2p*one_over_2p);
+    dE_dPA = PB*x0;
+    dE_dPB = x0*(PA + 3*PB);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    dE_dPA = x0;
+    dE_dPB = 4*x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_1_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 2*PA;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 2*one_over_2p;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 2*(PA*PB + one_over_2p);
+    dE_dPB = (PA*PA) + one_over_2p;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 2*one_over_2p;
+    dE_dPA = x0*(PA + PB);
+    dE_dPB = PA*x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p);
+    dE_dPA = 2*x0;
+    dE_dPB = x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = PA*one_over_2p;
+    const Vec8d x1 = PB*one_over_2p;
+    dE_dPA = 2*PA*(PB*PB) + 2*x0 + 4*x1;
+    dE_dPB = 2*(PA*PA)*PB + 4*x0 + 2*x1;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 2*PA*PB + 3*one_over_2p;
+    const Vec8d x1 = 2*one_over_2p;
+    dE_dPA = x1*((PB*PB) + x0);
+    dE_dPB = x1*((PA*PA) + x0);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 2*(one_over_2p*one_over_2p);
+    dE_dPA = x0*(PA + 2*PB);
+    dE_dPB = x0*(2*PA + PB);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 2*(one_over_2p*one_over_2p*one_over_2p);
+    dE_dPA = x0;
+    dE_dPB = x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 3*(one_over_2p*one_over_2p);
+    const Vec8d x1 = PA*PB*one_over_2p;
+    const Vec8d x2 = (PB*PB);
+    const Vec8d x3 = one_over_2p*x2;
+    const Vec8d x4 = (PA*PA);
+    dE_dPA = 2*PA*(PB*PB*PB) + 2*x0 + 6*x1 + 6*x3;
+    dE_dPB = 3*one_over_2p*x4 + 3*x0 + 12*x1 + 3*x2*x4 + 3*x3;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 3*one_over_2p;
+    const Vec8d x1 = PA*x0;
+    const Vec8d x2 = PA*(PB*PB);
+    dE_dPA = 2*one_over_2p*((PB*PB*PB) + 9*PB*one_over_2p + x1 + 3*x2);
+    dE_dPB = 6*one_over_2p*((PA*PA)*PB + PB*x0 + x1 + x2);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p);
+    const Vec8d x1 = (PB*PB);
+    const Vec8d x2 = PA*PB;
+    dE_dPA = 6*x0*(2*one_over_2p + x1 + x2);
+    dE_dPB = 3*x0*((PA*PA) + 6*one_over_2p + x1 + 4*x2);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    dE_dPA = 2*x0*(PA + 3*PB);
+    dE_dPB = 6*x0*(PA + PB);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    dE_dPA = 2*x0;
+    dE_dPB = 3*x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p);
+    const Vec8d x1 = PA*x0;
+    const Vec8d x2 = PB*x0;
+    const Vec8d x3 = (PB*PB*PB);
+    const Vec8d x4 = one_over_2p*x3;
+    const Vec8d x5 = 6*PA*(PB*PB)*one_over_2p;
+    const Vec8d x6 = (PA*PA);
+    dE_dPA = 2*PA*((PB*PB)*(PB*PB)) + 6*x1 + 24*x2 + 8*x4 + 2*x5;
+    dE_dPB = 12*PB*one_over_2p*x6 + 24*x1 + 36*x2 + 4*x3*x6 + 4*x4 + 4*x5;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 15*(one_over_2p*one_over_2p);
+    const Vec8d x1 = PA*PB*one_over_2p;
+    const Vec8d x2 = PA*(PB*PB*PB);
+    const Vec8d x3 = (PB*PB);
+    const Vec8d x4 = one_over_2p*x3;
+    const Vec8d x5 = 3*(PA*PA);
+    dE_dPA = 2*one_over_2p*(((PB*PB)*(PB*PB)) + x0 + 12*x1 + 4*x2 + 18*x4);
+    dE_dPB = 4*one_over_2p*(one_over_2p*x5 + x0 + 18*x1 + 2*x2 + x3*x5 + 9*x4);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 3*PA;
+    const Vec8d x1 = 12*one_over_2p;
+    const Vec8d x2 = (PB*PB*PB);
+    const Vec8d x3 = (PB*PB);
+    const Vec8d x4 = 4*(one_over_2p*one_over_2p);
+    dE_dPA = x4*(PB*x1 + one_over_2p*x0 + x0*x3 + 2*x2);
+    dE_dPB = x4*(3*(PA*PA)*PB + PA*x1 + 6*PA*x3 + 18*PB*one_over_2p + x2);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = PA*PB;
+    const Vec8d x1 = 3*(PB*PB);
+    const Vec8d x2 = 4*(one_over_2p*one_over_2p*one_over_2p);
+    dE_dPA = x2*(5*one_over_2p + 2*x0 + x1);
+    dE_dPB = x2*((PA*PA) + 10*one_over_2p + 6*x0 + x1);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    dE_dPA = 2*x0*(PA + 4*PB);
+    dE_dPB = 4*x0*(2*PA + 3*PB);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    dE_dPA = 2*x0;
+    dE_dPB = 4*x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_2_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 3*((PA*PA) + one_over_2p);
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 6*PA*one_over_2p;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 3*(one_over_2p*one_over_2p);
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_0_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (PA*PA);
+    dE_dPA = 6*PA*one_over_2p + 3*PB*one_over_2p + 3*PB*x0;
+    dE_dPB = PA*(3*one_over_2p + x0);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (PA*PA);
+    const Vec8d x1 = 3*one_over_2p;
+    dE_dPA = x1*(2*PA*PB + x0 + x1);
+    dE_dPB = x1*(one_over_2p + x0);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 3*(one_over_2p*one_over_2p);
+    dE_dPA = x0*(2*PA + PB);
+    dE_dPB = PA*x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    dE_dPA = 3*x0;
+    dE_dPB = x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_1_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 3*(one_over_2p*one_over_2p);
+    const Vec8d x1 = (PA*PA);
+    const Vec8d x2 = one_over_2p*x1;
+    const Vec8d x3 = (PB*PB);
+    const Vec8d x4 = PA*PB*one_over_2p;
+    dE_dPA = 3*one_over_2p*x3 + 3*x0 + 3*x1*x3 + 3*x2 + 12*x4;
+    dE_dPB = 2*(PA*PA*PA)*PB + 2*x0 + 6*x2 + 6*x4;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 3*one_over_2p;
+    const Vec8d x1 = PB*x0;
+    const Vec8d x2 = (PA*PA)*PB;
+    dE_dPA = 6*one_over_2p*(PA*(PB*PB) + PA*x0 + x1 + x2);
+    dE_dPB = 2*one_over_2p*((PA*PA*PA) + 9*PA*one_over_2p + x1 + 3*x2);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p);
+    const Vec8d x1 = (PA*PA);
+    const Vec8d x2 = PA*PB;
+    dE_dPA = 3*x0*((PB*PB) + 6*one_over_2p + x1 + 4*x2);
+    dE_dPB = 6*x0*(2*one_over_2p + x1 + x2);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    dE_dPA = 6*x0*(PA + PB);
+    dE_dPB = 2*x0*(3*PA + PB);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    dE_dPA = 3*x0;
+    dE_dPB = 2*x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_2_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (PB*PB*PB);
+    const Vec8d x1 = (one_over_2p*one_over_2p);
+    const Vec8d x2 = 6*x1;
+    const Vec8d x3 = 9*x1;
+    const Vec8d x4 = (PA*PA);
+    const Vec8d x5 = (PB*PB);
+    const Vec8d x6 = PA*x5;
+    const Vec8d x7 = 6*one_over_2p;
+    const Vec8d x8 = 3*one_over_2p;
+    const Vec8d x9 = PB*x4;
+    const Vec8d x10 = (PA*PA*PA);
+    dE_dPA = 3*PA*x2 + 3*PB*x3 + 3*one_over_2p*x0 + 3*x0*x4 + 3*x6*x7 + 3*x8*x9;
+    dE_dPB = 3*PA*x3 + 3*PB*x2 + 3*one_over_2p*x10 + 3*x10*x5 + 3*x6*x8 + 3*x7*x9;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (PA*PA);
+    const Vec8d x1 = 3*x0;
+    const Vec8d x2 = (PB*PB);
+    const Vec8d x3 = one_over_2p*x2;
+    const Vec8d x4 = 18*PA*PB*one_over_2p + 15*(one_over_2p*one_over_2p) + x1*x2;
+    const Vec8d x5 = 3*one_over_2p;
+    dE_dPA = x5*(2*PA*(PB*PB*PB) + one_over_2p*x1 + 9*x3 + x4);
+    dE_dPB = x5*(2*(PA*PA*PA)*PB + 9*one_over_2p*x0 + 3*x3 + x4);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 12*one_over_2p;
+    const Vec8d x1 = 18*one_over_2p;
+    const Vec8d x2 = PA*(PB*PB);
+    const Vec8d x3 = (PA*PA)*PB;
+    const Vec8d x4 = 3*(one_over_2p*one_over_2p);
+    dE_dPA = x4*(PA*x0 + (PB*PB*PB) + PB*x1 + 6*x2 + 3*x3);
+    dE_dPB = x4*((PA*PA*PA) + PA*x1 + PB*x0 + 3*x2 + 6*x3);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (PA*PA);
+    const Vec8d x1 = (PB*PB);
+    const Vec8d x2 = 6*PA*PB + 10*one_over_2p;
+    const Vec8d x3 = 3*(one_over_2p*one_over_2p*one_over_2p);
+    dE_dPA = x3*(x0 + 3*x1 + x2);
+    dE_dPB = x3*(3*x0 + x1 + x2);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 3*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    dE_dPA = x0*(2*PA + 3*PB);
+    dE_dPB = x0*(3*PA + 2*PB);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 3*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    dE_dPA = x0;
+    dE_dPB = x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_3_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 15*(one_over_2p*one_over_2p*one_over_2p);
+    const Vec8d x1 = ((PB*PB)*(PB*PB));
+    const Vec8d x2 = (PA*PA);
+    const Vec8d x3 = (one_over_2p*one_over_2p);
+    const Vec8d x4 = PA*PB*x3;
+    const Vec8d x5 = (PB*PB*PB);
+    const Vec8d x6 = PA*one_over_2p*x5;
+    const Vec8d x7 = x2*x3;
+    const Vec8d x8 = (PB*PB);
+    const Vec8d x9 = x3*x8;
+    const Vec8d x10 = one_over_2p*x2*x8;
+    const Vec8d x11 = (PA*PA*PA);
+    dE_dPA = 3*one_over_2p*x1 + 3*x0 + 3*x1*x2 + 18*x10 + 72*x4 + 24*x6 + 9*x7 + 54*x9;
+    dE_dPB = 12*PB*one_over_2p*x11 + 4*x0 + 36*x10 + 4*x11*x5 + 108*x4 + 12*x6 + 36*x7 + 36*x9;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p);
+    const Vec8d x1 = 15*x0;
+    const Vec8d x2 = PA*x1;
+    const Vec8d x3 = (PB*PB*PB);
+    const Vec8d x4 = one_over_2p*x3;
+    const Vec8d x5 = (PB*PB);
+    const Vec8d x6 = PA*one_over_2p*x5;
+    const Vec8d x7 = 6*one_over_2p;
+    const Vec8d x8 = (PA*PA);
+    const Vec8d x9 = PB*x8;
+    const Vec8d x10 = x3*x8;
+    const Vec8d x11 = (PA*PA*PA);
+    dE_dPA = x7*(PA*((PB*PB)*(PB*PB)) + 30*PB*x0 + 2*x10 + x2 + 6*x4 + 18*x6 + x7*x9);
+    dE_dPB = 12*one_over_2p*(PB*x1 + one_over_2p*x11 + 9*one_over_2p*x9 + x10 + x11*x5 + x2 + x4 + 9*x6);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p);
+    const Vec8d x1 = PA*PB*one_over_2p;
+    const Vec8d x2 = PA*(PB*PB*PB);
+    const Vec8d x3 = (PA*PA);
+    const Vec8d x4 = 6*x3;
+    const Vec8d x5 = one_over_2p*x4;
+    const Vec8d x6 = (PB*PB);
+    const Vec8d x7 = one_over_2p*x6;
+    dE_dPA = 3*x0*(((PB*PB)*(PB*PB)) + 45*x0 + 48*x1 + 8*x2 + x4*x6 + x5 + 36*x7);
+    dE_dPB = 12*x0*((PA*PA*PA)*PB + 15*x0 + 18*x1 + x2 + 3*x3*x6 + x5 + 6*x7);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    const Vec8d x1 = (PB*PB*PB);
+    const Vec8d x2 = PA*one_over_2p;
+    const Vec8d x3 = PB*one_over_2p;
+    const Vec8d x4 = (PA*PA)*PB;
+    const Vec8d x5 = PA*(PB*PB);
+    dE_dPA = 12*x0*(x1 + 5*x2 + 10*x3 + x4 + 3*x5);
+    dE_dPB = 4*x0*((PA*PA*PA) + x1 + 30*x2 + 30*x3 + 9*x4 + 9*x5);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    const Vec8d x1 = (PA*PA);
+    const Vec8d x2 = PA*PB;
+    const Vec8d x3 = (PB*PB);
+    dE_dPA = 3*x0*(15*one_over_2p + x1 + 8*x2 + 6*x3);
+    dE_dPB = 12*x0*(5*one_over_2p + x1 + 3*x2 + x3);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    dE_dPA = 6*x0*(PA + 2*PB);
+    dE_dPB = 12*x0*(PA + PB);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
+    dE_dPA = 3*x0;
+    dE_dPB = 4*x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_3_4_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_0_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 4*PA*((PA*PA) + 3*one_over_2p);
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_0_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 12*one_over_2p*((PA*PA) + one_over_2p);
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_0_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 12*PA*(one_over_2p*one_over_2p);
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_0_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 4*(one_over_2p*one_over_2p*one_over_2p);
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_0_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_1_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 3*(one_over_2p*one_over_2p);
+    const Vec8d x1 = (PA*PA)*one_over_2p;
+    dE_dPA = 4*(PA*PA*PA)*PB + 12*PA*PB*one_over_2p + 4*x0 + 12*x1;
+    dE_dPB = ((PA*PA)*(PA*PA)) + x0 + 6*x1;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_1_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = PA*one_over_2p;
+    const Vec8d x1 = 3*one_over_2p;
+    const Vec8d x2 = (PA*PA);
+    dE_dPA = 4*one_over_2p*((PA*PA*PA) + PB*x1 + 3*PB*x2 + 9*x0);
+    dE_dPB = 4*x0*(x1 + x2);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_1_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p);
+    const Vec8d x1 = (PA*PA);
+    dE_dPA = 12*x0*(PA*PB + 2*one_over_2p + x1);
+    dE_dPB = 6*x0*(one_over_2p + x1);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_1_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 4*(one_over_2p*one_over_2p*one_over_2p);
+    dE_dPA = x0*(3*PA + PB);
+    dE_dPB = PA*x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_1_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    dE_dPA = 4*x0;
+    dE_dPB = x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_1_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_2_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (PA*PA*PA);
+    const Vec8d x1 = one_over_2p*x0;
+    const Vec8d x2 = (one_over_2p*one_over_2p);
+    const Vec8d x3 = PA*x2;
+    const Vec8d x4 = PB*x2;
+    const Vec8d x5 = (PB*PB);
+    const Vec8d x6 = 6*(PA*PA)*PB*one_over_2p;
+    dE_dPA = 12*PA*one_over_2p*x5 + 4*x0*x5 + 4*x1 + 36*x3 + 24*x4 + 4*x6;
+    dE_dPB = 2*((PA*PA)*(PA*PA))*PB + 8*x1 + 24*x3 + 6*x4 + 2*x6;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_2_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 15*(one_over_2p*one_over_2p);
+    const Vec8d x1 = PA*PB*one_over_2p;
+    const Vec8d x2 = (PA*PA);
+    const Vec8d x3 = one_over_2p*x2;
+    const Vec8d x4 = (PA*PA*PA)*PB;
+    const Vec8d x5 = 3*(PB*PB);
+    dE_dPA = 4*one_over_2p*(one_over_2p*x5 + x0 + 18*x1 + x2*x5 + 9*x3 + 2*x4);
+    dE_dPB = 2*one_over_2p*(((PA*PA)*(PA*PA)) + x0 + 12*x1 + 18*x3 + 4*x4);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_2_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (PA*PA*PA);
+    const Vec8d x1 = PA*one_over_2p;
+    const Vec8d x2 = PB*one_over_2p;
+    const Vec8d x3 = (PA*PA)*PB;
+    const Vec8d x4 = 4*(one_over_2p*one_over_2p);
+    dE_dPA = x4*(3*PA*(PB*PB) + x0 + 18*x1 + 12*x2 + 6*x3);
+    dE_dPB = x4*(2*x0 + 12*x1 + 3*x2 + 3*x3);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_2_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = PA*PB;
+    const Vec8d x1 = 3*(PA*PA);
+    const Vec8d x2 = 4*(one_over_2p*one_over_2p*one_over_2p);
+    dE_dPA = x2*((PB*PB) + 10*one_over_2p + 6*x0 + x1);
+    dE_dPB = x2*(5*one_over_2p + 2*x0 + x1);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_2_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    dE_dPA = 4*x0*(3*PA + 2*PB);
+    dE_dPB = 2*x0*(4*PA + PB);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_2_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    dE_dPA = 4*x0;
+    dE_dPB = 2*x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_2_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_3_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 15*(one_over_2p*one_over_2p*one_over_2p);
+    const Vec8d x1 = (PA*PA*PA);
+    const Vec8d x2 = (PB*PB*PB);
+    const Vec8d x3 = (one_over_2p*one_over_2p);
+    const Vec8d x4 = PA*PB*x3;
+    const Vec8d x5 = 3*one_over_2p;
+    const Vec8d x6 = PB*x1;
+    const Vec8d x7 = (PA*PA);
+    const Vec8d x8 = 9*x3;
+    const Vec8d x9 = (PB*PB);
+    const Vec8d x10 = one_over_2p*x7*x9;
+    const Vec8d x11 = ((PA*PA)*(PA*PA));
+    dE_dPA = 4*PA*x2*x5 + 4*x0 + 4*x1*x2 + 36*x10 + 108*x4 + 4*x5*x6 + 4*x7*x8 + 4*x8*x9;
+    dE_dPB = 3*one_over_2p*x11 + 24*one_over_2p*x6 + 3*x0 + 18*x10 + 3*x11*x9 + 54*x3*x7 + 9*x3*x9 + 72*x4;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_3_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (PA*PA*PA);
+    const Vec8d x1 = one_over_2p*x0;
+    const Vec8d x2 = (PB*PB*PB);
+    const Vec8d x3 = (one_over_2p*one_over_2p);
+    const Vec8d x4 = 15*x3;
+    const Vec8d x5 = PB*x4;
+    const Vec8d x6 = (PA*PA);
+    const Vec8d x7 = (PB*PB);
+    const Vec8d x8 = x0*x7;
+    const Vec8d x9 = 9*one_over_2p;
+    const Vec8d x10 = PA*x7;
+    const Vec8d x11 = PB*x6;
+    const Vec8d x12 = 6*one_over_2p;
+    dE_dPA = 12*one_over_2p*(PA*x4 + one_over_2p*x2 + x1 + x10*x9 + x11*x9 + x2*x6 + x5 + x8);
+    dE_dPB = x12*(((PA*PA)*(PA*PA))*PB + 30*PA*x3 + 18*one_over_2p*x11 + 6*x1 + x10*x12 + x5 + 2*x8);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_3_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p);
+    const Vec8d x1 = (PA*PA*PA)*PB;
+    const Vec8d x2 = PA*PB*one_over_2p;
+    const Vec8d x3 = (PA*PA);
+    const Vec8d x4 = 6*one_over_2p;
+    const Vec8d x5 = (PB*PB);
+    const Vec8d x6 = x4*x5;
+    const Vec8d x7 = x3*x5;
+    dE_dPA = 12*x0*(PA*(PB*PB*PB) + 15*x0 + x1 + 18*x2 + x3*x4 + x6 + 3*x7);
+    dE_dPB = 3*x0*(((PA*PA)*(PA*PA)) + 36*one_over_2p*x3 + 45*x0 + 8*x1 + 48*x2 + x6 + 6*x7);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_3_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    const Vec8d x1 = (PA*PA*PA);
+    const Vec8d x2 = 30*one_over_2p;
+    const Vec8d x3 = PA*(PB*PB);
+    const Vec8d x4 = (PA*PA)*PB;
+    dE_dPA = 4*x0*(PA*x2 + (PB*PB*PB) + PB*x2 + x1 + 9*x3 + 9*x4);
+    dE_dPB = 12*x0*(10*PA*one_over_2p + 5*PB*one_over_2p + x1 + x3 + 3*x4);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_3_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    const Vec8d x1 = (PA*PA);
+    const Vec8d x2 = (PB*PB);
+    const Vec8d x3 = PA*PB;
+    dE_dPA = 12*x0*(5*one_over_2p + x1 + x2 + 3*x3);
+    dE_dPB = 3*x0*(15*one_over_2p + 6*x1 + x2 + 8*x3);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_3_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = ((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    dE_dPA = 12*x0*(PA + PB);
+    dE_dPB = 6*x0*(2*PA + PB);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_3_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = ((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
+    dE_dPA = 4*x0;
+    dE_dPB = 3*x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_3_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_4_0(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p*one_over_2p);
+    const Vec8d x1 = 45*x0;
+    const Vec8d x2 = 60*x0;
+    const Vec8d x3 = (PA*PA*PA);
+    const Vec8d x4 = ((PB*PB)*(PB*PB));
+    const Vec8d x5 = 3*one_over_2p;
+    const Vec8d x6 = (one_over_2p*one_over_2p);
+    const Vec8d x7 = 3*x6;
+    const Vec8d x8 = (PB*PB*PB);
+    const Vec8d x9 = 12*x6;
+    const Vec8d x10 = (PB*PB);
+    const Vec8d x11 = PA*x10;
+    const Vec8d x12 = 54*x6;
+    const Vec8d x13 = 36*x6;
+    const Vec8d x14 = (PA*PA);
+    const Vec8d x15 = PB*x14;
+    const Vec8d x16 = x14*x8;
+    const Vec8d x17 = 12*one_over_2p;
+    const Vec8d x18 = 6*one_over_2p;
+    const Vec8d x19 = x10*x3;
+    const Vec8d x20 = ((PA*PA)*(PA*PA));
+    dE_dPA = 4*PA*x1 + 4*PA*x4*x5 + 4*PB*x2 + 4*x11*x12 + 4*x13*x15 + 4*x16*x17 + 4*x18*x19 + 4*x3*x4 + 4*x3*x7 + 4*x8*x9;
+    dE_dPB = 4*PA*x2 + 4*PB*x1 + 4*PB*x20*x5 + 4*x11*x13 + 4*x12*x15 + 4*x16*x18 + 4*x17*x19 + 4*x20*x8 + 4*x3*x9 + 4*x7*x8;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_4_1(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 3*((PB*PB)*(PB*PB));
+    const Vec8d x1 = (PA*PA);
+    const Vec8d x2 = (one_over_2p*one_over_2p);
+    const Vec8d x3 = 45*x2;
+    const Vec8d x4 = (PB*PB);
+    const Vec8d x5 = 90*x2;
+    const Vec8d x6 = 12*one_over_2p;
+    const Vec8d x7 = (PA*PA*PA);
+    const Vec8d x8 = PB*x7;
+    const Vec8d x9 = (PB*PB*PB);
+    const Vec8d x10 = PA*x9;
+    const Vec8d x11 = 36*one_over_2p;
+    const Vec8d x12 = 180*PA*PB*x2 + 105*(one_over_2p*one_over_2p*one_over_2p) + 54*one_over_2p*x1*x4 + 4*x7*x9;
+    const Vec8d x13 = 4*one_over_2p;
+    const Vec8d x14 = 3*((PA*PA)*(PA*PA));
+    dE_dPA = x13*(one_over_2p*x0 + x0*x1 + x1*x3 + x10*x11 + x12 + x4*x5 + x6*x8);
+    dE_dPB = x13*(one_over_2p*x14 + x1*x5 + x10*x6 + x11*x8 + x12 + x14*x4 + x3*x4);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_4_2(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (one_over_2p*one_over_2p);
+    const Vec8d x1 = 45*x0;
+    const Vec8d x2 = (PA*PA*PA);
+    const Vec8d x3 = 2*x2;
+    const Vec8d x4 = 60*x0;
+    const Vec8d x5 = (PB*PB*PB);
+    const Vec8d x6 = one_over_2p*x5;
+    const Vec8d x7 = (PB*PB);
+    const Vec8d x8 = PA*x7;
+    const Vec8d x9 = 36*one_over_2p;
+    const Vec8d x10 = 24*one_over_2p;
+    const Vec8d x11 = (PA*PA);
+    const Vec8d x12 = PB*x11;
+    const Vec8d x13 = x11*x5;
+    const Vec8d x14 = 12*x0;
+    dE_dPA = x14*(PA*((PB*PB)*(PB*PB)) + PA*x1 + PB*x4 + one_over_2p*x3 + x10*x12 + 4*x13 + x3*x7 + 8*x6 + x8*x9);
+    dE_dPB = x14*(((PA*PA)*(PA*PA))*PB + PA*x4 + PB*x1 + 8*one_over_2p*x2 + x10*x8 + x12*x9 + 2*x13 + 4*x2*x7 + 2*x6);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_4_3(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (PA*PA*PA)*PB;
+    const Vec8d x1 = PA*(PB*PB*PB);
+    const Vec8d x2 = (PA*PA);
+    const Vec8d x3 = 30*one_over_2p;
+    const Vec8d x4 = (PB*PB);
+    const Vec8d x5 = 60*one_over_2p;
+    const Vec8d x6 = 120*PA*PB*one_over_2p + 105*(one_over_2p*one_over_2p) + 18*x2*x4;
+    const Vec8d x7 = 4*(one_over_2p*one_over_2p*one_over_2p);
+    dE_dPA = x7*(((PB*PB)*(PB*PB)) + 4*x0 + 12*x1 + x2*x3 + x4*x5 + x6);
+    dE_dPB = x7*(((PA*PA)*(PA*PA)) + 12*x0 + 4*x1 + x2*x5 + x3*x4 + x6);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_4_4(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (PA*PA*PA);
+    const Vec8d x1 = 45*one_over_2p;
+    const Vec8d x2 = 60*one_over_2p;
+    const Vec8d x3 = (PB*PB*PB);
+    const Vec8d x4 = PA*(PB*PB);
+    const Vec8d x5 = (PA*PA)*PB;
+    const Vec8d x6 = 4*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p));
+    dE_dPA = x6*(PA*x1 + PB*x2 + x0 + 4*x3 + 18*x4 + 12*x5);
+    dE_dPB = x6*(PA*x2 + PB*x1 + 4*x0 + x3 + 12*x4 + 18*x5);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_4_5(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = (PA*PA);
+    const Vec8d x1 = (PB*PB);
+    const Vec8d x2 = 4*PA*PB + 7*one_over_2p;
+    const Vec8d x3 = 12*((one_over_2p*one_over_2p)*(one_over_2p*one_over_2p)*one_over_2p);
+    dE_dPA = x3*(x0 + 2*x1 + x2);
+    dE_dPB = x3*(2*x0 + x1 + x2);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_4_6(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 4*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p));
+    dE_dPA = x0*(3*PA + 4*PB);
+    dE_dPB = x0*(4*PA + 3*PB);
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_4_7(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    const Vec8d x0 = 4*((one_over_2p*one_over_2p*one_over_2p)*(one_over_2p*one_over_2p*one_over_2p)*one_over_2p);
+    dE_dPA = x0;
+    dE_dPB = x0;
+}
+
+RECURSUM_FORCEINLINE void hermite_dE_both_4_4_8(Vec8d PA, Vec8d PB, Vec8d one_over_2p,
+                                                    Vec8d& dE_dPA, Vec8d& dE_dPB) {
+    dE_dPA = 0;
+    dE_dPB = 0;
+}
+
 /**
  * @brief Runtime dispatcher for ∂E/∂PA
  */
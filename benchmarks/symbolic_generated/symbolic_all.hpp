@@ -0,0 +1,17 @@
+/**
+ * @file symbolic_all.hpp
+ * @brief All symbolically-generated McMurchie-Davidson kernels
+ *
+ * AUTO-GENERATED - DO NOT EDIT MANUALLY
+ *
+ * Include order: Hermite E, Hermite gradients, Coulomb R. Each header is
+ * self-contained and #pragma once, so this file can be precompiled, e.g.
+ *   target_precompile_headers(<target> PRIVATE symbolic_generated/symbolic_all.hpp)
+ * or included alongside any of the individual headers.
+ */
+
+#pragma once
+
+#include "hermite_e_symbolic.hpp"
+#include "hermite_grad_symbolic.hpp"
+#include "coulomb_r_symbolic.hpp"